@@ -1,6 +1,9 @@
 # src/fetchtastic/cli.py
 
+from __future__ import annotations
+
 import argparse
+import importlib
 import logging
 import os
 import platform
@@ -8,11 +11,9 @@ import shutil
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import platformdirs
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from fetchtastic import log_utils, setup_config, utils
+from fetchtastic import log_utils
 from fetchtastic.constants import (
     FIRMWARE_DIR_NAME,
     FIRMWARE_DIR_PREFIX,
@@ -25,22 +26,45 @@ from fetchtastic.constants import (
     MSG_REMOVED_MANAGED_DIR,
     MSG_REMOVED_MANAGED_FILE,
     REPO_DOWNLOADS_DIR,
+    SETUP_SECTION_CHOICES,
     WINDOWS_SHORTCUT_FILE,
 )
-from fetchtastic.download import cli_integration as download_cli_integration
-from fetchtastic.download.repository import RepositoryDownloader
-from fetchtastic.utils import (
-    display_banner,
-)
-from fetchtastic.utils import get_api_request_summary as _get_api_request_summary
-from fetchtastic.utils import (
-    reset_api_tracking,
-)
 
-get_api_request_summary = _get_api_request_summary
+if TYPE_CHECKING:
+    from fetchtastic.download.cli_integration import DownloadCLIIntegration
+    from fetchtastic.download.run_coordinator import RunCoordinator
+
+# Heavy modules (setup_config with YAML and platform helpers, the download stack with
+# requests/aiohttp, utils with requests) are imported by the subcommands that need
+# them, so `version`, `help` and argument errors start quickly. The names below stay
+# patchable module attributes and are resolved on first access.
+_LAZY_ATTRIBUTES = {
+    "RepositoryDownloader": (
+        "fetchtastic.download.repository",
+        "RepositoryDownloader",
+    ),
+    "copy_to_clipboard_func": ("fetchtastic.setup_config", "copy_to_clipboard_func"),
+    "display_banner": ("fetchtastic.utils", "display_banner"),
+    "get_api_request_summary": ("fetchtastic.utils", "get_api_request_summary"),
+    "reset_api_tracking": ("fetchtastic.utils", "reset_api_tracking"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import and cache the lazily loaded module attributes listed in _LAZY_ATTRIBUTES."""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = target
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Return module attribute `name`, honouring patches and loading it on first use."""
+    return globals()[name] if name in globals() else __getattr__(name)
 
-# Patch-friendly aliases for CLI tests.
-copy_to_clipboard_func = setup_config.copy_to_clipboard_func
 
 _VALID_LOG_LEVEL_NAMES = {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"}
 
@@ -54,6 +78,8 @@ def get_version_info() -> tuple[str, str | None, bool]:
         latest_version (str | None): Latest available release version, or `None` if it cannot be determined.
         update_available (bool): `True` if a newer release is available, `False` otherwise.
     """
+    from fetchtastic import setup_config
+
     return setup_config.get_version_info()
 
 
@@ -64,6 +90,8 @@ def get_upgrade_command() -> str:
     Returns:
         upgrade_command (str): A command string suitable for display or execution to upgrade Fetchtastic on the current platform.
     """
+    from fetchtastic import setup_config
+
     return setup_config.get_upgrade_command()
 
 
@@ -93,6 +121,8 @@ def _load_and_prepare_config() -> Tuple[Optional[Dict[str, Any]], Optional[str]]
             config (dict[str, Any] | None): The loaded configuration mapping, or `None` if no configuration is available.
             config_path (str | None): Filesystem path to the loaded configuration file, or `None` if no configuration was found.
     """
+    from fetchtastic import setup_config
+
     exists, config_path = setup_config.config_exists()
     if exists and config_path == setup_config.OLD_CONFIG_FILE:
         # Check if config is in old location and needs migration
@@ -132,6 +162,8 @@ def _ensure_config_loaded() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         configuration dictionary or `None`, and `config_path` is the path to the configuration file or
         `None`. Returns `(None, None)` if setup does not produce a valid configuration.
     """
+    from fetchtastic import setup_config
+
     config, config_path = _load_and_prepare_config()
     if config_path is None:
         if not sys.stdin.isatty():
@@ -151,7 +183,7 @@ def _ensure_config_loaded() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
 
 def _prepare_command_run() -> Tuple[
     Optional[Dict[str, Any]],
-    Optional[download_cli_integration.DownloadCLIIntegration],
+    Optional[DownloadCLIIntegration],
 ]:
     """
     Ensure a valid configuration is loaded and create a DownloadCLIIntegration instance.
@@ -163,6 +195,10 @@ def _prepare_command_run() -> Tuple[
             `config` (dict[str, Any] | None): The loaded configuration mapping, or `None` if no configuration is available.
             `integration` (download_cli_integration.DownloadCLIIntegration | None): The created integration instance, or `None` if configuration loading failed.
     """
+    import platformdirs
+
+    from fetchtastic.download import cli_integration as download_cli_integration
+
     config, config_path = _ensure_config_loaded()
     if config_path is None:
         return None, None
@@ -199,7 +235,7 @@ def _prepare_command_run() -> Tuple[
 
 
 def _perform_cache_clear(
-    integration: download_cli_integration.DownloadCLIIntegration,
+    integration: DownloadCLIIntegration,
     config: Dict[str, Any],
 ) -> bool:
     """
@@ -219,6 +255,44 @@ def _perform_cache_clear(
     return success
 
 
+def run_verify(config: Dict[str, Any]) -> bool:
+    """
+    Scrub the download directory: re-hash files that have stored hashes and report mismatches.
+
+    Parameters:
+        config (Dict[str, Any]): Loaded configuration providing `DOWNLOAD_DIR`.
+
+    Returns:
+        bool: `True` if every checked file matched its stored hash, `False` if any failed or the scrub was interrupted.
+    """
+    from fetchtastic.utils import scrub_hashed_files
+
+    download_dir = config.get("DOWNLOAD_DIR")
+    if not isinstance(download_dir, str) or not os.path.isdir(download_dir):
+        log_utils.logger.error("Download directory not found: %s", download_dir)
+        return False
+
+    def _report_progress(completed: int, total: int, _path: str) -> None:
+        if completed == total or completed % 50 == 0:
+            log_utils.logger.info("Verified %d/%d files", completed, total)
+
+    try:
+        results = scrub_hashed_files(download_dir, progress=_report_progress)
+    except KeyboardInterrupt:
+        log_utils.logger.warning("Verification interrupted.")
+        return False
+
+    failed = sorted(path for path, verified in results.items() if not verified)
+    for path in failed:
+        print(f"FAILED: {path}", file=sys.stderr)
+    log_utils.logger.info(
+        "Checked %d file(s) with stored hashes; %d failed verification.",
+        len(results),
+        len(failed),
+    )
+    return not failed
+
+
 def _normalize_download_main_result(
     raw_result: Any,
 ) -> tuple[
@@ -301,23 +375,96 @@ def _normalize_download_main_result(
 
 def _handle_download_subcommand(
     args: argparse.Namespace,
-    integration: download_cli_integration.DownloadCLIIntegration,
+    integration: DownloadCLIIntegration,
     config: Dict[str, Any],
 ) -> None:
     """
     Run either a cache clear or a download operation based on command-line flags.
 
-    If `args.clear_cache` is true, clears caches via the provided integration; otherwise runs the integration's download routine (honoring `args.force_download`), measures elapsed time, and logs a download summary.
+    If `args.clear_cache` is true, clears caches via the provided integration; otherwise runs the integration's download routine (honoring `args.force_download`), measures elapsed time, logs a download summary, and writes a run metrics report when `args.metrics_out` is set. When `args.trace_out` is set the run is traced and a Chrome Trace Event Format file is written there, even if the run fails.
+
+    Downloads into a configured `DOWNLOAD_DIR` are coordinated with other fetchtastic runs using the same directory (see `fetchtastic.download.run_coordinator`): if one is in flight, this run exits, reuses its results, or runs after it, per `CONCURRENT_RUN_MODE` and `args.queue`.
 
     Parameters:
-        args (argparse.Namespace): Parsed CLI arguments; expected to include `clear_cache` and `force_download`.
+        args (argparse.Namespace): Parsed CLI arguments; expected to include `clear_cache` and `force_download`, and optionally `metrics_out`, `trace_out` and `queue`.
         integration (download_cli_integration.DownloadCLIIntegration): Integration instance used to perform the cache clear or downloads and to emit the results summary.
         config (dict): Configuration mapping passed to the integration for the operation.
     """
+    from fetchtastic.download.run_coordinator import (
+        RunCoordinator,
+        describe_run,
+        resolve_run_mode,
+    )
+
     if args.clear_cache:
         _perform_cache_clear(integration, config)
         return
 
+    download_dir = config.get("DOWNLOAD_DIR") if isinstance(config, dict) else None
+    if not download_dir:
+        _run_traced_download(args, integration, config, None)
+        return
+
+    coordinator = RunCoordinator(download_dir)
+    mode = resolve_run_mode(config, queue=getattr(args, "queue", False))
+    with coordinator.claim(mode) as ticket:
+        if ticket.should_run:
+            _run_traced_download(args, integration, config, coordinator)
+        elif ticket.waited:
+            log_utils.logger.info(
+                "Reusing the results of the run that just finished (%s)",
+                describe_run(ticket.other_run),
+            )
+        else:
+            log_utils.logger.info(
+                "Another fetchtastic run is already downloading into %s (%s); exiting",
+                coordinator.download_dir,
+                describe_run(ticket.other_run),
+            )
+
+
+def _run_traced_download(
+    args: argparse.Namespace,
+    integration: DownloadCLIIntegration,
+    config: Dict[str, Any],
+    run_coordinator: Optional["RunCoordinator"],
+) -> None:
+    """
+    Run `_run_download_with_summary`, tracing it to `args.trace_out` when set.
+
+    The trace file is written even if the run fails.
+    """
+    from fetchtastic import tracing
+
+    trace_out = getattr(args, "trace_out", None)
+    if not trace_out:
+        _run_download_with_summary(args, integration, config, run_coordinator)
+        return
+
+    tracing.start_tracing()
+    try:
+        with tracing.trace_span("download", tracing.TRACE_CATEGORY_STAGE):
+            _run_download_with_summary(args, integration, config, run_coordinator)
+    finally:
+        tracing.write_trace(trace_out)
+        tracing.stop_tracing()
+
+
+def _run_download_with_summary(
+    args: argparse.Namespace,
+    integration: DownloadCLIIntegration,
+    config: Dict[str, Any],
+    run_coordinator: Optional["RunCoordinator"] = None,
+) -> None:
+    """
+    Run the download integration, log the results summary, and write the optional metrics report.
+
+    Parameters:
+        args (argparse.Namespace): Parsed CLI arguments; expected to include `force_download` and optionally `metrics_out`.
+        integration (download_cli_integration.DownloadCLIIntegration): Integration instance used to perform the downloads and to emit the results summary.
+        config (dict): Configuration mapping passed to the integration.
+        run_coordinator (Optional[RunCoordinator]): Coordinator holding the download directory; a summary of the results is recorded with it for runs waiting on this one.
+    """
     start_time = time.time()
     raw_result = integration.main(
         config=config,
@@ -358,6 +505,30 @@ def _handle_download_subcommand(
         new_apk_versions=new_apk_versions,
         new_desktop_versions=new_desktop_versions,
     )
+    if run_coordinator is not None:
+        run_coordinator.record_result(
+            {
+                "downloaded": sum(
+                    len(downloaded)
+                    for downloaded in (
+                        downloaded_firmwares,
+                        downloaded_apks,
+                        downloaded_desktop,
+                        downloaded_firmware_prereleases,
+                        downloaded_apk_prereleases,
+                        downloaded_desktop_prereleases,
+                    )
+                ),
+                "failed": len(failed_downloads),
+                "latest_firmware": latest_firmware_version,
+                "latest_app": latest_apk_version,
+                "latest_desktop": latest_desktop_version,
+            }
+        )
+
+    metrics_out = getattr(args, "metrics_out", None)
+    if metrics_out:
+        integration.write_metrics_report(metrics_out)
 
 
 def main() -> None:
@@ -369,8 +540,8 @@ def main() -> None:
     Handles the top-level CLI for Fetchtastic, routing requests to subcommands such as
     setup, download, topic, cache, clean, version, help, and repo. Each subcommand
     performs the corresponding user-facing action (for example: run interactive
-    setup, perform downloads, show the NTFY topic, clear cached data, remove
-    Fetchtastic files, display version information, or interact with the repository).
+    setup, perform downloads, show the NTFY topic, clear cached data, verify
+    downloads, remove Fetchtastic files, display version information, or interact with the repository).
     """
     parser = argparse.ArgumentParser(
         description="Fetchtastic - Meshtastic Firmware and Client App Downloader"
@@ -382,7 +553,7 @@ def main() -> None:
     setup_parser.add_argument(
         "--section",
         action="append",
-        choices=sorted(setup_config.SETUP_SECTION_CHOICES),
+        choices=sorted(SETUP_SECTION_CHOICES),
         help="Only re-run specific setup sections (can be passed multiple times)",
     )
     setup_parser.add_argument(
@@ -417,6 +588,34 @@ def main() -> None:
         action="store_true",
         help="Clear cached API data and exit without running downloads",
     )
+    download_parser.add_argument(
+        "--metrics-out",
+        dest="metrics_out",
+        metavar="PATH",
+        help=(
+            "Write a run performance report (stage timings, bytes, API calls, "
+            "cache hit ratios) to PATH as JSON, or in Prometheus textfile "
+            "format when PATH ends with .prom"
+        ),
+    )
+    download_parser.add_argument(
+        "--trace-out",
+        dest="trace_out",
+        metavar="PATH",
+        help=(
+            "Record a timeline of the run (stages, API calls, downloads, "
+            "verification, extraction, cleanup) to PATH in Chrome Trace Event "
+            "Format; open it in Perfetto or chrome://tracing"
+        ),
+    )
+    download_parser.add_argument(
+        "--queue",
+        action="store_true",
+        help=(
+            "If another run is downloading into the same directory, wait for it "
+            "and then run (overrides CONCURRENT_RUN_MODE)"
+        ),
+    )
 
     # Command to display NTFY topic
     subparsers.add_parser("topic", help="Display the current NTFY topic")
@@ -434,6 +633,16 @@ def main() -> None:
         description="Clear cached API data and exit without running downloads.",
     )
 
+    # Command to re-verify downloaded files against their stored hashes
+    subparsers.add_parser(
+        "verify",
+        help="Re-verify downloaded files against their stored hashes",
+        description=(
+            "Re-hash every downloaded file that has a stored hash and report any "
+            "mismatches. Exits with status 1 if corruption is found."
+        ),
+    )
+
     # Command to clean/remove Fetchtastic files and settings
     subparsers.add_parser(
         "clean", help="Remove Fetchtastic configuration, downloads, and cron jobs"
@@ -488,7 +697,9 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "setup":
-        display_banner()
+        from fetchtastic import setup_config
+
+        _lazy("display_banner")()
         # Display version information
         _, latest_version, update_available = get_version_info()
 
@@ -523,7 +734,7 @@ def main() -> None:
 
             # Validate and deduplicate sections
             if combined_sections:
-                allowed = set(setup_config.SETUP_SECTION_CHOICES)
+                allowed = set(SETUP_SECTION_CHOICES)
                 invalid = [s for s in combined_sections if s not in allowed]
                 if invalid:
                     parser.error(
@@ -539,13 +750,13 @@ def main() -> None:
             if update_available and latest_version:
                 _display_update_reminder(latest_version)
     elif args.command == "download":
-        display_banner()
+        _lazy("display_banner")()
         config, integration = _prepare_command_run()
         if integration is None or config is None:
             sys.exit(1)
 
         # Run the downloader
-        reset_api_tracking()
+        _lazy("reset_api_tracking")()
         _handle_download_subcommand(args, integration, config)
 
         # Check for update after download completes
@@ -557,7 +768,16 @@ def main() -> None:
         if integration is None or config is None:
             sys.exit(1)
         _perform_cache_clear(integration, config)
+    elif args.command == "verify":
+        config, config_path = _ensure_config_loaded()
+        if config_path is None or config is None:
+            sys.exit(1)
+        if not run_verify(config):
+            sys.exit(1)
     elif args.command == "topic":
+        from fetchtastic import setup_config
+        from fetchtastic.utils import coerce_bool
+
         # Display the NTFY topic and prompt to copy to clipboard
         config = setup_config.load_config()
         if config and config.get("NTFY_SERVER") and config.get("NTFY_TOPIC"):
@@ -575,8 +795,8 @@ def main() -> None:
                 text_to_copy = full_url
 
             resp = setup_config._safe_input(copy_prompt_text, default="y")
-            if utils.coerce_bool(resp, default=True):
-                success = copy_to_clipboard_func(text_to_copy)
+            if coerce_bool(resp, default=True):
+                success = _lazy("copy_to_clipboard_func")(text_to_copy)
                 if success:
                     if setup_config.is_termux():
                         print("Topic name copied to clipboard.")
@@ -615,7 +835,9 @@ def main() -> None:
             subparsers,
         )
     elif args.command == "repo":
-        display_banner()
+        from fetchtastic import setup_config
+
+        _lazy("display_banner")()
         # Display version information
         _, latest_version, update_available = get_version_info()
 
@@ -748,6 +970,11 @@ def run_clean() -> None:
 
     This operation deletes current and legacy configuration files, only Fetchtastic-managed files and directories inside the configured download directory, platform-specific integrations (for example, Windows Start Menu and startup shortcuts, non-Windows cron entries, and a Termux boot script), and the Fetchtastic log file. The removal is irreversible and requires the user to confirm interactively; non-managed files are preserved.
     """
+    import platformdirs
+
+    from fetchtastic import setup_config
+    from fetchtastic.utils import coerce_bool
+
     if not _require_interactive_or_test_clean("Clean operation"):
         return
     # Load config (if present) before deleting config files so BASE_DIR is accurate.
@@ -770,7 +997,7 @@ def run_clean() -> None:
     confirm = setup_config._safe_input(
         "Are you sure you want to proceed? [y/n] (default: no): ", default="n"
     )
-    if not utils.coerce_bool(confirm, default=False):
+    if not coerce_bool(confirm, default=False):
         print("Clean operation cancelled.")
         return
 
@@ -984,6 +1211,9 @@ def run_repo_clean(config: Dict[str, Any]) -> None:
     Parameters:
         config (dict[str, Any]): Configuration containing the repository download directory and related metadata used to locate and clean the repository files.
     """
+    from fetchtastic import setup_config
+    from fetchtastic.utils import coerce_bool
+
     if not _require_interactive_or_test_clean("Repo clean operation"):
         return
 
@@ -993,13 +1223,13 @@ def run_repo_clean(config: Dict[str, Any]) -> None:
     confirm = setup_config._safe_input(
         "Are you sure you want to proceed? [y/n] (default: no): ", default="n"
     )
-    confirmed = utils.coerce_bool(confirm, default=False)
+    confirmed = coerce_bool(confirm, default=False)
     if not confirmed:
         print("Clean operation cancelled.")
         return
 
     # Clean the repo directory using the new downloader
-    repo_downloader = RepositoryDownloader(config)
+    repo_downloader = _lazy("RepositoryDownloader")(config)
     success = repo_downloader.clean_repository_directory()
     if success:
         print("Repository directory cleaned successfully.")
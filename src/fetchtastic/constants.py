@@ -26,13 +26,29 @@ MESHTASTIC_DESKTOP_RELEASES_URL = MESHTASTIC_ANDROID_RELEASES_URL
 MESHTASTIC_GITHUB_IO_CONTENTS_URL = (
     f"{GITHUB_API_BASE}/meshtastic/meshtastic.github.io/contents"
 )
+# Recursive listing of the whole site repository at its default branch
+MESHTASTIC_GITHUB_IO_TREE_URL = (
+    f"{GITHUB_API_BASE}/meshtastic/meshtastic.github.io/git/trees/HEAD"
+)
+MESHTASTIC_GITHUB_IO_RAW_URL = (
+    "https://raw.githubusercontent.com/meshtastic/meshtastic.github.io/HEAD"
+)
 MESHTASTIC_REPO_URL = "https://meshtastic.github.io"
+# Single endpoint of the GitHub GraphQL API (token required)
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 # Network timeouts and delays (in seconds)
 GITHUB_API_TIMEOUT = 10
 NTFY_REQUEST_TIMEOUT = 10
 PRERELEASE_REQUEST_TIMEOUT = 30
 CRON_COMMAND_TIMEOUT_SECONDS = 30
+# Longest wait for another process's lock on a shared cache file before
+# proceeding without it
+FILE_LOCK_TIMEOUT_SECONDS = 10
+# How long a waiting or queued download run waits for the run already in
+# flight for its DOWNLOAD_DIR, and how often it checks
+RUN_LOCK_WAIT_TIMEOUT_SECONDS = 4 * 60 * 60
+RUN_LOCK_POLL_INTERVAL_SECONDS = 1.0
 
 API_CALL_DELAY = 0.1  # Small delay to be respectful to GitHub API
 GITHUB_MAX_PER_PAGE = 100
@@ -83,8 +99,29 @@ FIRMWARE_RELEASE_HISTORY_JSON_FILE = "firmware_release_history.json"
 PRERELEASE_TRACKING_JSON_FILE = "prerelease_tracking.json"
 PRERELEASE_COMMITS_CACHE_FILE = "prerelease_commits_cache.json"
 PRERELEASE_COMMIT_HISTORY_FILE = "prerelease_commit_history.json"
+WARM_START_SNAPSHOT_FILE = "warm_start.bin"
+MIGRATIONS_STATE_FILE = "migrations.json"
+REPO_TREE_CACHE_FILE = "repo_tree.json"
+# ETags and directory SHAs of meshtastic.github.io Contents listings revalidated
+# with conditional requests, keyed by parent path
+REPO_LISTINGS_CACHE_FILE = "repo_listings.json"
+# Cached commit-list responses (newest first) that commit timestamp lookups can
+# harvest before calling the API, keyed by lowercase "owner/repo"
+COMMIT_LIST_CACHE_FILES = {
+    "meshtastic/meshtastic.github.io": PRERELEASE_COMMITS_CACHE_FILE,
+}
 WINDOWS_SHORTCUT_FILE = "fetchtastic_yaml.lnk"
 
+# Supported setup sections for partial reconfiguration (`fetchtastic setup --section`)
+SETUP_SECTION_CHOICES = {
+    "base",  # Base directory and environment-specific options
+    "app",  # Client app asset download preferences (APKs + Desktop installers)
+    "firmware",  # Firmware download preferences (including prereleases/extraction)
+    "notifications",  # NTFY configuration
+    "automation",  # Cron/startup automation choices
+    "github",  # GitHub API token configuration
+}
+
 # Regex patterns for parsing prerelease commit messages
 PRERELEASE_ADD_COMMIT_PATTERN = (
     r"^(\d+\.\d+\.\d+)\.([a-f0-9]{6,})\s+meshtastic/firmware@(?:[a-f0-9]{6,})"
@@ -97,6 +134,8 @@ PRERELEASE_DELETE_COMMIT_PATTERN = (
 DEFAULT_PRERELEASE_ACTIVE = False
 DEFAULT_PRERELEASE_STATUS = "unknown"
 DEFAULT_PRERELEASE_COMMITS_TO_FETCH = 40
+# Upper bound on the locally merged prerelease commit log (newest first)
+PRERELEASE_COMMIT_LOG_MAX_ENTRIES = 200
 DEFAULT_FIRMWARE_VERSIONS_TO_KEEP = 2
 DEFAULT_ANDROID_VERSIONS_TO_KEEP = 2
 DEFAULT_APP_VERSIONS_TO_KEEP = 2
@@ -116,6 +155,11 @@ DEFAULT_ADD_CHANNEL_SUFFIXES_TO_DIRECTORIES = True
 DEFAULT_PRESERVE_LEGACY_FIRMWARE_BASE_DIRS = True
 DEFAULT_FILTER_REVOKED_RELEASES = True
 DEFAULT_CREATE_LATEST_SYMLINKS = True
+# Opt-in: answer release and site-head lookups from one GraphQL query (token required)
+DEFAULT_USE_GITHUB_GRAPHQL = False
+# What a download run does when another run holds its DOWNLOAD_DIR:
+# "exit", "wait" (reuse the other run's results) or "queue" (run afterwards)
+DEFAULT_CONCURRENT_RUN_MODE = "exit"
 STORAGE_CHANNEL_SUFFIXES = frozenset({"alpha", "beta", "rc"})
 MAX_RETRY_DELAY = 60  # Cap exponential backoff at 60 seconds
 EXECUTABLE_PERMISSIONS = 0o755
@@ -230,6 +274,8 @@ DEVICE_HARDWARE_CACHE_HOURS = 24
 
 # Cache configuration
 COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS = 24
+# Concurrent GitHub API lookups when resolving a batch of commit timestamps
+COMMIT_TIMESTAMP_FETCH_WORKERS = 4
 
 # Cache schema versions - bump when cache format changes
 
@@ -245,12 +291,16 @@ COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS = 24
 # - prerelease: boolean, required
 # - published_at: ISO-8601 string or null, optional
 #
+# Since 2.0 entries hold the compact projection built by
+# github_source.project_release_data (only the release and asset fields fetchtastic
+# reads) instead of the verbatim API payload.
+#
 # Schema versioning:
 # - Entries with mismatched schema_version are rejected (cache miss).
 # - No migration is performed; fresh data is automatically fetched from GitHub API.
 # - Given the short cache expiry, users will transparently upgrade.
 # - When bumping version: update this constant and mention in release notes.
-GITHUB_RELEASES_CACHE_SCHEMA_VERSION = "1.0"
+GITHUB_RELEASES_CACHE_SCHEMA_VERSION = "2.0"
 
 # Releases API responses are cached for 10 minutes to balance API rate limiting
 # with reasonably fresh data. Users can use --force-download to bypass cache.
@@ -259,6 +309,11 @@ RELEASES_CACHE_EXPIRY_HOURS = 10 / 60  # 10 minutes (in hours)
 FIRMWARE_PRERELEASE_DIR_CACHE_EXPIRY_SECONDS = 24 * 60 * 60  # 24 hours
 # Keep prerelease commit history fresh for a typical download run (5 minutes)
 PRERELEASE_COMMITS_CACHE_EXPIRY_SECONDS = 5 * 60  # 5 minutes
+# The recursive repo tree is revalidated with a conditional request once this old
+REPO_TREE_CACHE_EXPIRY_SECONDS = 5 * 60  # 5 minutes
+# Size of the GraphQL metadata batch; larger REST requests are not served from it
+GRAPHQL_RELEASES_PER_REPO = 30
+GRAPHQL_ASSETS_PER_RELEASE = 100
 
 # File Type Patterns (non-device-specific patterns)
 FILE_TYPE_PREFIXES = {
@@ -346,9 +401,10 @@ class NightlyRunState(Enum):
       pointer, and executable-metadata repair ran without rewriting tracking
       or reporting a download. Also set when a transaction finalizes but every
       selected asset was ``was_skipped=True`` (reconciliation, not download).
-    - ``ALREADY_COMPLETE`` — legacy alias retained for tests that predate
-      ``MAINTENANCE_ONLY``; set when ``should_process_nightly`` returns False
-      before maintenance runs.
+    - ``ALREADY_COMPLETE`` — the ``firmware-nightly/`` tree SHA and selection
+      patterns match those recorded for the tracked, finalized build and its
+      recorded assets are all on disk, so the listing and validation were
+      skipped (local maintenance still ran). Not a download; "up to date".
     - ``ATTEMPTED_INCOMPLETE`` — assets were downloaded but at least one
       failed; tracking, pointer, and cleanup deferred. Tracking failure
       during finalization also lands here.
@@ -10,7 +10,7 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import platformdirs
@@ -102,6 +102,22 @@ class DeviceHardwareManager:
         self._device_patterns: Optional[Set[str]] = None
         self._last_fetch_time: Optional[float] = None
 
+        # Lookup indexes derived from _device_patterns (see _get_pattern_index)
+        self._indexed_patterns: Optional[Set[str]] = None
+        self._exact_index: FrozenSet[str] = frozenset()
+        self._prefix_index: FrozenSet[str] = frozenset()
+        self._pattern_matches: Dict[str, bool] = {}
+
+    def _current_device_patterns(self) -> Set[str]:
+        """
+        Return the in-memory device pattern set, (re)loading it when missing or expired.
+
+        Unlike get_device_patterns() this returns the internal set itself; callers must not mutate it.
+        """
+        if self._device_patterns is None or self._is_cache_expired():
+            self._device_patterns = self._load_device_patterns()
+        return self._device_patterns
+
     def get_device_patterns(self) -> Set[str]:
         """
         Get the current set of device patterns (platformioTarget values).
@@ -111,11 +127,36 @@ class DeviceHardwareManager:
         Returns:
             Set[str]: A set of normalized device pattern strings (e.g., {"rak4631", "tbeam"}).
         """
-        if self._device_patterns is None or self._is_cache_expired():
-            self._device_patterns = self._load_device_patterns()
-
         # hand back a copy to keep cache safe from outside mutation
-        return set(self._device_patterns)
+        return set(self._current_device_patterns())
+
+    def _get_pattern_index(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        Return the lowercase exact-match and prefix indexes for the current device patterns.
+
+        The prefix index holds every leading segment of a known pattern that ends at a
+        "-" or "_" boundary (e.g. "heltec" and "heltec-wsl" for "heltec-wsl-v3"). Both
+        indexes, and the per-pattern result memo, are rebuilt only when the pattern set
+        is reloaded or replaced.
+
+        Returns:
+            Tuple[FrozenSet[str], FrozenSet[str]]: (exact_index, prefix_index).
+        """
+        device_patterns = self._current_device_patterns()
+        if device_patterns is not self._indexed_patterns:
+            exact: Set[str] = set()
+            prefixes: Set[str] = set()
+            for device_pattern in device_patterns:
+                device_pattern_lower = device_pattern.lower()
+                exact.add(device_pattern_lower)
+                for index, char in enumerate(device_pattern_lower):
+                    if char in "-_":
+                        prefixes.add(device_pattern_lower[:index])
+            self._exact_index = frozenset(exact)
+            self._prefix_index = frozenset(prefixes)
+            self._pattern_matches = {}
+            self._indexed_patterns = device_patterns
+        return self._exact_index, self._prefix_index
 
     def is_device_pattern(self, user_pattern: str) -> bool:
         """
@@ -132,24 +173,21 @@ class DeviceHardwareManager:
         Returns:
             bool: True when the pattern matches a known device pattern, otherwise False.
         """
-        device_patterns = self.get_device_patterns()
+        exact_index, prefix_index = self._get_pattern_index()
+        cached = self._pattern_matches.get(user_pattern)
+        if cached is not None:
+            return cached
 
         # Remove trailing dash/underscore for comparison if present and normalize case
         clean_pattern = user_pattern.rstrip("-_ ").lower()
 
-        for device_pattern in device_patterns:
-            # Check if pattern matches exactly or is contained in device pattern (case-insensitive)
-            device_pattern_lower = device_pattern.lower()
-            if clean_pattern == device_pattern_lower or (
-                len(clean_pattern) >= MIN_DEVICE_PATTERN_PREFIX_LEN
-                and (
-                    device_pattern_lower.startswith(f"{clean_pattern}-")
-                    or device_pattern_lower.startswith(f"{clean_pattern}_")
-                )
-            ):
-                return True
-
-        return False
+        # Exact match, or a known pattern starting with "<clean_pattern>-" / "<clean_pattern>_"
+        result = clean_pattern in exact_index or (
+            len(clean_pattern) >= MIN_DEVICE_PATTERN_PREFIX_LEN
+            and clean_pattern in prefix_index
+        )
+        self._pattern_matches[user_pattern] = result
+        return result
 
     def _load_device_patterns(self) -> Set[str]:
         """
@@ -15,6 +15,7 @@ Core Components:
 - version: Version management utilities
 - cache: Caching infrastructure
 - files: File operations and utilities
+- selection: Precompiled include/exclude asset selection matchers
 
 Async Support:
 - async_client: AsyncGitHubClient for async HTTP operations
@@ -48,7 +49,8 @@ from .interfaces import (
 from .orchestrator import DownloadOrchestrator
 from .prerelease_history import PrereleaseHistoryManager
 from .repository import RepositoryDownloader
-from .version import VersionManager
+from .selection import SelectionMatcher
+from .version import VersionKey, VersionManager
 
 __all__ = [
     # Interfaces
@@ -79,9 +81,11 @@ __all__ = [
     "DownloadCLIIntegration",
     # Core components
     "VersionManager",
+    "VersionKey",
     "PrereleaseHistoryManager",
     "CacheManager",
     "FileOperations",
+    "SelectionMatcher",
     # Configuration utilities
     "get_prerelease_patterns",
 ]
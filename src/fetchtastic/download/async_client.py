@@ -17,7 +17,7 @@ import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 import aiofiles  # type: ignore[import-untyped]
 import aiohttp
@@ -40,6 +40,14 @@ from fetchtastic.constants import (
     RATE_LIMIT_REMAINING_DEFAULT,
 )
 from fetchtastic.log_utils import logger
+from fetchtastic.run_metrics import METRIC_BYTES_DOWNLOADED, increment_metric
+from fetchtastic.single_flight import AsyncSingleFlight
+from fetchtastic.tracing import (
+    TRACE_CATEGORY_API,
+    TRACE_CATEGORY_DOWNLOAD,
+    add_throughput,
+    trace_span,
+)
 
 from .github_source import create_asset_from_github_data
 from .interfaces import Asset, Pathish, Release
@@ -96,6 +104,7 @@ class AsyncGitHubClient:
         timeout: float = DEFAULT_REQUEST_TIMEOUT,
         max_concurrent: int = 5,
         connector_limit: int = 10,
+        github_tokens: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Initialize the async GitHub client.
@@ -105,6 +114,9 @@ class AsyncGitHubClient:
             timeout (float): Request timeout in seconds.
             max_concurrent (int): Maximum concurrent downloads (semaphore limit).
             connector_limit (int): Maximum total connections in the pool.
+            github_tokens (Optional[Sequence[str]]): Token pool; when given, each API
+                request uses the token (including `github_token`) with the most
+                remaining rate-limit budget.
         """
 
         def _clamp_positive(name: str, value: Any, default: int) -> int:
@@ -135,12 +147,15 @@ class AsyncGitHubClient:
             return parsed
 
         self.github_token = github_token
+        self.github_tokens = list(dict.fromkeys(t for t in github_tokens or () if t))
         self.timeout = ClientTimeout(total=timeout)
         self.max_concurrent = _clamp_positive("max_concurrent", max_concurrent, 5)
         self.connector_limit = _clamp_positive("connector_limit", connector_limit, 10)
         self._session: Optional[ClientSession] = None
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
         self._closed: bool = False
+        # Identical concurrent release lookups and downloads run once
+        self._flights = AsyncSingleFlight()
 
         # Rate limit tracking
         self._rate_limit_remaining: Dict[str, int] = {}
@@ -201,10 +216,37 @@ class AsyncGitHubClient:
             "X-GitHub-Api-Version": "2022-11-28",
             "User-Agent": get_user_agent(),
         }
-        if self.github_token:
+        # Pooled clients authenticate per request (see _select_token)
+        if self.github_token and not self.github_tokens:
             headers["Authorization"] = f"token {self.github_token}"
         return headers
 
+    def _select_token(self) -> Optional[str]:
+        """
+        Return the token for the next API request.
+
+        Without a pool this is the client's token. With a pool, the token with the most
+        remaining budget in the per-token-hash tracking is chosen, skipping exhausted
+        tokens; None (unauthenticated) only when all of them are exhausted.
+        """
+        if not self.github_tokens:
+            return self.github_token
+        from fetchtastic.utils import choose_token_by_budget, github_token_hash
+
+        def _budget(token: str) -> Optional[Tuple[int, Optional[datetime]]]:
+            token_hash = github_token_hash(token)
+            if token_hash not in self._rate_limit_remaining:
+                return None
+            return (
+                self._rate_limit_remaining[token_hash],
+                self._rate_limit_reset.get(token_hash),
+            )
+
+        candidates = ([self.github_token] if self.github_token else []) + list(
+            self.github_tokens
+        )
+        return choose_token_by_budget(dict.fromkeys(candidates), _budget)
+
     async def close(self) -> None:
         """Close the client session and release resources."""
         if self._session and not self._session.closed:
@@ -275,6 +317,8 @@ class AsyncGitHubClient:
             limit (Optional[int]): Maximum number of releases to request; must be an integer >= 0. A value of 0 returns an empty list without making a network request. If omitted, no explicit per-page limit is applied.
             params (Optional[Dict[str, Any]]): Additional query parameters to include in the request.
 
+        Concurrent calls with the same arguments share one request and its result.
+
         Returns:
             List[Release]: Parsed Release objects from the response, newest first.
 
@@ -282,12 +326,35 @@ class AsyncGitHubClient:
             ValueError: If `limit` cannot be interpreted as an integer >= 0.
             AsyncDownloadError: On HTTP, network, or rate-limit errors while fetching or parsing releases.
         """
+        key = (
+            "GET",
+            url,
+            limit,
+            tuple(
+                sorted(
+                    (str(name), str(value)) for name, value in (params or {}).items()
+                )
+            ),
+        )
+        return await self._flights.do(
+            key, lambda: self._fetch_releases(url, limit, params)
+        )
+
+    async def _fetch_releases(
+        self,
+        url: str,
+        limit: Optional[int],
+        params: Optional[Dict[str, Any]],
+    ) -> List[Release]:
+        """Request and parse one releases page for `get_releases`, which documents the parameters."""
         session = await self._ensure_session()
 
         # Create token hash for rate limit tracking
-        token_hash = hashlib.sha256(
-            (self.github_token or "no-token").encode()
-        ).hexdigest()[:16]
+        token = self._select_token()
+        token_hash = hashlib.sha256((token or "no-token").encode()).hexdigest()[:16]
+        request_kwargs: Dict[str, Any] = {}
+        if self.github_tokens and token:
+            request_kwargs["headers"] = {"Authorization": f"token {token}"}
 
         limit_int: Optional[int] = None
         if limit is not None:
@@ -319,34 +386,44 @@ class AsyncGitHubClient:
                 # Add small delay to be respectful to GitHub API
                 await asyncio.sleep(API_CALL_DELAY)
 
-                async with session.get(url, params=request_params) as response:
-                    self._update_rate_limits(token_hash, response)
-
-                    if response.status == 403:
-                        raw_remaining = response.headers.get("X-RateLimit-Remaining")
-                        try:
-                            remaining = (
-                                int(raw_remaining) if raw_remaining is not None else 0
+                with trace_span(
+                    "github_api_request", TRACE_CATEGORY_API, url=url
+                ) as span:
+                    async with session.get(
+                        url, params=request_params, **request_kwargs
+                    ) as response:
+                        self._update_rate_limits(token_hash, response)
+
+                        if response.status == 403:
+                            raw_remaining = response.headers.get(
+                                "X-RateLimit-Remaining"
                             )
-                        except (TypeError, ValueError):
-                            remaining = None
-                        if remaining == 0:
-                            reset_time = self._rate_limit_reset.get(token_hash)
+                            try:
+                                remaining = (
+                                    int(raw_remaining)
+                                    if raw_remaining is not None
+                                    else 0
+                                )
+                            except (TypeError, ValueError):
+                                remaining = None
+                            if remaining == 0:
+                                reset_time = self._rate_limit_reset.get(token_hash)
+                                raise AsyncDownloadError(
+                                    f"GitHub API rate limit exceeded. Resets at {reset_time}",
+                                    url=url,
+                                    status_code=403,
+                                    is_retryable=True,
+                                )
                             raise AsyncDownloadError(
-                                f"GitHub API rate limit exceeded. Resets at {reset_time}",
+                                "GitHub API access forbidden",
                                 url=url,
                                 status_code=403,
-                                is_retryable=True,
+                                is_retryable=False,
                             )
-                        raise AsyncDownloadError(
-                            "GitHub API access forbidden",
-                            url=url,
-                            status_code=403,
-                            is_retryable=False,
-                        )
 
-                    response.raise_for_status()
-                    data = await response.json()
+                        response.raise_for_status()
+                        data = await response.json()
+                    span["status"] = response.status
 
             if not isinstance(data, list):
                 logger.warning(
@@ -495,39 +572,47 @@ class AsyncGitHubClient:
             try:
                 start_time = time.time()
 
-                async with session.get(url) as response:
-                    if response.status >= HTTP_STATUS_ERROR_THRESHOLD:
-                        raise AsyncDownloadError(
-                            f"HTTP error {response.status}",
-                            url=url,
-                            status_code=response.status,
-                            is_retryable=response.status >= HTTP_STATUS_RETRY_THRESHOLD,
-                        )
-
-                    raw_content_length = response.headers.get("Content-Length")
-                    try:
-                        total_size = (
-                            int(raw_content_length) if raw_content_length else 0
-                        )
-                    except (TypeError, ValueError):
-                        total_size = 0
-                    downloaded = 0
-
-                    async with aiofiles.open(temp_path, "wb") as f:
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            await f.write(chunk)
-                            downloaded += len(chunk)
-
-                            if progress_callback:
-                                try:
-                                    result = progress_callback(
-                                        downloaded, total_size or None, target.name
-                                    )
-                                    if inspect.isawaitable(result):
-                                        await result
-                                except Exception as cb_err:
-                                    logger.debug(f"Progress callback error: {cb_err}")
+                with trace_span(target.name, TRACE_CATEGORY_DOWNLOAD, url=url) as span:
+                    async with session.get(url) as response:
+                        if response.status >= HTTP_STATUS_ERROR_THRESHOLD:
+                            raise AsyncDownloadError(
+                                f"HTTP error {response.status}",
+                                url=url,
+                                status_code=response.status,
+                                is_retryable=response.status
+                                >= HTTP_STATUS_RETRY_THRESHOLD,
+                            )
 
+                        raw_content_length = response.headers.get("Content-Length")
+                        try:
+                            total_size = (
+                                int(raw_content_length) if raw_content_length else 0
+                            )
+                        except (TypeError, ValueError):
+                            total_size = 0
+                        downloaded = 0
+
+                        async with aiofiles.open(temp_path, "wb") as f:
+                            async for chunk in response.content.iter_chunked(
+                                chunk_size
+                            ):
+                                await f.write(chunk)
+                                downloaded += len(chunk)
+
+                                if progress_callback:
+                                    try:
+                                        result = progress_callback(
+                                            downloaded, total_size or None, target.name
+                                        )
+                                        if inspect.isawaitable(result):
+                                            await result
+                                    except Exception as cb_err:
+                                        logger.debug(
+                                            f"Progress callback error: {cb_err}"
+                                        )
+                    add_throughput(span, downloaded, time.time() - start_time)
+
+                increment_metric(METRIC_BYTES_DOWNLOADED, downloaded)
                 elapsed = time.time() - start_time
                 file_size_mb = downloaded / BYTES_PER_MEGABYTE
                 logger.debug(
@@ -602,6 +687,8 @@ class AsyncGitHubClient:
         """
         Attempt to download a URL to a local path, retrying with exponential backoff on retryable failures.
 
+        Concurrent calls for the same URL and target path share one download and its outcome.
+
         Parameters:
             url (str): Source URL to download.
             target_path (Pathish): Destination path where the file will be written.
@@ -616,6 +703,28 @@ class AsyncGitHubClient:
         Raises:
             AsyncDownloadError: If a non-retryable error occurs or all retry attempts are exhausted.
         """
+        return await self._flights.do(
+            ("download", url, os.path.abspath(os.fspath(target_path))),
+            lambda: self._download_with_retries(
+                url,
+                target_path,
+                max_retries,
+                retry_delay,
+                backoff_factor,
+                progress_callback,
+            ),
+        )
+
+    async def _download_with_retries(
+        self,
+        url: str,
+        target_path: Pathish,
+        max_retries: int,
+        retry_delay: float,
+        backoff_factor: float,
+        progress_callback: Optional[Any],
+    ) -> bool:
+        """Run the download attempts for `download_file_with_retry`, which documents the parameters."""
         last_error: Optional[Exception] = None
         delay = max(0.0, retry_delay)
 
@@ -648,6 +757,7 @@ class AsyncGitHubClient:
 async def create_async_client(
     github_token: Optional[str] = None,
     max_concurrent: int = 5,
+    github_tokens: Optional[Sequence[str]] = None,
 ) -> AsyncIterator[AsyncGitHubClient]:
     """
     Provide a configured AsyncGitHubClient and ensure it is closed after use.
@@ -655,11 +765,16 @@ async def create_async_client(
     Parameters:
         github_token (Optional[str]): GitHub personal access token used for Authorization header; if `None`, requests are unauthenticated.
         max_concurrent (int): Maximum number of concurrent network operations the client will allow.
+        github_tokens (Optional[Sequence[str]]): Optional token pool rotated by remaining rate-limit budget.
 
     Returns:
         AsyncGitHubClient: Configured client instance; it will be closed when the context manager exits.
     """
-    client = AsyncGitHubClient(github_token=github_token, max_concurrent=max_concurrent)
+    client = AsyncGitHubClient(
+        github_token=github_token,
+        max_concurrent=max_concurrent,
+        github_tokens=github_tokens,
+    )
     try:
         yield client
     finally:
@@ -22,6 +22,7 @@ from fetchtastic.constants import (
     ERROR_TYPE_UNKNOWN,
     ERROR_TYPE_VALIDATION,
 )
+from fetchtastic.hashing import get_hash_executor
 from fetchtastic.log_utils import logger
 from fetchtastic.utils import calculate_sha256, save_file_hash
 
@@ -111,15 +112,18 @@ class AsyncDownloaderMixin(AsyncDownloadCoreMixin):
 
         try:
             loop = asyncio.get_running_loop()
+            executor = get_hash_executor()
             if file_path.suffix.lower() == ".zip":
-                if not await loop.run_in_executor(None, is_zip_intact, str(file_path)):
+                if not await loop.run_in_executor(
+                    executor, is_zip_intact, str(file_path)
+                ):
                     return False
 
             # Verify hash
             from fetchtastic.utils import verify_file_integrity
 
             return await loop.run_in_executor(
-                None, verify_file_integrity, str(file_path)
+                executor, verify_file_integrity, str(file_path)
             )
 
         except (OSError, zipfile.BadZipFile) as e:
@@ -145,7 +149,7 @@ class AsyncDownloaderMixin(AsyncDownloadCoreMixin):
             if hash_value:
                 save_file_hash(str(file_path), hash_value)
 
-        await loop.run_in_executor(None, _compute_and_save)
+        await loop.run_in_executor(get_hash_executor(), _compute_and_save)
 
     async def async_download_release(
         self,
@@ -10,18 +10,19 @@ Supports both synchronous and asynchronous download operations:
 """
 
 import asyncio
-import fnmatch
 import os
 import zipfile
 from abc import ABC
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
 
 from requests.exceptions import RequestException  # type: ignore[import-untyped]
 
 from fetchtastic import utils
+from fetchtastic.hashing import get_hash_executor
 from fetchtastic.log_utils import logger
-from fetchtastic.utils import load_file_hash, matches_selected_patterns
+from fetchtastic.run_metrics import METRIC_FILES_STATTED, increment_metric
+from fetchtastic.utils import load_file_hash
 
 from .async_core import AsyncDownloadCoreMixin
 from .cache import CacheManager
@@ -32,6 +33,7 @@ from .files import (
     strip_unwanted_chars,
 )
 from .interfaces import Asset, Downloader, DownloadResult, Pathish
+from .selection import get_selection_matcher
 from .version import VersionManager
 
 if TYPE_CHECKING:
@@ -210,8 +212,11 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         """
         try:
             loop = asyncio.get_running_loop()
+            executor = get_hash_executor()
             if file_path.suffix.lower() == ".zip":
-                if not await loop.run_in_executor(None, is_zip_intact, str(file_path)):
+                if not await loop.run_in_executor(
+                    executor, is_zip_intact, str(file_path)
+                ):
                     return False
 
             # Require a trusted hash before considering the file verified.
@@ -226,7 +231,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
 
             # Verify file integrity using existing sync utility
             return await loop.run_in_executor(
-                None, utils.verify_file_integrity, str(file_path)
+                executor, utils.verify_file_integrity, str(file_path)
             )
 
         except (OSError, zipfile.BadZipFile) as e:
@@ -253,7 +258,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             if hash_value:
                 utils.save_file_hash(str(file_path), hash_value)
 
-        await loop.run_in_executor(None, _compute_and_save)
+        await loop.run_in_executor(get_hash_executor(), _compute_and_save)
 
     async def _async_verify_existing_file(self, file_path: Path) -> bool:
         """
@@ -322,6 +327,20 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             return self.file_operations.verify_file_hash(str(file_path), expected_hash)
         return utils.verify_file_integrity(str(file_path))
 
+    def verify_files(self, file_paths: List[str]) -> Dict[str, bool]:
+        """
+        Verify a batch of files against their stored hashes, hashing them in parallel.
+
+        Files without a stored hash get one recorded, as with `verify`.
+
+        Parameters:
+            file_paths (List[str]): Paths of the files to verify.
+
+        Returns:
+            Dict[str, bool]: Verification result for each path.
+        """
+        return utils.verify_files_integrity(file_paths)
+
     def cleanup_old_versions(
         self,
         keep_limit: int,
@@ -453,7 +472,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         Returns:
             bool: True if filename matches any pattern, False otherwise
         """
-        return matches_selected_patterns(filename, patterns)
+        return get_selection_matcher(patterns).matches(filename)
 
     def _matches_exclude_patterns(self, filename: str, patterns: List[str]) -> bool:
         """
@@ -469,10 +488,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         if not patterns:
             return False  # No exclude patterns means don't exclude anything
 
-        filename_lower = filename.lower()
-        return any(
-            fnmatch.fnmatch(filename_lower, pattern.lower()) for pattern in patterns
-        )
+        return get_selection_matcher(None, patterns).is_excluded(filename)
 
     def _sanitize_required(self, component: str, label: str) -> str:
         """
@@ -511,6 +527,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         error_details: Optional[Dict[str, Any]] = None,
         http_status_code: Optional[int] = None,
         was_skipped: bool = False,
+        asset_platform: Optional[str] = None,
     ) -> DownloadResult:
         """
         Create a DownloadResult that encapsulates the outcome and metadata of a release asset download attempt.
@@ -529,6 +546,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             error_details (Optional[Dict[str, Any]]): Additional structured information about the error.
             http_status_code (Optional[int]): HTTP status code returned by the request, if applicable.
             was_skipped (bool): Whether the asset was intentionally skipped (not attempted).
+            asset_platform (Optional[str]): Client app platform of the asset (``Asset.platform``), if any.
 
         Returns:
             DownloadResult: Object containing the result fields and normalized Path for the file.
@@ -547,6 +565,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             error_details=error_details,
             http_status_code=http_status_code,
             was_skipped=was_skipped,
+            asset_platform=asset_platform,
         )
 
     def cleanup_file(self, file_path: str) -> bool:
@@ -566,7 +585,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         *,
         release_dir: str,
         release_tag: str,
-        body: Optional[str],
+        body: Union[Optional[str], Callable[[], Optional[str]]],
         base_dir: str,
         notes_prefix: Optional[str] = None,
     ) -> Optional[str]:
@@ -578,7 +597,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
         Parameters:
                 release_dir (str): Directory where the release notes file should be placed.
                 release_tag (str): Tag used to derive a safe filename component; will be sanitized.
-                body (Optional[str]): Release notes content; nothing is written if empty or whitespace after sanitization.
+                body (Union[Optional[str], Callable[[], Optional[str]]]): Release notes content, or a callable returning it that is only invoked when the notes file has to be written; nothing is written if empty or whitespace after sanitization.
                 base_dir (str): Base download directory used to verify the notes path does not escape the allowed location.
 
         Returns:
@@ -643,6 +662,11 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             )
             return None
 
+        if callable(body):
+            body = body()
+            if not body:
+                return None
+
         notes_content = strip_unwanted_chars(body)
         if not notes_content.strip():
             return None
@@ -676,6 +700,7 @@ class BaseDownloader(AsyncDownloadCoreMixin, Downloader, ABC):
             True if the asset file exists and passes size, hash, and ZIP integrity checks, False otherwise.
         """
         target_path = self.get_target_path_for_release(release_tag, asset.name)
+        increment_metric(METRIC_FILES_STATTED)
         if not os.path.exists(target_path):
             return False
 
@@ -7,29 +7,49 @@ commit timestamps, and other download-related data.
 
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import IO, Any, Callable, Optional, cast
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple, cast
 from urllib.parse import urlencode
 
 import requests  # type: ignore[import-untyped]
 
 from fetchtastic.constants import (
+    COMMIT_LIST_CACHE_FILES,
     COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS,
+    COMMIT_TIMESTAMP_FETCH_WORKERS,
     FIRMWARE_PRERELEASE_DIR_CACHE_EXPIRY_SECONDS,
     GITHUB_API_BASE,
     GITHUB_API_TIMEOUT,
     GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
     MESHTASTIC_GITHUB_IO_CONTENTS_URL,
+    MESHTASTIC_GITHUB_IO_TREE_URL,
     RELEASES_CACHE_EXPIRY_HOURS,
+    REPO_LISTINGS_CACHE_FILE,
+    REPO_TREE_CACHE_EXPIRY_SECONDS,
+    REPO_TREE_CACHE_FILE,
+    WARM_START_SNAPSHOT_FILE,
 )
+from fetchtastic.file_lock import file_lock
 from fetchtastic.log_utils import logger
+from fetchtastic.run_metrics import record_cache_lookup
 from fetchtastic.utils import (
     make_github_api_request,
     track_api_cache_hit,
     track_api_cache_miss,
 )
 
-from .files import _atomic_write, _atomic_write_json
+from .files import _atomic_write, _atomic_write_bytes, _atomic_write_json
+from .github_graphql import GraphQLMetadataSource
+from .repo_tree import RepoTree
+
+# Logical cache names used for per-cache hit ratios in run metrics
+RELEASES_CACHE_NAME = "releases"
+COMMIT_TIMESTAMPS_CACHE_NAME = "commit_timestamps"
+REPO_TREE_CACHE_NAME = "repo_tree"
 
 
 def parse_iso_datetime_utc(value: Any) -> Optional[datetime]:
@@ -53,6 +73,15 @@ def parse_iso_datetime_utc(value: Any) -> Optional[datetime]:
     return parsed
 
 
+@dataclass(slots=True)
+class ReleasesFreshness:
+    """Freshness of the releases cache entries read or written during a tracked block."""
+
+    # Earliest time (epoch seconds) at which one of those entries stops being served
+    # from the cache; None if no entry was read from or written to the cache.
+    fresh_until: Optional[float] = None
+
+
 class CacheManager:
     """
     Manages caching of download-related data including releases, commit timestamps,
@@ -70,6 +99,21 @@ class CacheManager:
         """
         self.cache_dir = cache_dir or self._get_default_cache_dir()
         self._ensure_cache_dir_exists()
+        # Per-thread stack of trackers opened by track_releases_freshness()
+        self._freshness_trackers = threading.local()
+        # (tree or None if unavailable, checked_at, etag) for the recursive repo tree
+        self._repo_tree_state: Optional[
+            Tuple[Optional[RepoTree], datetime, Optional[str]]
+        ] = None
+        # When this run last revalidated the repo tree on request (force_refresh);
+        # lookups of paths missing from the tree do not force another one.
+        self._repo_tree_revalidated_at: Optional[datetime] = None
+        # When this run last had the repo tree confirmed by GitHub (a fetch, a 304 or
+        # the GraphQL head tree); forced refreshes later in the run reuse it.
+        self._repo_tree_confirmed_at: Optional[datetime] = None
+        # Optional GraphQL batch consulted before REST metadata requests (see
+        # github_graphql); set by the orchestrator when enabled.
+        self.metadata_source: Optional[GraphQLMetadataSource] = None
 
     def get_cache_file_path(self, cache_name: str, suffix: str = ".json") -> str:
         """
@@ -158,6 +202,15 @@ class CacheManager:
         """
         return _atomic_write_json(file_path, data)
 
+    def atomic_write_bytes(self, file_path: str, data: bytes) -> bool:
+        """
+        Atomically write binary `data` to the specified filesystem path.
+
+        Returns:
+            bool: `True` if the file was written successfully, `False` otherwise.
+        """
+        return _atomic_write_bytes(file_path, data)
+
     def read_json(self, file_path: str) -> Optional[dict[str, Any]]:
         """
         Load and parse a JSON object from the specified file path.
@@ -181,6 +234,33 @@ class CacheManager:
             logger.error(f"Could not read JSON file {file_path}: {e}")
             return None
 
+    def update_json(
+        self, file_path: str, update: Callable[[dict[str, Any]], bool]
+    ) -> bool:
+        """
+        Read-modify-write a JSON cache file that other fetchtastic processes may also update.
+
+        Under the file's inter-process lock (see ``fetchtastic.file_lock``) the current
+        contents are re-read and passed to `update`, which modifies the mapping in place
+        and returns whether it should be written. Entries written by other processes
+        since this one last read the file are therefore kept rather than overwritten.
+        `update` runs inside the lock and must not perform network I/O.
+
+        Parameters:
+            file_path (str): JSON cache file to update.
+            update (Callable[[dict[str, Any]], bool]): Mutates the current contents (an empty dict if the file is missing or unreadable); returns False to skip the write.
+
+        Returns:
+            bool: `True` if the file was written, `False` otherwise.
+        """
+        with file_lock(file_path):
+            data = self.read_json(file_path)
+            if not isinstance(data, dict):
+                data = {}
+            if not update(data):
+                return False
+            return self.atomic_write_json(file_path, data)
+
     def read_json_with_backward_compatibility(
         self, file_path: str, key_mapping: Optional[dict[str, str]] = None
     ) -> Optional[dict[str, Any]]:
@@ -295,6 +375,7 @@ class CacheManager:
             Any: The data returned by `fetcher_func` and stored under `data_field_name` in the cache, or an empty list on fetch/parse errors.
         """
         now = datetime.now(timezone.utc)
+        metrics_name = os.path.splitext(os.path.basename(cache_file))[0]
 
         cache = self.read_json(cache_file)
         if not isinstance(cache, dict):
@@ -314,6 +395,7 @@ class CacheManager:
                             path_description or "data",
                             age_s,
                         )
+                        record_cache_lookup(metrics_name, hit=True)
                         return data
                     logger.debug(
                         "Cache stale for %s (age %.0fs >= %ss); refreshing",
@@ -322,13 +404,16 @@ class CacheManager:
                         cache_expiry_seconds,
                     )
 
+        record_cache_lookup(metrics_name, hit=False)
         try:
             fresh_data = fetcher_func()
-            cache[cache_key] = {
-                data_field_name: fresh_data,
-                "cached_at": now.isoformat(),
-            }
-            self.atomic_write_json(cache_file, cache)
+            entry = {data_field_name: fresh_data, "cached_at": now.isoformat()}
+
+            def store_entry(current: dict[str, Any]) -> bool:
+                current[cache_key] = entry
+                return True
+
+            self.update_json(cache_file, store_entry)
             return fresh_data
         except (ValueError, KeyError, TypeError) as e:
             # Note: The specific error message will be logged by the fetcher_func
@@ -341,6 +426,159 @@ class CacheManager:
             logger.debug("Could not fetch %s: %s", path_description or "data", exc)
             return []
 
+    def get_repo_tree(
+        self,
+        *,
+        force_refresh: bool = False,
+        github_token: Optional[str] = None,
+        allow_env_token: bool = True,
+    ) -> Optional[RepoTree]:
+        """
+        Get the recursive meshtastic.github.io tree, cached by tree SHA.
+
+        The tree is kept in memory and in ``repo_tree.json``. Once it is older than
+        ``REPO_TREE_CACHE_EXPIRY_SECONDS`` (or when `force_refresh` is set) it is
+        revalidated with a conditional request, so an unchanged revision costs a single
+        ``304`` response and a changed one a single recursive listing. When the GraphQL
+        metadata batch reports the cached tree as the head revision, no request is made.
+        A tree GitHub already confirmed during this run counts as revalidated, so the
+        run's forced refreshes share one request.
+
+        Parameters:
+            force_refresh (bool): Revalidate the tree unless this run already did.
+            github_token (Optional[str]): Token to use for the GitHub API request, if any.
+            allow_env_token (bool): Whether a token from the environment may be used.
+
+        Returns:
+            Optional[RepoTree]: The tree (check ``truncated`` before relying on it), or
+            None if it could not be fetched.
+        """
+        now = datetime.now(timezone.utc)
+        cache_file = self.get_cache_file_path(REPO_TREE_CACHE_FILE, suffix="")
+        state = self._repo_tree_state
+        if state is None:
+            cached = self.read_json(cache_file)
+            tree = RepoTree.from_cache(cached)
+            if tree is not None and isinstance(cached, dict):
+                checked_at = parse_iso_datetime_utc(cached.get("cached_at"))
+                etag = cached.get("etag")
+                if checked_at:
+                    state = (tree, checked_at, etag if isinstance(etag, str) else None)
+        if state is not None and (
+            (state[0] is not None and self._repo_tree_confirmed_at is not None)
+            or (
+                not force_refresh
+                and (now - state[1]).total_seconds() < REPO_TREE_CACHE_EXPIRY_SECONDS
+            )
+        ):
+            self._repo_tree_state = state
+            record_cache_lookup(REPO_TREE_CACHE_NAME, hit=True)
+            return state[0]
+        if force_refresh:
+            self._repo_tree_revalidated_at = now
+        if (
+            state is not None
+            and state[0] is not None
+            and self._site_tree_sha() == state[0].sha
+        ):
+            # This run's GraphQL batch already confirmed the head revision, which is
+            # as good as a 304 for the conditional request below.
+            logger.debug("Repository tree %s unchanged (GraphQL)", state[0].sha)
+            self._repo_tree_state = (state[0], now, state[2])
+            self._repo_tree_confirmed_at = now
+            record_cache_lookup(REPO_TREE_CACHE_NAME, hit=True)
+            self.atomic_write_json(
+                cache_file,
+                {**state[0].to_cache(), "etag": state[2], "cached_at": now.isoformat()},
+            )
+            return state[0]
+
+        record_cache_lookup(REPO_TREE_CACHE_NAME, hit=False)
+        tree, etag = (state[0], state[2]) if state is not None else (None, None)
+        try:
+            response = make_github_api_request(
+                MESHTASTIC_GITHUB_IO_TREE_URL,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+                params={"recursive": 1},
+                timeout=GITHUB_API_TIMEOUT,
+                etag=etag if tree is not None else None,
+            )
+            if tree is not None and getattr(response, "status_code", None) == 304:
+                logger.debug("Repository tree %s unchanged", tree.sha)
+            else:
+                payload = response.json()
+                if tree is None or not (
+                    isinstance(payload, dict) and payload.get("sha") == tree.sha
+                ):
+                    tree = RepoTree.from_api(payload)
+                    logger.debug(
+                        "Fetched repository tree %s (%d entries%s)",
+                        tree.sha,
+                        len(tree.rows),
+                        ", truncated" if tree.truncated else "",
+                    )
+                headers = getattr(response, "headers", None)
+                header = headers.get("ETag") if hasattr(headers, "get") else None
+                etag = header if isinstance(header, str) else None
+        except (requests.RequestException, ValueError, KeyError, TypeError) as exc:
+            logger.debug("Could not fetch repository tree: %s", exc)
+            # Remember the failure so per-directory lookups in this run go straight
+            # to the Contents API instead of retrying the tree each time.
+            self._repo_tree_state = (None, now, None)
+            return None
+
+        self._repo_tree_state = (tree, now, etag)
+        self._repo_tree_confirmed_at = now
+        self.atomic_write_json(
+            cache_file, {**tree.to_cache(), "etag": etag, "cached_at": now.isoformat()}
+        )
+        return tree
+
+    def _site_tree_sha(self) -> Optional[str]:
+        """Return the meshtastic.github.io head tree SHA from the GraphQL batch, if any."""
+        if not isinstance(self.metadata_source, GraphQLMetadataSource):
+            return None
+        head = self.metadata_source.get_site_head()
+        return (head.get("tree_sha") or None) if head else None
+
+    def _get_repo_tree_for_path(
+        self,
+        path: str,
+        *,
+        force_refresh: bool,
+        github_token: Optional[str],
+        allow_env_token: bool,
+    ) -> Optional[RepoTree]:
+        """
+        Return a complete repo tree containing directory `path`, or None.
+
+        A cached tree that lacks `path` is revalidated before giving up, since the
+        directory may have been published after the tree was cached; that happens at
+        most once per run, so further missing paths cost no extra request. None means the
+        caller must use the Contents API (tree unavailable or truncated, or `path` is
+        not a directory).
+        """
+        tree = self.get_repo_tree(
+            force_refresh=force_refresh,
+            github_token=github_token,
+            allow_env_token=allow_env_token,
+        )
+        if (
+            tree is not None
+            and not tree.has_directory(path)
+            and not force_refresh
+            and self._repo_tree_revalidated_at is None
+        ):
+            tree = self.get_repo_tree(
+                force_refresh=True,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+            )
+        if tree is None or tree.truncated or not tree.has_directory(path):
+            return None
+        return tree
+
     def get_repo_directories(
         self,
         path: str = "",
@@ -379,6 +617,14 @@ class CacheManager:
             Returns:
                 list[str]: Directory names found in the last fetched API response; empty list if the response is not a list or contains no directories.
             """
+            tree = self._get_repo_tree_for_path(
+                normalized_path,
+                force_refresh=force_refresh,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+            )
+            if tree is not None:
+                return tree.list_directories(normalized_path)
             response = make_github_api_request(
                 api_url,
                 github_token=github_token,
@@ -454,6 +700,14 @@ class CacheManager:
             Returns:
                 list[dict[str, Any]]: Parsed JSON objects from the response; empty list if the response is not a JSON list.
             """
+            tree = self._get_repo_tree_for_path(
+                normalized_path,
+                force_refresh=force_refresh,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+            )
+            if tree is not None:
+                return tree.list_contents(normalized_path)
             response = make_github_api_request(
                 api_url,
                 github_token=github_token,
@@ -484,6 +738,102 @@ class CacheManager:
             )
             return []
 
+    def get_repo_directory_sha(
+        self,
+        path: str,
+        *,
+        github_token: Optional[str] = None,
+        allow_env_token: bool = True,
+    ) -> Optional[str]:
+        """
+        Return the live git tree SHA of directory `path`.
+
+        The SHA is read from the recursive repo tree, revalidated for this run (see
+        :meth:`get_repo_tree`), so it shares the request later live listings make. Only
+        when the tree is unavailable or truncated is the parent's Contents listing used;
+        it is revalidated with a conditional request on every call, so an unchanged
+        parent costs a single ``304`` response. The listing's ETag and the directory
+        SHAs it reported are kept in ``repo_listings.json``.
+
+        Parameters:
+            path (str): Directory path relative to the site root.
+            github_token (Optional[str]): Token to use for the GitHub API request, if any.
+            allow_env_token (bool): Whether a token from the environment may be used.
+
+        Returns:
+            Optional[str]: The directory's tree SHA, or None if neither the tree nor the
+            listing could be fetched, or the repository has no such directory.
+        """
+        normalized_path = (path or "").strip("/")
+        if not normalized_path:
+            return None
+        tree = self.get_repo_tree(
+            force_refresh=True,
+            github_token=github_token,
+            allow_env_token=allow_env_token,
+        )
+        if tree is not None and not tree.truncated:
+            entry = tree.get_entry(normalized_path)
+            if entry is None or entry.get("type") != "dir":
+                return None
+            sha = entry.get("sha")
+            return sha if isinstance(sha, str) else None
+        parent, _, name = normalized_path.rpartition("/")
+        cache_key = parent or "/"
+        api_url = (
+            f"{MESHTASTIC_GITHUB_IO_CONTENTS_URL}/{parent}"
+            if parent
+            else MESHTASTIC_GITHUB_IO_CONTENTS_URL
+        )
+        cache_file = self.get_cache_file_path(REPO_LISTINGS_CACHE_FILE, suffix="")
+        cached = self.read_json(cache_file)
+        entry = cached.get(cache_key) if isinstance(cached, dict) else None
+        etag = entry.get("etag") if isinstance(entry, dict) else None
+        dir_shas = entry.get("dirs") if isinstance(entry, dict) else None
+        if not isinstance(etag, str) or not isinstance(dir_shas, dict):
+            etag, dir_shas = None, None
+
+        try:
+            response = make_github_api_request(
+                api_url,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+                timeout=GITHUB_API_TIMEOUT,
+                etag=etag,
+            )
+            if dir_shas is not None and getattr(response, "status_code", None) == 304:
+                logger.debug("Repository listing for %s unchanged", cache_key)
+            else:
+                listing = response.json()
+                if not isinstance(listing, list):
+                    return None
+                dir_shas = {
+                    item["name"]: item["sha"]
+                    for item in listing
+                    if isinstance(item, dict)
+                    and item.get("type") == "dir"
+                    and isinstance(item.get("name"), str)
+                    and isinstance(item.get("sha"), str)
+                }
+                headers = getattr(response, "headers", None)
+                header = headers.get("ETag") if hasattr(headers, "get") else None
+                new_entry = {
+                    "etag": header if isinstance(header, str) else None,
+                    "dirs": dir_shas,
+                    "cached_at": datetime.now(timezone.utc).isoformat(),
+                }
+
+                def store_entry(data: dict[str, Any]) -> bool:
+                    data[cache_key] = new_entry
+                    return True
+
+                self.update_json(cache_file, store_entry)
+        except (requests.RequestException, ValueError, KeyError, TypeError) as exc:
+            logger.debug("Could not list repository path %s: %s", cache_key, exc)
+            return None
+        sha = dir_shas.get(name)
+        return sha if isinstance(sha, str) else None
+
     def clear_cache(self, cache_file: str) -> bool:
         """
         Delete the specified cache file from disk.
@@ -564,25 +914,25 @@ class CacheManager:
         cache_file = self._get_releases_cache_file()
         cache = self.read_json(cache_file)
         if not isinstance(cache, dict):
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         now = datetime.now(timezone.utc)
 
         entry = cache.get(url_cache_key)
         if not isinstance(entry, dict):
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         cached_at_raw = entry.get("cached_at")
         releases = entry.get("releases")
         if not cached_at_raw or not isinstance(releases, list):
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         cached_at = parse_iso_datetime_utc(cached_at_raw)
         if not cached_at:
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         age_s = (now - cached_at).total_seconds()
@@ -593,7 +943,7 @@ class CacheManager:
                 age_s,
                 expiry_seconds,
             )
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         schema_version = entry.get("schema_version")
@@ -604,7 +954,7 @@ class CacheManager:
                 GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
                 schema_version,
             )
-            track_api_cache_miss()
+            track_api_cache_miss(RELEASES_CACHE_NAME)
             return None
 
         for idx, release in enumerate(releases):
@@ -614,12 +964,84 @@ class CacheManager:
                     url_cache_key,
                     idx,
                 )
-                track_api_cache_miss()
+                track_api_cache_miss(RELEASES_CACHE_NAME)
                 return None
 
-        track_api_cache_hit()
+        self._note_releases_fresh_until(cached_at.timestamp() + expiry_seconds)
+        track_api_cache_hit(RELEASES_CACHE_NAME)
         return releases
 
+    def _active_freshness_trackers(self) -> List[ReleasesFreshness]:
+        trackers = getattr(self._freshness_trackers, "stack", None)
+        if trackers is None:
+            trackers = self._freshness_trackers.stack = []
+        return trackers
+
+    def _note_releases_fresh_until(self, deadline: float) -> None:
+        for tracker in self._active_freshness_trackers():
+            if tracker.fresh_until is None or deadline < tracker.fresh_until:
+                tracker.fresh_until = deadline
+
+    @contextmanager
+    def track_releases_freshness(self) -> Iterator[ReleasesFreshness]:
+        """
+        Track the releases cache entries this thread reads or writes during the block.
+
+        Yields:
+            ReleasesFreshness: Filled in as entries are served from or stored in the
+            cache; read it after the block to learn how long the data stays fresh.
+        """
+        tracker = ReleasesFreshness()
+        trackers = self._active_freshness_trackers()
+        trackers.append(tracker)
+        try:
+            yield tracker
+        finally:
+            trackers.remove(tracker)
+
+    def releases_cache_generation(self) -> Optional[Tuple[int, int]]:
+        """
+        Identify the current contents of the releases cache file without reading it.
+
+        Returns:
+            Optional[Tuple[int, int]]: The file's (mtime_ns, size), or None if it does not exist.
+        """
+        try:
+            stat = os.stat(self._get_releases_cache_file())
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def read_cached_release_body(
+        self, url_cache_key: str, tag_name: str
+    ) -> Optional[str]:
+        """
+        Return the release notes stored for `tag_name` in a releases cache entry.
+
+        Used to load release bodies that were dropped from memory after parsing. Expiry
+        and schema checks are skipped (the entry was valid when the releases were read)
+        and no cache hit/miss is recorded.
+
+        Parameters:
+            url_cache_key (str): Cache key of the releases entry.
+            tag_name (str): Tag of the release whose notes to return.
+
+        Returns:
+            Optional[str]: The release body, or None if the entry or release is missing.
+        """
+        cache = self.read_json(self._get_releases_cache_file())
+        if not isinstance(cache, dict):
+            return None
+        entry = cache.get(url_cache_key)
+        releases = entry.get("releases") if isinstance(entry, dict) else None
+        if not isinstance(releases, list):
+            return None
+        for release in releases:
+            if isinstance(release, dict) and release.get("tag_name") == tag_name:
+                body = release.get("body")
+                return body if isinstance(body, str) else None
+        return None
+
     @staticmethod
     def _normalize_release_for_comparison(release: dict[str, Any]) -> dict[str, Any]:
         """
@@ -711,94 +1133,110 @@ class CacheManager:
 
     def write_releases_cache_entry(
         self, url_cache_key: str, releases: list[dict[str, Any]]
-    ) -> None:
+    ) -> bool:
         """
         Store a list of GitHub release objects in the releases cache under a URL-derived key.
 
-        Prunes expired or mismatched-schema entries from the releases cache file, then writes the provided list under `url_cache_key`, recording the current UTC timestamp as `cached_at` and the module's `schema_version` for the entry.
+        Prunes expired or mismatched-schema entries from the releases cache file, then writes the provided list under `url_cache_key`, recording the current UTC timestamp as `cached_at` and the module's `schema_version` for the entry. The file is updated through `update_json`, so entries other processes wrote in the meantime are kept.
 
         Parameters:
             url_cache_key (str): Stable cache key derived from the request URL and parameters.
             releases (list[dict[str, Any]]): List of release objects (GitHub release-like dicts) to persist in the cache.
+
+        Returns:
+            bool: True if the cache file was written, False otherwise.
         """
         cache_file = self._get_releases_cache_file()
-        raw_cache = self.read_json(cache_file) or {}
-
-        # Prune expired entries and outdated schema versions from the entire file
-        # before adding the new entry to keep the cache file clean and compact.
-        cache = self.prune_cache_data(
-            raw_cache,
-            expiry_seconds=RELEASES_CACHE_EXPIRY_HOURS * 3600,
-            schema_version=GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
-        )
-
-        old_releases = cache.get(url_cache_key, {}).get("releases")
-
         now = datetime.now(timezone.utc)
-
-        # Normalize releases for comparison (exclude dynamic fields like asset URLs)
-        old_normalized = (
-            [
+        # Filled in by merge_entry, which runs under the cache file's lock
+        is_unchanged = False
+        entry_count = 0
+
+        def merge_entry(cache: dict[str, Any]) -> bool:
+            nonlocal is_unchanged, entry_count
+            # Prune expired entries and outdated schema versions from the entire file
+            # before adding the new entry to keep the cache file clean and compact.
+            pruned = self.prune_cache_data(
+                cache,
+                expiry_seconds=RELEASES_CACHE_EXPIRY_HOURS * 3600,
+                schema_version=GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
+            )
+            cache.clear()
+            cache.update(pruned)
+
+            old_releases = cache.get(url_cache_key, {}).get("releases")
+
+            # Normalize releases for comparison (exclude dynamic fields like asset URLs)
+            old_normalized = (
+                [
+                    self._normalize_release_for_comparison(r)
+                    for r in old_releases
+                    if isinstance(r, dict)
+                ]
+                if isinstance(old_releases, list)
+                else None
+            )
+            new_normalized = [
                 self._normalize_release_for_comparison(r)
-                for r in old_releases
+                for r in releases
                 if isinstance(r, dict)
             ]
-            if isinstance(old_releases, list)
-            else None
-        )
-        new_normalized = [
-            self._normalize_release_for_comparison(r)
-            for r in releases
-            if isinstance(r, dict)
-        ]
-
-        # Log comparison details
-        if old_normalized is not None:
-            old_tags = {r.get("tag_name") for r in old_normalized}
-            new_tags = {r.get("tag_name") for r in new_normalized}
-            tags_equal = old_tags == new_tags
-            normalized_equal = old_normalized == new_normalized
 
-            logger.debug(
-                "Cache comparison for %s: old=%d, new=%d, tags_equal=%s, normalized_equal=%s",
-                url_cache_key,
-                len(old_normalized),
-                len(new_normalized),
-                tags_equal,
-                normalized_equal,
-            )
-        else:
-            logger.debug(
-                "First cache write for %s: %d releases",
-                url_cache_key,
-                len(new_normalized),
-            )
+            # Log comparison details
+            if old_normalized is not None:
+                old_tags = {r.get("tag_name") for r in old_normalized}
+                new_tags = {r.get("tag_name") for r in new_normalized}
+                tags_equal = old_tags == new_tags
+                normalized_equal = old_normalized == new_normalized
+
+                logger.debug(
+                    "Cache comparison for %s: old=%d, new=%d, tags_equal=%s, normalized_equal=%s",
+                    url_cache_key,
+                    len(old_normalized),
+                    len(new_normalized),
+                    tags_equal,
+                    normalized_equal,
+                )
+            else:
+                logger.debug(
+                    "First cache write for %s: %d releases",
+                    url_cache_key,
+                    len(new_normalized),
+                )
 
-        is_unchanged = old_normalized == new_normalized
+            is_unchanged = old_normalized == new_normalized
 
-        cache[url_cache_key] = {
-            "releases": releases,
-            "cached_at": now.isoformat(),
-            "schema_version": GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
-        }
-        if self.atomic_write_json(cache_file, cache):
+            cache[url_cache_key] = {
+                "releases": releases,
+                "cached_at": now.isoformat(),
+                "schema_version": GITHUB_RELEASES_CACHE_SCHEMA_VERSION,
+            }
+            entry_count = len(cache)
+            return True
+
+        if self.update_json(cache_file, merge_entry):
             if is_unchanged:
                 logger.debug(
                     "Extended releases cache freshness for %s (total %d cache entries)",
                     url_cache_key,
-                    len(cache),
+                    entry_count,
                 )
             else:
                 logger.debug(
                     "Saved %d releases to cache entry for %s (total %d cache entries)",
                     len(releases),
                     url_cache_key,
-                    len(cache),
+                    entry_count,
                 )
+            self._note_releases_fresh_until(
+                now.timestamp() + RELEASES_CACHE_EXPIRY_HOURS * 3600
+            )
+            return True
+        return False
 
     def clear_all_caches(self) -> bool:
         """
-        Removes all `.json` and `.tmp` files from the instance cache directory.
+        Removes all `.json` and `.tmp` files and the warm-start snapshot from the instance cache directory.
 
         Returns:
             bool: `True` if all targeted files were removed successfully or none were present, `False` if the directory could not be accessed or any removal failed.
@@ -806,7 +1244,10 @@ class CacheManager:
         try:
             with os.scandir(self.cache_dir) as it:
                 for entry in it:
-                    if entry.name.endswith((".json", ".tmp")):
+                    if (
+                        entry.name.endswith((".json", ".tmp"))
+                        or entry.name == WARM_START_SNAPSHOT_FILE
+                    ):
                         try:
                             os.remove(entry.path)
                         except OSError as e:
@@ -1090,7 +1531,7 @@ class CacheManager:
         """
         Retrieve the committer timestamp for a GitHub commit, using the on-disk cache when possible.
 
-        Looks up a cached timestamp in commit_timestamps.json and returns it if present and not expired; otherwise fetches the commit from the GitHub API, caches the ISO timestamp together with the fetch time, and returns the parsed UTC datetime. Cache entries honor COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS; set `force_refresh` to bypass the cache.
+        Single-commit form of :meth:`get_commit_timestamps`: returns a cached timestamp from commit_timestamps.json when present and not expired, otherwise a date harvested from cached commit lists or fetched from the GitHub API, which is then cached together with the lookup time. Cache entries honor COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS; set `force_refresh` to bypass the cache.
 
         Parameters:
             owner (str): Repository owner (GitHub user or organization).
@@ -1103,47 +1544,77 @@ class CacheManager:
         Returns:
             Optional[datetime]: The commit committer datetime in UTC if available and parseable, `None` otherwise.
         """
-        cache_key = f"{owner}/{repo}/{commit_hash}"
-        cache_file = os.path.join(self.cache_dir, "commit_timestamps.json")
-        cache = self.read_json(cache_file)
-        if not isinstance(cache, dict):
-            cache = {}
+        return self.get_commit_timestamps(
+            owner,
+            repo,
+            [commit_hash],
+            github_token=github_token,
+            allow_env_token=allow_env_token,
+            force_refresh=force_refresh,
+        ).get(commit_hash)
 
-        now = datetime.now(timezone.utc)
+    @staticmethod
+    def _cached_commit_timestamp(entry: Any, now: datetime) -> Optional[datetime]:
+        """Return the timestamp from a valid, unexpired commit timestamp cache entry."""
+        if not (
+            isinstance(entry, (list, tuple))
+            and len(entry) == 2
+            and isinstance(entry[0], str)
+            and isinstance(entry[1], str)
+        ):
+            return None
+        cached_at = parse_iso_datetime_utc(entry[1])
+        timestamp = parse_iso_datetime_utc(entry[0])
+        if cached_at is None or timestamp is None:
+            return None
+        if (
+            now - cached_at
+        ).total_seconds() >= COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS * 3600:
+            return None
+        return timestamp
 
-        if not force_refresh and cache_key in cache:
-            entry = cache[cache_key]
-            entry_valid = (
-                isinstance(entry, (list, tuple))
-                and len(entry) == 2
-                and isinstance(entry[0], str)
-                and isinstance(entry[1], str)
-            )
-            if entry_valid:
-                timestamp_str, cached_at_str = entry
-                cached_at = parse_iso_datetime_utc(cached_at_str)
-                timestamp = parse_iso_datetime_utc(timestamp_str)
-                if cached_at is not None and timestamp is not None:
-                    age = now - cached_at
-                    if (
-                        age.total_seconds()
-                        < COMMIT_TIMESTAMP_CACHE_EXPIRY_HOURS * 60 * 60
-                    ):
-                        track_api_cache_hit()
-                        logger.debug(
-                            "Using cached commit timestamp for %s (cached %.0fs ago)",
-                            commit_hash,
-                            age.total_seconds(),
-                        )
-                        return timestamp
-                else:
-                    entry_valid = False
-            if not entry_valid:
-                logger.debug(
-                    "Ignoring invalid commit timestamp cache entry for %s", cache_key
-                )
+    def _harvest_commit_list_timestamps(
+        self, owner: str, repo: str, shas: list[str]
+    ) -> dict[str, datetime]:
+        """
+        Find committer dates for `shas` in cached commit-list responses for the repo.
+
+        Short SHAs match by prefix. Only repositories whose commit lists are cached
+        (see ``COMMIT_LIST_CACHE_FILES``) can be harvested.
+        """
+        cache_name = COMMIT_LIST_CACHE_FILES.get(f"{owner}/{repo}".lower())
+        if not cache_name or not shas:
+            return {}
+        cached = self.read_json(os.path.join(self.cache_dir, cache_name))
+        commits = cached.get("commits") if isinstance(cached, dict) else None
+        if not isinstance(commits, list):
+            return {}
+        wanted = {sha.lower(): sha for sha in shas}
+        found: dict[str, datetime] = {}
+        for commit in commits:
+            if not isinstance(commit, dict) or not isinstance(commit.get("sha"), str):
+                continue
+            full_sha = commit["sha"].lower()
+            details = commit.get("commit")
+            committer = details.get("committer") if isinstance(details, dict) else None
+            date = committer.get("date") if isinstance(committer, dict) else None
+            timestamp = parse_iso_datetime_utc(date) if date else None
+            if timestamp is None:
+                continue
+            for prefix, sha in wanted.items():
+                if sha not in found and full_sha.startswith(prefix):
+                    found[sha] = timestamp
+        return found
 
-        track_api_cache_miss()
+    def _fetch_commit_timestamp(
+        self,
+        owner: str,
+        repo: str,
+        commit_hash: str,
+        github_token: Optional[str],
+        allow_env_token: bool,
+    ) -> Optional[datetime]:
+        """Fetch one commit's committer date from the GitHub API, or None on failure."""
         url = f"{GITHUB_API_BASE}/{owner}/{repo}/commits/{commit_hash}"
         try:
             response = make_github_api_request(
@@ -1158,18 +1629,116 @@ class CacheManager:
             )
             if not timestamp_str:
                 return None
-            timestamp = parse_iso_datetime_utc(timestamp_str)
-            if timestamp is None:
-                return None
-            cache[cache_key] = [timestamp.isoformat(), now.isoformat()]
-            self.atomic_write_json(cache_file, cache)
-            return timestamp
+            return parse_iso_datetime_utc(timestamp_str)
         except (requests.RequestException, ValueError, TypeError, KeyError) as exc:
             logger.debug(
                 "Could not fetch commit timestamp for %s: %s", commit_hash, exc
             )
             return None
 
+    def get_commit_timestamps(
+        self,
+        owner: str,
+        repo: str,
+        shas: Iterable[str],
+        *,
+        github_token: Optional[str] = None,
+        allow_env_token: bool = True,
+        force_refresh: bool = False,
+    ) -> dict[str, Optional[datetime]]:
+        """
+        Resolve committer timestamps for several commits with at most one cache write.
+
+        Each SHA is answered, in order of preference, from commit_timestamps.json, from
+        commit-list responses already cached for the repository, or from the GitHub
+        API. API lookups run concurrently (at most ``COMMIT_TIMESTAMP_FETCH_WORKERS``
+        at once). All newly resolved timestamps are then persisted in a single write.
+
+        Parameters:
+            owner (str): Repository owner (GitHub user or organization).
+            repo (str): Repository name.
+            shas (Iterable[str]): Full or short commit SHAs; duplicates are resolved once.
+            github_token (Optional[str]): Personal access token to use for GitHub API requests.
+            allow_env_token (bool): If True, allow using a token from the environment when `github_token` is not provided.
+            force_refresh (bool): If True, ignore commit_timestamps.json and cached commit lists and fetch every SHA from the API.
+
+        Returns:
+            dict[str, Optional[datetime]]: Mapping of each requested SHA to its committer
+            datetime in UTC, or None if it could not be resolved.
+        """
+        requested = list(dict.fromkeys(sha for sha in shas if sha))
+        cache_file = os.path.join(self.cache_dir, "commit_timestamps.json")
+        cache = self.read_json(cache_file)
+        if not isinstance(cache, dict):
+            cache = {}
+        now = datetime.now(timezone.utc)
+
+        results: dict[str, Optional[datetime]] = {}
+        missing: list[str] = []
+        for sha in requested:
+            cache_key = f"{owner}/{repo}/{sha}"
+            timestamp = None
+            if not force_refresh and cache_key in cache:
+                timestamp = self._cached_commit_timestamp(cache[cache_key], now)
+                if timestamp is None:
+                    logger.debug(
+                        "Ignoring invalid commit timestamp cache entry for %s",
+                        cache_key,
+                    )
+            if timestamp is not None:
+                track_api_cache_hit(COMMIT_TIMESTAMPS_CACHE_NAME)
+                results[sha] = timestamp
+            else:
+                track_api_cache_miss(COMMIT_TIMESTAMPS_CACHE_NAME)
+                missing.append(sha)
+        if not missing:
+            return results
+
+        resolved = (
+            {}
+            if force_refresh
+            else self._harvest_commit_list_timestamps(owner, repo, missing)
+        )
+        if resolved:
+            logger.debug(
+                "Resolved %d commit timestamps from cached commit lists", len(resolved)
+            )
+        to_fetch = [sha for sha in missing if sha not in resolved]
+        if len(to_fetch) == 1:
+            resolved[to_fetch[0]] = self._fetch_commit_timestamp(
+                owner, repo, to_fetch[0], github_token, allow_env_token
+            )
+        elif to_fetch:
+            with ThreadPoolExecutor(
+                max_workers=min(COMMIT_TIMESTAMP_FETCH_WORKERS, len(to_fetch)),
+                thread_name_prefix="fetchtastic-commits",
+            ) as executor:
+                fetched = executor.map(
+                    lambda sha: self._fetch_commit_timestamp(
+                        owner, repo, sha, github_token, allow_env_token
+                    ),
+                    to_fetch,
+                )
+                resolved.update(zip(to_fetch, fetched))
+
+        new_entries: dict[str, list[str]] = {}
+        for sha in missing:
+            timestamp = resolved.get(sha)
+            results[sha] = timestamp
+            if timestamp is not None:
+                new_entries[f"{owner}/{repo}/{sha}"] = [
+                    timestamp.isoformat(),
+                    now.isoformat(),
+                ]
+        if new_entries:
+
+            def add_entries(current: dict[str, Any]) -> bool:
+                current.update(new_entries)
+                return True
+
+            self.update_json(cache_file, add_entries)
+        return results
+
 
 def _load_json_cache_with_expiry(
     cache_file_path: str,
@@ -4,10 +4,12 @@ CLI Integration for New Download Subsystem
 This module provides integration between the new download subsystem and the existing CLI.
 """
 
+import json
 import os
 import re
 import time
 import urllib.parse
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 if TYPE_CHECKING:
@@ -15,10 +17,6 @@ if TYPE_CHECKING:
 
 import requests  # type: ignore[import-untyped]
 
-from fetchtastic.client_release_discovery import (
-    is_android_asset_name,
-    is_desktop_asset_name,
-)
 from fetchtastic.constants import (
     ANDROID_FILE_TYPES,
     CLIENT_APP_FILE_TYPES,
@@ -48,6 +46,11 @@ from fetchtastic.notifications import (
     send_new_releases_available_notification,
     send_up_to_date_notification,
 )
+from fetchtastic.run_metrics import (
+    format_prometheus_metrics,
+    get_run_metrics,
+    stage_timer,
+)
 from fetchtastic.utils import (
     coerce_bool,
     format_api_summary,
@@ -57,7 +60,9 @@ from fetchtastic.utils import (
 
 from .android import MeshtasticAndroidAppDownloader
 from .desktop import MeshtasticDesktopDownloader
+from .files import _atomic_write
 from .firmware import FirmwareReleaseDownloader
+from .interfaces import get_result_platform
 from .orchestrator import DownloadOrchestrator
 
 _SNAPSHOT_VC_RE = re.compile(SNAPSHOT_VERSION_CODE_PATTERN)
@@ -235,10 +240,12 @@ class DownloadCLIIntegration:
             )
 
             # Handle cleanup
-            orchestrator.cleanup_old_versions()
+            with stage_timer("cleanup"):
+                orchestrator.cleanup_old_versions()
 
             # Update version tracking
-            orchestrator.update_version_tracking()
+            with stage_timer("version_tracking"):
+                orchestrator.update_version_tracking()
 
             # Get failed downloads
             failed_downloads = self.get_failed_downloads()
@@ -729,15 +736,9 @@ class DownloadCLIIntegration:
             is_client_app = file_type in CLIENT_APP_FILE_TYPES
             is_client_app_prerelease = file_type == FILE_TYPE_CLIENT_APP_PRERELEASE
             if is_client_app:
-                file_path = getattr(result, "file_path", None)
-                download_url = getattr(result, "download_url", None)
-                file_name = (
-                    os.path.basename(str(file_path))
-                    if file_path
-                    else os.path.basename(str(download_url)) if download_url else ""
-                )
-                is_android = is_android or is_android_asset_name(file_name)
-                is_desktop = is_desktop or is_desktop_asset_name(file_name)
+                platform = get_result_platform(result)
+                is_android = is_android or platform == FILE_TYPE_ANDROID
+                is_desktop = is_desktop or platform == FILE_TYPE_DESKTOP
                 if not is_android and not is_desktop:
                     logger.debug("Unclassified client app asset, defaulting to Android")
                     is_android = True
@@ -1148,6 +1149,7 @@ class DownloadCLIIntegration:
                 - "android_downloads": legacy compat — count of client app downloads with Android-compatible filenames.
                 - "desktop_downloads": legacy compat — count of client app downloads with Desktop-compatible filenames.
                 - "repository_downloads": count of repository downloads (always 0 for automatic pipeline).
+                - Run metrics ("bytes_downloaded", "bytes_hashed", "bytes_decompressed", "files_statted", "api_calls_full", "api_calls_conditional", plus per-stage and per-cache entries); see DownloadOrchestrator.get_download_statistics.
         """
         if self.orchestrator:
             return self.orchestrator.get_download_statistics()
@@ -1162,8 +1164,74 @@ class DownloadCLIIntegration:
             "android_downloads": 0,
             "desktop_downloads": 0,
             "repository_downloads": 0,
+            "bytes_downloaded": 0,
+            "bytes_hashed": 0,
+            "bytes_decompressed": 0,
+            "files_statted": 0,
+            "api_calls_full": 0,
+            "api_calls_conditional": 0,
         }
 
+    def write_metrics_report(self, output_path: str) -> bool:
+        """
+        Write the run's download statistics and performance metrics to `output_path`.
+
+        Paths ending in ``.prom`` are written in the Prometheus textfile format (for the
+        node_exporter textfile collector); any other path receives a JSON report containing
+        the download statistics, per-stage timings, byte/stat counters, per-cache hit
+        ratios and the GitHub API session summary.
+
+        Parameters:
+            output_path (str): Destination file path; the parent directory is created if missing.
+
+        Returns:
+            bool: `True` if the report was written, `False` on error.
+        """
+        statistics = self.get_download_statistics()
+        metrics = get_run_metrics()
+        api_summary = get_api_request_summary()
+        rate_limit_reset = api_summary.get("rate_limit_reset")
+        api_report = {
+            "total_requests": api_summary.get("total_requests", 0),
+            "cache_hits": api_summary.get("cache_hits", 0),
+            "cache_misses": api_summary.get("cache_misses", 0),
+            "auth_used": api_summary.get("auth_used", False),
+            "rate_limit_remaining": api_summary.get("rate_limit_remaining"),
+            "rate_limit_reset": (
+                rate_limit_reset.isoformat()
+                if hasattr(rate_limit_reset, "isoformat")
+                else None
+            ),
+        }
+
+        output_path = os.path.abspath(os.path.expanduser(output_path))
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        except OSError as e:
+            logger.error("Could not create directory for metrics report: %s", e)
+            return False
+
+        if output_path.lower().endswith(".prom"):
+            prometheus_stats = dict(statistics)
+            prometheus_stats["api_requests"] = api_report["total_requests"]
+            prometheus_stats["api_cache_hits"] = api_report["cache_hits"]
+            prometheus_stats["api_cache_misses"] = api_report["cache_misses"]
+            content = format_prometheus_metrics(prometheus_stats, metrics)
+        else:
+            report = {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "statistics": statistics,
+                "stage_timings": metrics["stage_timings"],
+                "cache_stats": metrics["cache_stats"],
+                "api": api_report,
+            }
+            content = json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+        written = _atomic_write(output_path, lambda f: f.write(content))
+        if written:
+            logger.info("Wrote run metrics to %s", output_path)
+        return written
+
     def get_latest_versions(self) -> Dict[str, str]:
         """
         Get the latest known version strings for each artifact type.
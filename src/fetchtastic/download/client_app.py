@@ -10,13 +10,13 @@ Meshtastic-Android release feed. Storage is intentionally platform-neutral:
 """
 
 import filecmp
-import fnmatch
 import json
 import os
 import re
 import shutil
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -62,21 +62,28 @@ from fetchtastic.utils import (
     coerce_bool,
     expand_apk_selected_patterns,
     make_github_api_request,
-    matches_selected_patterns,
 )
 
 from .base import BaseDownloader
 from .cache import CacheManager, parse_iso_datetime_utc
 from .files import _safe_rmtree, _sanitize_path_component
+from .github_graphql import GraphQLMetadataSource
 from .github_source import (
     GithubReleaseSource,
     create_asset_from_github_data,
     create_release_from_github_data,
 )
-from .interfaces import Asset, DownloadResult, Release
+from .interfaces import (
+    Asset,
+    DownloadResult,
+    Release,
+    get_asset_platform,
+    get_release_body,
+)
 from .latest_pointer import remove_latest_pointer, update_latest_pointer
 from .prerelease_history import PrereleaseHistoryManager
 from .release_history import ReleaseHistoryManager
+from .selection import get_selection_matcher
 from .version import VersionManager
 
 MIN_ANDROID_TRACKED_VERSION = (2, 7, 0)
@@ -94,7 +101,7 @@ _SNAPSHOT_APK_ABIS = ("arm64-v8a", "armeabi-v7a", "universal", "x86_64", "x86")
 _ABI_WILDCARD = "*"  # Sentinel for "any ABI" (glob metacharacter detected)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ApkIdentity:
     """Semantic identity for snapshot-aware APK matching."""
 
@@ -108,6 +115,7 @@ _LEGACY_GENERIC_APK_NAMES = frozenset(
 )
 
 
+@lru_cache(maxsize=1024)
 def _parse_apk_identity(name: str) -> ApkIdentity | None:
     """Extract flavor and abi from a stable or snapshot Android APK name/pattern.
 
@@ -121,6 +129,9 @@ def _parse_apk_identity(name: str) -> ApkIdentity | None:
     Character-class patterns (``[...]``) are resolved via ``fnmatch`` against
     known ABIs so that ``app-fdroid-[u]niversal-release.apk`` narrows to
     universal rather than broadening to every ABI.
+
+    Results are memoised: the same asset names and configured patterns are
+    parsed for every snapshot asset.
     """
     lower = (name or "").lower()
     if not lower.endswith(".apk"):
@@ -578,6 +589,24 @@ class MeshtasticClientAppDownloader(BaseDownloader):
             except OSError:
                 continue
 
+    def has_legacy_layout(self) -> bool:
+        """
+        Return True if any legacy app layout directory that `migrate_legacy_layout` migrates still exists.
+
+        Used as the cheap sentinel that re-triggers the recorded one-shot migration.
+        """
+        return any(
+            os.path.isdir(directory)
+            for directory in (
+                self._get_legacy_android_base_dir(),
+                self._get_split_android_base_dir(),
+                self._get_split_desktop_base_dir(),
+                self._get_legacy_prerelease_base_dir(),
+                self._get_split_android_prerelease_base_dir(),
+                self._get_split_desktop_prerelease_base_dir(),
+            )
+        )
+
     def migrate_split_layout(self) -> None:
         """Compatibility alias used by older Desktop paths."""
         self.migrate_legacy_layout()
@@ -774,7 +803,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
         return self._write_release_notes(
             release_dir=release_dir,
             release_tag=release.tag_name,
-            body=release.body,
+            body=lambda: get_release_body(release),
             base_dir=os.path.dirname(release_dir),
         )
 
@@ -857,7 +886,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                             release.assets.append(asset)
                     if not release.assets:
                         continue
-                    releases.append(release)
+                    releases.append(release.classify())
                     if self._is_client_app_stable(release):
                         stable_count += 1
                     if limit is not None and len(releases) >= limit:
@@ -896,7 +925,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
         exclude = self._get_exclude_patterns()
         if not exclude:
             return False
-        return any(fnmatch.fnmatch(asset_name.lower(), pat.lower()) for pat in exclude)
+        return get_selection_matcher(None, exclude).is_excluded(asset_name)
 
     def should_download_asset(self, asset_name: str) -> bool:
         raw_selected = self.config.get("SELECTED_APP_ASSETS")
@@ -915,7 +944,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
             return False
         if self._is_excluded(asset_name):
             return False
-        return matches_selected_patterns(asset_name, selected)
+        return get_selection_matcher(selected).matches(asset_name)
 
     def download_app(self, release: Release, asset: Asset) -> DownloadResult:
         if is_snapshot_tag(release.tag_name):
@@ -934,6 +963,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                 download_url=getattr(asset, "download_url", None),
                 file_size=getattr(asset, "size", None),
                 file_type=FILE_TYPE_APP_SNAPSHOT,
+                asset_platform=get_asset_platform(asset),
                 is_retryable=False,
                 error_type=ERROR_TYPE_VALIDATION,
             )
@@ -965,6 +995,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                     download_url=asset.download_url,
                     file_size=asset.size,
                     file_type=file_type,
+                    asset_platform=get_asset_platform(asset),
                     was_skipped=True,
                 )
             success = self.download(asset.download_url, target_path)
@@ -977,6 +1008,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                     download_url=asset.download_url,
                     file_size=asset.size,
                     file_type=file_type,
+                    asset_platform=get_asset_platform(asset),
                 )
             if success:
                 self.cleanup_file(target_path)
@@ -993,6 +1025,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                 download_url=asset.download_url,
                 file_size=asset.size,
                 file_type=file_type,
+                asset_platform=get_asset_platform(asset),
                 is_retryable=True,
                 error_type=error_type,
             )
@@ -1018,6 +1051,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                 download_url=getattr(asset, "download_url", None),
                 file_size=getattr(asset, "size", None),
                 file_type=file_type,
+                asset_platform=get_asset_platform(asset),
                 is_retryable=is_retryable,
                 error_type=error_type,
             )
@@ -1498,7 +1532,13 @@ class MeshtasticClientAppDownloader(BaseDownloader):
     @staticmethod
     def extract_snapshot_commit_sha(release: Release) -> str | None:
         """Extract the commit SHA from a snapshot release title/body/tag."""
-        for source in (release.name, release.body, release.tag_name):
+        sources = (
+            lambda: release.name,
+            lambda: get_release_body(release),
+            lambda: release.tag_name,
+        )
+        for load_source in sources:
+            source = load_source()
             if not source:
                 continue
             match = _SNAPSHOT_COMMIT_SHA_RE.search(source)
@@ -1554,6 +1594,16 @@ class MeshtasticClientAppDownloader(BaseDownloader):
     def fetch_snapshot_release(self) -> Release | None:
         """Fetch the rolling snapshot release from GitHub by tag. Returns None on 404/error."""
         try:
+            metadata_source = getattr(self.cache_manager, "metadata_source", None)
+            if isinstance(metadata_source, GraphQLMetadataSource):
+                answered, release_data = metadata_source.get_snapshot_release()
+                if answered:
+                    if release_data is None:
+                        logger.debug(
+                            "Snapshot release tag not found (may not exist yet)"
+                        )
+                        return None
+                    return create_release_from_github_data(release_data)
             response = make_github_api_request(
                 MESHTASTIC_ANDROID_SNAPSHOT_RELEASE_URL,
                 github_token=self.config.get("GITHUB_TOKEN"),
@@ -1680,7 +1730,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
             return asset_id.abi in specific_abis
         if None in abis_for_flavor:
             return asset_id.abi == "universal"
-        return matches_selected_patterns(asset_name, expanded)
+        return get_selection_matcher(expanded).matches(asset_name)
 
     def get_snapshot_target_path(
         self,
@@ -1811,6 +1861,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                     download_url=asset.download_url,
                     file_size=asset.size,
                     file_type=FILE_TYPE_APP_SNAPSHOT,
+                    asset_platform=get_asset_platform(asset),
                     was_skipped=True,
                 )
             success = self.download(asset.download_url, target_path)
@@ -1823,6 +1874,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                     download_url=asset.download_url,
                     file_size=asset.size,
                     file_type=FILE_TYPE_APP_SNAPSHOT,
+                    asset_platform=get_asset_platform(asset),
                 )
             if success:
                 self.cleanup_file(target_path)
@@ -1840,6 +1892,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                 download_url=asset.download_url,
                 file_size=asset.size,
                 file_type=FILE_TYPE_APP_SNAPSHOT,
+                asset_platform=get_asset_platform(asset),
                 is_retryable=True,
                 error_type=error_type,
             )
@@ -1862,6 +1915,7 @@ class MeshtasticClientAppDownloader(BaseDownloader):
                 download_url=getattr(asset, "download_url", None),
                 file_size=getattr(asset, "size", None),
                 file_type=FILE_TYPE_APP_SNAPSHOT,
+                asset_platform=get_asset_platform(asset),
                 is_retryable=is_retryable,
                 error_type=error_type,
             )
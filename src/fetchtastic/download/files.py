@@ -7,7 +7,6 @@ hash verification, and archive extraction.
 
 import fnmatch
 import glob
-import hashlib
 import json
 import os
 import re
@@ -15,7 +14,7 @@ import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Callable, Protocol, cast
+from typing import IO, TYPE_CHECKING, Any, Callable
 
 from fetchtastic.constants import (
     DEFAULT_ADD_CHANNEL_SUFFIXES_TO_DIRECTORIES,
@@ -24,66 +23,41 @@ from fetchtastic.constants import (
     SHELL_SCRIPT_EXTENSION,
     STORAGE_CHANNEL_SUFFIXES,
 )
+from fetchtastic.hashing import hash_file, hash_files
 from fetchtastic.log_utils import logger
+from fetchtastic.run_metrics import (
+    METRIC_BYTES_DECOMPRESSED,
+    METRIC_FILES_STATTED,
+    increment_metric,
+)
+from fetchtastic.tracing import (
+    TRACE_CATEGORY_CLEANUP,
+    TRACE_CATEGORY_EXTRACT,
+    trace_span,
+)
 
 if TYPE_CHECKING:
     from .interfaces import Release
     from .release_history import ReleaseHistoryManager
 
 from fetchtastic.utils import (
+    check_zip_integrity,
+    get_extraction_manifest_path,
     get_hash_file_path,
     get_legacy_hash_file_path,
+    get_zip_check_file_path,
     load_file_hash,
-    matches_selected_patterns,
     save_file_hash,
     verify_file_integrity,
+    verify_files_integrity,
 )
 
-NON_ASCII_RX = re.compile(r"[^\x00-\x7F]+")
-
-
-class HashAlgorithm(Protocol):
-    """Protocol for hash objects returned by hashlib."""
-
-    name: str
-    digest_size: int
-    block_size: int
-
-    def update(self, data: bytes) -> None:
-        """
-        Update the hash object's internal state with the given bytes.
-
-        Parameters:
-            data (bytes): Input bytes to incorporate into the ongoing digest computation.
-        """
-        ...
-
-    def digest(self) -> bytes:
-        """
-        Return the binary digest for the current hash state.
-
-        Returns:
-            bytes: The raw hash digest corresponding to the current state of the hash object.
-        """
-        ...
-
-    def hexdigest(self) -> str:
-        """
-        Return the hexadecimal digest string representing the hash's current state.
-
-        Returns:
-            str: Hexadecimal string of the digest computed from the data processed so far.
-        """
-        ...
+from .selection import SelectionMatcher
 
-    def copy(self) -> "HashAlgorithm":
-        """
-        Create an independent copy of the hash object preserving its current internal state.
+NON_ASCII_RX = re.compile(r"[^\x00-\x7F]+")
 
-        Returns:
-            HashAlgorithm: A new hash object for the same algorithm with the same internal state as the original.
-        """
-        ...
+# Bump when the extraction manifest layout or key changes.
+EXTRACTION_MANIFEST_VERSION = 1
 
 
 def strip_unwanted_chars(text: str) -> str:
@@ -148,21 +122,20 @@ def _sanitize_path_component(component: str | None) -> str | None:
     return sanitized
 
 
-def is_zip_intact(file_path: str | Path) -> bool:
+def is_zip_intact(file_path: str | Path, *, full: bool = False) -> bool:
     """
     Check whether a ZIP archive is intact and has no corrupt entries.
 
+    Uses tiered validation (see `fetchtastic.utils.check_zip_integrity`): archives that already passed a full CRC check in their current state only get a structural check.
+
     Parameters:
         file_path (str | Path): Path to the ZIP file to inspect.
+        full (bool): Force a full CRC check of every member.
 
     Returns:
         bool: `True` if the archive passes the ZIP integrity test, `False` otherwise.
     """
-    try:
-        with zipfile.ZipFile(file_path, "r") as zf:
-            return zf.testzip() is None
-    except (OSError, zipfile.BadZipFile):
-        return False
+    return check_zip_integrity(str(file_path), full=full)
 
 
 def _get_existing_prerelease_dirs(prerelease_dir: str) -> list[str]:
@@ -244,6 +217,7 @@ def _is_release_complete(
     assets = release_data.get("assets")
     if not isinstance(assets, list):
         return False
+    matcher = SelectionMatcher.compile(selected_patterns, exclude_patterns)
     for asset in assets:
         if not isinstance(asset, dict):
             continue
@@ -251,12 +225,7 @@ def _is_release_complete(
         if not file_name:
             continue
 
-        if selected_patterns and not matches_selected_patterns(
-            file_name, selected_patterns
-        ):
-            continue
-
-        if _matches_exclude(file_name, exclude_patterns):
+        if not matcher.selects(file_name):
             continue
 
         expected_assets.append((file_name, asset.get("size")))
@@ -265,8 +234,11 @@ def _is_release_complete(
         logger.debug("No assets match selected patterns for release in %s", release_dir)
         return False
 
+    to_verify: list[str] = []
+    baseline_only: set[str] = set()
     for asset_name, expected_size in expected_assets:
         asset_path = os.path.join(release_dir, asset_name)
+        increment_metric(METRIC_FILES_STATTED)
         if not os.path.exists(asset_path):
             logger.debug(
                 "Missing asset %s in release directory %s", asset_name, release_dir
@@ -294,29 +266,30 @@ def _is_release_complete(
 
         if asset_name.lower().endswith(".zip"):
             try:
-                has_hash_baseline = load_file_hash(asset_path) is not None
-                if has_hash_baseline:
-                    if not verify_file_integrity(asset_path):
-                        logger.debug("Hash verification failed for %s", asset_path)
-                        return False
-                else:
+                if load_file_hash(asset_path) is None:
                     # Use is_zip_intact to check for corruption
                     if not is_zip_intact(asset_path):
                         logger.debug("Corrupted zip file detected: %s", asset_path)
                         return False
                     # Persist a hash so future checks use the faster hash path
-                    if not verify_file_integrity(asset_path):
-                        logger.debug(
-                            "Could not persist hash baseline for %s; "
-                            "future checks will re-verify ZIP integrity",
-                            asset_path,
-                        )
+                    baseline_only.add(asset_path)
             except (zipfile.BadZipFile, OSError, IOError, TypeError):
                 return False
-        else:
-            if not verify_file_integrity(asset_path):
-                logger.debug("Hash verification failed for %s", asset_path)
-                return False
+        to_verify.append(asset_path)
+
+    # Hash every asset in one parallel batch once the cheap checks have passed.
+    for asset_path, verified in verify_files_integrity(to_verify).items():
+        if verified:
+            continue
+        if asset_path in baseline_only:
+            logger.debug(
+                "Could not persist hash baseline for %s; "
+                "future checks will re-verify ZIP integrity",
+                asset_path,
+            )
+            continue
+        logger.debug("Hash verification failed for %s", asset_path)
+        return False
 
     return True
 
@@ -341,6 +314,13 @@ def _prepare_for_redownload(file_path: str) -> bool:
             os.remove(hash_path)
             logger.debug("Removed stale hash file: %s", hash_path)
 
+        for sidecar in (
+            get_zip_check_file_path(file_path),
+            get_extraction_manifest_path(file_path),
+        ):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
+
         legacy_hash_path = get_legacy_hash_file_path(file_path)
         if os.path.exists(legacy_hash_path):
             os.remove(legacy_hash_path)
@@ -432,10 +412,11 @@ def _safe_rmtree(path_to_remove: str, base_dir: str, item_name: str) -> bool:
             )
             return False
 
-        if os.path.isdir(path_to_remove):
-            shutil.rmtree(path_to_remove)
-        else:
-            os.remove(path_to_remove)
+        with trace_span("delete", TRACE_CATEGORY_CLEANUP, path=path_to_remove):
+            if os.path.isdir(path_to_remove):
+                shutil.rmtree(path_to_remove)
+            else:
+                os.remove(path_to_remove)
     except OSError as e:
         logger.error("Error removing %s: %s", path_to_remove, e)
         return False
@@ -481,6 +462,42 @@ def _atomic_write(
     return True
 
 
+def _atomic_write_bytes(file_path: str, data: bytes, suffix: str = ".tmp") -> bool:
+    """
+    Atomically write `data` to a target path via a temporary file in the same directory.
+
+    Parameters:
+        file_path (str): Destination filesystem path to write.
+        data (bytes): Binary content to write.
+        suffix (str): Suffix to use for the temporary file name (default ".tmp").
+
+    Returns:
+        bool: `True` if the temporary write and atomic replace succeeded, `False` otherwise.
+    """
+    try:
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path), prefix="tmp-", suffix=suffix
+        )
+    except OSError as e:
+        logger.error(f"Could not create temporary file for {file_path}: {e}")
+        return False
+
+    try:
+        with os.fdopen(temp_fd, "wb") as temp_f:
+            temp_f.write(data)
+        os.replace(temp_path, file_path)
+    except OSError as e:
+        logger.error(f"Could not write to {file_path}: {e}")
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return True
+
+
 def _atomic_write_json(file_path: str, data: dict[str, Any]) -> bool:
     """
     Atomically write the given dictionary to the target file as pretty-printed JSON.
@@ -497,6 +514,70 @@ def _atomic_write_json(file_path: str, data: dict[str, Any]) -> bool:
     )
 
 
+def _extraction_manifest_key(
+    zip_hash: str,
+    extract_dir: str,
+    patterns: list[str],
+    exclude_patterns: list[str],
+) -> str:
+    """
+    Build the key an extraction manifest is valid for: archive contents, target directory and normalized patterns.
+    """
+    return json.dumps(
+        [
+            EXTRACTION_MANIFEST_VERSION,
+            zip_hash,
+            os.path.abspath(extract_dir),
+            sorted({str(pattern) for pattern in patterns}),
+            sorted({str(pattern) for pattern in exclude_patterns}),
+        ]
+    )
+
+
+def _extraction_manifest_is_current(zip_path: str, key: str) -> bool:
+    """
+    Return True if the ZIP's extraction manifest matches `key` and every recorded output is unchanged.
+
+    Costs one small JSON read plus a stat per extracted file; any missing, resized or modified output invalidates the manifest.
+    """
+    try:
+        with open(get_extraction_manifest_path(zip_path), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get("key") != key:
+        return False
+    outputs = manifest.get("outputs")
+    if not isinstance(outputs, list):
+        return False
+    for entry in outputs:
+        increment_metric(METRIC_FILES_STATTED)
+        try:
+            output_path, size, mtime_ns = entry
+            stat_result = os.stat(output_path)
+        except (OSError, TypeError, ValueError):
+            return False
+        if stat_result.st_size != size or stat_result.st_mtime_ns != mtime_ns:
+            return False
+    return True
+
+
+def _record_extraction_manifest(zip_path: str, key: str, outputs: list[str]) -> None:
+    """
+    Persist the extracted outputs of a ZIP (with their sizes and mtimes) under `key`.
+    """
+    entries = []
+    for output_path in outputs:
+        try:
+            stat_result = os.stat(output_path)
+        except OSError:
+            return
+        entries.append([output_path, stat_result.st_size, stat_result.st_mtime_ns])
+    _atomic_write_json(
+        get_extraction_manifest_path(zip_path), {"key": key, "outputs": entries}
+    )
+
+
 class FileOperations:
     """
     Provides file operations utilities for the download subsystem.
@@ -585,9 +666,13 @@ class FileOperations:
             return []
 
         extracted_files = []
+        matcher = SelectionMatcher.compile(patterns, exclude_patterns)
 
         try:
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            with (
+                trace_span("extract", TRACE_CATEGORY_EXTRACT, file=zip_path) as span,
+                zipfile.ZipFile(zip_path, "r") as zip_ref,
+            ):
                 for file_info in zip_ref.infolist():
                     # Skip directory entries
                     if file_info.is_dir():
@@ -602,11 +687,11 @@ class FileOperations:
                         continue
 
                     base_name = os.path.basename(file_name)
-                    if self._matches_exclude(base_name, exclude_patterns):
+                    if matcher.is_excluded(base_name):
                         continue
 
                     # Check if file matches any pattern
-                    if matches_selected_patterns(base_name, patterns):
+                    if matcher.matches(base_name):
                         # Extract the file with safe path resolution
                         try:
                             extract_path = safe_extract_path(extract_dir, file_name)
@@ -622,6 +707,7 @@ class FileOperations:
                             open(extract_path, "wb") as target,
                         ):
                             shutil.copyfileobj(source, target)
+                        increment_metric(METRIC_BYTES_DECOMPRESSED, file_info.file_size)
 
                         if os.name != "nt" and base_name.lower().endswith(
                             SHELL_SCRIPT_EXTENSION
@@ -633,6 +719,7 @@ class FileOperations:
 
                         extracted_files.append(Path(extract_path))
                         logger.debug(f"Extracted {file_name} to {extract_path}")
+                span["extracted_files"] = len(extracted_files)
 
             return extracted_files
 
@@ -746,6 +833,8 @@ class FileOperations:
         - One or more matching members, at least one missing or size-stale -> extraction needed.
         - Bad or unreadable ZIP -> returns True to preserve defensive behavior (assume extraction is needed, surface the error).
 
+        When the ZIP has a stored hash, a "not needed" result is recorded in an extraction manifest keyed by the ZIP hash, extract_dir and normalized patterns. Later checks with the same key only stat the recorded outputs instead of reopening the archive.
+
         Parameters:
             zip_path (str): Path to the ZIP archive.
             extract_dir (str): Target directory where files would be extracted.
@@ -766,10 +855,30 @@ class FileOperations:
                 logger.debug("No extraction patterns specified")
                 return False
 
+            # A manifest recorded for this exact archive and pattern set turns the
+            # check into a stat of the previously extracted outputs.
+            zip_hash = load_file_hash(zip_path)
+            manifest_key = (
+                _extraction_manifest_key(
+                    zip_hash, extract_dir, patterns, exclude_patterns
+                )
+                if zip_hash
+                else None
+            )
+            if manifest_key and _extraction_manifest_is_current(zip_path, manifest_key):
+                logger.debug(
+                    f"Extraction manifest for {os.path.basename(zip_path)} is current"
+                    " - skipping extraction"
+                )
+                return False
+
+            matcher = SelectionMatcher.compile(patterns, exclude_patterns)
+
             # Check if all files that would be extracted already exist
             with zipfile.ZipFile(zip_path, "r") as zip_ref:
                 files_to_extract = 0
                 files_existing = 0
+                outputs: list[str] = []
 
                 for file_info in zip_ref.infolist():
                     if file_info.is_dir():
@@ -780,20 +889,22 @@ class FileOperations:
                         continue
 
                     base_name = os.path.basename(file_name)
-                    if self._matches_exclude(base_name, exclude_patterns):
+                    if matcher.is_excluded(base_name):
                         continue
 
-                    if matches_selected_patterns(base_name, patterns):
+                    if matcher.matches(base_name):
                         files_to_extract += 1
                         try:
                             extract_path = safe_extract_path(extract_dir, file_name)
                         except ValueError:
                             # Skip unsafe paths for extraction check
                             continue
+                        increment_metric(METRIC_FILES_STATTED)
                         if os.path.exists(extract_path):
                             # Check if file size matches
                             if os.path.getsize(extract_path) == file_info.file_size:
                                 files_existing += 1
+                                outputs.append(extract_path)
 
                 # No archive members matched the extraction patterns: this is
                 # an expected no-op (e.g. an rp2040/rp2350/stm32 zip when the
@@ -804,6 +915,8 @@ class FileOperations:
                         f"No archive members matched extraction patterns in"
                         f" {os.path.basename(zip_path)} - skipping extraction"
                     )
+                    if manifest_key:
+                        _record_extraction_manifest(zip_path, manifest_key, [])
                     return False
 
                 # If all files that would be extracted already exist with correct sizes,
@@ -812,6 +925,8 @@ class FileOperations:
                     logger.debug(
                         f"All {files_to_extract} files already extracted - skipping extraction"
                     )
+                    if manifest_key:
+                        _record_extraction_manifest(zip_path, manifest_key, outputs)
                     return False
 
                 return True
@@ -867,7 +982,7 @@ class FileOperations:
         """
         Compute cryptographic digests for the provided extracted files and persist SHA-256 hashes to the cache.
 
-        Processes only paths that exist and are readable. The `algorithm` parameter selects the hashing algorithm (case-insensitive); if the algorithm is unsupported it falls back to SHA-256. When `algorithm` is "sha256" the resulting hex digests are saved to the centralized cache via save_file_hash; digests produced with other algorithms are returned but not persisted.
+        Existing paths are hashed in parallel by the shared hashing engine; unreadable files are skipped. The `algorithm` parameter selects the hashing algorithm (case-insensitive); if the algorithm is unsupported it falls back to SHA-256. When `algorithm` is "sha256" the resulting hex digests are saved to the centralized cache via save_file_hash; digests produced with other algorithms are returned but not persisted.
 
         Parameters:
             extracted_files (list[Path]): Iterable of file paths to hash; non-existent or unreadable files are skipped.
@@ -876,60 +991,29 @@ class FileOperations:
         Returns:
             dict[str, str]: Mapping from each processed file's path string to its hexadecimal digest. Only successfully hashed files appear in the mapping.
         """
-        hash_dict = {}
-
+        existing = [str(path) for path in extracted_files if os.path.exists(path)]
         try:
-            # Validate algorithm is available
-            try:
-
-                def hash_func() -> HashAlgorithm:
-                    """
-                    Create a new hash object for the configured algorithm.
+            digests = hash_files(existing, algorithm.lower())
+        except ValueError:
+            logger.warning(f"Unsupported hash algorithm: {algorithm}, using SHA-256")
+            algorithm = "sha256"
+            digests = hash_files(existing, algorithm)
 
-                    Returns:
-                        HashAlgorithm: A fresh hash object suitable for incremental `update` calls and digest computation.
-                    """
-                    return cast(HashAlgorithm, hashlib.new(algorithm.lower()))
-
-                hash_func()  # Test that algorithm is valid
-            except ValueError:
-                logger.warning(
-                    f"Unsupported hash algorithm: {algorithm}, using SHA-256"
+        hash_dict = {}
+        for file_path, hash_value in digests.items():
+            if hash_value is None:
+                logger.error(f"Error generating hash for {file_path}")
+                continue
+            hash_dict[file_path] = hash_value
+            if algorithm.lower() == "sha256":
+                save_file_hash(file_path, hash_value)
+            else:
+                logger.debug(
+                    "Skipping persisted hash sidecar for %s (algorithm=%s)",
+                    file_path,
+                    algorithm,
                 )
-                algorithm = "sha256"
-
-                def hash_func() -> HashAlgorithm:
-                    return cast(HashAlgorithm, hashlib.sha256())
-
-            for file_path in extracted_files:
-                if os.path.exists(file_path):
-                    try:
-                        # Calculate hash
-                        file_hash = hash_func()
-                        with open(file_path, "rb") as f:
-                            for byte_block in iter(lambda: f.read(4096), b""):
-                                file_hash.update(byte_block)
-
-                        hash_value = file_hash.hexdigest()
-                        hash_dict[str(file_path)] = hash_value
-
-                        if algorithm == "sha256":
-                            save_file_hash(str(file_path), hash_value)
-                        else:
-                            logger.debug(
-                                "Skipping persisted hash sidecar for %s (algorithm=%s)",
-                                file_path,
-                                algorithm,
-                            )
-
-                    except IOError as e:
-                        logger.error(f"Error generating hash for {file_path}: {e}")
-
-            return hash_dict
-
-        except (IOError, OSError) as e:
-            logger.error("Error generating hashes for extracted files: %s", e)
-            return {}
+        return hash_dict
 
     def cleanup_file(self, file_path: str) -> bool:
         """
@@ -1018,14 +1102,7 @@ class FileOperations:
         if not os.path.exists(file_path):
             return None
 
-        try:
-            sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        except IOError:
-            return None
+        return hash_file(file_path)
 
 
 def safe_extract_path(extract_dir: str, file_path: str) -> str:
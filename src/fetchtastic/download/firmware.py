@@ -4,11 +4,12 @@ Firmware Release Downloader
 This module implements the specific downloader for Meshtastic firmware releases.
 """
 
-import fnmatch
+import hashlib
 import json
 import os
 import re
 import shutil
+import stat
 import zipfile
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple, cast
@@ -53,6 +54,7 @@ from fetchtastic.constants import (
 )
 from fetchtastic.device_hardware import DeviceHardwareManager
 from fetchtastic.log_utils import logger
+from fetchtastic.tracing import TRACE_CATEGORY_CLEANUP, trace_span
 from fetchtastic.utils import (
     coerce_bool,
     download_file_with_retry,
@@ -73,11 +75,18 @@ from .files import (
     is_zip_intact,
 )
 from .github_source import GithubReleaseSource, create_release_from_github_data
-from .interfaces import Asset, DownloadResult, FirmwareManifest, Release
+from .interfaces import (
+    Asset,
+    DownloadResult,
+    FirmwareManifest,
+    Release,
+    get_release_body,
+)
 from .latest_pointer import remove_latest_pointer, update_latest_pointer
 from .prerelease_history import PrereleaseHistoryManager
 from .release_history import ReleaseHistoryManager
-from .version import VersionManager
+from .selection import SelectionMatcher, get_selection_matcher
+from .version import VersionManager, version_key
 
 _FIRMWARE_SUFFIX_PARTS = [
     "revoked",
@@ -209,6 +218,8 @@ class FirmwareReleaseDownloader(BaseDownloader):
             ),
             api_url=device_api_config.get("api_url", DEVICE_HARDWARE_API_URL),
         )
+        # firmware-nightly/ tree SHA from this run's generation check
+        self._nightly_generation_sha: Optional[str] = None
 
     @property
     def _filter_revoked_releases(self) -> bool:
@@ -454,7 +465,7 @@ class FirmwareReleaseDownloader(BaseDownloader):
         return self._write_release_notes(
             release_dir=release_dir,
             release_tag=release.tag_name,
-            body=release.body,
+            body=lambda: get_release_body(release),
             base_dir=base_dir,
         )
 
@@ -994,12 +1005,16 @@ class FirmwareReleaseDownloader(BaseDownloader):
 
         return results
 
-    def _parse_manifest_data(self, data: Any) -> Optional[FirmwareManifest]:
+    def _parse_manifest_data(
+        self, data: Any, *, keep_raw: bool = False
+    ) -> Optional[FirmwareManifest]:
         """
         Parse raw manifest JSON data into a FirmwareManifest dataclass.
 
         Parameters:
             data (Any): Raw JSON manifest data.
+            keep_raw (bool): Keep `data` as the manifest's raw_data; off by default so
+                the parsed manifest does not hold a second copy of the JSON.
 
         Returns:
             Optional[FirmwareManifest]: Parsed manifest, or None if parsing fails.
@@ -1043,7 +1058,7 @@ class FirmwareReleaseDownloader(BaseDownloader):
                 has_inkhud=data.get("has_inkhud"),
                 files=files,
                 part=part,
-                raw_data=data,
+                raw_data=data if keep_raw else None,
             )
         except (TypeError, ValueError) as exc:
             logger.debug("Failed to parse manifest data: %s", exc)
@@ -1097,6 +1112,7 @@ class FirmwareReleaseDownloader(BaseDownloader):
             )
             return False
 
+        to_verify: list[str] = []
         for asset in expected_assets:
             asset_path = os.path.join(version_dir, asset.name)
             if not os.path.exists(asset_path):
@@ -1120,41 +1136,27 @@ class FirmwareReleaseDownloader(BaseDownloader):
                 logger.debug(f"Error checking file size for {asset_path}")
                 return False
 
-            if asset.name.lower().endswith(".zip"):
-                # If a trusted hash baseline already exists, hash verification is
-                # substantially faster than re-running ZIP member decompression.
-                has_hash_baseline = load_file_hash(asset_path) is not None
-                if has_hash_baseline:
-                    try:
-                        if not self.verify(asset_path):
-                            logger.debug("Hash verification failed for %s", asset_path)
-                            return False
-                    except OSError as e:
-                        logger.debug(
-                            "Error during hash verification for %s: %s", asset_path, e
-                        )
-                        return False
-                    continue
-
-                try:
-                    with zipfile.ZipFile(asset_path, "r") as zf:
-                        if zf.testzip() is not None:
-                            logger.debug(f"Corrupted zip file detected: {asset_path}")
-                            return False
-                    if not self.verify(asset_path):
-                        logger.debug("Hash verification failed for %s", asset_path)
-                        return False
-                except zipfile.BadZipFile:
-                    logger.debug(f"Bad zip file detected: {asset_path}")
-                    return False
-                except (IOError, OSError):
-                    logger.debug(f"Error checking zip file: {asset_path}")
-                    return False
-            else:
-                # For non-zip files, verify the hash
-                if not self.verify(asset_path):
-                    logger.debug("Hash verification failed for %s", asset_path)
+            # If a trusted hash baseline already exists, hash verification is
+            # substantially faster than re-running ZIP member decompression.
+            if (
+                asset.name.lower().endswith(".zip")
+                and load_file_hash(asset_path) is None
+            ):
+                if not is_zip_intact(asset_path):
+                    logger.debug(f"Corrupted zip file detected: {asset_path}")
                     return False
+            to_verify.append(asset_path)
+
+        # Hash all selected assets in one parallel batch
+        try:
+            results = self.verify_files(to_verify)
+        except OSError as e:
+            logger.debug("Error during hash verification for %s: %s", version_dir, e)
+            return False
+        for asset_path in to_verify:
+            if not results.get(asset_path, False):
+                logger.debug("Hash verification failed for %s", asset_path)
+                return False
 
         return True
 
@@ -1619,7 +1621,10 @@ class FirmwareReleaseDownloader(BaseDownloader):
                                 "Removing firmware directory: %s",
                                 entry.path,
                             )
-                            shutil.rmtree(entry.path)
+                            with trace_span(
+                                "delete", TRACE_CATEGORY_CLEANUP, path=entry.path
+                            ):
+                                shutil.rmtree(entry.path)
                             logger.info("Removed old firmware version: %s", entry.name)
                         except OSError as e:
                             logger.error(
@@ -1737,14 +1742,13 @@ class FirmwareReleaseDownloader(BaseDownloader):
         Returns:
             bool: `True` if `filename` matches any pattern, `False` otherwise.
         """
-        filename_lower = filename.lower()
-        return any(
-            fnmatch.fnmatch(filename_lower, str(pattern).lower())
-            for pattern in patterns or []
-        )
+        return get_selection_matcher(None, patterns).is_excluded(filename)
 
     def _matches_prerelease_selection(
-        self, filename: str, selected_patterns: List[str]
+        self,
+        filename: str,
+        selected_patterns: List[str],
+        matcher: Optional[SelectionMatcher] = None,
     ) -> bool:
         """
         Determine whether a prerelease filename should be selected by include patterns.
@@ -1754,11 +1758,20 @@ class FirmwareReleaseDownloader(BaseDownloader):
         - Files matching legacy prerelease extraction patterns are eligible.
         - Release-level manifest JSON (`firmware-<version>.json`) is always eligible
           so target metadata remains available even with narrow pattern filters.
+
+        Parameters:
+            filename (str): Prerelease file name to test.
+            selected_patterns (List[str]): Configured include patterns.
+            matcher (Optional[SelectionMatcher]): Extract matcher precompiled from
+                `selected_patterns`; used instead of re-parsing the patterns when given.
         """
         if not selected_patterns:
             return True
 
-        if matches_extract_patterns(
+        if matcher is not None:
+            if matcher.matches(filename):
+                return True
+        elif matches_extract_patterns(
             filename, selected_patterns, device_manager=self.device_manager
         ):
             return True
@@ -1830,19 +1843,20 @@ class FirmwareReleaseDownloader(BaseDownloader):
             if isinstance(item, dict) and item.get("type") == "file"
         ]
 
+        matcher = SelectionMatcher.compile(
+            selected_patterns, exclude_patterns, self.device_manager, extract=True
+        )
         matching: list[Dict[str, Any]] = []
         for item in file_items:
             name = str(item.get("name") or "")
             if not name:
                 continue
-            if exclude_patterns and self._matches_exclude_patterns(
-                name, exclude_patterns
-            ):
+            if matcher.is_excluded(name):
                 logger.debug(
                     "Skipping pre-release file %s (matched exclude pattern)", name
                 )
                 continue
-            if not self._matches_prerelease_selection(name, selected_patterns):
+            if not self._matches_prerelease_selection(name, selected_patterns, matcher):
                 continue
             matching.append(item)
 
@@ -1865,11 +1879,7 @@ class FirmwareReleaseDownloader(BaseDownloader):
                     if name.lower().endswith(".zip"):
                         has_hash_baseline = load_file_hash(target_path) is not None
                         if not has_hash_baseline:
-                            try:
-                                with zipfile.ZipFile(target_path, "r") as zf:
-                                    zip_ok = zf.testzip() is None
-                            except (zipfile.BadZipFile, IOError):
-                                zip_ok = False
+                            zip_ok = is_zip_intact(target_path)
 
                     if zip_ok and verify_file_integrity(target_path):
                         logger.debug(
@@ -2335,13 +2345,10 @@ class FirmwareReleaseDownloader(BaseDownloader):
 
     @staticmethod
     def _sort_prerelease_dirs(dirs: List[str]) -> List[str]:
-        """Deduplicate and sort prerelease directory names by parsed version tuple, then directory string as tie breaker."""
-        version_manager = VersionManager()
+        """Deduplicate and sort prerelease directory names by version key, then directory string as tie breaker."""
 
         def sort_key(directory: str) -> Tuple:
-            identifier = directory.removeprefix(FIRMWARE_DIR_PREFIX)
-            version_tuple = version_manager.get_release_tuple(identifier) or ()
-            return (version_tuple, directory)
+            return (version_key(directory.removeprefix(FIRMWARE_DIR_PREFIX)), directory)
 
         seen: set[str] = set()
         unique_dirs: list[str] = []
@@ -2827,7 +2834,12 @@ class FirmwareReleaseDownloader(BaseDownloader):
                                         if dir_tuple <= release_tuple:
                                             prerelease_path = entry.path
                                             try:
-                                                shutil.rmtree(prerelease_path)
+                                                with trace_span(
+                                                    "delete",
+                                                    TRACE_CATEGORY_CLEANUP,
+                                                    path=prerelease_path,
+                                                ):
+                                                    shutil.rmtree(prerelease_path)
                                                 logger.info(
                                                     f"Removed superseded prerelease: {entry.name}"
                                                 )
@@ -2897,6 +2909,91 @@ class FirmwareReleaseDownloader(BaseDownloader):
         """Cache path to the latest firmware-nightly tracking JSON."""
         return self.cache_manager.get_cache_file_path(LATEST_FIRMWARE_NIGHTLY_JSON_FILE)
 
+    def get_nightly_generation_sha(self) -> Optional[str]:
+        """
+        Return the live git tree SHA of ``firmware-nightly/``.
+
+        The SHA changes whenever upstream replaces the directory, so it identifies a
+        nightly generation. It is read from the repo tree revalidated for this run,
+        which :meth:`fetch_firmware_nightlies` then reuses, so an unchanged site costs
+        one ``304`` (or nothing when the GraphQL batch confirmed the tree). The root
+        Contents listing is only used when the tree is unavailable or truncated. The
+        SHA is remembered for :meth:`update_nightly_tracking`.
+
+        Returns:
+            Optional[str]: The tree SHA, or None when nightlies are disabled or the
+            tree and listing are unavailable or lack the directory.
+        """
+        self._nightly_generation_sha = None
+        if not self._nightlies_enabled():
+            return None
+        sha = self.cache_manager.get_repo_directory_sha(
+            FIRMWARE_NIGHTLY_SOURCE_DIR,
+            github_token=self.config.get("GITHUB_TOKEN"),
+            allow_env_token=self.config.get("ALLOW_ENV_TOKEN", True),
+        )
+        self._nightly_generation_sha = sha
+        return sha
+
+    def _nightly_selection_fingerprint(self) -> str:
+        """Hash of the extraction and exclude patterns that decide the nightly selection."""
+        payload = json.dumps(
+            [self._get_nightly_selection_patterns(), self._get_exclude_patterns()],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_finalized_nightly_build(
+        self, generation_sha: str
+    ) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Return the tracked build and its selected assets if nothing has changed since it was finalized.
+
+        All of these must still hold: `generation_sha` is the generation recorded at
+        finalization, the selection patterns hash to the recorded fingerprint (so the
+        selected set would be the same), and every recorded asset is still a regular
+        file of the recorded size in the build directory.
+
+        Parameters:
+            generation_sha (str): Current ``firmware-nightly/`` tree SHA.
+
+        Returns:
+            Optional[Tuple[str, List[Dict[str, Any]]]]: The finalized build-id and its
+            selected entries (``name``, ``size``, ``type``), or None if it must be
+            checked against the live listing.
+        """
+        if not generation_sha:
+            return None
+        try:
+            data = self.cache_manager.read_json(self._nightly_tracking_path())
+        except (OSError, ValueError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("generation_sha") != generation_sha:
+            return None
+        build_id = data.get("build_id")
+        assets = data.get("selected_assets")
+        if (
+            not isinstance(build_id, str)
+            or not isinstance(assets, dict)
+            or not assets
+            or data.get("selection_fingerprint")
+            != self._nightly_selection_fingerprint()
+        ):
+            return None
+        selected: List[Dict[str, Any]] = []
+        for name, size in sorted(assets.items()):
+            try:
+                target = self.get_nightly_target_path(build_id, name, create=False)
+                st = os.lstat(target)
+            except (OSError, ValueError):
+                return None
+            if not stat.S_ISREG(st.st_mode) or (
+                isinstance(size, int) and st.st_size != size
+            ):
+                return None
+            selected.append({"name": name, "size": size, "type": "file"})
+        return build_id, selected
+
     def fetch_firmware_nightlies(self) -> List[Dict[str, Any]]:
         """
         Fetch the flat GitHub Contents listing of the rolling firmware-nightly directory.
@@ -3256,7 +3353,9 @@ class FirmwareReleaseDownloader(BaseDownloader):
         if not patterns:
             return []
 
-        exclude_patterns = self._get_exclude_patterns()
+        matcher = SelectionMatcher.compile(
+            patterns, self._get_exclude_patterns(), self.device_manager, extract=True
+        )
 
         # Collect the release manifest (this build) separately from non-release
         # matches so we can fail-closed when no eligible device file survives.
@@ -3289,14 +3388,10 @@ class FirmwareReleaseDownloader(BaseDownloader):
             if token_match and token_match.group(1).lower() != build_id:
                 continue
 
-            if exclude_patterns and self._matches_exclude_patterns(
-                name, exclude_patterns
-            ):
+            if matcher.is_excluded(name):
                 continue
 
-            if matches_extract_patterns(
-                name, patterns, device_manager=self.device_manager
-            ):
+            if matcher.matches(name):
                 non_release.append(entry)
                 seen_names.add(name)
 
@@ -3443,18 +3538,34 @@ class FirmwareReleaseDownloader(BaseDownloader):
                 return True
         return False
 
-    def update_nightly_tracking(self, build_id: str) -> bool:
+    def update_nightly_tracking(
+        self, build_id: str, selected: Optional[List[Dict[str, Any]]] = None
+    ) -> bool:
         """
         Persist the supplied build-id to the nightly tracking JSON.  Callers must
         only invoke this after all selected assets have downloaded successfully.
+
+        When ``selected`` (the finalized selected set) is given, the
+        ``firmware-nightly/`` tree SHA from this run's generation check, the
+        selected asset names and sizes, and a fingerprint of the selection
+        patterns are recorded with it, so :meth:`get_finalized_nightly_build` can
+        skip an unchanged generation next run.
         """
         if not build_id:
             return False
-        data = {
+        data: Dict[str, Any] = {
             "build_id": build_id,
             "file_type": FILE_TYPE_FIRMWARE_NIGHTLY,
             "last_updated": self._get_current_iso_timestamp(),
         }
+        if self._nightly_generation_sha and selected:
+            data["generation_sha"] = self._nightly_generation_sha
+            data["selection_fingerprint"] = self._nightly_selection_fingerprint()
+            data["selected_assets"] = {
+                entry["name"]: entry.get("size")
+                for entry in selected
+                if isinstance(entry.get("name"), str) and entry["name"]
+            }
         return self.cache_manager.atomic_write_json(self._nightly_tracking_path(), data)
 
     def _remove_nightly_target_and_hash(self, target_path: str) -> None:
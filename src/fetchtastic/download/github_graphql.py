@@ -0,0 +1,351 @@
+"""
+Batched GitHub metadata over the GraphQL API.
+
+Discovery otherwise makes one REST request per endpoint: the firmware releases, the
+client app releases (re-paged when more history is needed), the Android snapshot
+release and the meshtastic.github.io commits and tree. With a token, the GraphQL API
+can answer all of these in a single query.
+
+``GraphQLMetadataSource`` runs that query at most once per pipeline run, on first
+use, and serves the results in the REST payload shape so the existing parsers and
+caches consume them unchanged. It is an accelerator only: whenever it cannot answer
+(no token, query failure, a field that failed to resolve, a release with more
+assets than the batch holds, or a request for more history than the batch holds)
+the caller makes its usual REST request.
+"""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import requests  # type: ignore[import-untyped]
+
+from fetchtastic.constants import (
+    DEFAULT_USE_GITHUB_GRAPHQL,
+    GRAPHQL_ASSETS_PER_RELEASE,
+    GRAPHQL_RELEASES_PER_REPO,
+    MESHTASTIC_ANDROID_SNAPSHOT_TAG,
+    MESHTASTIC_CLIENT_APP_RELEASES_URL,
+    MESHTASTIC_FIRMWARE_RELEASES_URL,
+)
+from fetchtastic.log_utils import logger
+from fetchtastic.utils import (
+    coerce_bool,
+    make_github_graphql_request,
+    select_github_token,
+)
+
+_RELEASE_FIELDS = """
+fragment ReleaseFields on Release {
+  tagName
+  name
+  isPrerelease
+  isDraft
+  publishedAt
+  createdAt
+  description
+  releaseAssets(first: $assets) {
+    pageInfo { hasNextPage }
+    nodes { name size downloadUrl contentType digest updatedAt }
+  }
+}
+"""
+
+METADATA_QUERY = """
+query FetchtasticMetadata($releases: Int!, $assets: Int!, $snapshotTag: String!) {
+  firmware: repository(owner: "meshtastic", name: "firmware") {
+    releases(first: $releases, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage }
+      nodes { ...ReleaseFields }
+    }
+  }
+  clientApp: repository(owner: "meshtastic", name: "Meshtastic-Android") {
+    releases(first: $releases, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage }
+      nodes { ...ReleaseFields }
+    }
+    snapshot: release(tagName: $snapshotTag) { ...ReleaseFields }
+  }
+  site: repository(owner: "meshtastic", name: "meshtastic.github.io") {
+    defaultBranchRef {
+      target { ... on Commit { oid committedDate tree { oid } } }
+    }
+  }
+}
+""" + _RELEASE_FIELDS
+
+# Query aliases answering each REST releases endpoint
+_RELEASE_LIST_ALIASES = {
+    MESHTASTIC_FIRMWARE_RELEASES_URL: "firmware",
+    MESHTASTIC_CLIENT_APP_RELEASES_URL: "clientApp",
+}
+
+
+def graphql_asset_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL ``ReleaseAsset`` node to the REST asset fields fetchtastic reads."""
+    return {
+        "name": node.get("name"),
+        "size": node.get("size"),
+        "browser_download_url": node.get("downloadUrl"),
+        "content_type": node.get("contentType"),
+        "digest": node.get("digest"),
+        "updated_at": node.get("updatedAt"),
+    }
+
+
+def _assets_truncated(node: Dict[str, Any]) -> bool:
+    """Return whether a GraphQL ``Release`` node holds only some of its assets."""
+    assets = node.get("releaseAssets")
+    page_info = assets.get("pageInfo") if isinstance(assets, dict) else None
+    return not isinstance(page_info, dict) or bool(page_info.get("hasNextPage", True))
+
+
+def _error_paths(errors: Sequence[Dict[str, Any]]) -> Set[str]:
+    """Return the top-level query aliases (and ``alias.field`` pairs) that errored."""
+    paths: Set[str] = set()
+    for error in errors:
+        path = error.get("path")
+        if isinstance(path, list) and path:
+            paths.add(str(path[0]))
+            if len(path) > 1:
+                paths.add(f"{path[0]}.{path[1]}")
+    return paths
+
+
+def graphql_release_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a GraphQL ``Release`` node to the projected REST release payload.
+
+    The result has the same keys as ``github_source.project_release_data`` output, so
+    it can be cached and parsed exactly like a REST response.
+    """
+    assets = node.get("releaseAssets")
+    asset_nodes = assets.get("nodes") if isinstance(assets, dict) else None
+    return {
+        "tag_name": node.get("tagName"),
+        "prerelease": bool(node.get("isPrerelease")),
+        "published_at": node.get("publishedAt"),
+        "created_at": node.get("createdAt"),
+        "name": node.get("name"),
+        "body": node.get("description"),
+        "assets": [
+            graphql_asset_to_rest(asset)
+            for asset in (asset_nodes if isinstance(asset_nodes, list) else [])
+            if isinstance(asset, dict)
+        ],
+    }
+
+
+@dataclass(slots=True)
+class GraphQLMetadata:
+    """Decoded result of one metadata query, in REST payload shapes."""
+
+    # Releases URL -> (releases newest first, whether older releases exist)
+    releases: Dict[str, Tuple[List[Dict[str, Any]], bool]] = field(default_factory=dict)
+    # Whether the snapshot lookup resolved (a missing release also resolves, as null)
+    snapshot_answered: bool = False
+    snapshot_release: Optional[Dict[str, Any]] = None
+    # Head commit of meshtastic.github.io: sha, date and tree_sha
+    site_head: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def from_data(
+        cls, data: Dict[str, Any], errors: Sequence[Dict[str, Any]] = ()
+    ) -> "GraphQLMetadata":
+        """
+        Build the metadata from a metadata query response.
+
+        Parts of the response named by an error, and release lists or releases with
+        truncated assets, are left unanswered so their lookups fall back to REST.
+
+        Parameters:
+            data (Dict[str, Any]): The response's ``data`` object.
+            errors (Sequence[Dict[str, Any]]): The response's ``errors`` list.
+        """
+        metadata = cls()
+        failed = _error_paths(errors)
+        for releases_url, alias in _RELEASE_LIST_ALIASES.items():
+            if f"{alias}.releases" in failed:
+                continue
+            repository = data.get(alias)
+            releases = (
+                repository.get("releases") if isinstance(repository, dict) else None
+            )
+            if not isinstance(releases, dict) or not isinstance(
+                releases.get("nodes"), list
+            ):
+                continue
+            nodes = [
+                node
+                for node in releases["nodes"]
+                # Drafts are not listed by the REST API for most tokens
+                if isinstance(node, dict) and not node.get("isDraft")
+            ]
+            if any(_assets_truncated(node) for node in nodes):
+                continue
+            page_info = releases.get("pageInfo")
+            has_more = not isinstance(page_info, dict) or bool(
+                page_info.get("hasNextPage", True)
+            )
+            metadata.releases[releases_url] = (
+                [graphql_release_to_rest(node) for node in nodes],
+                has_more,
+            )
+
+        client_app = data.get("clientApp")
+        if isinstance(client_app, dict) and "clientApp.snapshot" not in failed:
+            snapshot = client_app.get("snapshot")
+            if snapshot is None:
+                metadata.snapshot_answered = True
+            elif isinstance(snapshot, dict) and not _assets_truncated(snapshot):
+                metadata.snapshot_answered = True
+                metadata.snapshot_release = graphql_release_to_rest(snapshot)
+
+        site = data.get("site") if "site" not in failed else None
+        branch = site.get("defaultBranchRef") if isinstance(site, dict) else None
+        target = branch.get("target") if isinstance(branch, dict) else None
+        if isinstance(target, dict) and isinstance(target.get("oid"), str):
+            tree = target.get("tree")
+            metadata.site_head = {
+                "sha": target["oid"],
+                "date": target.get("committedDate") or "",
+                "tree_sha": (tree.get("oid") if isinstance(tree, dict) else "") or "",
+            }
+        return metadata
+
+
+class GraphQLMetadataSource:
+    """Answers release and site-head lookups from a single GraphQL query per run."""
+
+    def __init__(self, github_token: Optional[str], allow_env_token: bool = True):
+        """
+        Create a metadata source for the given token settings.
+
+        Parameters:
+            github_token (Optional[str]): Token to use for the query, if any.
+            allow_env_token (bool): Whether a token from the environment may be used.
+        """
+        self.github_token = github_token
+        self.allow_env_token = allow_env_token
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._metadata: Optional[GraphQLMetadata] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["GraphQLMetadataSource"]:
+        """
+        Create a metadata source when ``USE_GITHUB_GRAPHQL`` is enabled and a token is available.
+
+        Parameters:
+            config (Dict[str, Any]): Fetchtastic configuration.
+
+        Returns:
+            Optional[GraphQLMetadataSource]: The source, or None when REST is used alone.
+        """
+        if not coerce_bool(
+            config.get("USE_GITHUB_GRAPHQL", DEFAULT_USE_GITHUB_GRAPHQL),
+            DEFAULT_USE_GITHUB_GRAPHQL,
+        ):
+            return None
+        github_token = config.get("GITHUB_TOKEN")
+        allow_env_token = config.get("ALLOW_ENV_TOKEN", True)
+        if not select_github_token(github_token, allow_env_token):
+            logger.debug("USE_GITHUB_GRAPHQL is set but no token is available")
+            return None
+        return cls(github_token, allow_env_token)
+
+    def reset(self) -> None:
+        """Forget the previous query result so the next lookup runs the query again."""
+        with self._lock:
+            self._loaded = False
+            self._metadata = None
+
+    def _load(self) -> Optional[GraphQLMetadata]:
+        """Run the metadata query on first use; return None if it failed."""
+        with self._lock:
+            if self._loaded:
+                return self._metadata
+            self._loaded = True
+            try:
+                data, errors = make_github_graphql_request(
+                    METADATA_QUERY,
+                    {
+                        "releases": GRAPHQL_RELEASES_PER_REPO,
+                        "assets": GRAPHQL_ASSETS_PER_RELEASE,
+                        "snapshotTag": MESHTASTIC_ANDROID_SNAPSHOT_TAG,
+                    },
+                    github_token=self.github_token,
+                    allow_env_token=self.allow_env_token,
+                )
+                self._metadata = GraphQLMetadata.from_data(data, errors)
+            except (
+                requests.RequestException,
+                ValueError,
+                KeyError,
+                TypeError,
+                json.JSONDecodeError,
+            ) as exc:
+                logger.warning(
+                    "GitHub GraphQL metadata query failed; using the REST API: %s", exc
+                )
+                return None
+            logger.debug(
+                "Fetched GitHub metadata via GraphQL (%s)",
+                ", ".join(
+                    f"{len(releases)} releases from {url}"
+                    for url, (releases, _more) in self._metadata.releases.items()
+                ),
+            )
+            return self._metadata
+
+    def get_releases(
+        self, releases_url: str, per_page: Optional[int]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the newest releases of a repository in the REST payload shape.
+
+        Parameters:
+            releases_url (str): REST releases URL of the repository.
+            per_page (Optional[int]): Number of releases the REST request would ask for.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Up to `per_page` releases, or None when the
+            repository is not covered, the batch holds fewer releases than requested,
+            or a release in the batch has more assets than it holds.
+        """
+        if releases_url not in _RELEASE_LIST_ALIASES:
+            return None
+        metadata = self._load()
+        if metadata is None or releases_url not in metadata.releases:
+            return None
+        releases, has_more = metadata.releases[releases_url]
+        if not isinstance(per_page, int) or per_page <= 0:
+            return None
+        if per_page > len(releases) and has_more:
+            return None
+        return releases[:per_page]
+
+    def get_snapshot_release(self) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Return the rolling Android snapshot release in the REST payload shape.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]: Whether the batch could answer, and
+            the release (None if the snapshot tag has no release).
+        """
+        metadata = self._load()
+        if metadata is None or not metadata.snapshot_answered:
+            return False, None
+        return True, metadata.snapshot_release
+
+    def get_site_head(self) -> Optional[Dict[str, str]]:
+        """
+        Return the head commit of meshtastic.github.io.
+
+        Returns:
+            Optional[Dict[str, str]]: ``sha``, ``date`` and ``tree_sha`` of the default
+            branch head, or None if unavailable.
+        """
+        metadata = self._load()
+        return metadata.site_head if metadata is not None else None
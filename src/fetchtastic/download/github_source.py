@@ -15,8 +15,96 @@ from fetchtastic.log_utils import logger
 from fetchtastic.utils import make_github_api_request
 
 from .cache import CacheManager
+from .github_graphql import GraphQLMetadataSource
 from .interfaces import Asset, Release
 
+# Release and asset fields fetchtastic reads from GitHub release payloads. Everything
+# else (author/uploader objects, reactions, API URLs, ids) is dropped before caching.
+RELEASE_PAYLOAD_FIELDS = (
+    "tag_name",
+    "prerelease",
+    "published_at",
+    "created_at",
+    "name",
+    "body",
+)
+ASSET_PAYLOAD_FIELDS = (
+    "name",
+    "size",
+    "browser_download_url",
+    "content_type",
+    "digest",
+    "updated_at",
+)
+
+
+def project_release_data(release_data: Any) -> Any:
+    """
+    Reduce a GitHub release payload to the fields fetchtastic consumes.
+
+    Missing fields stay missing (so callers' ``.get`` defaults still apply) and
+    malformed values (non-dict releases or assets, non-list asset fields) are passed
+    through unchanged so the usual validation skips them.
+
+    Parameters:
+        release_data (Any): Release dict from the GitHub releases API.
+
+    Returns:
+        Any: A compact release dict, or `release_data` itself when it is not a dict.
+    """
+    if not isinstance(release_data, dict):
+        return release_data
+    projected = {
+        key: release_data[key] for key in RELEASE_PAYLOAD_FIELDS if key in release_data
+    }
+    assets = release_data.get("assets")
+    if isinstance(assets, list):
+        projected["assets"] = [
+            (
+                {key: asset[key] for key in ASSET_PAYLOAD_FIELDS if key in asset}
+                if isinstance(asset, dict)
+                else asset
+            )
+            for asset in assets
+        ]
+    elif "assets" in release_data:
+        projected["assets"] = assets
+    return projected
+
+
+def project_releases_data(releases_data: List[Any]) -> List[Any]:
+    """Apply project_release_data to every entry of a releases API response."""
+    return [project_release_data(release_data) for release_data in releases_data]
+
+
+class CachedReleaseBody:
+    """
+    Loader for release notes offloaded to the releases cache (see Release.offload_body).
+
+    A plain object rather than a closure so the warm-start snapshot can record where
+    the notes live and rebuild the loader.
+    """
+
+    __slots__ = ("cache_manager", "url_key", "tag_name")
+
+    def __init__(self, cache_manager: CacheManager, url_key: str, tag_name: str):
+        """
+        Create a loader for the cached notes of one release.
+
+        Parameters:
+            cache_manager (CacheManager): Cache manager owning the releases cache.
+            url_key (str): Releases cache key holding the release.
+            tag_name (str): Tag of the release.
+        """
+        self.cache_manager = cache_manager
+        self.url_key = url_key
+        self.tag_name = tag_name
+
+    def __call__(self) -> Optional[str]:
+        """Return the cached release body, or None if it is no longer cached."""
+        body = self.cache_manager.read_cached_release_body(self.url_key, self.tag_name)
+        return body if isinstance(body, str) else None
+
 
 class GithubReleaseSource:
     """
@@ -83,16 +171,23 @@ class GithubReleaseSource:
                 url_key, expiry_seconds=int(RELEASES_CACHE_EXPIRY_HOURS * 3600)
             )
 
+            # Release notes are only offloaded when the cache entry holds them.
+            notes_cached = releases_data is not None
+
             if releases_data is None:
                 releases_data = self._fetch_from_api(params)
                 if isinstance(releases_data, list):
+                    releases_data = project_releases_data(releases_data)
                     logger.debug(
                         "Cached %d releases for %s (fetched from API)",
                         len(releases_data),
                         self.releases_url,
                     )
-                    self.cache_manager.write_releases_cache_entry(
-                        url_key, releases_data
+                    notes_cached = (
+                        self.cache_manager.write_releases_cache_entry(
+                            url_key, releases_data
+                        )
+                        is True
                     )
                 else:
                     logger.debug(
@@ -129,6 +224,10 @@ class GithubReleaseSource:
                     )
                     continue
                 if release is not None:
+                    if notes_cached and isinstance(release, Release):
+                        release.offload_body(
+                            self._cached_body_loader(url_key, release.tag_name)
+                        )
                     releases.append(release)
 
             return releases
@@ -145,6 +244,19 @@ class GithubReleaseSource:
             )
             return []
 
+    def _cached_body_loader(self, url_key: str, tag_name: str) -> "CachedReleaseBody":
+        """
+        Build a loader that reads a release's notes back from the releases cache.
+
+        Parameters:
+            url_key (str): Releases cache key the release was read from or written to.
+            tag_name (str): Tag of the release.
+
+        Returns:
+            CachedReleaseBody: Returns the cached release body, or None, when called.
+        """
+        return CachedReleaseBody(self.cache_manager, url_key, tag_name)
+
     def fetch_raw_releases_data(
         self, params: Dict[str, Any]
     ) -> Optional[List[Dict[str, Any]]]:
@@ -173,6 +285,7 @@ class GithubReleaseSource:
             if releases_data is None:
                 releases_data = self._fetch_from_api(params)
                 if isinstance(releases_data, list):
+                    releases_data = project_releases_data(releases_data)
                     logger.debug(
                         "Cached %d releases for %s (fetched from API)",
                         len(releases_data),
@@ -212,10 +325,22 @@ class GithubReleaseSource:
         Parameters:
             params (Dict[str, Any]): Query parameters for the API request.
 
+        When the cache manager has a GraphQL metadata batch that covers the request,
+        the releases are taken from it instead of a REST request.
+
         Returns:
             Optional[List[Dict[str, Any]]]: List of release dicts from the API response,
                 or None if the request failed or returned invalid data.
         """
+        metadata_source = getattr(self.cache_manager, "metadata_source", None)
+        if isinstance(metadata_source, GraphQLMetadataSource) and set(params) <= {
+            "per_page"
+        }:
+            releases_data = metadata_source.get_releases(
+                self.releases_url, params.get("per_page")
+            )
+            if releases_data is not None:
+                return releases_data
         response = make_github_api_request(
             self.releases_url,
             self.config.get("GITHUB_TOKEN"),
@@ -230,7 +355,8 @@ def create_release_from_github_data(release_data: Dict[str, Any]) -> Optional[Re
     Create a Release object from GitHub API release data.
 
     This is a default parser that creates a Release with standard fields
-    and populates it with all assets from the release.
+    and populates it with all assets from the release. The release and asset
+    classifications are computed here, once (see ``Release.classify``).
 
     Parameters:
         release_data (Dict[str, Any]): Raw release data from GitHub API.
@@ -267,7 +393,7 @@ def create_release_from_github_data(release_data: Dict[str, Any]) -> Optional[Re
         logger.warning("Skipping release %s with no valid assets", tag_name)
         return None
 
-    return release
+    return release.classify()
 
 
 def create_asset_from_github_data(
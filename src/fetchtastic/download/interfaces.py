@@ -5,19 +5,101 @@ This module defines the fundamental interfaces and data structures that form
 the foundation of the modular download architecture.
 """
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from fetchtastic.client_release_discovery import (
+    is_android_asset_name,
+    is_desktop_asset_name,
+)
+from fetchtastic.constants import (
+    FILE_TYPE_ANDROID,
+    FILE_TYPE_DESKTOP,
+    FIRMWARE_DIR_PREFIX,
+    FIRMWARE_MANIFEST_EXTENSION,
+)
+from fetchtastic.utils import extract_base_name
 
 Pathish = Union[str, Path]
 
 if TYPE_CHECKING:
     from .cache import CacheManager
+    from .client_app import ApkIdentity
     from .version import VersionManager
 
+_T = TypeVar("_T")
 
-@dataclass
+
+def cached_classification(
+    obj: Any, key: str, inputs: Tuple[Any, ...], compute: Callable[[], _T]
+) -> _T:
+    """
+    Return a classification of `obj` memoised on the object itself.
+
+    Release and asset classifications (channel, revoked status, platform, ...) are
+    derived from a few text fields but consulted many times per run. The result is
+    stored in the object's ``_classification_cache`` together with the `inputs` it
+    was derived from, so it is recomputed only if those fields change. Objects
+    without a cache (e.g. test doubles) are classified afresh on every call.
+
+    Parameters:
+        obj (Any): Release or Asset (or a stand-in object).
+        key (str): Classification name.
+        inputs (Tuple[Any, ...]): Field values the classification depends on.
+        compute (Callable[[], _T]): Computes the classification from `obj`.
+
+    Returns:
+        _T: The cached or freshly computed classification.
+    """
+    cache = getattr(obj, "_classification_cache", None)
+    if not isinstance(cache, dict):
+        return compute()
+    entry = cache.get(key)
+    if entry is not None and entry[0] == inputs:
+        return entry[1]
+    value = compute()
+    cache[key] = (inputs, value)
+    return value
+
+
+def classify_asset_platform(name: Any) -> Optional[str]:
+    """Return the client app platform of an asset file name ('android' or 'desktop'), or None."""
+    if not isinstance(name, str) or not name:
+        return None
+    if is_android_asset_name(name):
+        return FILE_TYPE_ANDROID
+    if is_desktop_asset_name(name):
+        return FILE_TYPE_DESKTOP
+    return None
+
+
+def is_firmware_manifest_name(name: str) -> bool:
+    """Whether a file name is a firmware JSON manifest (per-device ``.mt.json`` or release-level)."""
+    name_lower = name.lower()
+    return name_lower.endswith(FIRMWARE_MANIFEST_EXTENSION) or (
+        name_lower.startswith(FIRMWARE_DIR_PREFIX) and name_lower.endswith(".json")
+    )
+
+
+# Leading lines of release notes kept in memory when the full notes are offloaded;
+# revocation notices are only recognised within this many lines.
+RELEASE_NOTES_PREVIEW_LINES = 14
+
+
+@dataclass(slots=True)
 class Release:
     """Represents a software release from a repository."""
 
@@ -36,11 +118,112 @@ class Release:
     body: Optional[str] = None
     """Release notes/markdown content"""
 
+    created_at: Optional[str] = None
+    """ISO 8601 creation timestamp (ordering fallback when published_at is missing)"""
+
     assets: List["Asset"] = field(default_factory=list)
     """List of downloadable assets for this release"""
 
+    body_preview: Optional[str] = field(default=None, repr=False, compare=False)
+    """Leading lines of the release notes when `body` has been offloaded"""
+
+    notes_loader: Optional[Callable[[], Optional[str]]] = field(
+        default=None, repr=False, compare=False
+    )
+    """Loads the full release notes on demand when `body` has been offloaded"""
+
+    _classification_cache: Dict[str, Tuple[Any, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Memoised classifications (see cached_classification)"""
+
+    def offload_body(self, loader: Callable[[], Optional[str]]) -> None:
+        """
+        Drop the in-memory release notes, keeping only a short preview.
+
+        The full notes are fetched again through `loader` by get_body() (e.g. when
+        writing release notes to disk). The preview holds the first
+        RELEASE_NOTES_PREVIEW_LINES lines, which is all revocation checks read.
+
+        Parameters:
+            loader (Callable[[], Optional[str]]): Returns the full release notes.
+        """
+        if self.body is None:
+            return
+        self.body_preview = "\n".join(
+            self.body.splitlines()[:RELEASE_NOTES_PREVIEW_LINES]
+        )
+        self.notes_loader = loader
+        self.body = None
+
+    def get_body(self) -> Optional[str]:
+        """
+        Return the full release notes, loading offloaded notes on demand.
+
+        Loaded notes are not retained, so callers that need them repeatedly should
+        keep the returned value.
+        """
+        if self.body is not None or self.notes_loader is None:
+            return self.body
+        return self.notes_loader()
+
+    def get_body_head(self) -> Optional[str]:
+        """Return the in-memory release notes, or their preview when offloaded."""
+        return self.body if self.body is not None else self.body_preview
+
+    @property
+    def channel(self) -> str:
+        """Release channel ('alpha', 'beta' or 'rc') inferred from name and tag."""
+        from .release_history import detect_release_channel
+
+        return detect_release_channel(self)
+
+    @property
+    def is_revoked(self) -> bool:
+        """Whether the release title or notes mark it as revoked."""
+        from .release_history import is_release_revoked
+
+        return is_release_revoked(self)
+
+    @property
+    def is_snapshot(self) -> bool:
+        """Whether this is the rolling Android snapshot debug-build release."""
+        from .client_app import is_snapshot_tag
 
-@dataclass
+        return cached_classification(
+            self, "snapshot", (self.tag_name,), lambda: is_snapshot_tag(self.tag_name)
+        )
+
+    def classify(self) -> "Release":
+        """
+        Compute the classifications of the release and its assets now.
+
+        Parsers call this once per release, so filters, summaries and history
+        updates read cached fields instead of re-running the classifiers.
+
+        Returns:
+            Release: This release.
+        """
+        _ = (self.channel, self.is_revoked, self.is_snapshot)
+        for asset in self.assets:
+            asset.classify()
+        return self
+
+
+def get_release_body(release: Any) -> Optional[str]:
+    """
+    Return the full release notes of `release`, loading offloaded notes on demand.
+
+    Accepts Release objects as well as release-like stand-ins that only carry a
+    ``body`` attribute.
+    """
+    if isinstance(release, Release):
+        return release.get_body()
+    body = getattr(release, "body", None)
+    return body if isinstance(body, str) else None
+
+
+@dataclass(slots=True)
 class Asset:
     """Represents a downloadable asset from a release."""
 
@@ -59,8 +242,63 @@ class Asset:
     content_type: Optional[str] = None
     """MIME type of the asset"""
 
-
-@dataclass
+    _classification_cache: Dict[str, Tuple[Any, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    """Memoised classifications (see cached_classification)"""
+
+    @property
+    def platform(self) -> Optional[str]:
+        """Client app platform ('android' or 'desktop'), or None for other assets."""
+        return cached_classification(
+            self, "platform", (self.name,), lambda: classify_asset_platform(self.name)
+        )
+
+    @property
+    def apk_identity(self) -> Optional["ApkIdentity"]:
+        """Flavor/ABI identity for Android APK assets, or None."""
+        from .client_app import _parse_apk_identity
+
+        return cached_classification(
+            self, "apk_identity", (self.name,), lambda: _parse_apk_identity(self.name)
+        )
+
+    @property
+    def base_name(self) -> str:
+        """Asset name with version numbers stripped (see extract_base_name)."""
+        return cached_classification(
+            self, "base_name", (self.name,), lambda: extract_base_name(self.name)
+        )
+
+    @property
+    def is_manifest(self) -> bool:
+        """Whether the asset is a firmware JSON manifest (per-device or release-level)."""
+        return cached_classification(
+            self, "manifest", (self.name,), lambda: is_firmware_manifest_name(self.name)
+        )
+
+    def classify(self) -> "Asset":
+        """Compute the asset's classifications now (see Release.classify)."""
+        _ = (self.platform, self.apk_identity, self.base_name, self.is_manifest)
+        return self
+
+
+def get_asset_platform(asset: Any) -> Optional[str]:
+    """Return ``Asset.platform``, classifying the name of stand-in asset objects directly."""
+    if isinstance(asset, Asset):
+        return asset.platform
+    return classify_asset_platform(getattr(asset, "name", None))
+
+
+def is_manifest_asset(asset: Any) -> bool:
+    """Return ``Asset.is_manifest``, classifying the name of stand-in asset objects directly."""
+    if isinstance(asset, Asset):
+        return asset.is_manifest
+    name = getattr(asset, "name", None)
+    return isinstance(name, str) and is_firmware_manifest_name(name)
+
+
+@dataclass(slots=True, frozen=True)
 class FirmwareManifest:
     """Represents a Meshtastic firmware manifest file (.mt.json)."""
 
@@ -98,10 +336,10 @@ class FirmwareManifest:
     """Partition information (name, offset, size)"""
 
     raw_data: Optional[dict[str, Any]] = None
-    """Raw manifest data for extensibility"""
+    """Raw manifest data for extensibility (only kept when explicitly requested)"""
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a download operation."""
 
@@ -151,6 +389,29 @@ class DownloadResult:
     was_skipped: bool = False
     """Whether this result represents a skip (already complete) rather than a new download."""
 
+    asset_platform: Optional[str] = None
+    """Client app platform of the downloaded asset ('android' or 'desktop'), when known"""
+
+
+def get_result_platform(result: Any) -> Optional[str]:
+    """
+    Return the client app platform of a download result.
+
+    Uses the platform recorded from the asset when the result was created, and
+    otherwise (results from other producers, stand-ins) classifies the file name.
+
+    Returns:
+        Optional[str]: 'android', 'desktop', or None when the name is neither.
+    """
+    platform = getattr(result, "asset_platform", None)
+    if platform in (FILE_TYPE_ANDROID, FILE_TYPE_DESKTOP):
+        return platform
+    for attr in ("file_path", "download_url"):
+        value = getattr(result, attr, None)
+        if isinstance(value, (str, os.PathLike)) and str(value):
+            return classify_asset_platform(os.path.basename(str(value)))
+    return None
+
 
 class DownloadTask(ABC):
     """
@@ -0,0 +1,160 @@
+"""
+Registry of one-shot download-tree migrations.
+
+Some maintenance steps only exist to upgrade trees written by older releases, e.g.
+removing legacy ``<file>.sha256`` sidecars (a full walk of the download directory) or
+moving legacy client app layouts into the unified ``app/`` tree. Running them on
+every pipeline run costs seconds on large archives while almost always doing nothing.
+
+``MigrationRegistry`` records each completed migration in ``migrations.json`` in the
+cache directory, together with the version that ran and a generation marker for the
+download tree it ran against (path, device and inode). A migration runs again only
+when:
+
+- it has never completed for this tree, or the tree was replaced;
+- its registered version is newer than the recorded one; or
+- its optional sentinel, a cheap probe for new legacy content, returns True.
+
+A migration that raises is logged and retried on the next run.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from fetchtastic.constants import MIGRATIONS_STATE_FILE
+from fetchtastic.log_utils import logger
+
+from .cache import CacheManager
+
+
+@dataclass(slots=True, frozen=True)
+class Migration:
+    """A named, versioned one-shot migration."""
+
+    name: str
+    version: int
+    run: Callable[[], Any]
+    sentinel: Optional[Callable[[], bool]] = None
+
+
+class MigrationRegistry:
+    """Runs registered migrations at most once per version and download tree."""
+
+    def __init__(self, cache_manager: CacheManager, tree_root: str):
+        """
+        Create a registry for migrations applied to the download tree at `tree_root`.
+
+        Parameters:
+            cache_manager (CacheManager): Cache manager owning the migration state file.
+            tree_root (str): Root of the download tree the migrations operate on.
+        """
+        self.cache_manager = cache_manager
+        self.tree_root = tree_root
+        self.state_file = cache_manager.get_cache_file_path(
+            MIGRATIONS_STATE_FILE, suffix=""
+        )
+        self._migrations: Dict[str, Migration] = {}
+
+    def register(
+        self,
+        name: str,
+        version: int,
+        run: Callable[[], Any],
+        sentinel: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """
+        Register a migration.
+
+        Parameters:
+            name (str): Unique migration name (the key in the state file).
+            version (int): Bump to force the migration to run again.
+            run (Callable[[], Any]): Performs the migration; its return value is ignored.
+            sentinel (Optional[Callable[[], bool]]): Cheap check returning True when new
+                legacy content exists and the migration must run despite being recorded.
+        """
+        self._migrations[name] = Migration(name, version, run, sentinel)
+
+    def _tree_marker(self) -> Optional[List[Any]]:
+        """Return [path, st_dev, st_ino] identifying the download tree, or None."""
+        if not self.tree_root:
+            return None
+        path = os.path.abspath(self.tree_root)
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return [path, stat_result.st_dev, stat_result.st_ino]
+
+    def _needs_run(
+        self,
+        migration: Migration,
+        record: Any,
+        tree_marker: Optional[List[Any]],
+    ) -> bool:
+        if (
+            tree_marker is None
+            or not isinstance(record, dict)
+            or record.get("tree") != tree_marker
+        ):
+            return True
+        version = record.get("version")
+        if not isinstance(version, int) or version < migration.version:
+            return True
+        if migration.sentinel is not None:
+            try:
+                return bool(migration.sentinel())
+            except OSError as exc:
+                logger.debug("Migration sentinel %s failed: %s", migration.name, exc)
+                return True
+        return False
+
+    def run_if_needed(self, name: str) -> bool:
+        """
+        Run the named migration if it is not recorded as complete for this tree.
+
+        Parameters:
+            name (str): Registered migration name.
+
+        Returns:
+            bool: True if the migration ran successfully, False if it was skipped or failed.
+        """
+        migration = self._migrations[name]
+        state = self.cache_manager.read_json(self.state_file) or {}
+        tree_marker = self._tree_marker()
+        if not self._needs_run(migration, state.get(name), tree_marker):
+            logger.debug("Migration %s already applied; skipping", name)
+            return False
+
+        logger.debug("Running migration %s (version %d)", name, migration.version)
+        try:
+            migration.run()
+        except (OSError, ValueError) as exc:
+            logger.warning("Migration %s failed; will retry next run: %s", name, exc)
+            return False
+
+        if tree_marker is not None:
+            record = {
+                "version": migration.version,
+                "tree": tree_marker,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+            # Merged into the current file so concurrent updates to other
+            # migrations are kept.
+            def store_record(state: Dict[str, Any]) -> bool:
+                state[name] = record
+                return True
+
+            self.cache_manager.update_json(self.state_file, store_record)
+        return True
+
+    def run_pending(self) -> List[str]:
+        """
+        Run every registered migration that needs to run, in registration order.
+
+        Returns:
+            List[str]: Names of the migrations that ran successfully.
+        """
+        return [name for name in list(self._migrations) if self.run_if_needed(name)]
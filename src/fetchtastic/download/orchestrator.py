@@ -16,13 +16,9 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests  # type: ignore[import-untyped]
-from packaging.version import Version
 
 from fetchtastic.client_app_config import normalize_client_app_config
-from fetchtastic.client_release_discovery import (
-    is_android_asset_name,
-    is_desktop_asset_name,
-)
+from fetchtastic.client_release_discovery import is_desktop_asset_name
 from fetchtastic.constants import (
     APKS_DIR_NAME,
     DEFAULT_APP_VERSIONS_TO_KEEP,
@@ -35,6 +31,7 @@ from fetchtastic.constants import (
     ERROR_TYPE_REVOKED_RELEASE,
     ERROR_TYPE_UNKNOWN,
     EXECUTABLE_PERMISSIONS,
+    FILE_TYPE_ANDROID,
     FILE_TYPE_APP_SNAPSHOT,
     FILE_TYPE_CLIENT_APP,
     FILE_TYPE_CLIENT_APP_PRERELEASE,
@@ -49,7 +46,6 @@ from fetchtastic.constants import (
     FILE_TYPE_UNKNOWN,
     FIRMWARE_DIR_NAME,
     FIRMWARE_DIR_PREFIX,
-    FIRMWARE_MANIFEST_EXTENSION,
     FIRMWARE_PRERELEASES_DIR_NAME,
     LATEST_FIRMWARE_NIGHTLY_JSON_FILE,
     LATEST_POINTER_NAME,
@@ -59,8 +55,19 @@ from fetchtastic.constants import (
     NightlyRunState,
 )
 from fetchtastic.log_utils import logger
+from fetchtastic.run_metrics import (
+    flatten_run_metrics,
+    get_run_metrics,
+    reset_run_metrics,
+    stage_timer,
+)
 from fetchtastic.setup_config import is_termux
-from fetchtastic.utils import cleanup_legacy_hash_sidecars, coerce_bool
+from fetchtastic.utils import (
+    cleanup_legacy_hash_sidecars,
+    coerce_bool,
+    configure_github_token_pool,
+    load_github_token_pool,
+)
 
 from .base import BaseDownloader
 from .cache import CacheManager, parse_iso_datetime_utc
@@ -72,9 +79,18 @@ from .client_app import (
 )
 from .files import _safe_rmtree
 from .firmware import FirmwareReleaseDownloader
-from .interfaces import DownloadResult, Release
+from .github_graphql import GraphQLMetadataSource
+from .interfaces import (
+    DownloadResult,
+    Release,
+    get_result_platform,
+    is_firmware_manifest_name,
+    is_manifest_asset,
+)
+from .migrations import MigrationRegistry
 from .prerelease_history import PrereleaseHistoryManager
-from .version import VersionManager, is_prerelease_directory
+from .version import VersionManager, is_prerelease_directory, version_key
+from .warm_start import WarmStartSnapshot
 
 
 def is_connected_to_wifi() -> bool:
@@ -158,6 +174,13 @@ class DownloadOrchestrator:
         self.version_manager = VersionManager()
         self.prerelease_manager = PrereleaseHistoryManager()
         self.cache_manager = CacheManager()
+        # Shared tokens are rotated by remaining budget when a pool is configured
+        configure_github_token_pool(load_github_token_pool(self.config))
+        # One GraphQL query per run answers release and site-head lookups when the
+        # user opted in and a token is available; REST is used otherwise.
+        self.cache_manager.metadata_source = GraphQLMetadataSource.from_config(
+            self.config
+        )
 
         # Initialize downloaders
         self.client_app_downloader: MeshtasticClientAppDownloader = (
@@ -170,6 +193,23 @@ class DownloadOrchestrator:
         self.firmware_downloader: FirmwareReleaseDownloader = FirmwareReleaseDownloader(
             self.config, self.cache_manager
         )
+        # Release lists restored from / recorded for the next run's warm start
+        self.warm_start = WarmStartSnapshot(self.cache_manager, self.config)
+        # One-shot upgrades of legacy download trees, recorded in the cache
+        self.migrations = MigrationRegistry(
+            self.cache_manager, self.config.get("DOWNLOAD_DIR", "")
+        )
+        self.migrations.register(
+            "legacy_hash_sidecars",
+            1,
+            lambda: cleanup_legacy_hash_sidecars(self.config.get("DOWNLOAD_DIR", "")),
+        )
+        self.migrations.register(
+            "client_app_layout",
+            1,
+            lambda: self.client_app_downloader.migrate_legacy_layout(),
+            sentinel=lambda: self.client_app_downloader.has_legacy_layout(),
+        )
 
         # Track results
         self.download_results: List[DownloadResult] = []
@@ -253,6 +293,9 @@ class DownloadOrchestrator:
         self.available_new_firmware_versions = []
         self.available_new_apk_versions = []
         self._client_app_downloads_processed = False
+        reset_run_metrics()
+        if self.cache_manager.metadata_source is not None:
+            self.cache_manager.metadata_source.reset()
         logger.info("Starting download pipeline...")
         logger.debug(
             "Execution context: cwd=%s, python=%s, fetchtastic=%s",
@@ -268,29 +311,37 @@ class DownloadOrchestrator:
                 self._discover_available_versions_when_wifi_skipped()
                 return [], []
 
-        cleanup_legacy_hash_sidecars(self.config.get("DOWNLOAD_DIR", ""))
+        with stage_timer("legacy_hash_cleanup"):
+            self.migrations.run_if_needed("legacy_hash_sidecars")
 
-        # Process firmware downloads
-        self._process_firmware_downloads()
+        # Process firmware downloads (includes the nightly stage)
+        with stage_timer("firmware"):
+            self._process_firmware_downloads()
 
-        self._process_client_app_downloads()
+        with stage_timer("client_apps"):
+            self._process_client_app_downloads()
 
         # Legacy parity: Repository downloads are handled separately through the interactive
         # "repo browse" command and are not part of the automatic download pipeline.
 
         # Enhance results with metadata before retry
-        self._enhance_download_results_with_metadata()
+        with stage_timer("metadata_enrichment"):
+            self._enhance_download_results_with_metadata()
 
         # Retry failed downloads
-        self._retry_failed_downloads()
+        with stage_timer("retries"):
+            self._retry_failed_downloads()
 
         # Finalize any in-flight firmware-nightly transaction now that retries
         # have run. No-op unless a nightly build is pending finalization.
-        self._finalize_nightly_transaction_if_complete()
+        with stage_timer("nightly_finalize"):
+            self._finalize_nightly_transaction_if_complete()
 
         # Log summary
         self._log_download_summary(start_time)
 
+        self.warm_start.save()
+
         return self.download_results, self.failed_downloads
 
     def _discover_available_versions_when_wifi_skipped(self) -> None:
@@ -410,7 +461,7 @@ class DownloadOrchestrator:
                 logger.info("Client app downloads are disabled in configuration")
                 return
 
-            self.client_app_downloader.migrate_legacy_layout()
+            self.migrations.run_if_needed("client_app_layout")
             snapshots_enabled = coerce_bool(
                 self.config.get("CHECK_APP_SNAPSHOTS", False)
             )
@@ -774,7 +825,14 @@ class DownloadOrchestrator:
         )
 
         if should_fetch:
-            new_releases = downloader.get_releases(limit=limit) or []
+            snapshot_key = f"{releases_attr}:{limit}"
+            new_releases = self.warm_start.get_releases(snapshot_key)
+            if new_releases is None:
+                with self.cache_manager.track_releases_freshness() as freshness:
+                    new_releases = downloader.get_releases(limit=limit) or []
+                self.warm_start.record_releases(
+                    snapshot_key, new_releases, freshness.fresh_until
+                )
             setattr(self, releases_attr, new_releases)
             setattr(self, fetch_limit_attr, limit)
             return new_releases
@@ -1143,7 +1201,15 @@ class DownloadOrchestrator:
         maintenance run. A tracked-but-empty/nonmatching build therefore never
         reports ``MAINTENANCE_ONLY``: there is no valid set to reconcile.
 
+        Before listing, the ``firmware-nightly/`` tree SHA is compared with the one
+        recorded when the tracked build was finalized; when it is unchanged, the
+        selection patterns are unchanged and every recorded asset is still on
+        disk, listing, selection and validation are skipped.
+
         State mapping:
+          - generation and selection unchanged since the last finalized build →
+            ``ALREADY_COMPLETE`` after running retention/pointer/chmod repair on
+            the recorded selected set (no listing, no download report).
           - source fetch error / malformed listing / ambiguous generation
             → ``CHECK_FAILED`` (logged, no fake asset failure, no download
             report, suppresses up-to-date).
@@ -1167,6 +1233,26 @@ class DownloadOrchestrator:
         ):
             return
         try:
+            generation_sha = self.firmware_downloader.get_nightly_generation_sha()
+            finalized = (
+                self.firmware_downloader.get_finalized_nightly_build(generation_sha)
+                if generation_sha
+                else None
+            )
+            if finalized:
+                # Same firmware-nightly/ tree and selection as the last finalized
+                # build, all still on disk: skip listing, selection and validation
+                # but keep the cheap local repairs.
+                build_id, selected = finalized
+                logger.debug(
+                    "Firmware-nightly generation %s unchanged (build %s); "
+                    "running maintenance only",
+                    generation_sha,
+                    build_id,
+                )
+                self._run_nightly_maintenance(build_id, selected, selected=selected)
+                self.nightly_run_state = NightlyRunState.ALREADY_COMPLETE
+                return
             entries = self.firmware_downloader.fetch_firmware_nightlies()
             if not entries:
                 # Empty-but-valid listing: no candidate published yet. Not a
@@ -1298,7 +1384,7 @@ class DownloadOrchestrator:
                 self.nightly_run_state = NightlyRunState.ATTEMPTED_INCOMPLETE
                 return False
 
-        if not self.firmware_downloader.update_nightly_tracking(build_id):
+        if not self.firmware_downloader.update_nightly_tracking(build_id, selected):
             logger.warning(
                 "Failed to update firmware-nightly tracking for %s; "
                 "deferring latest pointer, cleanup, and run-scoped id",
@@ -1472,18 +1558,22 @@ class DownloadOrchestrator:
         )
 
     def _successful_release_sort_key(self, release: Release) -> tuple[Any, ...]:
-        try:
-            parsed_version = self.version_manager.normalize_version(release.tag_name)
-        except (AttributeError, TypeError, ValueError):
-            parsed_version = None
+        published_dt = parse_iso_datetime_utc(getattr(release, "published_at", None))
+        created_dt = parse_iso_datetime_utc(getattr(release, "created_at", None))
+        timestamp_dt = published_dt or created_dt
+        timestamp = timestamp_dt.timestamp() if timestamp_dt is not None else 0.0
+        tag_name = str(release.tag_name or "")
+        release_name = str(release.name or "")
+        key = (
+            version_key(release.tag_name) if isinstance(release.tag_name, str) else None
+        )
+        if key is not None and key.parsed is not None:
+            return (2, key, timestamp, tag_name, release_name)
 
+        # Tags VersionKey cannot parse rank by their numeric release tuple, then by date
         release_tuple = self.version_manager.get_release_tuple(release.tag_name)
         version_parts: tuple[int, ...] = ()
-        if isinstance(release_tuple, tuple) and all(
-            isinstance(part, int) for part in release_tuple
-        ):
-            version_parts = release_tuple
-        elif isinstance(release_tuple, list) and all(
+        if isinstance(release_tuple, (tuple, list)) and all(
             isinstance(part, int) for part in release_tuple
         ):
             version_parts = tuple(release_tuple)
@@ -1492,20 +1582,6 @@ class DownloadOrchestrator:
         normalized_version = version_parts[:max_components] + (0,) * (
             max_components - len(version_parts[:max_components])
         )
-        published_dt = parse_iso_datetime_utc(getattr(release, "published_at", None))
-        created_dt = parse_iso_datetime_utc(getattr(release, "created_at", None))
-        timestamp_dt = published_dt or created_dt
-        timestamp = timestamp_dt.timestamp() if timestamp_dt is not None else 0.0
-        tag_name = str(release.tag_name or "")
-        release_name = str(release.name or "")
-        if isinstance(parsed_version, Version):
-            return (
-                2,
-                parsed_version,
-                timestamp,
-                tag_name,
-                release_name,
-            )
         return (
             1 if version_parts else 0,
             *normalized_version,
@@ -1589,7 +1665,7 @@ class DownloadOrchestrator:
                 for asset in release.assets
                 if (
                     asset.name
-                    and not self._is_firmware_manifest_asset(asset.name)
+                    and not is_manifest_asset(asset)
                     and self.firmware_downloader.should_download_release(
                         release.tag_name, asset.name
                     )
@@ -1650,12 +1726,7 @@ class DownloadOrchestrator:
         This includes both per-device manifests (`*.mt.json`) and release-level
         manifests (`firmware-<version>.json`).
         """
-        asset_name_lower = asset_name.lower()
-        return asset_name_lower.endswith(FIRMWARE_MANIFEST_EXTENSION) or (
-            asset_name_lower.startswith(FIRMWARE_DIR_PREFIX)
-            and asset_name_lower.endswith(".json")
-            and not asset_name_lower.endswith(FIRMWARE_MANIFEST_EXTENSION)
-        )
+        return is_firmware_manifest_name(asset_name)
 
     def _has_selected_non_manifest_firmware_asset(self, release: Release) -> bool:
         """Check whether a firmware release has at least one selected non-manifest asset.
@@ -1664,13 +1735,11 @@ class DownloadOrchestrator:
         eligibility. A release qualifies only when at least one non-manifest
         payload asset matches the configured firmware selection.
         """
-        assets = getattr(release, "assets", None) or []
-        if not assets:
+        assets = getattr(release, "assets", None)
+        if not isinstance(assets, (list, tuple)) or not assets:
             return False
         non_manifest = [
-            a
-            for a in assets
-            if getattr(a, "name", None) and not self._is_firmware_manifest_asset(a.name)
+            a for a in assets if getattr(a, "name", None) and not is_manifest_asset(a)
         ]
         if not non_manifest:
             return False
@@ -2641,6 +2710,11 @@ class DownloadOrchestrator:
                 - "android_downloads": legacy compat — count of client app downloads with Android-compatible filenames.
                 - "desktop_downloads": legacy compat — count of client app downloads with Desktop-compatible filenames.
                 - "repository_downloads": count of repository downloads (always 0 for automatic pipeline).
+                - "bytes_downloaded", "bytes_hashed", "bytes_decompressed": bytes streamed from the network, read for SHA-256 hashing, and inflated by ZIP checks or extraction during the last run.
+                - "files_statted": number of local files stat'ed by completeness and extraction checks.
+                - "api_calls_full", "api_calls_conditional": GitHub API calls made as full or conditional requests.
+                - "stage_<name>_seconds": wall-clock seconds spent in each pipeline stage.
+                - "cache_<name>_hits", "cache_<name>_misses", "cache_<name>_hit_ratio": lookups and hit ratio for each cache consulted during the run.
         """
         downloaded = [
             result
@@ -2673,6 +2747,7 @@ class DownloadOrchestrator:
             ),
             # Repository downloads are not part of the automatic download pipeline.
             "repository_downloads": 0,
+            **flatten_run_metrics(get_run_metrics()),
         }
 
     def _get_unique_failures(self) -> List[DownloadResult]:
@@ -2753,15 +2828,6 @@ class DownloadOrchestrator:
                 return file_type in {"android", "android_prerelease"}
             return file_type == requested_type
 
-        def _result_name(result: DownloadResult) -> str:
-            file_path = getattr(result, "file_path", None)
-            if isinstance(file_path, (str, os.PathLike)):
-                return Path(file_path).name
-            download_url = getattr(result, "download_url", None)
-            if isinstance(download_url, (str, os.PathLike)):
-                return Path(download_url).name
-            return ""
-
         count = 0
         for result in self.download_results:
             if not result.success or getattr(result, "was_skipped", False) is True:
@@ -2785,11 +2851,11 @@ class DownloadOrchestrator:
             if requested_type == "android":
                 if file_type in {FILE_TYPE_DESKTOP, FILE_TYPE_DESKTOP_PRERELEASE}:
                     continue
-                name = _result_name(result)
-                if name and is_android_asset_name(name):
+                platform = get_result_platform(result)
+                if platform == FILE_TYPE_ANDROID:
                     count += 1
                     continue
-                if name and is_desktop_asset_name(name):
+                if platform == FILE_TYPE_DESKTOP:
                     continue
                 if file_type in {
                     FILE_TYPE_CLIENT_APP,
@@ -2798,13 +2864,12 @@ class DownloadOrchestrator:
                 }:
                     logger.debug(
                         "Client app asset could not be classified by filename; defaulting to legacy Android bucket: %s",
-                        name or "unknown",
+                        getattr(result, "file_path", None) or "unknown",
                     )
                     count += 1
                     continue
             if requested_type == FILE_TYPE_DESKTOP:
-                name = _result_name(result)
-                if name and is_desktop_asset_name(name):
+                if get_result_platform(result) == FILE_TYPE_DESKTOP:
                     count += 1
                     continue
                 if file_type in {FILE_TYPE_DESKTOP, FILE_TYPE_DESKTOP_PRERELEASE}:
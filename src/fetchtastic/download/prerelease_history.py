@@ -23,6 +23,7 @@ from fetchtastic.constants import (
     GITHUB_MAX_PER_PAGE,
     PRERELEASE_ADD_COMMIT_PATTERN,
     PRERELEASE_COMMIT_HISTORY_FILE,
+    PRERELEASE_COMMIT_LOG_MAX_ENTRIES,
     PRERELEASE_COMMITS_CACHE_EXPIRY_SECONDS,
     PRERELEASE_COMMITS_CACHE_FILE,
     PRERELEASE_DELETE_COMMIT_PATTERN,
@@ -33,6 +34,7 @@ from fetchtastic.log_utils import logger
 from fetchtastic.utils import make_github_api_request
 
 from .cache import parse_iso_datetime_utc
+from .github_graphql import GraphQLMetadataSource
 from .version import VersionManager
 
 
@@ -66,6 +68,10 @@ class PrereleaseHistoryManager:
         """
         Fetch recent commits for meshtastic.github.io repository, using a local cache with expiry to avoid unnecessary API requests.
 
+        The cache is an append-only commit log (newest first) that records the newest
+        known commit. Once it expires, only commits newer than that one are requested and
+        merged in, so steady-state polling costs one small (often ``304``) request.
+
         Parameters:
             limit (int): Maximum number of commits to return; values less than 1 are treated as 1.
             cache_manager (Any): Cache manager providing `cache_dir`, `read_json`, and `atomic_write_json` used for storing/retrieving cached commits.
@@ -120,39 +126,35 @@ class PrereleaseHistoryManager:
                         return commits[:limit]
                     logger.debug("Commits cache expired (age: %.1fs)", age_seconds)
 
-        logger.debug("Fetching commits from API (cache miss/expired)")
-
-        all_commits: List[Dict[str, Any]] = []
-        seen_shas: set[str] = set()
-        per_page = min(GITHUB_MAX_PER_PAGE, limit)
-        page = 1
         url = f"{GITHUB_API_BASE}/meshtastic/meshtastic.github.io/commits"
-
         try:
-            while len(all_commits) < limit:
-                response = make_github_api_request(
+            cache_data = None
+            if not force_refresh and isinstance(cached, dict):
+                metadata_source = getattr(cache_manager, "metadata_source", None)
+                head = (
+                    metadata_source.get_site_head()
+                    if isinstance(metadata_source, GraphQLMetadataSource)
+                    else None
+                )
+                cache_data = self._sync_commit_log(
                     url,
+                    cached,
+                    limit,
                     github_token=github_token,
                     allow_env_token=allow_env_token,
-                    params={"per_page": per_page, "page": page},
-                    timeout=PRERELEASE_REQUEST_TIMEOUT,
+                    head_sha=head["sha"] if head else None,
                 )
-                commits_page = response.json()
-                if not isinstance(commits_page, list) or not commits_page:
-                    break
-                for commit in commits_page:
-                    sha = commit.get("sha")
-                    if sha and sha in seen_shas:
-                        continue
-                    if sha:
-                        seen_shas.add(sha)
-                    all_commits.append(commit)
-                    if len(all_commits) >= limit:
-                        break
-                if len(commits_page) < per_page:
-                    break
-                page += 1
-
+            if cache_data is None:
+                logger.debug("Fetching commits from API (cache miss/expired)")
+                all_commits, _found, _etag = self._fetch_commit_pages(
+                    url,
+                    {},
+                    limit,
+                    github_token=github_token,
+                    allow_env_token=allow_env_token,
+                )
+                # The ETag only applies to the unfiltered query; syncs use ``since``.
+                cache_data = self._commit_log_cache_data(all_commits or [], None)
         except (
             requests.RequestException,
             ValueError,
@@ -163,18 +165,178 @@ class PrereleaseHistoryManager:
             logger.warning("Could not fetch repo commits (%s): %s", type(e).__name__, e)
             return []
 
-        now_after_fetch = datetime.now(timezone.utc)
-        cache_data = {
-            "commits": all_commits,
-            "cached_at": now_after_fetch.isoformat(),
-        }
+        all_commits = cache_data["commits"]
         if cache_manager.atomic_write_json(cache_file, cache_data):
             logger.debug("Saved %d prerelease commits to cache", len(all_commits))
         self._in_memory_commits_cache = cache_data
-        self._in_memory_commits_timestamp = now_after_fetch
+        self._in_memory_commits_timestamp = parse_iso_datetime_utc(
+            cache_data["cached_at"]
+        )
 
         return all_commits[:limit]
 
+    def _fetch_commit_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        limit: int,
+        *,
+        github_token: Optional[str],
+        allow_env_token: bool,
+        stop_sha: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[List[Dict[str, Any]]], bool, Optional[str]]:
+        """
+        Page through the commits endpoint, newest first.
+
+        Parameters:
+            url (str): Commits endpoint URL.
+            params (Dict[str, Any]): Extra query parameters (e.g. ``since``).
+            limit (int): Maximum number of commits to collect.
+            github_token (Optional[str]): GitHub token to use for API requests.
+            allow_env_token (bool): Whether an environment token may be used.
+            stop_sha (Optional[str]): Stop paging (exclusive) when this commit is reached.
+            etag (Optional[str]): ETag of a previous first page for the same query; sent as a conditional request.
+
+        Returns:
+            Tuple[Optional[List[Dict[str, Any]]], bool, Optional[str]]: The collected commits
+            (None if the first page was ``304 Not Modified``), whether `stop_sha` was reached,
+            and the ETag of the first page.
+        """
+        all_commits: List[Dict[str, Any]] = []
+        seen_shas: set[str] = set()
+        per_page = min(GITHUB_MAX_PER_PAGE, limit)
+        page = 1
+        first_etag: Optional[str] = None
+
+        while len(all_commits) < limit:
+            response = make_github_api_request(
+                url,
+                github_token=github_token,
+                allow_env_token=allow_env_token,
+                params={**params, "per_page": per_page, "page": page},
+                timeout=PRERELEASE_REQUEST_TIMEOUT,
+                etag=etag if page == 1 else None,
+            )
+            if page == 1:
+                if getattr(response, "status_code", None) == 304:
+                    return None, True, etag
+                header = response.headers.get("ETag")
+                first_etag = header if isinstance(header, str) else None
+            commits_page = response.json()
+            if not isinstance(commits_page, list) or not commits_page:
+                break
+            for commit in commits_page:
+                sha = commit.get("sha")
+                if stop_sha and sha == stop_sha:
+                    return all_commits, True, first_etag
+                if sha and sha in seen_shas:
+                    continue
+                if sha:
+                    seen_shas.add(sha)
+                all_commits.append(commit)
+                if len(all_commits) >= limit:
+                    break
+            if len(commits_page) < per_page:
+                break
+            page += 1
+
+        return all_commits, False, first_etag
+
+    @staticmethod
+    def _commit_date(commit: Dict[str, Any]) -> Optional[str]:
+        """Return the committer (or author) date of a GitHub commit object."""
+        details = commit.get("commit")
+        if not isinstance(details, dict):
+            return None
+        for role in ("committer", "author"):
+            person = details.get(role)
+            if isinstance(person, dict) and isinstance(person.get("date"), str):
+                return person["date"]
+        return None
+
+    def _commit_log_cache_data(
+        self, commits: List[Dict[str, Any]], etag: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the commits cache payload, recording the newest known commit.
+
+        The newest SHA and date are what the next incremental sync resumes from.
+        """
+        newest = commits[0] if commits else {}
+        return {
+            "commits": commits,
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+            "newest_sha": newest.get("sha"),
+            "newest_date": self._commit_date(newest) if newest else None,
+            "etag": etag,
+        }
+
+    def _sync_commit_log(
+        self,
+        url: str,
+        cached: Dict[str, Any],
+        limit: int,
+        *,
+        github_token: Optional[str],
+        allow_env_token: bool,
+        head_sha: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Bring an expired commit log up to date by fetching only newer commits.
+
+        Requests commits ``since`` the newest known commit date (conditionally, with the
+        stored ETag) and stops at the newest known SHA. New commits are prepended to the
+        log, which is trimmed to ``PRERELEASE_COMMIT_LOG_MAX_ENTRIES``. When `head_sha`
+        (the branch head already known from the GraphQL batch) is the newest known SHA,
+        no request is made.
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated cache payload, or None when the cached log
+            cannot be extended (no sync point, too short for `limit`, or the known SHA
+            is no longer in the history) and a full fetch is required.
+        """
+        commits = cached.get("commits")
+        newest_sha = cached.get("newest_sha")
+        newest_date = cached.get("newest_date")
+        if (
+            not isinstance(commits, list)
+            or not all(isinstance(c, dict) for c in commits)
+            or not newest_sha
+            or not isinstance(newest_date, str)
+            or len(commits) < limit
+        ):
+            return None
+
+        if head_sha and head_sha == newest_sha:
+            logger.debug("Prerelease commit log unchanged (GraphQL head %s)", head_sha)
+            return {**cached, "cached_at": datetime.now(timezone.utc).isoformat()}
+
+        retention = max(limit, PRERELEASE_COMMIT_LOG_MAX_ENTRIES)
+        new_commits, found, etag = self._fetch_commit_pages(
+            url,
+            {"since": newest_date},
+            retention,
+            github_token=github_token,
+            allow_env_token=allow_env_token,
+            stop_sha=newest_sha,
+            etag=cached.get("etag"),
+        )
+        if new_commits is None:
+            logger.debug("Prerelease commit log unchanged (304 Not Modified)")
+            return {**cached, "cached_at": datetime.now(timezone.utc).isoformat()}
+        if not found:
+            logger.debug(
+                "Newest known commit %s not found in incremental sync; refetching",
+                newest_sha,
+            )
+            return None
+
+        logger.debug("Merged %d new prerelease commits into log", len(new_commits))
+        known = {c.get("sha") for c in new_commits}
+        merged = new_commits + [c for c in commits if c.get("sha") not in known]
+        return self._commit_log_cache_data(merged[:retention], etag)
+
     def extract_prerelease_directory_timestamps(
         self, commits: List[Dict[str, Any]]
     ) -> Dict[str, datetime]:
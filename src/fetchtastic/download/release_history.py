@@ -14,7 +14,7 @@ from typing import Any, Dict, Iterable, List, Optional
 from fetchtastic.log_utils import logger
 
 from .cache import CacheManager, parse_iso_datetime_utc
-from .interfaces import Release
+from .interfaces import RELEASE_NOTES_PREVIEW_LINES, Release, cached_classification
 from .version import VersionManager
 
 STATUS_ACTIVE = "active"
@@ -31,6 +31,7 @@ _CHANNEL_RX = {
     "beta": re.compile(r"\bbeta\b", re.IGNORECASE),
     "rc": re.compile(r"\b(?:rc|release candidate)\b", re.IGNORECASE),
 }
+_LEADING_PUNCTUATION_RX = re.compile(r"^[^a-zA-Z0-9]+")
 _STABLE_RX = re.compile(r"\bstable\b", re.IGNORECASE)
 _CHANNEL_ORDER = ("alpha", "beta", "rc")
 _HASH_TAGGED_RELEASE_RX = re.compile(r"^v?\d+\.\d+\.\d+\.[a-f0-9]{6,}$", re.IGNORECASE)
@@ -83,9 +84,20 @@ def detect_release_channel(release: Release) -> str:
 
     This function examines the release's name and tag text to decide the channel. Explicit channel keywords in the name or tag take precedence; the word "stable" is treated as "beta"; tags with hash-style suffixes are treated as "alpha"; the release's prerelease flag is ignored. If no condition matches, returns "alpha".
 
+    The result is memoised on the release (see ``cached_classification``).
+
     Returns:
         'alpha', 'beta', or 'rc' indicating the inferred channel.
     """
+    return cached_classification(
+        release,
+        "channel",
+        (release.name, release.tag_name),
+        lambda: _detect_release_channel(release),
+    )
+
+
+def _detect_release_channel(release: Release) -> str:
     # Use only name + tag for channel detection; body text is ignored by design to
     # avoid accidental channel mismatches from release notes.
     primary_text = _join_text([release.name, release.tag_name])
@@ -117,24 +129,38 @@ def is_release_revoked(release: Release) -> bool:
     """
     Determine whether a release has been marked as revoked by inspecting its title and the first several non-empty lines of its body for revocation indicators.
 
+    The result is memoised on the release (see ``cached_classification``).
+
     Returns:
         `true` if the release is revoked, `false` otherwise.
     """
+    return cached_classification(
+        release,
+        "revoked",
+        (release.name, release.body, getattr(release, "body_preview", None)),
+        lambda: _is_release_revoked(release),
+    )
+
+
+def _is_release_revoked(release: Release) -> bool:
     name_text = release.name if isinstance(release.name, str) else ""
     if _REVOKED_TITLE_RX.search(name_text):
         return True
 
-    body = release.body if isinstance(release.body, str) else ""
-    if not body:
+    # Only the leading lines are inspected, so offloaded notes need not be reloaded.
+    body = release.body
+    if body is None:
+        body = getattr(release, "body_preview", None)
+    if not isinstance(body, str) or not body:
         return False
 
-    for line in body.splitlines()[:14]:
+    for line in body.splitlines()[:RELEASE_NOTES_PREVIEW_LINES]:
         cleaned = line.strip()
         if not cleaned:
             continue
         while cleaned.startswith(">"):
             cleaned = cleaned[1:].lstrip()
-        cleaned = re.sub(r"^[^a-zA-Z0-9]+", "", cleaned)
+        cleaned = _LEADING_PUNCTUATION_RX.sub("", cleaned)
         if not cleaned:
             continue
         lower = cleaned.lower()
@@ -0,0 +1,194 @@
+"""
+Recursive listing of the meshtastic.github.io repository tree.
+
+The Contents API returns one directory per request, so browsing the repository or
+scanning prerelease directories costs one call per level visited. The Git Trees API
+(``git/trees/HEAD?recursive=1``) returns every path in the repository in a single
+response. ``RepoTree`` indexes such a response by directory so that directory
+listings, file lists and sizes for any path are answered locally, in the same
+shape as Contents API entries.
+
+GitHub truncates very large trees; a truncated ``RepoTree`` is still cached (so the
+truncation is not re-fetched on every lookup) but callers must fall back to
+per-directory Contents requests for it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fetchtastic.constants import MESHTASTIC_GITHUB_IO_RAW_URL
+
+# Git tree entry types mapped to the Contents API "type" field
+_TREE_TYPE_TO_CONTENTS_TYPE = {"blob": "file", "tree": "dir", "commit": "submodule"}
+_SYMLINK_MODE = "120000"
+
+
+def _normalize_path(path: str) -> str:
+    return (path or "").strip("/")
+
+
+@dataclass(slots=True)
+class RepoTree:
+    """Directory index built from one recursive Git Trees API response."""
+
+    sha: str
+    truncated: bool
+    # Rows of [path, type, size, sha], in Contents API terms, as returned by GitHub
+    rows: List[List[Any]]
+    _children: Dict[str, List[Dict[str, Any]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _by_path: Dict[str, Dict[str, Any]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self._children[""] = []
+        for path, entry_type, size, sha in self.rows:
+            parent, _, name = path.rpartition("/")
+            entry = {
+                "name": name,
+                "path": path,
+                "sha": sha,
+                "size": size,
+                "type": entry_type,
+                "download_url": (
+                    f"{MESHTASTIC_GITHUB_IO_RAW_URL}/{path}"
+                    if entry_type == "file"
+                    else None
+                ),
+            }
+            self._by_path[path] = entry
+            self._children.setdefault(parent, []).append(entry)
+            if entry_type == "dir":
+                self._children.setdefault(path, [])
+
+    @classmethod
+    def from_api(cls, payload: Any) -> "RepoTree":
+        """
+        Build a tree from a ``git/trees/<sha>?recursive=1`` response body.
+
+        Parameters:
+            payload (Any): Decoded JSON response.
+
+        Returns:
+            RepoTree: Indexed tree.
+
+        Raises:
+            ValueError: If the payload is not a Git Trees API response.
+        """
+        if (
+            not isinstance(payload, dict)
+            or not isinstance(payload.get("sha"), str)
+            or not isinstance(payload.get("tree"), list)
+        ):
+            raise ValueError("Unexpected Git Trees API response")
+        rows: List[List[Any]] = []
+        for item in payload["tree"]:
+            if not isinstance(item, dict) or not isinstance(item.get("path"), str):
+                continue
+            entry_type = _TREE_TYPE_TO_CONTENTS_TYPE.get(str(item.get("type")))
+            if entry_type is None:
+                continue
+            if entry_type == "file" and item.get("mode") == _SYMLINK_MODE:
+                entry_type = "symlink"
+            size = item.get("size") if entry_type != "dir" else 0
+            rows.append([item["path"], entry_type, size or 0, item.get("sha")])
+        return cls(payload["sha"], bool(payload.get("truncated")), rows)
+
+    @classmethod
+    def from_cache(cls, data: Any) -> Optional["RepoTree"]:
+        """Rebuild a tree from ``to_cache()`` output, or return None if malformed."""
+        if not isinstance(data, dict):
+            return None
+        sha = data.get("sha")
+        rows = data.get("rows")
+        if not isinstance(sha, str) or not isinstance(rows, list):
+            return None
+        if not all(
+            isinstance(row, list) and len(row) == 4 and isinstance(row[0], str)
+            for row in rows
+        ):
+            return None
+        return cls(sha, bool(data.get("truncated")), rows)
+
+    def to_cache(self) -> Dict[str, Any]:
+        """Return a compact JSON-serializable form of the tree."""
+        return {"sha": self.sha, "truncated": self.truncated, "rows": self.rows}
+
+    def has_directory(self, path: str) -> bool:
+        """Return True if `path` is a directory in the tree (the root always is)."""
+        return _normalize_path(path) in self._children
+
+    def get_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the Contents-style entry for `path`, or None if it does not exist."""
+        return self._by_path.get(_normalize_path(path))
+
+    def list_contents(self, path: str = "") -> List[Dict[str, Any]]:
+        """
+        List the entries directly under a directory, like the Contents API.
+
+        Parameters:
+            path (str): Repository-relative directory path; "" for the root.
+
+        Returns:
+            List[Dict[str, Any]]: Entries with ``name``, ``path``, ``sha``, ``size``,
+            ``type`` and ``download_url``; empty if the directory does not exist.
+        """
+        return [dict(entry) for entry in self._children.get(_normalize_path(path), [])]
+
+    def list_directories(self, path: str = "") -> List[str]:
+        """Return the names of directories directly under `path`."""
+        return [
+            entry["name"]
+            for entry in self._children.get(_normalize_path(path), [])
+            if entry["type"] == "dir"
+        ]
+
+    def list_files(self, path: str = "", *, recursive: bool = False) -> List[str]:
+        """
+        Return the paths of files under a directory.
+
+        Parameters:
+            path (str): Repository-relative directory path; "" for the root.
+            recursive (bool): Include files in subdirectories.
+
+        Returns:
+            List[str]: Repository-relative file paths.
+        """
+        normalized = _normalize_path(path)
+        if not recursive:
+            return [
+                entry["path"]
+                for entry in self._children.get(normalized, [])
+                if entry["type"] == "file"
+            ]
+        prefix = f"{normalized}/" if normalized else ""
+        return [
+            row[0]
+            for row in self.rows
+            if row[1] == "file" and row[0].startswith(prefix)
+        ]
+
+    def get_size(self, path: str) -> Optional[int]:
+        """
+        Return the size of a file, or the total size of the files under a directory.
+
+        Parameters:
+            path (str): Repository-relative path.
+
+        Returns:
+            Optional[int]: Size in bytes, or None if `path` does not exist.
+        """
+        normalized = _normalize_path(path)
+        entry = self._by_path.get(normalized)
+        if entry is not None and entry["type"] != "dir":
+            return int(entry["size"] or 0)
+        if normalized not in self._children:
+            return None
+        prefix = f"{normalized}/" if normalized else ""
+        return sum(
+            int(row[2] or 0)
+            for row in self.rows
+            if row[1] == "file" and row[0].startswith(prefix)
+        )
@@ -0,0 +1,242 @@
+"""
+Single-instance coordination of download runs.
+
+Two runs downloading into the same ``DOWNLOAD_DIR`` (an hourly cron job starting
+while the previous one is still fetching a large installer, or a manual run during
+a cron run) would download the same files into different temporary paths and race
+to move them into place. ``RunCoordinator`` serializes them with an inter-process
+lock per download directory (see ``fetchtastic.file_lock``), held for the whole
+run. A run that finds the lock taken acts on ``CONCURRENT_RUN_MODE``:
+
+- ``exit``: report the in-flight run's status and stop without downloading.
+- ``wait``: wait for the in-flight run to finish and report its results instead of
+  downloading the same files again.
+- ``queue`` (also ``fetchtastic download --queue``): wait, then run against the
+  caches the previous run has just refreshed.
+
+The lock holder records its status (pid, start time and, once done, a summary of
+its results) in a small JSON file in the cache directory; that is what the other
+runs report. If the holder dies, the OS releases its lock, so a stale status never
+blocks later runs. If the lock file cannot be created at all (an unwritable cache
+directory), the run proceeds uncoordinated, with a warning.
+"""
+
+import hashlib
+import os
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional
+
+from fetchtastic.constants import (
+    DEFAULT_CONCURRENT_RUN_MODE,
+    RUN_LOCK_POLL_INTERVAL_SECONDS,
+    RUN_LOCK_WAIT_TIMEOUT_SECONDS,
+)
+from fetchtastic.file_lock import file_lock
+from fetchtastic.log_utils import logger
+
+from .cache import CacheManager
+
+RUN_MODE_EXIT = "exit"
+RUN_MODE_WAIT = "wait"
+RUN_MODE_QUEUE = "queue"
+RUN_MODES = (RUN_MODE_EXIT, RUN_MODE_WAIT, RUN_MODE_QUEUE)
+
+RUN_STATE_RUNNING = "running"
+RUN_STATE_FINISHED = "finished"
+RUN_STATE_FAILED = "failed"
+
+
+@dataclass(slots=True)
+class RunTicket:
+    """Outcome of claiming a download directory."""
+
+    # Whether this process holds the directory and should run the downloads
+    should_run: bool
+    # Status recorded by the run that held the directory before this one, if any
+    other_run: Optional[Dict[str, Any]] = None
+    # Whether this process waited for that run to finish
+    waited: bool = False
+
+
+def resolve_run_mode(config: Dict[str, Any], *, queue: bool = False) -> str:
+    """
+    Return the concurrent-run mode for a download run.
+
+    Parameters:
+        config (Dict[str, Any]): Fetchtastic configuration; ``CONCURRENT_RUN_MODE`` is read.
+        queue (bool): True when ``--queue`` was given, which always selects ``queue``.
+
+    Returns:
+        str: One of ``RUN_MODES``; unknown configured values fall back to the default.
+    """
+    if queue:
+        return RUN_MODE_QUEUE
+    mode = (
+        str(config.get("CONCURRENT_RUN_MODE") or DEFAULT_CONCURRENT_RUN_MODE)
+        .strip()
+        .lower()
+    )
+    if mode not in RUN_MODES:
+        logger.warning(
+            "Unknown CONCURRENT_RUN_MODE %r; using %r",
+            mode,
+            DEFAULT_CONCURRENT_RUN_MODE,
+        )
+        return DEFAULT_CONCURRENT_RUN_MODE
+    return mode
+
+
+def describe_run(status: Optional[Dict[str, Any]]) -> str:
+    """Return a one-line description of a recorded run status for log messages."""
+    if not isinstance(status, dict):
+        return "status unknown"
+    description = f"pid {status.get('pid')}, started {status.get('started_at')}"
+    state = status.get("state")
+    if state == RUN_STATE_RUNNING:
+        return f"{description}, still running"
+    description = f"{description}, {state} at {status.get('finished_at')}"
+    summary = status.get("summary")
+    if isinstance(summary, dict):
+        description += ": " + ", ".join(
+            f"{key.replace('_', ' ')} {value}"
+            for key, value in summary.items()
+            if value not in (None, "")
+        )
+    return description
+
+
+class RunCoordinator:
+    """Serializes download runs that share a download directory."""
+
+    def __init__(
+        self,
+        download_dir: str,
+        cache_manager: Optional[CacheManager] = None,
+        *,
+        wait_timeout: float = RUN_LOCK_WAIT_TIMEOUT_SECONDS,
+    ):
+        """
+        Create a coordinator for one download directory.
+
+        Parameters:
+            download_dir (str): The run's ``DOWNLOAD_DIR``.
+            cache_manager (Optional[CacheManager]): Cache holding the run status file; the default user cache if omitted.
+            wait_timeout (float): Longest wait, in seconds, for an in-flight run in ``wait`` and ``queue`` modes.
+        """
+        self.download_dir = os.path.abspath(download_dir)
+        self.cache_manager = cache_manager or CacheManager()
+        self.wait_timeout = wait_timeout
+        dir_hash = hashlib.sha256(self.download_dir.encode("utf-8")).hexdigest()[:16]
+        self.status_file = self.cache_manager.get_cache_file_path(
+            f"run_{dir_hash}.json", suffix=""
+        )
+        self._status: Dict[str, Any] = {}
+
+    def read_status(self) -> Optional[Dict[str, Any]]:
+        """Return the status recorded by the latest run for this directory, if any."""
+        return self.cache_manager.read_json(self.status_file)
+
+    def _write_status(self, state: str, **fields: Any) -> None:
+        self._status.update(fields, state=state)
+        if state != RUN_STATE_RUNNING:
+            self._status["finished_at"] = datetime.now(timezone.utc).isoformat()
+        self.cache_manager.atomic_write_json(self.status_file, self._status)
+
+    def record_result(self, summary: Dict[str, Any]) -> None:
+        """
+        Record that this run finished, with a summary for runs that waited on it.
+
+        Parameters:
+            summary (Dict[str, Any]): JSON-serializable result summary (counts, latest versions).
+        """
+        self._write_status(RUN_STATE_FINISHED, summary=summary)
+
+    @contextmanager
+    def _hold(self) -> Iterator[None]:
+        """Record this process as the running holder until the block exits."""
+        self._status = {}
+        self._write_status(
+            RUN_STATE_RUNNING,
+            pid=os.getpid(),
+            download_dir=self.download_dir,
+            started_at=datetime.now(timezone.utc).isoformat(),
+        )
+        try:
+            yield
+        except BaseException:
+            self._write_status(RUN_STATE_FAILED)
+            raise
+        if self._status.get("state") == RUN_STATE_RUNNING:
+            self._write_status(RUN_STATE_FINISHED)
+
+    @contextmanager
+    def claim(self, mode: str) -> Iterator[RunTicket]:
+        """
+        Claim the download directory for the duration of the block, according to `mode`.
+
+        When the directory is free (or its lock cannot be opened, in which case the
+        run is not coordinated), or once an awaited run has finished in ``queue``
+        mode (or failed in ``wait`` mode), the ticket says to run and the lock is held
+        until the block exits. Otherwise the ticket carries the other run's status:
+        still running (``exit`` mode, or the wait timed out) or finished (``wait``).
+
+        Parameters:
+            mode (str): One of ``RUN_MODES``.
+
+        Yields:
+            RunTicket: Whether to run, and the status of the run that held the directory.
+        """
+        with ExitStack() as stack:
+            uncoordinated = False
+            try:
+                held = stack.enter_context(
+                    file_lock(self.status_file, timeout=0, raise_open_errors=True)
+                )
+            except OSError as exc:
+                logger.warning(
+                    "Could not open the run lock for %s (%s); running without "
+                    "coordination with other fetchtastic runs",
+                    self.download_dir,
+                    exc,
+                )
+                uncoordinated = True
+            if uncoordinated:
+                # Yield outside the handler so errors raised by the run are not
+                # chained to the lock failure.
+                yield RunTicket(should_run=True)
+                return
+            if held:
+                with self._hold():
+                    yield RunTicket(should_run=True)
+                return
+
+        other_run = self.read_status()
+        if mode == RUN_MODE_EXIT:
+            yield RunTicket(should_run=False, other_run=other_run)
+            return
+
+        logger.info(
+            "Another fetchtastic run is downloading into %s (%s); waiting for it to finish",
+            self.download_dir,
+            describe_run(other_run),
+        )
+        with file_lock(
+            self.status_file,
+            timeout=self.wait_timeout,
+            poll_interval=RUN_LOCK_POLL_INTERVAL_SECONDS,
+        ) as held:
+            other_run = self.read_status()
+            if not held:
+                yield RunTicket(should_run=False, other_run=other_run)
+                return
+            finished = (
+                isinstance(other_run, dict)
+                and other_run.get("state") == RUN_STATE_FINISHED
+            )
+            if mode == RUN_MODE_WAIT and finished:
+                yield RunTicket(should_run=False, other_run=other_run, waited=True)
+                return
+            with self._hold():
+                yield RunTicket(should_run=True, other_run=other_run, waited=True)
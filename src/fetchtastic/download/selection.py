@@ -0,0 +1,299 @@
+"""
+Precompiled asset selection matchers.
+
+``matches_selected_patterns``, ``matches_extract_patterns`` and the glob exclude
+helpers re-parse every pattern on every call. Selection loops call them once per
+asset, nightly file or ZIP member, so ``SelectionMatcher.compile`` classifies the
+patterns once and folds each family of substring checks into a single combined
+regex. Per-filename normalisation (modern/legacy base names and their
+punctuation-stripped forms) is memoised across calls.
+
+The compiled matcher is a drop-in replacement: results are identical to the
+function-based matchers in ``fetchtastic.utils``, which remain the reference
+implementation (see ``tests/test_selection_matcher.py``).
+"""
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from fetchtastic.constants import DESKTOP_EXTENSIONS
+from fetchtastic.utils import (
+    _PUNC_RX,
+    extract_base_name,
+    legacy_strip_version_numbers,
+)
+
+_DESKTOP_NAME_MARKERS = (
+    "meshtastic desktop",
+    "meshtastic.desktop",
+    "meshtastic-desktop",
+    "meshtastic_desktop",
+)
+_SANITISED_KEYWORDS = ("release", "apk", "aab", "fdroid")
+
+# Bases for one filename: (legacy_lower, comparison_bases, modern_sanitised, legacy_sanitised)
+_Bases = Tuple[str, Tuple[str, ...], str, str]
+
+
+@lru_cache(maxsize=8192)
+def _selection_bases(filename: str) -> _Bases:
+    """
+    Compute (and memoise) the normalised forms of `filename` used by selected-pattern matching.
+
+    Mirrors the base computation in ``matches_selected_patterns``: the lowered modern and
+    legacy base names, desktop-app name aliases, and punctuation-stripped variants.
+    """
+    base_modern = extract_base_name(filename)
+    base_legacy = legacy_strip_version_numbers(filename)
+    base_modern_lower = base_modern.lower()
+    base_legacy_lower = base_legacy.lower()
+    comparison_bases = [base_modern_lower, base_legacy_lower]
+    if filename.lower().endswith(DESKTOP_EXTENSIONS):
+        for base in (base_modern_lower, base_legacy_lower):
+            for marker in _DESKTOP_NAME_MARKERS:
+                if marker in base:
+                    alias = base.replace(marker, "meshtastic")
+                    if alias not in comparison_bases:
+                        comparison_bases.append(alias)
+    return (
+        base_legacy_lower,
+        tuple(comparison_bases),
+        _PUNC_RX.sub("", base_modern_lower),
+        _PUNC_RX.sub("", base_legacy_lower),
+    )
+
+
+def _literal_alternatives(literals: Iterable[str]) -> List[str]:
+    """Return de-duplicated, escaped regex alternatives for `literals` (longest first)."""
+    unique = sorted(set(literals), key=lambda value: (-len(value), value))
+    return [re.escape(value) for value in unique]
+
+
+def _literal_regex(literals: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compile an alternation matching any of `literals` as a substring, or None if empty."""
+    parts = _literal_alternatives(literals)
+    return re.compile("|".join(parts)) if parts else None
+
+
+def _is_device_pattern(pattern: Any, pattern_lower: str, device_manager: Any) -> bool:
+    """Classify a pattern exactly as ``fetchtastic.utils._matches_device_pattern`` does."""
+    if device_manager and getattr(device_manager, "is_device_pattern", None):
+        try:
+            return bool(device_manager.is_device_pattern(pattern))
+        except (AttributeError, TypeError, ValueError):
+            return False
+    return pattern_lower.endswith(("-", "_"))
+
+
+class SelectionMatcher:
+    """
+    Include/exclude pattern set compiled once and reused across many filenames.
+
+    Two include semantics are supported:
+
+    - selected (default): ``matches_selected_patterns`` rules, used for release
+      assets, ZIP member extraction and client-app assets.
+    - extract (``extract=True``): legacy ``matches_extract_patterns`` rules with
+      device-pattern classification, used for prerelease and nightly selection.
+
+    Exclude patterns are case-insensitive globs, matching the ``_matches_exclude*``
+    helpers.
+    """
+
+    __slots__ = (
+        "_extract",
+        "_match_all",
+        "_legacy_rx",
+        "_comparison_rx",
+        "_sanitised_rx",
+        "_extract_rx",
+        "_exclude_rx",
+    )
+
+    def __init__(self) -> None:
+        """Create an empty matcher; use :meth:`compile` to build one."""
+        self._extract = False
+        self._match_all = False
+        self._legacy_rx: Optional[Pattern[str]] = None
+        self._comparison_rx: Optional[Pattern[str]] = None
+        self._sanitised_rx: Optional[Pattern[str]] = None
+        self._extract_rx: Optional[Pattern[str]] = None
+        self._exclude_rx: Optional[Pattern[str]] = None
+
+    @classmethod
+    def compile(
+        cls,
+        patterns: Optional[Sequence[Any]],
+        excludes: Optional[Sequence[Any]] = None,
+        device_manager: Optional[Any] = None,
+        *,
+        extract: bool = False,
+    ) -> "SelectionMatcher":
+        """
+        Pre-classify `patterns` and `excludes` into combined regexes.
+
+        Parameters:
+            patterns (Optional[Sequence[Any]]): Include patterns. With selected semantics
+                an empty or missing list matches every filename; with extract semantics it
+                matches none (as the function-based matchers do).
+            excludes (Optional[Sequence[Any]]): Case-insensitive glob exclude patterns.
+            device_manager (Optional[Any]): Object with ``is_device_pattern(pattern)``
+                used to classify extract patterns; ignored for selected semantics.
+            extract (bool): Use legacy extract-pattern semantics instead of selected.
+
+        Returns:
+            SelectionMatcher: The compiled matcher.
+        """
+        matcher = cls()
+        matcher._extract = extract
+        if extract:
+            matcher._compile_extract(patterns or [], device_manager)
+        else:
+            matcher._compile_selected(patterns)
+        matcher._exclude_rx = cls._compile_excludes(excludes or [])
+        return matcher
+
+    def _compile_selected(self, patterns: Optional[Sequence[str]]) -> None:
+        if not patterns:
+            self._match_all = True
+            return
+
+        legacy_literals: List[str] = []
+        comparison_literals: List[str] = []
+        sanitised_literals: List[str] = []
+        for raw_pattern in patterns:
+            pat = raw_pattern.strip()
+            if not pat:
+                continue
+            pat_lower = pat.lower()
+            # Separator-suffixed patterns only match the legacy base (which keeps the
+            # separator); all other patterns match any comparison base.
+            legacy_literals.append(pat_lower)
+            if not pat_lower.endswith(("-", "_")):
+                comparison_literals.append(pat_lower)
+
+            needs_sanitised = (
+                any(ch.isupper() for ch in pat)
+                or "." in pat
+                or any(keyword in pat_lower for keyword in _SANITISED_KEYWORDS)
+            )
+            # Short patterns (<= 3 chars) get the same sanitised last-chance fallback.
+            if needs_sanitised or len(pat) <= 3:
+                pat_sanitised = _PUNC_RX.sub("", pat_lower)
+                if pat_sanitised:
+                    sanitised_literals.append(pat_sanitised)
+
+        self._legacy_rx = _literal_regex(legacy_literals)
+        self._comparison_rx = _literal_regex(comparison_literals)
+        self._sanitised_rx = _literal_regex(sanitised_literals)
+
+    def _compile_extract(self, patterns: Sequence[Any], device_manager: Any) -> None:
+        # Every extract rule (littlefs prefix, file-type prefix, plain substring) is
+        # implied by the substring test, so only device patterns need extra regexes.
+        literals: List[str] = []
+        device_parts: List[str] = []
+        for pattern in patterns:
+            pattern_lower = str(pattern).strip().lower()
+            if not pattern_lower:
+                continue
+            literals.append(pattern_lower)
+            if not _is_device_pattern(pattern, pattern_lower, device_manager):
+                continue
+            clean_pattern = pattern_lower.rstrip("-_ ")
+            if not clean_pattern:
+                continue
+            escaped = re.escape(clean_pattern)
+            if len(clean_pattern) <= 2:
+                device_parts.append(rf"\b{escaped}\b")
+            else:
+                device_parts.append(rf"(?:^|[-_]){escaped}(?:[-_]|$)")
+
+        parts = _literal_alternatives(literals)
+        parts.extend(dict.fromkeys(device_parts))
+        self._extract_rx = re.compile("|".join(parts)) if parts else None
+
+    @staticmethod
+    def _compile_excludes(excludes: Sequence[Any]) -> Optional[Pattern[str]]:
+        translated = [
+            f"(?:{fnmatch.translate(os.path.normcase(str(pattern).lower()))})"
+            for pattern in excludes
+        ]
+        return re.compile("|".join(translated)) if translated else None
+
+    def matches(self, filename: str) -> bool:
+        """
+        Return True if `filename` matches the include patterns.
+
+        Equivalent to ``matches_selected_patterns(filename, patterns)`` (or
+        ``matches_extract_patterns(filename, patterns, device_manager)`` for extract
+        matchers).
+        """
+        if self._extract:
+            return (
+                self._extract_rx is not None
+                and self._extract_rx.search(filename.lower()) is not None
+            )
+        if self._match_all:
+            return True
+
+        legacy_lower, comparison_bases, modern_sanitised, legacy_sanitised = (
+            _selection_bases(filename)
+        )
+        if self._legacy_rx is not None and self._legacy_rx.search(legacy_lower):
+            return True
+        if self._comparison_rx is not None:
+            for base in comparison_bases:
+                if self._comparison_rx.search(base):
+                    return True
+        if self._sanitised_rx is not None:
+            return bool(
+                self._sanitised_rx.search(modern_sanitised)
+                or self._sanitised_rx.search(legacy_sanitised)
+            )
+        return False
+
+    def is_excluded(self, filename: str) -> bool:
+        """Return True if `filename` matches any exclude glob (case-insensitive)."""
+        if self._exclude_rx is None:
+            return False
+        return self._exclude_rx.match(os.path.normcase(filename.lower())) is not None
+
+    def selects(self, filename: str) -> bool:
+        """Return True if `filename` matches the include patterns and is not excluded."""
+        return self.matches(filename) and not self.is_excluded(filename)
+
+
+@lru_cache(maxsize=128)
+def _cached_matcher(
+    patterns: Optional[Tuple[Any, ...]], excludes: Tuple[Any, ...]
+) -> SelectionMatcher:
+    return SelectionMatcher.compile(patterns, excludes)
+
+
+def get_selection_matcher(
+    patterns: Optional[Sequence[Any]], excludes: Optional[Sequence[Any]] = None
+) -> SelectionMatcher:
+    """
+    Return a compiled selected-semantics matcher, reusing a cached one when possible.
+
+    Used by per-asset predicates (e.g. ``should_download_release``) that receive the
+    same configured pattern lists on every call. Extract matchers are not cached
+    because their device-pattern classification depends on the device manager state
+    at compile time. Falls back to compiling afresh when a pattern is unhashable.
+
+    Parameters:
+        patterns (Optional[Sequence[Any]]): Include patterns; empty or None matches all.
+        excludes (Optional[Sequence[Any]]): Case-insensitive glob exclude patterns.
+
+    Returns:
+        SelectionMatcher: A compiled matcher equivalent to ``SelectionMatcher.compile``.
+    """
+    try:
+        return _cached_matcher(
+            tuple(patterns) if patterns is not None else None, tuple(excludes or ())
+        )
+    except TypeError:
+        return SelectionMatcher.compile(patterns, excludes)
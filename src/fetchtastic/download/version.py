@@ -10,6 +10,7 @@ import json
 import os
 import re
 from datetime import datetime, timezone
+from functools import lru_cache, total_ordering
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from packaging.version import InvalidVersion, Version
@@ -97,30 +98,7 @@ class VersionManager:
         if not trimmed:
             return None
 
-        if trimmed.lower().startswith("v"):
-            trimmed = trimmed[1:]
-
-        try:
-            return parse_version(trimmed)
-        except InvalidVersion:
-            m_pr = self.PRERELEASE_VERSION_RX.match(trimmed)
-            if m_pr:
-                pr_kind_lower = m_pr.group(2).lower()
-                kind = {"alpha": "a", "beta": "b"}.get(pr_kind_lower, pr_kind_lower)
-                num = m_pr.group(3) or "0"
-                try:
-                    return parse_version(f"{m_pr.group(1)}{kind}{num}")
-                except InvalidVersion:
-                    return None
-
-            m_hash = self.HASH_SUFFIX_VERSION_RX.match(trimmed)
-            if m_hash:
-                try:
-                    return parse_version(f"{m_hash.group(1)}+{m_hash.group(2)}")
-                except InvalidVersion:
-                    return None
-
-        return None
+        return _parse_normalized_version(trimmed)
 
     def get_release_tuple(self, version: Optional[str]) -> Optional[Tuple[int, ...]]:
         """
@@ -141,32 +119,7 @@ class VersionManager:
         if not version_stripped:
             return None
 
-        base = (
-            version_stripped[1:]
-            if version_stripped.lower().startswith("v")
-            else version_stripped
-        )
-        match = self.HASH_SUFFIX_VERSION_RX.match(base) or self.VERSION_BASE_RX.match(
-            base
-        )
-        base_tuple = (
-            tuple(int(part) for part in match.group(1).split(".")) if match else None
-        )
-
-        normalized = self.normalize_version(version_stripped)
-        normalized_tuple = (
-            normalized.release
-            if isinstance(normalized, Version) and normalized.release
-            else None
-        )
-
-        if base_tuple and normalized_tuple:
-            return (
-                base_tuple
-                if len(base_tuple) > len(normalized_tuple)
-                else normalized_tuple
-            )
-        return base_tuple or normalized_tuple
+        return _parse_release_tuple(version_stripped)
 
     def compare_versions(self, version1: str, version2: str) -> int:
         """
@@ -184,37 +137,24 @@ class VersionManager:
         Returns:
             int: 1 if version1 > version2, 0 if equal, -1 if version1 < version2
         """
-        v1 = self.normalize_version(version1)
-        v2 = self.normalize_version(version2)
-        if v1 is not None and v2 is not None:
-            if v1 > v2:
-                return 1
-            elif v1 < v2:
-                return -1
-            else:
-                return 0
-
-        # Natural comparison fallback for truly non-standard versions
-        def _nat_key(s: str) -> List[Tuple[int, Union[int, str]]]:
-            """
-            Compute a natural-sort key by splitting a string into consecutive numeric and alphabetic runs.
+        return _compare_version_keys(
+            self.version_key(version1), self.version_key(version2)
+        )
 
-            Parameters:
-                s (str): Input string to convert into a natural-sort key.
+    def version_key(self, version: str) -> "VersionKey":
+        """
+        Return the precomputed comparison key for `version`.
 
-            Returns:
-                List[Tuple[int, Union[int, str]]]: A list of tuples representing consecutive runs; numeric runs are returned as `(1, int_value)` and alphabetic runs as `(0, lowercase_string)`.
-            """
-            parts = re.findall(r"\d+|[A-Za-z]+", s.lower())
-            return [(1, int(p)) if p.isdigit() else (0, p) for p in parts]
+        Keys are memoised per version string, so sorting or repeatedly comparing the
+        same tags parses each one only once. See :class:`VersionKey` for the ordering.
 
-        k1, k2 = _nat_key(version1), _nat_key(version2)
+        Parameters:
+            version (str): Version string to build a key for.
 
-        if k1 > k2:
-            return 1
-        elif k1 < k2:
-            return -1
-        return 0
+        Returns:
+            VersionKey: Comparable key for `version`.
+        """
+        return version_key(version)
 
     def is_prerelease_base_newer_than_stable(
         self, base_version: str, stable_version: str
@@ -920,6 +860,189 @@ class VersionManager:
         return False
 
 
+# ==============================================================================
+# Memoised parsing
+#
+# Tags are parsed inside sort keys, cleanup loops and tracking comparisons, often
+# for the same handful of strings many times per run. Parsed results (Version
+# objects and tuples) are immutable, so they are cached per input string.
+# ==============================================================================
+
+VERSION_PARSE_CACHE_SIZE = 4096
+
+_NATURAL_RUN_RX = re.compile(r"\d+|[A-Za-z]+")
+
+NaturalKey = Tuple[Tuple[int, Union[int, str]], ...]
+
+
+@lru_cache(maxsize=VERSION_PARSE_CACHE_SIZE)
+def _parse_normalized_version(trimmed: str) -> Optional[Version]:
+    """
+    Parse a stripped, non-empty version string as described in :meth:`VersionManager.normalize_version`.
+    """
+    if trimmed.lower().startswith("v"):
+        trimmed = trimmed[1:]
+
+    try:
+        return parse_version(trimmed)
+    except InvalidVersion:
+        m_pr = VersionManager.PRERELEASE_VERSION_RX.match(trimmed)
+        if m_pr:
+            pr_kind_lower = m_pr.group(2).lower()
+            kind = {"alpha": "a", "beta": "b"}.get(pr_kind_lower, pr_kind_lower)
+            num = m_pr.group(3) or "0"
+            try:
+                return parse_version(f"{m_pr.group(1)}{kind}{num}")
+            except InvalidVersion:
+                return None
+
+        m_hash = VersionManager.HASH_SUFFIX_VERSION_RX.match(trimmed)
+        if m_hash:
+            try:
+                return parse_version(f"{m_hash.group(1)}+{m_hash.group(2)}")
+            except InvalidVersion:
+                return None
+
+    return None
+
+
+@lru_cache(maxsize=VERSION_PARSE_CACHE_SIZE)
+def _parse_release_tuple(version_stripped: str) -> Optional[Tuple[int, ...]]:
+    """
+    Extract the release tuple of a stripped, non-empty version string as described in :meth:`VersionManager.get_release_tuple`.
+    """
+    base = (
+        version_stripped[1:]
+        if version_stripped.lower().startswith("v")
+        else version_stripped
+    )
+    match = VersionManager.HASH_SUFFIX_VERSION_RX.match(
+        base
+    ) or VersionManager.VERSION_BASE_RX.match(base)
+    base_tuple = (
+        tuple(int(part) for part in match.group(1).split(".")) if match else None
+    )
+
+    normalized = _parse_normalized_version(version_stripped)
+    normalized_tuple = (
+        normalized.release
+        if isinstance(normalized, Version) and normalized.release
+        else None
+    )
+
+    if base_tuple and normalized_tuple:
+        return (
+            base_tuple if len(base_tuple) > len(normalized_tuple) else normalized_tuple
+        )
+    return base_tuple or normalized_tuple
+
+
+@lru_cache(maxsize=VERSION_PARSE_CACHE_SIZE)
+def _natural_sort_key(value: str) -> NaturalKey:
+    """
+    Compute a natural-sort key by splitting a string into consecutive numeric and alphabetic runs.
+
+    Numeric runs become `(1, int_value)` and alphabetic runs `(0, lowercase_string)`.
+    """
+    parts = _NATURAL_RUN_RX.findall(value.lower())
+    return tuple((1, int(p)) if p.isdigit() else (0, p) for p in parts)
+
+
+@total_ordering
+class VersionKey:
+    """
+    Comparable sort key for a version string, computed once per tag.
+
+    Holds the PEP 440 parse (when the string normalizes to one) and a natural-sort
+    fallback key, and orders by a single ``rank`` tuple: ``(1, parsed)`` for
+    versions that parse and ``(0, natural)`` for those that do not. This is a total
+    order (unparsable tags sort before every parsable one), so ``sorted()`` and
+    ``max()`` results do not depend on input order. Two parsable or two unparsable
+    versions order exactly as :meth:`VersionManager.compare_versions` does. Use
+    :func:`version_key` to obtain memoised instances, e.g.
+    ``sorted(tags, key=version_key)``.
+    """
+
+    __slots__ = ("version", "parsed", "natural", "rank")
+
+    def __init__(self, version: str) -> None:
+        """
+        Parse `version` into its comparison components.
+
+        Parameters:
+            version (str): Version string (may include a leading "v", prerelease words or a hash suffix).
+        """
+        trimmed = version.strip()
+        self.version = version
+        self.parsed = _parse_normalized_version(trimmed) if trimmed else None
+        self.natural = _natural_sort_key(version)
+        self.rank: Tuple[int, Any] = (
+            (1, self.parsed) if self.parsed is not None else (0, self.natural)
+        )
+
+    def compare(self, other: "VersionKey") -> int:
+        """
+        Three-way comparison with `other` in sort-key order.
+
+        Returns:
+            int: 1 if this key sorts after `other`, 0 if equal, -1 if before.
+        """
+        return (self.rank > other.rank) - (self.rank < other.rank)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VersionKey):
+            return NotImplemented
+        return self.rank == other.rank
+
+    def __lt__(self, other: "VersionKey") -> bool:
+        if not isinstance(other, VersionKey):
+            return NotImplemented
+        return self.rank < other.rank
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"VersionKey({self.version!r})"
+
+
+def _compare_version_keys(left: VersionKey, right: VersionKey) -> int:
+    """
+    Pairwise comparison used by :meth:`VersionManager.compare_versions`.
+
+    Compares parsed versions when both parsed and natural keys otherwise. Unlike
+    :class:`VersionKey` ordering this is not transitive across parsable and
+    unparsable inputs, so it must not be used as a sort key.
+    """
+    if left.parsed is not None and right.parsed is not None:
+        a: Any = left.parsed
+        b: Any = right.parsed
+    else:
+        a, b = left.natural, right.natural
+    return (a > b) - (a < b)
+
+
+@lru_cache(maxsize=VERSION_PARSE_CACHE_SIZE)
+def _cached_version_key(version: str) -> VersionKey:
+    return VersionKey(version)
+
+
+def version_key(version: str) -> VersionKey:
+    """
+    Return a memoised :class:`VersionKey` for `version`.
+
+    Parameters:
+        version (str): Version string.
+
+    Returns:
+        VersionKey: Comparable key; equal inputs return the same instance.
+    """
+    try:
+        return _cached_version_key(version)
+    except TypeError:
+        # Unhashable input: build an uncached key (raising as the parser would)
+        return VersionKey(version)
+
+
 # ==============================================================================
 # Legacy / Module-Level Compatibility Functions
 #
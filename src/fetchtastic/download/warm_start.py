@@ -0,0 +1,247 @@
+"""
+Warm-start snapshot of parsed release lists.
+
+Each run normally rebuilds the same ``Release``/``Asset`` lists from ``releases.json``:
+read the JSON, re-validate every cached entry and re-create every object. While the
+releases cache is unchanged and its entries are still fresh, that work produces the
+same result as the previous run, so ``DownloadOrchestrator`` records the release lists
+it fetched in a compact binary snapshot and restores them in one read on the next run.
+
+A snapshot is only used when all of these still hold:
+
+- the snapshot format, Python version and configuration hash match;
+- ``releases.json`` has the same mtime and size as when the snapshot was written
+  (any refetch, prune or ``--force-download`` cache clear changes it);
+- the releases cache entries the lists were built from have not expired, i.e. the
+  downloaders would have been served the same cached data.
+
+The snapshot is written with ``marshal`` from plain tuples, so loading it never
+constructs arbitrary objects.
+"""
+
+import hashlib
+import json
+import marshal
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from fetchtastic.constants import WARM_START_SNAPSHOT_FILE
+from fetchtastic.log_utils import logger
+
+from .cache import CacheManager
+from .github_source import CachedReleaseBody
+from .interfaces import Asset, Release
+
+# Bump when the serialised release/asset layout changes.
+WARM_START_SCHEMA_VERSION = 1
+
+_Entry = Tuple[float, Tuple[Any, ...]]
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """
+    Return a stable hash of `config` used to key the warm-start snapshot.
+
+    Parameters:
+        config (Dict[str, Any]): Run configuration.
+
+    Returns:
+        str: Hex SHA-256 of the canonical JSON form of `config`.
+    """
+    canonical = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _dump_release(release: Release) -> Optional[Tuple[Any, ...]]:
+    notes_url_key = None
+    if release.notes_loader is not None:
+        if not isinstance(release.notes_loader, CachedReleaseBody):
+            return None
+        notes_url_key = release.notes_loader.url_key
+    return (
+        release.tag_name,
+        release.prerelease,
+        release.published_at,
+        release.name,
+        release.body,
+        release.created_at,
+        release.body_preview,
+        notes_url_key,
+        tuple(
+            (
+                asset.name,
+                asset.download_url,
+                asset.size,
+                asset.browser_download_url,
+                asset.content_type,
+            )
+            for asset in release.assets
+        ),
+    )
+
+
+def _load_release(data: Tuple[Any, ...], cache_manager: CacheManager) -> Release:
+    (
+        tag_name,
+        prerelease,
+        published_at,
+        name,
+        body,
+        created_at,
+        body_preview,
+        notes_url_key,
+        assets,
+    ) = data
+    release = Release(
+        tag_name=tag_name,
+        prerelease=prerelease,
+        published_at=published_at,
+        name=name,
+        body=body,
+        created_at=created_at,
+        assets=[
+            Asset(
+                name=asset_name,
+                download_url=download_url,
+                size=size,
+                browser_download_url=browser_download_url,
+                content_type=content_type,
+            )
+            for asset_name, download_url, size, browser_download_url, content_type in assets
+        ],
+        body_preview=body_preview,
+    )
+    if notes_url_key is not None:
+        release.notes_loader = CachedReleaseBody(cache_manager, notes_url_key, tag_name)
+    return release
+
+
+class WarmStartSnapshot:
+    """
+    Release lists from the previous run, reusable while their inputs are unchanged.
+
+    Lists are looked up and recorded under caller-chosen keys (the orchestrator uses
+    the release attribute and fetch limit). Recorded lists are serialised immediately,
+    so later in-run mutation of the Release objects does not leak into the snapshot.
+    """
+
+    def __init__(self, cache_manager: CacheManager, config: Dict[str, Any]):
+        """
+        Create a snapshot bound to `cache_manager`'s cache directory and `config`.
+
+        Parameters:
+            cache_manager (CacheManager): Cache manager owning ``releases.json``.
+            config (Dict[str, Any]): Run configuration; any change invalidates the snapshot.
+        """
+        self.cache_manager = cache_manager
+        self.path = cache_manager.get_cache_file_path(
+            WARM_START_SNAPSHOT_FILE, suffix=""
+        )
+        self._config_hash = config_fingerprint(config)
+        self._entries: Optional[Dict[str, _Entry]] = None
+        self._dirty = False
+
+    def _header(self) -> Tuple[Any, ...]:
+        return (
+            WARM_START_SCHEMA_VERSION,
+            tuple(sys.version_info[:2]),
+            self._config_hash,
+        )
+
+    def _load_entries(self) -> Dict[str, _Entry]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        generation = self.cache_manager.releases_cache_generation()
+        if generation is None:
+            return self._entries
+        try:
+            with open(self.path, "rb") as f:
+                header, stored_generation, entries = marshal.load(f)
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, EOFError, ValueError, TypeError) as exc:
+            logger.debug(
+                "Ignoring unreadable warm-start snapshot %s: %s", self.path, exc
+            )
+            return self._entries
+        if header != self._header() or tuple(stored_generation) != generation:
+            logger.debug("Warm-start snapshot is stale; rebuilding release state")
+            return self._entries
+        if isinstance(entries, dict):
+            now = time.time()
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if isinstance(entry, tuple) and len(entry) == 2 and entry[0] > now
+            }
+        return self._entries
+
+    def get_releases(self, key: str) -> Optional[List[Release]]:
+        """
+        Return the release list recorded under `key`, or None if it must be rebuilt.
+
+        Parameters:
+            key (str): Snapshot key the list was recorded under.
+
+        Returns:
+            Optional[List[Release]]: Fresh Release objects equal to the recorded list.
+        """
+        entry = self._load_entries().get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        try:
+            releases = [_load_release(data, self.cache_manager) for data in entry[1]]
+        except (TypeError, ValueError) as exc:
+            logger.debug("Ignoring malformed warm-start entry %s: %s", key, exc)
+            return None
+        logger.debug("Restored %d releases for %s from warm start", len(releases), key)
+        return releases
+
+    def record_releases(
+        self, key: str, releases: List[Any], fresh_until: Optional[float]
+    ) -> None:
+        """
+        Record a release list fetched through the releases cache under `key`.
+
+        Lists are skipped when they were not served from or stored in the releases
+        cache (`fresh_until` is None) or when they contain anything other than Release
+        objects with cache-backed notes.
+
+        Parameters:
+            key (str): Snapshot key.
+            releases (List[Any]): Release list as returned by the downloader.
+            fresh_until (Optional[float]): When the releases cache entries the list was
+                built from expire (see ``CacheManager.track_releases_freshness``).
+        """
+        if not isinstance(fresh_until, (int, float)):
+            return
+        dumped = []
+        for release in releases:
+            data = _dump_release(release) if isinstance(release, Release) else None
+            if data is None:
+                return
+            dumped.append(data)
+        self._load_entries()[key] = (float(fresh_until), tuple(dumped))
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write recorded lists (plus still-fresh entries from the previous snapshot).
+
+        Returns:
+            bool: True if a snapshot was written, False if nothing changed or it failed.
+        """
+        if not self._dirty:
+            return False
+        generation = self.cache_manager.releases_cache_generation()
+        if generation is None:
+            return False
+        try:
+            payload = marshal.dumps((self._header(), generation, self._entries))
+        except ValueError as exc:
+            logger.debug("Could not serialise warm-start snapshot: %s", exc)
+            return False
+        self._dirty = False
+        return self.cache_manager.atomic_write_bytes(self.path, payload)
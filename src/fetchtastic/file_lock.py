@@ -0,0 +1,127 @@
+"""
+Advisory inter-process locks for shared state files.
+
+Every fetchtastic process on a host (a cron run and a manual run, or runs for
+different configurations) shares one user cache directory. Files that several of
+them read, modify and write back (the rate-limit cache and the releases, contents
+and commit timestamp caches) are updated under ``file_lock``: the writer re-reads
+the file inside the lock and merges its changes into what is there, so entries
+written by another process in the meantime are kept instead of overwritten (see
+``CacheManager.update_json``). Critical sections cover only that re-read and the
+atomic write, never network I/O.
+
+The lock is held on a ``<file>.lock`` sidecar because atomic writes replace the
+data file itself. Locks are advisory (``fcntl.flock`` on POSIX, ``msvcrt.locking``
+on Windows) and best effort: when a lock cannot be taken within the timeout the
+caller proceeds without it, as every write did before locking existed.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from fetchtastic.constants import FILE_LOCK_TIMEOUT_SECONDS
+from fetchtastic.log_utils import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None  # type: ignore[assignment]
+
+LOCK_FILE_SUFFIX = ".lock"
+_POLL_INTERVAL_SECONDS = 0.05
+
+
+def get_lock_file_path(path: str) -> str:
+    """Return the sidecar path whose lock guards `path`."""
+    return f"{path}{LOCK_FILE_SUFFIX}"
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive lock on `fd` without blocking; return whether it was taken."""
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (BlockingIOError, PermissionError):
+            return False
+        return True
+    if msvcrt is not None:  # pragma: no cover - Windows
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    return True  # pragma: no cover - no locking primitive available
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken by `_try_lock`."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(
+    path: str,
+    timeout: float = FILE_LOCK_TIMEOUT_SECONDS,
+    *,
+    poll_interval: float = _POLL_INTERVAL_SECONDS,
+    raise_open_errors: bool = False,
+) -> Iterator[bool]:
+    """
+    Hold the advisory inter-process lock guarding `path` for the duration of the block.
+
+    Locks taken through separate calls also exclude each other within one process, so
+    threads may use this too.
+
+    Parameters:
+        path (str): Shared file to guard; the lock lives on ``path + ".lock"``.
+        timeout (float): Seconds to wait for another holder; 0 tries exactly once.
+        poll_interval (float): Seconds between attempts while waiting.
+        raise_open_errors (bool): Raise instead of running unlocked when the lock file
+            cannot be opened, for callers that must tell that apart from a busy lock.
+
+    Yields:
+        bool: True if the lock is held, False if it could not be taken in time (or the
+        lock file could not be opened) and the block runs unlocked.
+
+    Raises:
+        OSError: If the lock file cannot be opened and `raise_open_errors` is set.
+    """
+    lock_path = get_lock_file_path(path)
+    try:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError as exc:
+        if raise_open_errors:
+            raise
+        logger.debug("Could not open lock file %s: %s", lock_path, exc)
+        yield False
+        return
+
+    try:
+        deadline = time.monotonic() + timeout
+        acquired = _try_lock(fd)
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            acquired = _try_lock(fd)
+        if not acquired:
+            logger.debug(
+                "Timed out waiting for lock on %s; continuing without it", path
+            )
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                _unlock(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,226 @@
+"""
+Shared file hashing engine.
+
+All file digests (download verification, release completeness checks, extracted
+file sidecars and ``fetchtastic verify``) go through this module so they share one
+read strategy: a 1 MiB buffer reused per thread and filled with ``readinto``, which
+avoids a bytes allocation per chunk. ``hashlib`` releases the GIL while digesting
+large buffers, so ``hash_files`` spreads batches across a bounded thread pool.
+
+Batches can be cancelled with a ``threading.Event`` (files not yet finished are left
+out of the result) and report progress through a ``(completed, total, path)``
+callback.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from fetchtastic.log_utils import logger
+from fetchtastic.run_metrics import METRIC_BYTES_HASHED, increment_metric
+from fetchtastic.tracing import TRACE_CATEGORY_VERIFY, trace_span
+
+HASH_BUFFER_SIZE = 1024 * 1024
+MAX_HASH_WORKERS = 4
+
+HashProgressCallback = Callable[[int, int, str], None]
+
+_buffers = threading.local()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class HashCancelledError(Exception):
+    """Raised inside a hashing worker when the batch's cancel event is set."""
+
+
+def _get_buffer() -> memoryview:
+    """Return this thread's reusable read buffer."""
+    buffer = getattr(_buffers, "view", None)
+    if buffer is None:
+        buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+        _buffers.view = buffer
+    return buffer
+
+
+def default_hash_workers() -> int:
+    """
+    Return the default worker count for hashing batches.
+
+    Returns:
+        int: CPU count capped at ``MAX_HASH_WORKERS`` (at least 1).
+    """
+    return max(1, min(MAX_HASH_WORKERS, os.cpu_count() or 1))
+
+
+def get_hash_executor() -> ThreadPoolExecutor:
+    """
+    Return the shared executor for hashing work submitted from asyncio code.
+
+    Async download paths run their verification jobs here instead of the loop's
+    default executor, so at most ``default_hash_workers()`` files are hashed at once
+    regardless of download concurrency.
+
+    Returns:
+        ThreadPoolExecutor: Process-wide executor, created on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=default_hash_workers(),
+                thread_name_prefix="fetchtastic-verify",
+            )
+        return _executor
+
+
+def _digest_file(
+    file_path: str, algorithm: str, cancel_event: Optional[threading.Event]
+) -> str:
+    """
+    Hash one file, raising OSError on read errors and HashCancelledError on cancel.
+    """
+    digest = hashlib.new(algorithm)
+    buffer = _get_buffer()
+    bytes_hashed = 0
+    with trace_span(algorithm, TRACE_CATEGORY_VERIFY, file=file_path) as span:
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise HashCancelledError(file_path)
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                digest.update(buffer[:read])
+                bytes_hashed += read
+        span["bytes"] = bytes_hashed
+    increment_metric(METRIC_BYTES_HASHED, bytes_hashed)
+    return digest.hexdigest()
+
+
+def hash_file(
+    file_path: str,
+    algorithm: str = "sha256",
+    cancel_event: Optional[threading.Event] = None,
+) -> Optional[str]:
+    """
+    Compute the hex digest of a single file.
+
+    Parameters:
+        file_path (str): File to hash.
+        algorithm (str): ``hashlib`` algorithm name.
+        cancel_event (Optional[threading.Event]): When set, hashing stops early.
+
+    Returns:
+        Optional[str]: Lowercase hex digest, or None if the file could not be read or
+        hashing was cancelled.
+
+    Raises:
+        ValueError: If `algorithm` is not supported by ``hashlib``.
+    """
+    try:
+        return _digest_file(file_path, algorithm, cancel_event)
+    except HashCancelledError:
+        logger.debug("Hashing of %s cancelled", file_path)
+        return None
+    except (IOError, OSError) as e:
+        logger.debug("Error calculating %s for %s: %s", algorithm, file_path, e)
+        return None
+
+
+def hash_files(
+    file_paths: Iterable[str],
+    algorithm: str = "sha256",
+    *,
+    max_workers: Optional[int] = None,
+    progress: Optional[HashProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    Hash a batch of files across a bounded thread pool.
+
+    Duplicate paths are hashed once. Single-file batches (or ``max_workers=1``) are
+    hashed on the calling thread.
+
+    Parameters:
+        file_paths (Iterable[str]): Files to hash.
+        algorithm (str): ``hashlib`` algorithm name.
+        max_workers (Optional[int]): Pool size; defaults to ``default_hash_workers()``.
+        progress (Optional[HashProgressCallback]): Called with
+            ``(completed, total, path)`` after each file finishes.
+        cancel_event (Optional[threading.Event]): When set, in-flight files stop at the
+            next buffer and queued files are skipped.
+
+    Returns:
+        Dict[str, Optional[str]]: Mapping of path to hex digest, or None for files
+        that could not be read. Files skipped by cancellation are omitted.
+
+    Raises:
+        ValueError: If `algorithm` is not supported by ``hashlib``.
+    """
+    paths = list(dict.fromkeys(str(path) for path in file_paths))
+    hashlib.new(algorithm)  # Fail fast on unsupported algorithms
+    results: Dict[str, Optional[str]] = {}
+    total = len(paths)
+
+    def _record(path: str, digest: Optional[str]) -> None:
+        results[path] = digest
+        if progress is not None:
+            progress(len(results), total, path)
+
+    workers = min(max_workers or default_hash_workers(), total)
+    if cancel_event is not None and cancel_event.is_set():
+        return results
+    if workers <= 1:
+        for path in paths:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            try:
+                _record(path, _digest_file(path, algorithm, cancel_event))
+            except HashCancelledError:
+                break
+            except (IOError, OSError) as e:
+                logger.debug("Error calculating %s for %s: %s", algorithm, path, e)
+                _record(path, None)
+        return results
+
+    # Workers watch a private event so an interrupt in the caller (e.g. Ctrl-C) also
+    # stops in-flight files without touching the caller's event.
+    stop = threading.Event()
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="fetchtastic-hash"
+    ) as executor:
+        pending: Dict[Future[str], str] = {
+            executor.submit(_digest_file, path, algorithm, stop): path for path in paths
+        }
+        not_done: Set[Future[str]] = set(pending)
+        try:
+            while not_done:
+                if cancel_event is not None and cancel_event.is_set():
+                    stop.set()
+                    for future in not_done:
+                        future.cancel()
+                done, not_done = wait(
+                    not_done, timeout=0.1, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    path = pending[future]
+                    if future.cancelled():
+                        continue
+                    try:
+                        _record(path, future.result())
+                    except HashCancelledError:
+                        continue
+                    except (IOError, OSError) as e:
+                        logger.debug(
+                            "Error calculating %s for %s: %s", algorithm, path, e
+                        )
+                        _record(path, None)
+        except BaseException:
+            stop.set()
+            for future in not_done:
+                future.cancel()
+            raise
+    return results
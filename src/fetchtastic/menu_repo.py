@@ -24,9 +24,13 @@ from fetchtastic.constants import (
 from fetchtastic.download.cache import CacheManager
 from fetchtastic.download.prerelease_history import PrereleaseHistoryManager
 from fetchtastic.download.repository import RepositoryDownloader
-from fetchtastic.download.version import VersionManager
+from fetchtastic.download.version import VersionKey, VersionManager, version_key
 from fetchtastic.log_utils import logger
-from fetchtastic.utils import make_github_api_request
+from fetchtastic.utils import (
+    configure_github_token_pool,
+    load_github_token_pool,
+    make_github_api_request,
+)
 
 CursesScreen = Backend
 
@@ -236,7 +240,6 @@ def _process_repo_contents(
     other_dirs = [d for d in dirs if not d["name"].startswith(FIRMWARE_DIR_PREFIX)]
 
     firmware_commit_times = firmware_commit_times or {}
-    version_manager = _VERSION_MANAGER
 
     def _lookup_commit_time(name: str) -> datetime | None:
         """
@@ -253,7 +256,7 @@ def _process_repo_contents(
     # Sort firmware directories by commit time when available, otherwise by version.
     def _fw_dir_key(
         d: dict[str, Any],
-    ) -> tuple[int, float, tuple[Any, ...], str] | tuple[tuple[Any, ...], str]:
+    ) -> tuple[int, float, VersionKey, str] | tuple[VersionKey, str]:
         """
         Compute a sort key for a firmware directory entry, prioritizing recent commits when available.
 
@@ -262,17 +265,17 @@ def _process_repo_contents(
 
         Returns:
             tuple: If commit timestamps are available, returns a 4-tuple
-            (has_commit_flag, commit_timestamp, version_tuple, name) where `has_commit_flag` is `1` when a commit timestamp exists and `0` otherwise, `commit_timestamp` is a float seconds-since-epoch (or `0.0` when absent), `version_tuple` is a parsed version tuple (empty tuple if unparsable), and `name` is the directory name.
-            Otherwise returns a 2-tuple `(version_tuple, name)`.
+            (has_commit_flag, commit_timestamp, version, name) where `has_commit_flag` is `1` when a commit timestamp exists and `0` otherwise, `commit_timestamp` is a float seconds-since-epoch (or `0.0` when absent), `version` is the directory's `VersionKey`, and `name` is the directory name.
+            Otherwise returns a 2-tuple `(version, name)`.
         """
         name = d["name"]
         version_str = name.removeprefix(FIRMWARE_DIR_PREFIX)
-        version_tuple = version_manager.get_release_tuple(version_str) or ()
+        version = version_key(version_str)
         if firmware_commit_times:
             commit_time = _lookup_commit_time(name)
             commit_ts = commit_time.timestamp() if commit_time else 0.0
-            return (1 if commit_time else 0, commit_ts, version_tuple, name)
-        return (version_tuple, name)
+            return (1 if commit_time else 0, commit_ts, version, name)
+        return (version, name)
 
     firmware_dirs.sort(key=_fw_dir_key, reverse=True)
     # Sort other directories alphabetically
@@ -620,6 +623,7 @@ def run_menu(config: dict[str, Any] | None = None) -> dict[str, Any] | None:
         if config is not None:
             github_token = config.get("GITHUB_TOKEN")
             allow_env_token = config.get("ALLOW_ENV_TOKEN", True)
+            configure_github_token_pool(load_github_token_pool(config))
             cache_manager = CacheManager()
         firmware_commit_times: dict[str, datetime] = {}
 
@@ -0,0 +1,243 @@
+"""
+Run-level performance metrics.
+
+Collects per-run counters describing where wall time and I/O go during a
+download pipeline run: per-stage timings, bytes downloaded/hashed/decompressed,
+files stat'ed, GitHub API calls and per-cache hit ratios.
+
+Counters are process-wide and thread-safe, mirroring the API request tracking
+in ``fetchtastic.utils``. The orchestrator resets them at the start of every
+pipeline run and snapshots them into ``get_download_statistics()``.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Union
+
+from fetchtastic.tracing import TRACE_CATEGORY_STAGE, trace_span
+
+# Counter names (also used as JSON keys in the metrics report)
+METRIC_BYTES_DOWNLOADED = "bytes_downloaded"
+METRIC_BYTES_HASHED = "bytes_hashed"
+METRIC_BYTES_DECOMPRESSED = "bytes_decompressed"
+METRIC_FILES_STATTED = "files_statted"
+METRIC_API_CALLS_FULL = "api_calls_full"
+METRIC_API_CALLS_CONDITIONAL = "api_calls_conditional"
+# Callers served by an identical in-flight request or download (single_flight)
+METRIC_REQUESTS_SHARED = "requests_shared"
+
+_COUNTER_NAMES = (
+    METRIC_BYTES_DOWNLOADED,
+    METRIC_BYTES_HASHED,
+    METRIC_BYTES_DECOMPRESSED,
+    METRIC_FILES_STATTED,
+    METRIC_API_CALLS_FULL,
+    METRIC_API_CALLS_CONDITIONAL,
+    METRIC_REQUESTS_SHARED,
+)
+
+_PROMETHEUS_PREFIX = "fetchtastic"
+
+_metrics_lock = threading.Lock()
+_counters: Dict[str, int] = dict.fromkeys(_COUNTER_NAMES, 0)
+_stage_seconds: Dict[str, float] = {}
+_cache_lookups: Dict[str, Dict[str, int]] = {}
+
+
+def increment_metric(name: str, amount: int = 1) -> None:
+    """
+    Add `amount` to the named run counter.
+
+    Parameters:
+        name (str): One of the ``METRIC_*`` counter names.
+        amount (int): Value to add; non-positive amounts are ignored.
+    """
+    if amount <= 0:
+        return
+    with _metrics_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def record_cache_lookup(cache_name: str, hit: bool) -> None:
+    """
+    Record a lookup against a named cache.
+
+    Parameters:
+        cache_name (str): Logical cache name (e.g. "releases", "commit_timestamps").
+        hit (bool): True when the lookup was served from cache, False when it missed.
+    """
+    with _metrics_lock:
+        stats = _cache_lookups.setdefault(cache_name, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+
+def record_stage_duration(stage: str, seconds: float) -> None:
+    """
+    Accumulate wall time spent in a pipeline stage.
+
+    Parameters:
+        stage (str): Stage name.
+        seconds (float): Elapsed wall time in seconds.
+    """
+    with _metrics_lock:
+        _stage_seconds[stage] = _stage_seconds.get(stage, 0.0) + max(0.0, seconds)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    Context manager that records the wall time of the enclosed block as `stage`.
+
+    The duration is recorded even when the block raises, and the block is also
+    emitted as a stage span when run tracing is enabled.
+    """
+    start = time.perf_counter()
+    try:
+        with trace_span(stage, TRACE_CATEGORY_STAGE):
+            yield
+    finally:
+        record_stage_duration(stage, time.perf_counter() - start)
+
+
+def reset_run_metrics() -> None:
+    """Reset all run counters, stage timings and cache statistics."""
+    with _metrics_lock:
+        for name in list(_counters):
+            _counters[name] = 0
+        _stage_seconds.clear()
+        _cache_lookups.clear()
+
+
+def get_run_metrics() -> Dict[str, Any]:
+    """
+    Return a snapshot of the current run metrics.
+
+    Returns:
+        dict: Mapping with keys:
+            - one integer entry per ``METRIC_*`` counter name.
+            - "stage_timings" (Dict[str, float]): seconds spent per pipeline stage.
+            - "cache_stats" (Dict[str, Dict[str, Any]]): per-cache "hits", "misses"
+              and "hit_ratio" (0.0-1.0) for every cache consulted during the run.
+    """
+    with _metrics_lock:
+        snapshot: Dict[str, Any] = dict(_counters)
+        snapshot["stage_timings"] = {
+            stage: round(seconds, 6) for stage, seconds in _stage_seconds.items()
+        }
+        cache_stats: Dict[str, Dict[str, Any]] = {}
+        for cache_name, stats in sorted(_cache_lookups.items()):
+            lookups = stats["hits"] + stats["misses"]
+            cache_stats[cache_name] = {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_ratio": (stats["hits"] / lookups) if lookups else 0.0,
+            }
+        snapshot["cache_stats"] = cache_stats
+    return snapshot
+
+
+def flatten_run_metrics(metrics: Dict[str, Any]) -> Dict[str, Union[int, float]]:
+    """
+    Flatten a ``get_run_metrics()`` snapshot into scalar entries.
+
+    Stage timings become ``stage_<name>_seconds`` and cache statistics become
+    ``cache_<name>_hits``, ``cache_<name>_misses`` and ``cache_<name>_hit_ratio`` so
+    the result can be merged into numeric-only statistics mappings.
+
+    Parameters:
+        metrics (Dict[str, Any]): Snapshot as returned by ``get_run_metrics()``.
+
+    Returns:
+        Dict[str, Union[int, float]]: Flat mapping of metric names to numbers.
+    """
+    flat: Dict[str, Union[int, float]] = {
+        name: metrics.get(name, 0) for name in _COUNTER_NAMES
+    }
+    for stage, seconds in (metrics.get("stage_timings") or {}).items():
+        flat[f"stage_{stage}_seconds"] = seconds
+    for cache_name, stats in (metrics.get("cache_stats") or {}).items():
+        flat[f"cache_{cache_name}_hits"] = stats.get("hits", 0)
+        flat[f"cache_{cache_name}_misses"] = stats.get("misses", 0)
+        flat[f"cache_{cache_name}_hit_ratio"] = stats.get("hit_ratio", 0.0)
+    return flat
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: Any) -> str:
+    """Render a numeric value for the Prometheus text format."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def format_prometheus_metrics(
+    statistics: Dict[str, Any], metrics: Dict[str, Any]
+) -> str:
+    """
+    Render download statistics and run metrics in the Prometheus textfile format.
+
+    Suitable for the node_exporter textfile collector. Numeric statistics are emitted
+    as ``fetchtastic_<key>`` gauges; stage timings and cache statistics from `metrics`
+    are emitted as labelled series instead of their flattened statistics keys.
+
+    Parameters:
+        statistics (Dict[str, Any]): Mapping as returned by ``get_download_statistics()``.
+        metrics (Dict[str, Any]): Snapshot as returned by ``get_run_metrics()``.
+
+    Returns:
+        str: Prometheus exposition text terminated by a newline.
+    """
+    lines: List[str] = []
+    labelled_keys = set(flatten_run_metrics(metrics)) - set(_COUNTER_NAMES)
+
+    for key in sorted(statistics):
+        value = statistics[key]
+        if key in labelled_keys or not isinstance(value, (int, float)):
+            continue
+        metric = f"{_PROMETHEUS_PREFIX}_{key}"
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {_format_number(value)}")
+
+    stage_timings = metrics.get("stage_timings") or {}
+    if stage_timings:
+        metric = f"{_PROMETHEUS_PREFIX}_stage_duration_seconds"
+        lines.append(f"# HELP {metric} Wall time spent in each pipeline stage.")
+        lines.append(f"# TYPE {metric} gauge")
+        for stage in sorted(stage_timings):
+            lines.append(
+                f'{metric}{{stage="{_escape_label_value(stage)}"}} '
+                f"{_format_number(stage_timings[stage])}"
+            )
+
+    cache_stats = metrics.get("cache_stats") or {}
+    if cache_stats:
+        lookups_metric = f"{_PROMETHEUS_PREFIX}_cache_lookups"
+        ratio_metric = f"{_PROMETHEUS_PREFIX}_cache_hit_ratio"
+        lines.append(f"# HELP {lookups_metric} Cache lookups per cache and result.")
+        lines.append(f"# TYPE {lookups_metric} gauge")
+        for cache_name in sorted(cache_stats):
+            label = _escape_label_value(cache_name)
+            stats = cache_stats[cache_name]
+            for key, result in (("hits", "hit"), ("misses", "miss")):
+                lines.append(
+                    f'{lookups_metric}{{cache="{label}",result="{result}"}} '
+                    f"{_format_number(stats.get(key, 0))}"
+                )
+        lines.append(
+            f"# HELP {ratio_metric} Fraction of cache lookups served from cache."
+        )
+        lines.append(f"# TYPE {ratio_metric} gauge")
+        for cache_name in sorted(cache_stats):
+            lines.append(
+                f'{ratio_metric}{{cache="{_escape_label_value(cache_name)}"}} '
+                f"{_format_number(cache_stats[cache_name].get('hit_ratio', 0.0))}"
+            )
+
+    return "\n".join(lines) + "\n"
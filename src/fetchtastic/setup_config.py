@@ -41,6 +41,7 @@ from fetchtastic.constants import (
     DEFAULT_NOTIFY_ON_SNAPSHOTS,
     MESHTASTIC_DIR_NAME,
     NTFY_REQUEST_TIMEOUT,
+    SETUP_SECTION_CHOICES,
     WINDOWS_SHORTCUT_FILE,
 )
 from fetchtastic.log_utils import logger
@@ -300,16 +301,6 @@ WINDOWS_START_MENU_FOLDER = os.path.join(
     "Fetchtastic",
 )
 
-# Supported setup sections for partial reconfiguration
-SETUP_SECTION_CHOICES: Set[str] = {
-    "base",  # Base directory and environment-specific options
-    "app",  # Client app asset download preferences (APKs + Desktop installers)
-    "firmware",  # Firmware download preferences (including prereleases/extraction)
-    "notifications",  # NTFY configuration
-    "automation",  # Cron/startup automation choices
-    "github",  # GitHub API token configuration
-}
-
 SECTION_SHORTCUTS = {
     "b": "base",
     "a": "app",
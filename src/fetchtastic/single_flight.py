@@ -0,0 +1,122 @@
+"""
+Single-flight deduplication of identical concurrent operations.
+
+Within one run the same GitHub API request can be issued by several callers at
+once (the prerelease scan and the nightly stage listing the same directory, or
+different ``_ensure_*_releases`` callers), and the same asset can be queued for
+download twice into one target. ``SingleFlight`` (threads) and
+``AsyncSingleFlight`` (coroutines) run an operation once per key while it is in
+flight: callers arriving meanwhile wait for it and receive the same result, or
+the same exception. Once the operation completes its key is forgotten, so later
+calls run again; persistent reuse across calls is the job of the caches.
+
+``AsyncSingleFlight`` runs the operation as its own task, so cancelling any caller,
+including the one that started it, leaves the operation running for the others.
+
+Each caller served by another caller's operation is counted in the
+``requests_shared`` run metric.
+"""
+
+import asyncio
+import functools
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from fetchtastic.run_metrics import METRIC_REQUESTS_SHARED, increment_metric
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Flight:
+    """One in-flight operation and its outcome."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads; concurrent callers share it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call `func`, or wait for the call already in flight for `key` and share its outcome.
+
+        Parameters:
+            key (Hashable): Identity of the operation.
+            func (Callable[[], T]): The operation; only the first concurrent caller runs it.
+
+        Returns:
+            T: The operation's result.
+
+        Raises:
+            BaseException: Whatever the operation raised, re-raised in every waiting caller.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            increment_metric(METRIC_REQUESTS_SHARED)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+
+class AsyncSingleFlight:
+    """Runs at most one awaitable per key at a time within an event loop; concurrent awaiters share it."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def _forget(self, key: Hashable, flight: "asyncio.Future[Any]") -> None:
+        """Drop a completed operation; retrieve its error so none is reported as lost."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            flight.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `func()`, or the call already in flight for `key`, and return its outcome.
+
+        A caller that is cancelled, including the one that started the operation, does
+        not cancel the shared operation.
+
+        Parameters:
+            key (Hashable): Identity of the operation.
+            func (Callable[[], Awaitable[T]]): Creates the operation; only the first concurrent caller invokes it.
+
+        Returns:
+            T: The operation's result.
+
+        Raises:
+            BaseException: Whatever the operation raised, re-raised in every waiting caller.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            increment_metric(METRIC_REQUESTS_SHARED)
+        else:
+            flight = self._flights[key] = asyncio.ensure_future(func())
+            flight.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(flight)
@@ -0,0 +1,226 @@
+"""
+Opt-in run tracing in Chrome Trace Event Format.
+
+When enabled (``fetchtastic download --trace-out run.json``) spans for pipeline
+stages, GitHub API calls, downloads, hashing/verification, extraction and cleanup
+deletions are recorded as complete ("X") events. Each thread and asyncio task gets
+its own lane (``tid``) so concurrent work renders as parallel tracks. The output
+opens directly in Perfetto (https://ui.perfetto.dev) or ``chrome://tracing``.
+
+Tracing is disabled by default; spans are then no-ops.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fetchtastic.log_utils import logger
+
+# Trace event categories
+TRACE_CATEGORY_STAGE = "stage"
+TRACE_CATEGORY_API = "api"
+TRACE_CATEGORY_DOWNLOAD = "download"
+TRACE_CATEGORY_VERIFY = "verify"
+TRACE_CATEGORY_EXTRACT = "extract"
+TRACE_CATEGORY_CLEANUP = "cleanup"
+
+
+class _TraceRecorder:
+    """Thread-safe collector of trace events for a single run."""
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty recorder whose timestamps are relative to its creation.
+        """
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._lanes: Dict[Tuple[str, int], int] = {}
+
+    def now_us(self) -> float:
+        """Return microseconds elapsed since the recorder was created."""
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def lane_id(self) -> int:
+        """
+        Return the trace lane (``tid``) for the current asyncio task or thread.
+
+        A ``thread_name`` metadata event is emitted the first time a lane is seen.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            key = ("task", id(task))
+            lane_name = f"task {task.get_name()}"
+        else:
+            thread = threading.current_thread()
+            key = ("thread", thread.ident or 0)
+            lane_name = thread.name
+
+        with self._lock:
+            tid = self._lanes.get(key)
+            if tid is None:
+                tid = len(self._lanes) + 1
+                self._lanes[key] = tid
+                self._events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": self._pid,
+                        "tid": tid,
+                        "args": {"name": lane_name},
+                    }
+                )
+        return tid
+
+    def add_complete_event(
+        self,
+        name: str,
+        category: str,
+        start_us: float,
+        duration_us: float,
+        tid: int,
+        args: Dict[str, Any],
+    ) -> None:
+        """Append a complete ("X") event."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start_us, 3),
+            "dur": round(max(0.0, duration_us), 3),
+            "pid": self._pid,
+            "tid": tid,
+            "args": args,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Return a copy of all recorded events."""
+        with self._lock:
+            return list(self._events)
+
+
+_recorder: Optional[_TraceRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def start_tracing() -> None:
+    """Enable tracing, discarding any previously recorded events."""
+    global _recorder
+    with _recorder_lock:
+        _recorder = _TraceRecorder()
+
+
+def stop_tracing() -> None:
+    """Disable tracing and discard recorded events."""
+    global _recorder
+    with _recorder_lock:
+        _recorder = None
+
+
+def is_tracing_enabled() -> bool:
+    """Return True when spans are currently being recorded."""
+    return _recorder is not None
+
+
+@contextmanager
+def trace_span(
+    name: str, category: str = TRACE_CATEGORY_STAGE, **args: Any
+) -> Iterator[Dict[str, Any]]:
+    """
+    Record the enclosed block as a trace span.
+
+    Yields the span's ``args`` mapping so callers can attach details known only once
+    the work completes (e.g. bytes transferred or an HTTP status). The span is
+    recorded even when the block raises; when tracing is disabled this is a no-op.
+
+    Parameters:
+        name (str): Span name shown in the trace viewer.
+        category (str): One of the ``TRACE_CATEGORY_*`` constants.
+        **args: Initial span arguments.
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield args
+        return
+
+    tid = recorder.lane_id()
+    start_us = recorder.now_us()
+    try:
+        yield args
+    except BaseException as exc:
+        args["error"] = type(exc).__name__
+        raise
+    finally:
+        recorder.add_complete_event(
+            name, category, start_us, recorder.now_us() - start_us, tid, args
+        )
+
+
+def add_throughput(
+    args: Dict[str, Any], num_bytes: int, elapsed_seconds: float
+) -> None:
+    """
+    Attach byte count and throughput fields to a span's ``args`` mapping.
+
+    Parameters:
+        args (Dict[str, Any]): Span arguments as yielded by ``trace_span``.
+        num_bytes (int): Bytes transferred.
+        elapsed_seconds (float): Transfer wall time in seconds.
+    """
+    args["bytes"] = num_bytes
+    if elapsed_seconds > 0:
+        args["throughput_mib_s"] = round(num_bytes / elapsed_seconds / (1024 * 1024), 3)
+
+
+def write_trace(output_path: str) -> bool:
+    """
+    Write the recorded events as a Trace Event Format JSON file.
+
+    Parameters:
+        output_path (str): Destination path; the parent directory is created if missing.
+
+    Returns:
+        bool: `True` if the trace was written, `False` if tracing is disabled or on error.
+    """
+    recorder = _recorder
+    if recorder is None:
+        logger.warning("Tracing is not enabled; no trace written to %s", output_path)
+        return False
+
+    trace = {"traceEvents": recorder.events(), "displayTimeUnit": "ms"}
+    output_path = os.path.abspath(os.path.expanduser(output_path))
+    temp_path = None
+    try:
+        output_dir = os.path.dirname(output_path)
+        os.makedirs(output_dir, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=output_dir, prefix="tmp-", suffix=".json"
+        )
+        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
+            # default=str keeps unexpected arg values from breaking the export
+            json.dump(trace, f, default=str)
+        os.replace(temp_path, output_path)
+        temp_path = None
+    except (OSError, TypeError, ValueError) as e:
+        logger.error("Could not write trace file %s: %s", output_path, e)
+        return False
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    logger.info("Wrote run trace to %s", output_path)
+    return True
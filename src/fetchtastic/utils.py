@@ -1,4 +1,5 @@
 # src/fetchtastic/utils.py
+import functools
 import gc  # For Windows file operation retries
 import hashlib
 import importlib.metadata
@@ -12,7 +13,7 @@ import threading
 import time
 import zipfile
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple  # Callable removed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import platformdirs
 import requests  # type: ignore[import-untyped]
@@ -29,11 +30,30 @@ from fetchtastic.constants import (
     DESKTOP_EXTENSIONS,
     FILE_TYPE_PREFIXES,
     GITHUB_API_TIMEOUT,
+    GITHUB_GRAPHQL_URL,
     WINDOWS_INITIAL_RETRY_DELAY,
     WINDOWS_MAX_REPLACE_RETRIES,
     ZIP_EXTENSION,
 )
+from fetchtastic.file_lock import file_lock
+from fetchtastic.hashing import HashProgressCallback, hash_file, hash_files
 from fetchtastic.log_utils import logger  # Import the new logger
+from fetchtastic.run_metrics import (
+    METRIC_API_CALLS_CONDITIONAL,
+    METRIC_API_CALLS_FULL,
+    METRIC_BYTES_DECOMPRESSED,
+    METRIC_BYTES_DOWNLOADED,
+    increment_metric,
+    record_cache_lookup,
+)
+from fetchtastic.single_flight import SingleFlight
+from fetchtastic.tracing import (
+    TRACE_CATEGORY_API,
+    TRACE_CATEGORY_DOWNLOAD,
+    TRACE_CATEGORY_VERIFY,
+    add_throughput,
+    trace_span,
+)
 
 
 def coerce_bool(value: Any, default: bool = False) -> bool:
@@ -104,6 +124,16 @@ _USER_AGENT_CACHE = None
 _token_warning_shown = False
 _token_warning_lock = threading.Lock()
 
+# Optional pool of GitHub tokens rotated by remaining budget (see select_github_token)
+_github_token_pool: List[str] = []
+# Pool tokens rejected with 401 during this process; skipped by select_github_token
+_invalid_pool_tokens: Set[str] = set()
+_token_pool_lock = threading.Lock()
+
+# In-flight GitHub API requests and file downloads shared by concurrent callers
+_api_request_flights = SingleFlight()
+_download_flights = SingleFlight()
+
 # GitHub API rate limit tracking
 _rate_limit_cache: Dict[str, Tuple[int, datetime]] = {}  # remaining, reset_timestamp
 _rate_limit_lock = threading.Lock()
@@ -167,18 +197,32 @@ def get_user_agent() -> str:
     return _USER_AGENT_CACHE
 
 
-def track_api_cache_hit() -> None:
-    """Track a cache hit for API requests."""
+def track_api_cache_hit(cache_name: Optional[str] = None) -> None:
+    """
+    Track a cache hit for API requests.
+
+    Parameters:
+        cache_name (Optional[str]): Logical cache name; when given, the hit is also recorded in the per-cache run metrics.
+    """
     global _api_cache_hits
     with _api_tracking_lock:
         _api_cache_hits += 1
+    if cache_name:
+        record_cache_lookup(cache_name, hit=True)
 
 
-def track_api_cache_miss() -> None:
-    """Track a cache miss for API requests."""
+def track_api_cache_miss(cache_name: Optional[str] = None) -> None:
+    """
+    Track a cache miss for API requests.
+
+    Parameters:
+        cache_name (Optional[str]): Logical cache name; when given, the miss is also recorded in the per-cache run metrics.
+    """
     global _api_cache_misses
     with _api_tracking_lock:
         _api_cache_misses += 1
+    if cache_name:
+        record_cache_lookup(cache_name, hit=False)
 
 
 def get_api_request_summary() -> Dict[str, Any]:
@@ -324,6 +368,129 @@ def get_effective_github_token(
     return env_token.strip() if env_token else None
 
 
+def github_token_hash(token: Optional[str]) -> str:
+    """Return the short hash that keys rate-limit tracking for `token` (or no token)."""
+    return hashlib.sha256((token or "no-token").encode()).hexdigest()[:16]
+
+
+def load_github_token_pool(config: Dict[str, Any]) -> List[str]:
+    """
+    Read the GitHub token pool from the configuration.
+
+    Tokens come from ``GITHUB_TOKENS`` (a list, or a string separated by commas or
+    whitespace) followed by ``GITHUB_TOKENS_FILE`` (one token per line; blank lines
+    and ``#`` comments are ignored). Duplicates are dropped, keeping the first.
+
+    Parameters:
+        config (Dict[str, Any]): Fetchtastic configuration.
+
+    Returns:
+        List[str]: Pool tokens in configuration order; empty when no pool is configured.
+    """
+    raw_tokens = config.get("GITHUB_TOKENS") or []
+    if isinstance(raw_tokens, str):
+        raw_tokens = raw_tokens.replace(",", " ").split()
+    tokens = [str(token).strip() for token in raw_tokens if str(token).strip()]
+
+    tokens_file = config.get("GITHUB_TOKENS_FILE")
+    if tokens_file:
+        try:
+            with open(os.path.expanduser(str(tokens_file)), "r", encoding="utf-8") as f:
+                for line in f:
+                    token = line.split("#", 1)[0].strip()
+                    if token:
+                        tokens.append(token)
+        except OSError as e:
+            logger.warning(f"Could not read GITHUB_TOKENS_FILE {tokens_file}: {e}")
+
+    return list(dict.fromkeys(tokens))
+
+
+def configure_github_token_pool(tokens: Iterable[str]) -> None:
+    """
+    Set the process-wide token pool used by ``select_github_token``.
+
+    Parameters:
+        tokens (Iterable[str]): Pool tokens; an empty iterable disables the pool.
+    """
+    with _token_pool_lock:
+        _github_token_pool[:] = list(dict.fromkeys(t for t in tokens if t))
+        _invalid_pool_tokens.clear()
+    if _github_token_pool:
+        logger.debug(f"Using a pool of {len(_github_token_pool)} GitHub tokens")
+
+
+def choose_token_by_budget(
+    tokens: Iterable[str],
+    budget: Callable[[str], Optional[Tuple[int, Optional[datetime]]]],
+) -> Optional[str]:
+    """
+    Pick the token with the most remaining rate-limit budget.
+
+    A token without a current budget entry (never used, or its window has reset) is
+    assumed to have a full window and is preferred. Tokens with no requests left are
+    skipped until their reset time. Ties go to the earlier token.
+
+    Parameters:
+        tokens (Iterable[str]): Candidate tokens in preference order.
+        budget (Callable[[str], Optional[Tuple[int, Optional[datetime]]]]): Returns the
+            tracked (remaining, reset time) for a token, or None if unknown.
+
+    Returns:
+        Optional[str]: The chosen token, or None if every candidate is exhausted.
+    """
+    now = datetime.now(timezone.utc)
+    best: Optional[str] = None
+    best_remaining = -1.0
+    for token in tokens:
+        info = budget(token)
+        remaining: float = math.inf
+        if info is not None:
+            tracked, reset_time = info
+            if reset_time is None or reset_time > now:
+                remaining = tracked
+        if remaining > 0 and remaining > best_remaining:
+            best, best_remaining = token, remaining
+    return best
+
+
+def select_github_token(
+    github_token: Optional[str], allow_env_token: bool = True
+) -> Optional[str]:
+    """
+    Choose the token for the next GitHub API request.
+
+    Without a token pool this is ``get_effective_github_token``. With a pool, the
+    explicit (or environment) token joins the pool and the token with the most
+    remaining budget in the per-token-hash rate-limit tracking is used; exhausted
+    tokens are skipped until their reset. None (an unauthenticated request) is only
+    returned when every token is exhausted or was rejected.
+
+    Parameters:
+        github_token (Optional[str]): Explicit token; leading and trailing whitespace are ignored.
+        allow_env_token (bool): If True, the `GITHUB_TOKEN` environment variable may be used.
+
+    Returns:
+        Optional[str]: The token to authenticate with, or None.
+    """
+    effective_token = get_effective_github_token(github_token, allow_env_token)
+    with _token_pool_lock:
+        if not _github_token_pool:
+            return effective_token
+        candidates = [
+            token
+            for token in dict.fromkeys(
+                ([effective_token] if effective_token else []) + _github_token_pool
+            )
+            if token not in _invalid_pool_tokens
+        ]
+    if not _rate_limit_cache_loaded:
+        _load_rate_limit_cache()
+    return choose_token_by_budget(
+        candidates, lambda token: get_rate_limit_info(github_token_hash(token))
+    )
+
+
 def _show_token_warning_if_needed(effective_token: Optional[str]) -> None:
     """
     Log a one-time warning when no GitHub token is available.
@@ -355,6 +522,61 @@ def _get_rate_limit_cache_file() -> str:
     return _rate_limit_cache_file
 
 
+def _read_rate_limit_file(cache_file: str) -> Dict[str, Tuple[int, datetime]]:
+    """
+    Read the on-disk rate-limit cache, keeping only well-formed entries whose reset time is in the future.
+
+    Missing files, malformed entries, and I/O or JSON errors yield an empty or partial result rather than an exception.
+
+    Parameters:
+        cache_file (str): Path to the rate-limit cache file.
+
+    Returns:
+        Dict[str, Tuple[int, datetime]]: Mapping of token hash to (remaining, reset time).
+    """
+    loaded: Dict[str, Tuple[int, datetime]] = {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache_data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return loaded  # No file or unreadable; treat as empty
+    if not isinstance(cache_data, dict):
+        return loaded  # Invalid structure; treat as empty
+
+    # Convert string timestamps back to datetime objects
+    current_time = datetime.now(timezone.utc)
+    for cache_key, cache_value in cache_data.items():
+        try:
+            # Validate value structure
+            if not isinstance(cache_value, (list, tuple)) or len(cache_value) != 2:
+                continue
+
+            remaining_str, reset_timestamp_str = cache_value
+            remaining = int(remaining_str)
+            reset_timestamp = datetime.fromisoformat(reset_timestamp_str)
+
+            # Only keep cache entries where reset is in the future
+            if reset_timestamp > current_time:
+                loaded[cache_key] = (remaining, reset_timestamp)
+        except (ValueError, TypeError):
+            continue
+    return loaded
+
+
+def _merge_rate_limit_entry(
+    ours: Tuple[int, datetime], theirs: Tuple[int, datetime]
+) -> Tuple[int, datetime]:
+    """
+    Combine two observations of one token's rate limit, as seen by two processes.
+
+    The later reset window wins; within the same window the lower remaining count is
+    the more recent observation, since the budget only shrinks until the reset.
+    """
+    if ours[1] != theirs[1]:
+        return ours if ours[1] > theirs[1] else theirs
+    return ours if ours[0] <= theirs[0] else theirs
+
+
 def _load_rate_limit_cache() -> None:
     """
     Load persisted rate-limit entries from disk into the in-memory cache if they have not already been loaded.
@@ -373,40 +595,7 @@ def _load_rate_limit_cache() -> None:
             return
 
     # Load cache data outside the lock to avoid holding it during I/O
-    cache_file = _get_rate_limit_cache_file()
-    loaded: Dict[str, Tuple[int, datetime]] = {}
-    try:
-        if not os.path.exists(cache_file):
-            loaded = {}  # No file; treat as empty
-        else:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-            # Validate cache structure
-            if not isinstance(cache_data, dict):
-                loaded = {}  # Invalid structure; treat as empty
-            else:
-                # Convert string timestamps back to datetime objects (build locally)
-                current_time = datetime.now(timezone.utc)
-                for cache_key, cache_value in cache_data.items():
-                    try:
-                        # Validate value structure
-                        if (
-                            not isinstance(cache_value, (list, tuple))
-                            or len(cache_value) != 2
-                        ):
-                            continue
-
-                        remaining_str, reset_timestamp_str = cache_value
-                        remaining = int(remaining_str)
-                        reset_timestamp = datetime.fromisoformat(reset_timestamp_str)
-
-                        # Only keep cache entries where reset is in the future
-                        if reset_timestamp > current_time:
-                            loaded[cache_key] = (remaining, reset_timestamp)
-                    except (ValueError, TypeError):
-                        continue
-    except (OSError, json.JSONDecodeError):
-        loaded = {}  # Silently ignore cache loading errors
+    loaded = _read_rate_limit_file(_get_rate_limit_cache_file())
 
     # Publish under lock, double-check flag
     with _rate_limit_lock:
@@ -440,34 +629,47 @@ def _parse_rate_limit_header(header_value: Any) -> Optional[int]:
 
 def _save_rate_limit_cache() -> None:
     """
-    Persist the in-memory rate-limit cache to the on-disk cache file.
+    Persist the in-memory rate-limit cache to the on-disk cache file, merged with what other processes saved.
 
-    Serializes cached entries (timestamps as ISO 8601 strings) and writes them atomically via a temporary file replacement. I/O errors during the save are ignored.
+    The file is shared by every fetchtastic process on the host. Under an inter-process file lock, the current file is re-read and merged with the in-memory entries (see `_merge_rate_limit_entry`); the merged entries are adopted in memory, so this process also sees budget spent by the others, and written back atomically via a temporary file replacement. I/O errors during the save are ignored.
     """
     cache_file = _get_rate_limit_cache_file()
 
     try:
-        # Snapshot under lock, then write outside to minimize contention
-        with _rate_limit_lock:
-            cache_data = {
-                cache_key: (remaining, reset_timestamp.isoformat())
-                for cache_key, (remaining, reset_timestamp) in _rate_limit_cache.items()
-            }
-
-        # Write to a unique temporary file first, then atomically replace
-        fd, temp_file = tempfile.mkstemp(
-            dir=os.path.dirname(cache_file), prefix="tmp-", suffix=".json"
-        )
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
-            os.replace(temp_file, cache_file)
-        finally:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except OSError:
-                    pass
+        with file_lock(cache_file):
+            on_disk = _read_rate_limit_file(cache_file)
+
+            # Merge and snapshot under the thread lock, then write outside it
+            with _rate_limit_lock:
+                for cache_key, entry in on_disk.items():
+                    current = _rate_limit_cache.get(cache_key)
+                    _rate_limit_cache[cache_key] = (
+                        entry
+                        if current is None
+                        else _merge_rate_limit_entry(current, entry)
+                    )
+                cache_data = {
+                    cache_key: (remaining, reset_timestamp.isoformat())
+                    for cache_key, (
+                        remaining,
+                        reset_timestamp,
+                    ) in _rate_limit_cache.items()
+                }
+
+            # Write to a unique temporary file first, then atomically replace
+            fd, temp_file = tempfile.mkstemp(
+                dir=os.path.dirname(cache_file), prefix="tmp-", suffix=".json"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache_data, f, indent=2)
+                os.replace(temp_file, cache_file)
+            finally:
+                if os.path.exists(temp_file):
+                    try:
+                        os.remove(temp_file)
+                    except OSError:
+                        pass
 
     except OSError:
         pass  # Silently ignore cache saving errors
@@ -591,14 +793,18 @@ def make_github_api_request(
     timeout: Optional[int] = None,
     _is_retry: bool = False,
     custom_403_message: Optional[str] = None,
+    etag: Optional[str] = None,
 ) -> requests.Response:
     """
     Perform a GitHub API GET request, update persistent and in-memory rate-limit tracking, and retry once without credentials if token authentication fails.
 
+    Identical concurrent requests (same URL, params, ETag, credentials, timeout and 403 message) are sent once and share the response or error; see `fetchtastic.single_flight`.
+
     Parameters:
         github_token (Optional[str]): Explicit token to use for Authorization; leading/trailing whitespace is trimmed. If omitted and allow_env_token is True, the GITHUB_TOKEN environment variable may be used.
         allow_env_token (bool): If True, allow falling back to the GITHUB_TOKEN environment variable when no explicit github_token is provided.
         custom_403_message (Optional[str]): Optional message to use when a 403 rate-limit condition is raised; if omitted a default explanatory message is used.
+        etag (Optional[str]): ETag from a previous response to the same URL and params. When given, the request is sent with ``If-None-Match`` and GitHub may answer ``304 Not Modified``, which callers must check for.
 
     Returns:
         requests.Response: The HTTP response returned by GitHub.
@@ -607,6 +813,44 @@ def make_github_api_request(
         requests.HTTPError: For HTTP error responses (including handled 401/403 cases surfaced with descriptive messages).
         requests.RequestException: For lower-level network or request errors.
     """
+    request = functools.partial(
+        _send_github_api_request,
+        url,
+        github_token=github_token,
+        allow_env_token=allow_env_token,
+        params=params,
+        timeout=timeout,
+        _is_retry=_is_retry,
+        custom_403_message=custom_403_message,
+        etag=etag,
+    )
+    if _is_retry:
+        return request()
+    key = (
+        "GET",
+        url,
+        tuple(
+            sorted((str(name), str(value)) for name, value in (params or {}).items())
+        ),
+        etag,
+        github_token_hash(get_effective_github_token(github_token, allow_env_token)),
+        timeout,
+        custom_403_message,
+    )
+    return _api_request_flights.do(key, request)
+
+
+def _send_github_api_request(
+    url: str,
+    github_token: Optional[str] = None,
+    allow_env_token: bool = True,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Optional[int] = None,
+    _is_retry: bool = False,
+    custom_403_message: Optional[str] = None,
+    etag: Optional[str] = None,
+) -> requests.Response:
+    """Send one GitHub API GET request for `make_github_api_request`, which documents the parameters."""
     from fetchtastic.log_utils import logger
 
     # Prepare headers with optional authentication
@@ -616,8 +860,11 @@ def make_github_api_request(
         "User-Agent": get_user_agent(),
     }
 
-    # Add authentication if token provided
-    effective_token = get_effective_github_token(github_token, allow_env_token)
+    if etag:
+        headers["If-None-Match"] = etag
+
+    # Add authentication if token provided (the best-budget pool token, if pooled)
+    effective_token = select_github_token(github_token, allow_env_token)
     if effective_token:
         headers["Authorization"] = f"token {effective_token}"
         logger.debug("Using GitHub token for API authentication")
@@ -633,9 +880,7 @@ def make_github_api_request(
         _load_rate_limit_cache()
 
     # Create token hash for caching
-    token_hash = hashlib.sha256((effective_token or "no-token").encode()).hexdigest()[
-        :16
-    ]
+    token_hash = github_token_hash(effective_token)
     global _last_rate_limit_token_hash
     _last_rate_limit_token_hash = token_hash
 
@@ -659,9 +904,11 @@ def make_github_api_request(
         # Make the request
         actual_timeout = timeout or GITHUB_API_TIMEOUT
         logger.debug(f"Making GitHub API request: {url}")
-        response = requests.get(
-            url, timeout=actual_timeout, headers=headers, params=params
-        )
+        with trace_span("github_api_request", TRACE_CATEGORY_API, url=url) as span:
+            response = requests.get(
+                url, timeout=actual_timeout, headers=headers, params=params
+            )
+            span["status"] = getattr(response, "status_code", None)
         response.raise_for_status()
     except requests.HTTPError as e:
         if (
@@ -670,10 +917,29 @@ def make_github_api_request(
             and e.response.status_code == 401
             and effective_token
         ):
+            with _token_pool_lock:
+                pooled = bool(_github_token_pool)
+                if pooled:
+                    # Skip the rejected token from now on; the retry picks another
+                    _invalid_pool_tokens.add(effective_token)
+            if pooled:
+                logger.warning(
+                    f"GitHub token authentication failed for {url}. Retrying with the next pooled token."
+                )
+                return _send_github_api_request(
+                    url,
+                    github_token=github_token,
+                    allow_env_token=allow_env_token,
+                    params=params,
+                    timeout=timeout,
+                    _is_retry=True,
+                    custom_403_message=custom_403_message,
+                    etag=etag,
+                )
             logger.warning(
                 f"GitHub token authentication failed for {url}. Retrying without authentication."
             )
-            return make_github_api_request(
+            return _send_github_api_request(
                 url,
                 github_token=None,
                 allow_env_token=False,  # Don't try env token on retry
@@ -681,6 +947,7 @@ def make_github_api_request(
                 timeout=timeout,
                 _is_retry=True,
                 custom_403_message=custom_403_message,
+                etag=etag,
             )
         elif e.response is not None and e.response.status_code == 403:
             rate_limit_remaining = e.response.headers.get("X-RateLimit-Remaining")
@@ -723,6 +990,9 @@ def make_github_api_request(
             # API request counter increment
             if effective_token:
                 _api_auth_used = True
+        increment_metric(
+            METRIC_API_CALLS_CONDITIONAL if etag else METRIC_API_CALLS_FULL
+        )
 
     # Enhanced rate limit tracking and logging
     try:
@@ -799,22 +1069,232 @@ def make_github_api_request(
     return response
 
 
+def make_github_graphql_request(
+    query: str,
+    variables: Optional[Dict[str, Any]] = None,
+    github_token: Optional[str] = None,
+    allow_env_token: bool = True,
+    timeout: Optional[int] = None,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Run a query against the GitHub GraphQL API and return its ``data`` and ``errors``.
+
+    GraphQL requires authentication, so unlike ``make_github_api_request`` there is no
+    unauthenticated fallback. The request is counted in the same API statistics.
+
+    Parameters:
+        query (str): GraphQL query document.
+        variables (Optional[Dict[str, Any]]): Query variables.
+        github_token (Optional[str]): Explicit token; whitespace is trimmed.
+        allow_env_token (bool): Allow falling back to the GITHUB_TOKEN environment variable.
+        timeout (Optional[int]): Request timeout in seconds; defaults to GITHUB_API_TIMEOUT.
+
+    Returns:
+        Tuple[Dict[str, Any], List[Dict[str, Any]]]: The response's ``data`` object and
+        its ``errors`` list. Fields that failed to resolve are None in ``data`` and have
+        an error whose ``path`` names them.
+
+    Raises:
+        ValueError: If no token is available or the response carries no ``data``.
+        requests.HTTPError: For HTTP error responses.
+        requests.RequestException: For lower-level network or request errors.
+    """
+    effective_token = select_github_token(github_token, allow_env_token)
+    if not effective_token:
+        raise ValueError("The GitHub GraphQL API requires a token")
+    headers = {
+        "Authorization": f"bearer {effective_token}",
+        "User-Agent": get_user_agent(),
+    }
+
+    global _api_request_count, _api_auth_used
+    try:
+        logger.debug(f"Making GitHub GraphQL request: {GITHUB_GRAPHQL_URL}")
+        with trace_span(
+            "github_graphql_request", TRACE_CATEGORY_API, url=GITHUB_GRAPHQL_URL
+        ) as span:
+            response = requests.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": query, "variables": variables or {}},
+                headers=headers,
+                timeout=timeout or GITHUB_API_TIMEOUT,
+            )
+            span["status"] = getattr(response, "status_code", None)
+        response.raise_for_status()
+    finally:
+        time.sleep(API_CALL_DELAY)
+        with _api_tracking_lock:
+            _api_request_count += 1
+            _api_auth_used = True
+        increment_metric(METRIC_API_CALLS_FULL)
+
+    payload = response.json()
+    data = payload.get("data") if isinstance(payload, dict) else None
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        raise ValueError(f"GitHub GraphQL request failed: {errors or payload!r}")
+    if not isinstance(errors, list):
+        errors = []
+    if errors:
+        logger.debug("GitHub GraphQL response has partial errors: %s", errors)
+    return data, [error for error in errors if isinstance(error, dict)]
+
+
 def calculate_sha256(file_path: str) -> Optional[str]:
     """
     Compute the SHA-256 hex digest of a file.
 
-    Reads the file in binary mode and streams its contents without loading the whole file into memory.
+    Streams the file through the shared hashing engine (``fetchtastic.hashing``) without loading the whole file into memory.
     Returns the 64-character lowercase hexadecimal digest on success, or None if the file cannot be opened or read (e.g., missing file or permission error).
     """
+    return hash_file(file_path, "sha256")
+
+
+def _zip_uncompressed_size(zf: zipfile.ZipFile) -> int:
+    """
+    Return the total uncompressed size of all members of an open ZIP archive.
+
+    Used to account for bytes decompressed by full CRC checks (``testzip``).
+    """
+    return sum(info.file_size for info in zf.infolist())
+
+
+# ZIP local file header size before the variable-length name and extra fields
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def get_zip_check_file_path(file_path: str) -> str:
+    """
+    Get the cache-backed marker path recording a passed full CRC check for a ZIP file.
+
+    Lives next to the file's hash sidecar (see `get_hash_file_path`) with a `.zipcrc` suffix.
+    """
+    return get_hash_file_path(file_path)[: -len(".sha256")] + ".zipcrc"
+
+
+def get_extraction_manifest_path(file_path: str) -> str:
+    """
+    Get the cache-backed path of the extraction manifest for a ZIP file.
+
+    Lives next to the file's hash sidecar (see `get_hash_file_path`) with an `.extract.json` suffix.
+    """
+    return get_hash_file_path(file_path)[: -len(".sha256")] + ".extract.json"
+
+
+def _zip_stat_signature(file_path: str) -> Optional[str]:
+    """Return "<size> <mtime_ns>" for file_path, or None if it cannot be stat'ed."""
     try:
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
-    except (IOError, OSError) as e:
-        logger.debug(f"Error calculating SHA-256 for {file_path}: {e}")
+        stat_result = os.stat(file_path)
+    except OSError:
         return None
+    return f"{stat_result.st_size} {stat_result.st_mtime_ns}"
+
+
+def record_zip_crc_check(file_path: str) -> None:
+    """
+    Record that file_path passed a full ZIP CRC check in its current state.
+
+    The marker stores the file's size and mtime; any later change to the file invalidates it. IO errors are logged and suppressed.
+    """
+    signature = _zip_stat_signature(file_path)
+    if signature is None:
+        return
+    marker_file = get_zip_check_file_path(file_path)
+    tmp_file = f"{marker_file}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_file, "w", encoding="ascii", newline="\n") as f:
+            f.write(f"{signature}\n")
+        os.replace(tmp_file, marker_file)
+    except (IOError, OSError) as e:
+        logger.debug("Error saving ZIP check marker %s: %s", marker_file, e)
+        try:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _zip_crc_check_is_current(file_path: str) -> bool:
+    """Return True if a full CRC check was recorded for file_path in its current state."""
+    signature = _zip_stat_signature(file_path)
+    if signature is None:
+        return False
+    try:
+        with open(get_zip_check_file_path(file_path), "r", encoding="ascii") as f:
+            return f.readline().strip() == signature
+    except (IOError, OSError, UnicodeDecodeError):
+        return False
+
+
+def is_zip_structurally_sound(file_path: str) -> bool:
+    """
+    Check a ZIP archive's structure without decompressing any member.
+
+    Reads the end-of-central-directory record and central directory, then checks that every member's local header and compressed data lie before the central directory. This catches truncated and overwritten archives at the cost of a stat and a few KB of reads.
+
+    Returns:
+        bool: `True` if the archive structure is consistent, `False` otherwise.
+    """
+    try:
+        file_size = os.path.getsize(file_path)
+        with zipfile.ZipFile(file_path, "r") as zf:
+            data_limit = min(getattr(zf, "start_dir", file_size), file_size)
+            for info in zf.infolist():
+                encoding = "utf-8" if info.flag_bits & 0x800 else "cp437"
+                name_length = len(info.orig_filename.encode(encoding, errors="replace"))
+                member_end = (
+                    info.header_offset
+                    + _ZIP_LOCAL_HEADER_SIZE
+                    + name_length
+                    + info.compress_size
+                )
+                if info.header_offset < 0 or member_end > data_limit:
+                    logger.debug(
+                        "ZIP member %s in %s extends past its data area",
+                        info.filename,
+                        file_path,
+                    )
+                    return False
+    except (OSError, zipfile.BadZipFile, ValueError):
+        return False
+    return True
+
+
+def _zip_members_pass_crc(file_path: str) -> bool:
+    """Decompress every member of a ZIP archive and verify its CRC (``testzip``)."""
+    try:
+        with zipfile.ZipFile(file_path, "r") as zf:
+            if zf.testzip() is not None:
+                return False
+            increment_metric(METRIC_BYTES_DECOMPRESSED, _zip_uncompressed_size(zf))
+            return True
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def check_zip_integrity(file_path: str, *, full: bool = False) -> bool:
+    """
+    Validate a ZIP archive, decompressing it only when it has not been fully checked before.
+
+    A full CRC check (every member decompressed) runs the first time an archive is seen, or when `full` is set, and its success is recorded with the file's size and mtime. While that record matches, only the cheap structural check (`is_zip_structurally_sound`) runs.
+
+    Parameters:
+        file_path (str): Path to the ZIP archive.
+        full (bool): Force a full CRC check even if one was recorded.
+
+    Returns:
+        bool: `True` if the archive passed the applicable check, `False` otherwise.
+    """
+    file_path = str(file_path)
+    with trace_span("zip_check", TRACE_CATEGORY_VERIFY, file=file_path) as span:
+        if not full and _zip_crc_check_is_current(file_path):
+            span["mode"] = "structural"
+            return is_zip_structurally_sound(file_path)
+        span["mode"] = "crc"
+        if not _zip_members_pass_crc(file_path):
+            return False
+        record_zip_crc_check(file_path)
+        return True
 
 
 def get_hash_file_path(file_path: str) -> str:
@@ -913,9 +1393,13 @@ def _remove_file_and_hash(path: str) -> bool:
     try:
         if os.path.exists(path):
             os.remove(path)
-        hash_file = get_hash_file_path(path)
-        if os.path.exists(hash_file):
-            os.remove(hash_file)
+        for sidecar in (
+            get_hash_file_path(path),
+            get_zip_check_file_path(path),
+            get_extraction_manifest_path(path),
+        ):
+            if os.path.exists(sidecar):
+                os.remove(sidecar)
         _remove_legacy_hash_file(path)
         return True
     except (IOError, OSError) as e:
@@ -970,10 +1454,82 @@ def verify_file_integrity(file_path: str, release_tag: Optional[str] = None) ->
         logger.debug("verify_file_integrity called on a directory: %s", file_path)
         return False
 
+    with trace_span("verify", TRACE_CATEGORY_VERIFY, file=file_path) as span:
+        verified = _verify_file_against_stored_hash(file_path, release_tag)
+        span["verified"] = verified
+    return verified
+
+
+def verify_files_integrity(
+    file_paths: List[str],
+    release_tag: Optional[str] = None,
+    *,
+    max_workers: Optional[int] = None,
+    progress: Optional[HashProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, bool]:
+    """
+    Batch form of `verify_file_integrity`: hash all files in parallel, then compare each with its stored hash.
+
+    Files without a stored hash get one saved, as in `verify_file_integrity`. Missing paths and directories fail verification.
+
+    Parameters:
+        file_paths (List[str]): Files to verify.
+        release_tag (Optional[str]): Release tag used in log messages.
+        max_workers (Optional[int]): Hashing pool size; see `fetchtastic.hashing.hash_files`.
+        progress (Optional[HashProgressCallback]): Called with ``(completed, total, path)`` as files finish hashing.
+        cancel_event (Optional[threading.Event]): Stops hashing early when set.
+
+    Returns:
+        Dict[str, bool]: Verification result per path. Files skipped by cancellation are omitted.
+    """
+    results: Dict[str, bool] = {}
+    to_hash = []
+    for file_path in file_paths:
+        if os.path.isfile(file_path):
+            to_hash.append(file_path)
+        else:
+            results[file_path] = False
+    digests = hash_files(
+        to_hash,
+        "sha256",
+        max_workers=max_workers,
+        progress=progress,
+        cancel_event=cancel_event,
+    )
+    for file_path, digest in digests.items():
+        results[file_path] = _check_against_stored_hash(file_path, digest, release_tag)
+    return results
+
+
+def _verify_file_against_stored_hash(
+    file_path: str, release_tag: Optional[str] = None
+) -> bool:
+    """
+    Compare an existing file's SHA-256 against its stored hash, creating the hash when missing.
+
+    Helper for `verify_file_integrity`; `file_path` must be an existing regular file.
+
+    Returns:
+        `True` if the hashes match or an initial hash was saved, `False` otherwise.
+    """
+    return _check_against_stored_hash(
+        file_path, calculate_sha256(file_path), release_tag
+    )
+
+
+def _check_against_stored_hash(
+    file_path: str, current_hash: Optional[str], release_tag: Optional[str] = None
+) -> bool:
+    """
+    Compare an already computed SHA-256 with the file's stored hash, saving it when none is stored.
+
+    Returns:
+        `True` if the hashes match or an initial hash was saved, `False` otherwise (including when `current_hash` is None).
+    """
     stored_hash = load_file_hash(file_path)
     if not stored_hash:
-        # No stored hash, calculate and save it
-        current_hash = calculate_sha256(file_path)
+        # No stored hash, save the one just calculated
         if current_hash:
             save_file_hash(file_path, current_hash)
             logger.debug(f"Generated initial hash for {os.path.basename(file_path)}")
@@ -981,7 +1537,6 @@ def verify_file_integrity(file_path: str, release_tag: Optional[str] = None) ->
         # Could not read file to create initial hash; treat as invalid to trigger remediation
         return False
 
-    current_hash = calculate_sha256(file_path)
     if not current_hash:
         return False
 
@@ -1046,6 +1601,42 @@ def cleanup_legacy_hash_sidecars(base_dir: str) -> int:
     return removed
 
 
+def scrub_hashed_files(
+    base_dir: str,
+    *,
+    progress: Optional[HashProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, bool]:
+    """
+    Re-hash every file under base_dir that has a stored hash and compare it with that hash.
+
+    Files without a stored hash, temporary download files and legacy `.sha256` sidecars are skipped, so scrubbing never records new baselines.
+
+    Parameters:
+        base_dir (str): Root directory to scan (normally the download directory).
+        progress (Optional[HashProgressCallback]): Called with ``(completed, total, path)`` as files finish hashing.
+        cancel_event (Optional[threading.Event]): Stops the scrub early when set.
+
+    Returns:
+        Dict[str, bool]: Verification result per checked file; `False` marks a hash mismatch or unreadable file. Files skipped by cancellation are omitted.
+    """
+    if not base_dir or not os.path.isdir(base_dir):
+        return {}
+
+    hashed_files = []
+    for root, _dirs, files in os.walk(base_dir):
+        for name in files:
+            if name.endswith(".sha256") or ".tmp" in name:
+                continue
+            path = os.path.join(root, name)
+            if load_file_hash(path) is not None:
+                hashed_files.append(path)
+
+    return verify_files_integrity(
+        sorted(hashed_files), progress=progress, cancel_event=cancel_event
+    )
+
+
 def download_file_with_retry(
     url: str,
     download_path: str,
@@ -1056,6 +1647,8 @@ def download_file_with_retry(
 
     If the destination file already exists and passes verification it is left in place. The function validates ZIP archives using ZIP integrity checks and verifies or records a SHA-256 sidecar hash. Temporary or partially downloaded files are removed on failure; corrupted files and their associated hash records are removed before re-downloading. On Windows the final install may be retried to accommodate transient file-access issues.
 
+    Concurrent calls for the same URL and destination run once and share the outcome; see `fetchtastic.single_flight`.
+
     Parameters:
         url (str): HTTP(S) URL of the file to download.
         download_path (str): Final filesystem path where the downloaded file will be installed.
@@ -1063,17 +1656,22 @@ def download_file_with_retry(
     Returns:
         bool: `True` if the destination file is present and verified or was downloaded and installed successfully, `False` otherwise.
     """
+    return _download_flights.do(
+        (url, os.path.abspath(download_path)),
+        lambda: _download_file_with_retry(url, download_path),
+    )
+
+
+def _download_file_with_retry(url: str, download_path: str) -> bool:
+    """Download and install one file for `download_file_with_retry`, which documents the behavior."""
     # Note: Session is created after pre-checks and closed in finally
 
     # Check if file exists and is valid (especially for zips)
     if os.path.exists(download_path):
         if download_path.lower().endswith(ZIP_EXTENSION):
             try:
-                with zipfile.ZipFile(download_path, "r") as zf:
-                    if zf.testzip() is not None:  # None means no errors
-                        raise zipfile.BadZipFile(
-                            "Zip file integrity check failed (testzip)."
-                        )
+                if not check_zip_integrity(download_path):
+                    raise zipfile.BadZipFile("Zip file integrity check failed.")
 
                 # Additional hash verification
                 if verify_file_integrity(download_path):
@@ -1157,29 +1755,34 @@ def download_file_with_retry(
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
-        response = session.get(url, stream=True, timeout=DEFAULT_REQUEST_TIMEOUT)
-
-        # Log HTTP response status code
-        logger.debug(
-            f"Received HTTP response status code: {response.status_code} for URL: {url}"
-        )
-        # Status-based retries have already been applied by urllib3's Retry;
-        # raise_for_status will surface the final HTTP error, if any.
-        response.raise_for_status()  # Handled by requests.exceptions.RequestException
-
         downloaded_chunks = 0
         downloaded_bytes = 0
-        # Ensure destination directory exists for the temp file
-        parent_dir = os.path.dirname(download_path)
-        if parent_dir and not os.path.exists(parent_dir):
-            os.makedirs(parent_dir, exist_ok=True)
-        with open(temp_path, "wb") as file:  # Can raise IOError
-            for chunk in response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE):
-                if chunk:
-                    file.write(chunk)
-                    downloaded_chunks += 1
-                    downloaded_bytes += len(chunk)
+        with trace_span(
+            os.path.basename(download_path), TRACE_CATEGORY_DOWNLOAD, url=url
+        ) as span:
+            response = session.get(url, stream=True, timeout=DEFAULT_REQUEST_TIMEOUT)
 
+            # Log HTTP response status code
+            logger.debug(
+                f"Received HTTP response status code: {response.status_code} for URL: {url}"
+            )
+            # Status-based retries have already been applied by urllib3's Retry;
+            # raise_for_status will surface the final HTTP error, if any.
+            response.raise_for_status()  # Handled by requests.exceptions.RequestException
+
+            # Ensure destination directory exists for the temp file
+            parent_dir = os.path.dirname(download_path)
+            if parent_dir and not os.path.exists(parent_dir):
+                os.makedirs(parent_dir, exist_ok=True)
+            with open(temp_path, "wb") as file:  # Can raise IOError
+                for chunk in response.iter_content(chunk_size=DEFAULT_CHUNK_SIZE):
+                    if chunk:
+                        file.write(chunk)
+                        downloaded_chunks += 1
+                        downloaded_bytes += len(chunk)
+            add_throughput(span, downloaded_bytes, time.time() - start_time)
+
+        increment_metric(METRIC_BYTES_DOWNLOADED, downloaded_bytes)
         elapsed = time.time() - start_time
         file_size_mb = downloaded_bytes / (1024 * 1024)
         logger.debug(
@@ -1191,11 +1794,12 @@ def download_file_with_retry(
 
         if download_path.lower().endswith(ZIP_EXTENSION):
             try:
-                with zipfile.ZipFile(temp_path, "r") as zf_temp:
-                    if zf_temp.testzip() is not None:
-                        raise zipfile.BadZipFile(
-                            "Downloaded zip file integrity check failed (testzip)."
-                        )
+                # Full CRC check once at download time; recorded after the move so
+                # later runs only need the structural check.
+                if not _zip_members_pass_crc(temp_path):
+                    raise zipfile.BadZipFile(
+                        "Downloaded zip file integrity check failed (testzip)."
+                    )
             except zipfile.BadZipFile as e_zip_bad:
                 if os.path.exists(temp_path):
                     try:
@@ -1243,6 +1847,8 @@ def download_file_with_retry(
                     current_hash = calculate_sha256(download_path)
                     if current_hash:
                         save_file_hash(download_path, current_hash)
+                    if download_path.lower().endswith(ZIP_EXTENSION):
+                        record_zip_crc_check(download_path)
 
                     # Log successful download after file is in place
                     if file_size_mb >= 1.0:
@@ -1304,6 +1910,8 @@ def download_file_with_retry(
                 current_hash = calculate_sha256(download_path)
                 if current_hash:
                     save_file_hash(download_path, current_hash)
+                if download_path.lower().endswith(ZIP_EXTENSION):
+                    record_zip_crc_check(download_path)
 
                 # Log successful download after file is in place
                 if file_size_mb >= 1.0:
@@ -0,0 +1,135 @@
+"""
+Shared baseline handling for the benchmark test modules.
+
+Baselines are committed JSON files mapping a benchmark name to its recorded
+measurements. Behavioural keys (e.g. match counts) must equal the baseline, counts
+(requests, bytes) are deterministic and must not grow, and memory varies between
+machines so it only fails beyond a tolerance.
+
+Timings depend on the machine and are distorted by coverage (which the default
+pytest options enable) and other tracers, so the default suite does not check them.
+Set ``FETCHTASTIC_BENCHMARK_TIMINGS=1`` and run without coverage (``--no-cov``) to
+enforce them; they are still skipped if a tracer is active.
+
+Set ``FETCHTASTIC_UPDATE_BENCHMARK_BASELINES=1`` to rewrite the baselines from the
+current measurements instead of checking them (also without coverage, since the
+recorded timings are what the timing run enforces), and
+``FETCHTASTIC_BENCHMARK_TOLERANCE`` to change the allowed timing factor (default 4x).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+UPDATE_BASELINES = os.environ.get("FETCHTASTIC_UPDATE_BENCHMARK_BASELINES") == "1"
+ENFORCE_TIMINGS = os.environ.get("FETCHTASTIC_BENCHMARK_TIMINGS") == "1"
+TIME_TOLERANCE = float(os.environ.get("FETCHTASTIC_BENCHMARK_TOLERANCE", "4.0"))
+MEMORY_TOLERANCE = 1.5
+
+
+def tracing_active() -> bool:
+    """Return whether a tracer (coverage, a debugger or profiler) slows this process."""
+    if sys.gettrace() is not None:
+        return True
+    monitoring = getattr(sys, "monitoring", None)  # Python 3.12+
+    return monitoring is not None and any(
+        monitoring.get_tool(tool_id) is not None for tool_id in range(6)
+    )
+
+
+def load_baselines(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the baselines stored at `path`, or an empty mapping if none exist."""
+    if not path.exists():
+        return {}
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _store_baseline(path: Path, name: str, values: Dict[str, Any]) -> None:
+    baselines = load_baselines(path)
+    baselines[name] = values
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def check_against_baseline(
+    path: Path,
+    name: str,
+    measured: Dict[str, Any],
+    *,
+    exact_keys: Iterable[str] = (),
+    count_keys: Iterable[str] = (),
+    time_keys: Iterable[str] = (),
+    memory_keys: Iterable[str] = (),
+    time_slack: float = 0.0,
+    memory_slack: float = 0.0,
+) -> None:
+    """
+    Compare `measured` with the stored baseline `name`, or record it when updating.
+
+    Parameters:
+        path (Path): Baselines JSON file.
+        name (str): Benchmark name (key in the baselines file).
+        measured (Dict[str, Any]): Measurements for this run.
+        exact_keys (Iterable[str]): Behavioural keys (e.g. match counts) that must equal the baseline.
+        count_keys (Iterable[str]): Deterministic keys that must not exceed the baseline.
+        time_keys (Iterable[str]): Timing keys allowed up to ``baseline * TIME_TOLERANCE + time_slack``;
+            checked only when ``ENFORCE_TIMINGS`` is set and no tracer is active.
+        memory_keys (Iterable[str]): Memory keys allowed up to ``baseline * MEMORY_TOLERANCE + memory_slack``.
+        time_slack (float): Absolute allowance added to timing limits.
+        memory_slack (float): Absolute allowance added to memory limits.
+
+    Raises:
+        AssertionError: If the baseline is missing or any key regressed.
+    """
+    exact_keys, count_keys, time_keys, memory_keys = (
+        tuple(exact_keys),
+        tuple(count_keys),
+        tuple(time_keys),
+        tuple(memory_keys),
+    )
+    print(f"\n[benchmark] {name}: {json.dumps(measured, sort_keys=True)}")
+
+    if UPDATE_BASELINES:
+        assert not (time_keys and tracing_active()), (
+            f"Not recording timings for benchmark {name!r} under a tracer; "
+            "rerun without coverage (--no-cov)"
+        )
+        _store_baseline(
+            path,
+            name,
+            {
+                key: measured[key]
+                for key in (*exact_keys, *count_keys, *time_keys, *memory_keys)
+                if key in measured
+            },
+        )
+        return
+
+    baseline = load_baselines(path).get(name)
+    assert baseline is not None, (
+        f"No baseline for benchmark {name!r} in {path.name}; run with "
+        "FETCHTASTIC_UPDATE_BENCHMARK_BASELINES=1 to record one"
+    )
+
+    regressions = []
+    for key in exact_keys:
+        if measured[key] != baseline[key]:
+            regressions.append(f"{key}: {measured[key]} != baseline {baseline[key]}")
+    for key in count_keys:
+        if measured[key] > baseline[key]:
+            regressions.append(f"{key}: {measured[key]} > baseline {baseline[key]}")
+    if not ENFORCE_TIMINGS or tracing_active():
+        time_keys = ()
+    for keys, tolerance, slack in (
+        (time_keys, TIME_TOLERANCE, time_slack),
+        (memory_keys, MEMORY_TOLERANCE, memory_slack),
+    ):
+        for key in keys:
+            limit = baseline[key] * tolerance + slack
+            if measured[key] > limit:
+                regressions.append(f"{key}: {measured[key]} > limit {limit:.4g}")
+    assert not regressions, f"Benchmark {name!r} regressed: " + "; ".join(regressions)
@@ -0,0 +1,628 @@
+"""
+Local stand-in for the GitHub API and asset hosts used by pipeline benchmarks.
+
+The server emulates the endpoints the download pipeline talks to (firmware and
+client-app release feeds, the meshtastic.github.io Contents, Git Trees and Commits
+APIs, the firmware-nightly directory, the device hardware API, and a GraphQL
+endpoint answering the batched metadata query) and hosts the referenced assets. JSON API responses carry an ETag and honour ``If-None-Match``. Latency, bandwidth and payload sizes are configurable so benchmarks can
+model slow links or large installers without touching the network.
+
+``redirect_requests`` reroutes every ``requests`` transfer to the server by
+rewriting the target URL to ``http://127.0.0.1:<port>/<original-host>/<path>``.
+"""
+
+import hashlib
+import io
+import json
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+import requests.adapters
+
+# Captured at import time: the test suite replaces these with network blockers and
+# makes time.sleep a no-op, but the stand-in needs real transfers and real delays.
+_REAL_SLEEP = time.sleep
+_REAL_REQUESTS_GET = requests.get
+_REAL_REQUESTS_POST = requests.post
+_REAL_SESSION_REQUEST = requests.Session.request
+_REAL_SESSION_SEND = requests.Session.send
+_REAL_ADAPTER_SEND = requests.adapters.HTTPAdapter.send
+
+API_HOST = "api.github.com"
+ASSET_HOST = "github.com"
+RAW_HOST = "raw.githubusercontent.com"
+DEVICE_API_HOST = "api.meshtastic.org"
+
+PRERELEASE_REPO = "meshtastic/meshtastic.github.io"
+RAW_PREFIX = f"{RAW_HOST}/{PRERELEASE_REPO}/HEAD"
+
+DEVICE_TARGETS = (
+    "rak4631",
+    "rak4631_eink",
+    "tbeam",
+    "heltec-v3",
+    "t1000-e",
+    "tlora-v2-1-1_6",
+)
+
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class StandInConfig:
+    """Tunable network characteristics and payload sizes for the stand-in."""
+
+    latency_seconds: float = 0.0
+    bandwidth_bytes_per_second: Optional[int] = None
+    firmware_zip_member_bytes: int = 16 * 1024
+    apk_bytes: int = 256 * 1024
+    desktop_installer_bytes: int = 512 * 1024
+    nightly_asset_bytes: int = 64 * 1024
+
+
+@dataclass
+class StandInState:
+    """Mutable catalogue served by the stand-in; tests edit it between runs."""
+
+    firmware_releases: List[Dict[str, Any]] = field(default_factory=list)
+    app_releases: List[Dict[str, Any]] = field(default_factory=list)
+    nightly_build: Optional[str] = None
+    # meshtastic.github.io directory name -> file names (payloads live in `assets`)
+    directories: Dict[str, List[str]] = field(default_factory=dict)
+    commits: List[Dict[str, Any]] = field(default_factory=list)
+    # URL path (host-prefixed) -> (payload, content type)
+    assets: Dict[str, Tuple[bytes, str]] = field(default_factory=dict)
+
+
+def _deterministic_bytes(seed: str, size: int) -> bytes:
+    """Return `size` bytes derived from `seed` (cheap, repeatable, poorly compressible)."""
+    block = (seed.encode("utf-8") * 7 + bytes(range(256)))[:4096]
+    repeats, remainder = divmod(size, len(block))
+    return block * repeats + block[:remainder]
+
+
+def _build_zip(members: List[Tuple[str, int]], seed: str) -> bytes:
+    """Build an in-memory ZIP archive with the given (name, size) members."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        for name, size in members:
+            zf.writestr(name, _deterministic_bytes(f"{seed}/{name}", size))
+    return buffer.getvalue()
+
+
+class GitHubStandIn:
+    """Threaded HTTP server emulating GitHub release/contents/commits endpoints."""
+
+    def __init__(self, config: Optional[StandInConfig] = None) -> None:
+        self.config = config or StandInConfig()
+        self.state = StandInState()
+        self.request_log: List[str] = []
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ----------------------------------------------------------------- lifecycle
+
+    def start(self) -> "GitHubStandIn":
+        """Start serving on an ephemeral localhost port."""
+        handler = type("_BoundHandler", (_StandInHandler,), {"stand_in": self})
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="github-stand-in", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and join its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        assert self._server is not None, "stand-in server is not running"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        """Forget logged requests and served byte counts."""
+        with self._lock:
+            self.request_log.clear()
+            self.bytes_served = 0
+
+    # ------------------------------------------------------------- catalogue API
+
+    def _asset_url(self, path: str) -> str:
+        return f"https://{ASSET_HOST}{path}"
+
+    def _register_asset(
+        self, path: str, payload: bytes, content_type: str
+    ) -> Dict[str, Any]:
+        self.state.assets[f"/{ASSET_HOST}{path}"] = (payload, content_type)
+        return {
+            "name": path.rsplit("/", 1)[-1],
+            "size": len(payload),
+            "browser_download_url": self._asset_url(path),
+            "content_type": content_type,
+        }
+
+    def add_firmware_release(
+        self,
+        version: str,
+        *,
+        prerelease: bool = False,
+        published_at: str = "2026-01-01T00:00:00Z",
+        devices: Tuple[str, ...] = DEVICE_TARGETS,
+    ) -> Dict[str, Any]:
+        """
+        Publish a firmware release with per-platform firmware ZIPs.
+
+        Each ZIP contains one ``.bin``/``.uf2`` member per device target, sized by
+        ``StandInConfig.firmware_zip_member_bytes``.
+        """
+        tag = f"v{version}"
+        member_size = self.config.firmware_zip_member_bytes
+        assets = []
+        for platform in ("esp32", "esp32s3", "nrf52840"):
+            members = [
+                (
+                    f"firmware-{device}-{version}."
+                    f"{'uf2' if platform == 'nrf52840' else 'bin'}",
+                    member_size,
+                )
+                for device in devices
+            ]
+            payload = _build_zip(members, seed=f"{tag}/{platform}")
+            assets.append(
+                self._register_asset(
+                    f"/meshtastic/firmware/releases/download/{tag}/"
+                    f"firmware-{platform}-{version}.zip",
+                    payload,
+                    "application/zip",
+                )
+            )
+        release = {
+            "tag_name": tag,
+            "name": f"Meshtastic Firmware {version}",
+            "prerelease": prerelease,
+            "published_at": published_at,
+            "body": f"Release notes for {version}",
+            "assets": assets,
+        }
+        self.state.firmware_releases.insert(0, release)
+        return release
+
+    def add_app_release(
+        self,
+        version: str,
+        *,
+        published_at: str = "2026-01-01T00:00:00Z",
+        desktop_installers: bool = True,
+    ) -> Dict[str, Any]:
+        """Publish a client-app release with an APK and optional desktop installers."""
+        tag = f"v{version}"
+        base = f"/meshtastic/Meshtastic-Android/releases/download/{tag}"
+        assets = [
+            self._register_asset(
+                f"{base}/app-fdroid-release.apk",
+                _deterministic_bytes(f"{tag}/apk", self.config.apk_bytes),
+                "application/vnd.android.package-archive",
+            )
+        ]
+        if desktop_installers:
+            for name in (
+                f"Meshtastic-{version}.dmg",
+                f"Meshtastic-{version}.msi",
+                f"Meshtastic-{version}-x86_64.AppImage",
+            ):
+                assets.append(
+                    self._register_asset(
+                        f"{base}/{name}",
+                        _deterministic_bytes(
+                            f"{tag}/{name}", self.config.desktop_installer_bytes
+                        ),
+                        "application/octet-stream",
+                    )
+                )
+        release = {
+            "tag_name": tag,
+            "name": f"Meshtastic Android {version}",
+            "prerelease": False,
+            "published_at": published_at,
+            "body": f"App release {version}",
+            "assets": assets,
+        }
+        self.state.app_releases.insert(0, release)
+        return release
+
+    def _publish_directory(
+        self, directory: str, files: Dict[str, bytes], *, replace: bool
+    ) -> None:
+        if replace:
+            for name in self.state.directories.get(directory, []):
+                self.state.assets.pop(f"/{RAW_PREFIX}/{directory}/{name}", None)
+        self.state.directories[directory] = sorted(files)
+        for name, payload in files.items():
+            self.state.assets[f"/{RAW_PREFIX}/{directory}/{name}"] = (
+                payload,
+                "application/octet-stream",
+            )
+
+    def _device_files(
+        self, build_id: str, devices: Tuple[str, ...], *, manifests: bool
+    ) -> Dict[str, bytes]:
+        size = self.config.nightly_asset_bytes
+        files: Dict[str, bytes] = {}
+        for device in devices:
+            for suffix in (".bin", ".uf2"):
+                name = f"firmware-{device}-{build_id}{suffix}"
+                files[name] = _deterministic_bytes(f"{build_id}/{name}", size)
+            if manifests:
+                files[f"firmware-{device}-{build_id}.mt.json"] = json.dumps(
+                    {
+                        "version": build_id,
+                        "platformioTarget": device,
+                        "files": [{"name": f"firmware-{device}-{build_id}.bin"}],
+                    }
+                ).encode("utf-8")
+        return files
+
+    def publish_nightly(
+        self, build_id: str, devices: Tuple[str, ...] = DEVICE_TARGETS
+    ) -> None:
+        """Replace the rolling firmware-nightly directory with generation `build_id`."""
+        self.state.nightly_build = build_id
+        files = self._device_files(build_id, devices, manifests=True)
+        files[f"firmware-{build_id}.json"] = json.dumps(
+            {"version": build_id, "targets": list(devices)}
+        ).encode("utf-8")
+        self._publish_directory("firmware-nightly", files, replace=True)
+
+    def publish_prerelease(
+        self,
+        build_id: str,
+        *,
+        committed_at: str = "2026-03-01T00:00:00Z",
+        devices: Tuple[str, ...] = DEVICE_TARGETS,
+    ) -> None:
+        """
+        Publish a ``firmware-<build_id>`` prerelease directory and its commit.
+
+        The commit message follows the upstream "<version>.<hash> meshtastic/firmware@<sha>"
+        convention so prerelease history detection picks it up.
+        """
+        version, short_hash = build_id.rsplit(".", 1)
+        self._publish_directory(
+            f"firmware-{build_id}",
+            self._device_files(build_id, devices, manifests=False),
+            replace=False,
+        )
+        sha = f"{short_hash}{len(self.state.commits):04d}".ljust(40, "0")
+        self.state.commits.insert(
+            0,
+            {
+                "sha": sha,
+                "commit": {
+                    "message": f"{build_id} meshtastic/firmware@{short_hash}",
+                    "committer": {"date": committed_at},
+                },
+            },
+        )
+
+    # ---------------------------------------------------------------- responses
+
+    def _directory_listing(self, directory: str) -> Optional[List[Dict[str, Any]]]:
+        names = self.state.directories.get(directory)
+        if names is None:
+            return None
+        listing = []
+        for name in names:
+            payload, _content_type = self.state.assets[
+                f"/{RAW_PREFIX}/{directory}/{name}"
+            ]
+            listing.append(
+                {
+                    "name": name,
+                    "path": f"{directory}/{name}",
+                    "type": "file",
+                    "size": len(payload),
+                    "download_url": f"https://{RAW_PREFIX}/{directory}/{name}",
+                }
+            )
+        return listing
+
+    def _directory_blobs(self, directory: str) -> List[Dict[str, Any]]:
+        blobs = []
+        for entry in self._directory_listing(directory) or []:
+            payload, _content_type = self.state.assets[f"/{RAW_PREFIX}/{entry['path']}"]
+            blobs.append(
+                {
+                    "path": entry["path"],
+                    "mode": "100644",
+                    "type": "blob",
+                    "size": entry["size"],
+                    "sha": hashlib.sha1(payload).hexdigest(),
+                }
+            )
+        return blobs
+
+    @staticmethod
+    def _tree_sha(entries: List[Dict[str, Any]]) -> str:
+        return hashlib.sha1(json.dumps(entries).encode("utf-8")).hexdigest()
+
+    def _root_listing(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": name,
+                "path": name,
+                "type": "dir",
+                "size": 0,
+                "sha": self._tree_sha(self._directory_blobs(name)),
+            }
+            for name in sorted(self.state.directories)
+        ]
+
+    def _tree_listing(self) -> Dict[str, Any]:
+        tree: List[Dict[str, Any]] = []
+        for directory in sorted(self.state.directories):
+            blobs = self._directory_blobs(directory)
+            tree.append(
+                {
+                    "path": directory,
+                    "mode": "040000",
+                    "type": "tree",
+                    "sha": self._tree_sha(blobs),
+                }
+            )
+            tree.extend(blobs)
+        return {"sha": self._tree_sha(tree), "truncated": False, "tree": tree}
+
+    @staticmethod
+    def _graphql_release(release: Dict[str, Any], first_assets: int) -> Dict[str, Any]:
+        return {
+            "tagName": release["tag_name"],
+            "name": release.get("name"),
+            "isPrerelease": release.get("prerelease", False),
+            "isDraft": False,
+            "publishedAt": release.get("published_at"),
+            "createdAt": release.get("published_at"),
+            "description": release.get("body"),
+            "releaseAssets": {
+                "pageInfo": {
+                    "hasNextPage": len(release.get("assets", [])) > first_assets
+                },
+                "nodes": [
+                    {
+                        "name": asset["name"],
+                        "size": asset["size"],
+                        "downloadUrl": asset["browser_download_url"],
+                        "contentType": asset.get("content_type"),
+                        "digest": None,
+                        "updatedAt": release.get("published_at"),
+                    }
+                    for asset in release.get("assets", [])[:first_assets]
+                ],
+            },
+        }
+
+    def _graphql_metadata(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer the batched metadata query (the only query the client sends)."""
+        first = int(variables.get("releases", 30))
+        first_assets = int(variables.get("assets", 100))
+
+        def _releases(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+            return {
+                "pageInfo": {"hasNextPage": len(items) > first},
+                "nodes": [
+                    self._graphql_release(r, first_assets) for r in items[:first]
+                ],
+            }
+
+        head = self.state.commits[0] if self.state.commits else None
+        return {
+            "data": {
+                "firmware": {"releases": _releases(self.state.firmware_releases)},
+                "clientApp": {
+                    "releases": _releases(self.state.app_releases),
+                    "snapshot": next(
+                        (
+                            self._graphql_release(r, first_assets)
+                            for r in self.state.app_releases
+                            if r["tag_name"] == variables.get("snapshotTag")
+                        ),
+                        None,
+                    ),
+                },
+                "site": {
+                    "defaultBranchRef": {
+                        "target": (
+                            {
+                                "oid": head["sha"],
+                                "committedDate": head["commit"]["committer"]["date"],
+                                "tree": {"oid": self._tree_listing()["sha"]},
+                            }
+                            if head
+                            else None
+                        )
+                    }
+                },
+            }
+        }
+
+    @staticmethod
+    def _paginate(items: List[Any], query: Dict[str, List[str]]) -> List[Any]:
+        try:
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+        except ValueError:
+            per_page, page = 30, 1
+        start = (max(page, 1) - 1) * per_page
+        return items[start : start + per_page]
+
+    def resolve(self, raw_path: str) -> Tuple[int, bytes, str]:
+        """Return (status, body, content type) for a host-prefixed request path."""
+        parts = urlsplit(raw_path)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+
+        asset = self.state.assets.get(path)
+        if asset is not None:
+            return 200, asset[0], asset[1]
+
+        payload: Any = None
+        api_prefix = f"/{API_HOST}/repos/"
+        if path == f"/{DEVICE_API_HOST}/resource/deviceHardware":
+            payload = [
+                {"platformioTarget": device, "displayName": device}
+                for device in DEVICE_TARGETS
+            ]
+        elif path.startswith(api_prefix):
+            route = path[len(api_prefix) :]
+            if route == "meshtastic/firmware/releases":
+                payload = self._paginate(self.state.firmware_releases, query)
+            elif route == "meshtastic/Meshtastic-Android/releases":
+                payload = self._paginate(self.state.app_releases, query)
+            elif route == f"{PRERELEASE_REPO}/commits":
+                payload = self._paginate(self.state.commits, query)
+            elif route.startswith(f"{PRERELEASE_REPO}/commits/"):
+                sha = route.rsplit("/", 1)[-1]
+                payload = next(
+                    (c for c in self.state.commits if c.get("sha") == sha), None
+                )
+            elif route == f"{PRERELEASE_REPO}/git/trees/HEAD":
+                payload = self._tree_listing()
+            elif route == f"{PRERELEASE_REPO}/contents":
+                payload = self._root_listing()
+            elif route.startswith(f"{PRERELEASE_REPO}/contents/"):
+                directory = route[len(f"{PRERELEASE_REPO}/contents/") :]
+                payload = self._directory_listing(directory)
+
+        if payload is None:
+            body = json.dumps({"message": "Not Found"}).encode("utf-8")
+            return 404, body, "application/json"
+        return 200, json.dumps(payload).encode("utf-8"), "application/json"
+
+    def resolve_post(self, raw_path: str, body: bytes) -> Tuple[int, bytes, str]:
+        """Return (status, body, content type) for a host-prefixed POST request."""
+        if urlsplit(raw_path).path != f"/{API_HOST}/graphql":
+            body = json.dumps({"message": "Not Found"}).encode("utf-8")
+            return 404, body, "application/json"
+        request = json.loads(body or b"{}")
+        payload = self._graphql_metadata(request.get("variables") or {})
+        return 200, json.dumps(payload).encode("utf-8"), "application/json"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Request handler applying configured latency and bandwidth limits."""
+
+    stand_in: GitHubStandIn
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond(*self._resolve_request())
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else b""
+        status, body, content_type = self._resolve_request(request_body)
+        # GraphQL responses are not cacheable; never answer them with 304
+        self._respond(status, body, content_type, conditional=False)
+
+    def _resolve_request(
+        self, request_body: Optional[bytes] = None
+    ) -> Tuple[int, bytes, str]:
+        stand_in = self.stand_in
+        if stand_in.config.latency_seconds > 0:
+            _REAL_SLEEP(stand_in.config.latency_seconds)
+        if request_body is None:
+            result = stand_in.resolve(self.path)
+        else:
+            result = stand_in.resolve_post(self.path, request_body)
+        with stand_in._lock:
+            stand_in.request_log.append(self.path)
+        return result
+
+    def _respond(
+        self, status: int, body: bytes, content_type: str, conditional: bool = True
+    ) -> None:
+        stand_in = self.stand_in
+        config = stand_in.config
+
+        etag = None
+        if conditional and status == 200 and content_type == "application/json":
+            etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "5000")
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.end_headers()
+
+        bandwidth = config.bandwidth_bytes_per_second
+        sent = 0
+        for offset in range(0, len(body), _CHUNK_SIZE):
+            chunk = body[offset : offset + _CHUNK_SIZE]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if bandwidth:
+                _REAL_SLEEP(len(chunk) / bandwidth)
+        with stand_in._lock:
+            stand_in.bytes_served += sent
+
+
+@contextmanager
+def redirect_requests(stand_in: GitHubStandIn) -> Iterator[GitHubStandIn]:
+    """
+    Route all ``requests`` traffic to `stand_in` for the duration of the block.
+
+    Undoes the test suite's network blockers for ``requests`` (restoring them on
+    exit) and rewrites each outgoing URL to ``<stand-in>/<original-host><path>``.
+    """
+    base_url = stand_in.base_url
+
+    def _send(adapter, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        target = f"{base_url}/{parts.netloc}{parts.path}"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request.url = target
+        return _REAL_ADAPTER_SEND(adapter, request, *args, **kwargs)
+
+    patched = [
+        (requests, "get", _REAL_REQUESTS_GET),
+        (requests, "post", _REAL_REQUESTS_POST),
+        (requests.Session, "request", _REAL_SESSION_REQUEST),
+        (requests.Session, "send", _REAL_SESSION_SEND),
+        (requests.adapters.HTTPAdapter, "send", _send),
+    ]
+    saved = [(owner, name, getattr(owner, name)) for owner, name, _ in patched]
+    for owner, name, replacement in patched:
+        setattr(owner, name, replacement)
+    try:
+        yield stand_in
+    finally:
+        for owner, name, original in saved:
+            setattr(owner, name, original)
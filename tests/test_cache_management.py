@@ -17,6 +17,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
 from fetchtastic.constants import GITHUB_RELEASES_CACHE_SCHEMA_VERSION
 from fetchtastic.download.cache import (
@@ -647,6 +648,107 @@ class TestCommitTimestampCache:
         expected_time = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         assert result == expected_time
 
+    @patch("fetchtastic.download.cache.make_github_api_request")
+    def test_get_commit_timestamps_batch(self, mock_request, tmp_path):
+        """Batch lookups use the cache, then cached commit lists, then the API."""
+        cache_manager = CacheManager(str(tmp_path))
+        now = datetime.now(timezone.utc)
+        with open(os.path.join(tmp_path, "commit_timestamps.json"), "w") as f:
+            json.dump(
+                {
+                    "meshtastic/meshtastic.github.io/aaa": [
+                        "2023-01-01T00:00:00+00:00",
+                        now.isoformat(),
+                    ]
+                },
+                f,
+            )
+        with open(os.path.join(tmp_path, "prerelease_commits_cache.json"), "w") as f:
+            json.dump(
+                {
+                    "commits": [
+                        {
+                            "sha": "bbb" + "0" * 37,
+                            "commit": {"committer": {"date": "2023-01-02T00:00:00Z"}},
+                        }
+                    ],
+                    "cached_at": now.isoformat(),
+                },
+                f,
+            )
+
+        def fake_request(url, **_kwargs):
+            response = MagicMock()
+            day = {"ccc": "03", "ddd": "04"}[url.rsplit("/", 1)[-1]]
+            response.json.return_value = {
+                "commit": {"committer": {"date": f"2023-01-{day}T00:00:00Z"}}
+            }
+            return response
+
+        mock_request.side_effect = fake_request
+
+        with patch.object(
+            cache_manager, "atomic_write_json", wraps=cache_manager.atomic_write_json
+        ) as mock_write:
+            result = cache_manager.get_commit_timestamps(
+                "meshtastic",
+                "meshtastic.github.io",
+                ["aaa", "bbb", "ccc", "ddd", "ccc"],
+            )
+
+        assert {sha: ts.day for sha, ts in result.items()} == {
+            "aaa": 1,
+            "bbb": 2,
+            "ccc": 3,
+            "ddd": 4,
+        }
+        assert mock_request.call_count == 2
+        mock_write.assert_called_once()
+        with open(os.path.join(tmp_path, "commit_timestamps.json")) as f:
+            assert len(json.load(f)) == 4
+
+    @patch("fetchtastic.download.cache.make_github_api_request")
+    def test_get_commit_timestamps_force_refresh_skips_commit_lists(
+        self, mock_request, tmp_path
+    ):
+        """A forced refresh fetches from the API even when a commit list has the SHA."""
+        cache_manager = CacheManager(str(tmp_path))
+        with open(os.path.join(tmp_path, "prerelease_commits_cache.json"), "w") as f:
+            json.dump(
+                {
+                    "commits": [
+                        {
+                            "sha": "bbb" + "0" * 37,
+                            "commit": {"committer": {"date": "2023-01-02T00:00:00Z"}},
+                        }
+                    ],
+                    "cached_at": datetime.now(timezone.utc).isoformat(),
+                },
+                f,
+            )
+        mock_request.return_value.json.return_value = {
+            "commit": {"committer": {"date": "2023-01-05T00:00:00Z"}}
+        }
+
+        result = cache_manager.get_commit_timestamps(
+            "meshtastic", "meshtastic.github.io", ["bbb"], force_refresh=True
+        )
+
+        assert result["bbb"].day == 5
+        mock_request.assert_called_once()
+
+    @patch("fetchtastic.download.cache.make_github_api_request")
+    def test_get_commit_timestamps_failures_not_cached(self, mock_request, tmp_path):
+        """Unresolvable commits map to None and trigger no cache write."""
+        cache_manager = CacheManager(str(tmp_path))
+        mock_request.side_effect = requests.RequestException("boom")
+
+        with patch.object(cache_manager, "atomic_write_json") as mock_write:
+            result = cache_manager.get_commit_timestamps("owner", "repo", ["a", "b"])
+
+        assert result == {"a": None, "b": None}
+        mock_write.assert_not_called()
+
     def test_read_commit_timestamp_cache(self, tmp_path):
         """Test reading commit timestamp cache with mixed formats."""
         cache_manager = CacheManager(str(tmp_path))
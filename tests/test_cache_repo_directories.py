@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+import requests
 
 from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.repo_tree import RepoTree
 
 
 class _FakeResponse:
@@ -15,6 +17,9 @@ class _FakeResponse:
         """
         self._payload = payload
 
+    status_code = 200
+    headers: dict = {}
+
     def json(self):
         """
         Return the stored JSON-serializable payload.
@@ -25,6 +30,17 @@ class _FakeResponse:
         return self._payload
 
 
+def _reject_tree_requests(fake_request):
+    """Wrap a Contents API fake so recursive tree requests fail (Contents fallback)."""
+
+    def wrapper(url, *args, **kwargs):
+        if "/git/trees/" in url:
+            raise requests.HTTPError("404 Not Found")
+        return fake_request(url, *args, **kwargs)
+
+    return wrapper
+
+
 @pytest.fixture
 def isolated_cache_dir(tmp_path, monkeypatch):
     """
@@ -72,7 +88,8 @@ def test_get_repo_directories_caches_with_ttl(monkeypatch, isolated_cache_dir):
         return _FakeResponse(payload)
 
     monkeypatch.setattr(
-        "fetchtastic.download.cache.make_github_api_request", fake_request
+        "fetchtastic.download.cache.make_github_api_request",
+        _reject_tree_requests(fake_request),
     )
 
     first = manager.get_repo_directories("")
@@ -104,7 +121,8 @@ def test_get_repo_directories_refreshes_when_stale(monkeypatch, isolated_cache_d
         return _FakeResponse([{"type": "dir", "name": f"firmware-{calls['count']}"}])
 
     monkeypatch.setattr(
-        "fetchtastic.download.cache.make_github_api_request", fake_request
+        "fetchtastic.download.cache.make_github_api_request",
+        _reject_tree_requests(fake_request),
     )
 
     monkeypatch.setattr(
@@ -157,7 +175,8 @@ def test_get_repo_contents_caches_with_ttl(monkeypatch, isolated_cache_dir):
         return _FakeResponse(payload)
 
     monkeypatch.setattr(
-        "fetchtastic.download.cache.make_github_api_request", fake_request
+        "fetchtastic.download.cache.make_github_api_request",
+        _reject_tree_requests(fake_request),
     )
 
     first = manager.get_repo_contents("firmware-1.2.3.abc")
@@ -186,7 +205,8 @@ def test_get_repo_contents_refreshes_when_stale(monkeypatch, isolated_cache_dir)
         return _FakeResponse([{"type": "file", "name": f"fw-{calls['count']}.bin"}])
 
     monkeypatch.setattr(
-        "fetchtastic.download.cache.make_github_api_request", fake_request
+        "fetchtastic.download.cache.make_github_api_request",
+        _reject_tree_requests(fake_request),
     )
 
     monkeypatch.setattr(
@@ -212,3 +232,241 @@ def test_get_repo_contents_refreshes_when_stale(monkeypatch, isolated_cache_dir)
     assert calls["count"] == 2
     assert first == [{"type": "file", "name": "fw-1.bin"}]
     assert second == [{"type": "file", "name": "fw-2.bin"}]
+
+
+def _tree_payload(sha="tree1", truncated=False, extra=()):
+    return {
+        "sha": sha,
+        "truncated": truncated,
+        "tree": [
+            {"path": "firmware-2.7.0.abc", "mode": "040000", "type": "tree"},
+            {
+                "path": "firmware-2.7.0.abc/firmware-rak4631.uf2",
+                "mode": "100644",
+                "type": "blob",
+                "size": 100,
+                "sha": "b1",
+            },
+            {"path": "firmware-2.7.0.abc/sub", "mode": "040000", "type": "tree"},
+            {
+                "path": "firmware-2.7.0.abc/sub/notes.txt",
+                "mode": "100644",
+                "type": "blob",
+                "size": 5,
+                "sha": "b2",
+            },
+            {
+                "path": "index.html",
+                "mode": "100644",
+                "type": "blob",
+                "size": 7,
+                "sha": "b3",
+            },
+            *extra,
+        ],
+    }
+
+
+def test_repo_tree_answers_listing_queries_locally():
+    tree = RepoTree.from_api(_tree_payload())
+
+    assert tree.list_directories("") == ["firmware-2.7.0.abc"]
+    assert tree.list_directories("/firmware-2.7.0.abc/") == ["sub"]
+    assert tree.list_files("firmware-2.7.0.abc") == [
+        "firmware-2.7.0.abc/firmware-rak4631.uf2"
+    ]
+    assert tree.list_files("firmware-2.7.0.abc", recursive=True) == [
+        "firmware-2.7.0.abc/firmware-rak4631.uf2",
+        "firmware-2.7.0.abc/sub/notes.txt",
+    ]
+    assert tree.get_size("firmware-2.7.0.abc") == 105
+    assert tree.get_size("index.html") == 7
+    assert tree.get_size("missing") is None
+    entry = tree.list_contents("firmware-2.7.0.abc")[0]
+    assert entry["name"] == "firmware-rak4631.uf2"
+    assert entry["type"] == "file"
+    assert entry["download_url"].endswith(
+        "/meshtastic.github.io/HEAD/firmware-2.7.0.abc/firmware-rak4631.uf2"
+    )
+    assert RepoTree.from_cache(tree.to_cache()).list_contents(
+        "firmware-2.7.0.abc"
+    ) == tree.list_contents("firmware-2.7.0.abc")
+
+
+def test_repo_listings_share_one_tree_request(monkeypatch, isolated_cache_dir):
+    urls = []
+
+    def fake_request(url, *_args, **_kwargs):
+        urls.append(url)
+        return _FakeResponse(_tree_payload())
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+    manager = CacheManager()
+
+    assert manager.get_repo_directories("") == ["firmware-2.7.0.abc"]
+    contents = manager.get_repo_contents("firmware-2.7.0.abc")
+    assert [item["name"] for item in contents] == ["firmware-rak4631.uf2", "sub"]
+
+    # A new manager (next run) reads the tree from disk.
+    assert CacheManager().get_repo_directories("firmware-2.7.0.abc") == ["sub"]
+    assert len(urls) == 1
+    assert urls[0].endswith("/git/trees/HEAD")
+
+
+def test_repo_tree_revalidates_with_etag(monkeypatch, isolated_cache_dir):
+    calls = []
+
+    def fake_request(url, *_args, **kwargs):
+        calls.append(kwargs.get("etag"))
+        response = _FakeResponse(_tree_payload())
+        response.headers = {"ETag": 'W/"v1"'}
+        if kwargs.get("etag") == 'W/"v1"':
+            response.status_code = 304
+        return response
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+    manager = CacheManager()
+
+    first = manager.get_repo_tree()
+    # Forced refreshes later in the same run reuse the tree GitHub just confirmed.
+    assert manager.get_repo_tree(force_refresh=True) is first
+    second = CacheManager().get_repo_tree(force_refresh=True)
+
+    assert calls == [None, 'W/"v1"']
+    assert second.sha == first.sha
+
+
+def test_truncated_tree_falls_back_to_contents(monkeypatch, isolated_cache_dir):
+    urls = []
+
+    def fake_request(url, *_args, **_kwargs):
+        urls.append(url)
+        if "/git/trees/" in url:
+            return _FakeResponse(_tree_payload(truncated=True))
+        return _FakeResponse([{"type": "dir", "name": "firmware-from-contents"}])
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+    manager = CacheManager()
+
+    assert manager.get_repo_directories("") == ["firmware-from-contents"]
+    assert manager.get_repo_directories("firmware-2.7.0.abc") == [
+        "firmware-from-contents"
+    ]
+    assert sum("/git/trees/" in url for url in urls) == 1
+    assert sum("/contents" in url for url in urls) == 2
+
+
+def test_path_missing_from_tree_revalidates_then_falls_back(
+    monkeypatch, isolated_cache_dir
+):
+    urls = []
+
+    def fake_request(url, *_args, **_kwargs):
+        urls.append(url)
+        if "/git/trees/" in url:
+            return _FakeResponse(_tree_payload())
+        return _FakeResponse([{"type": "file", "name": "new.bin"}])
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+    # The tree was cached by an earlier run and is still fresh.
+    CacheManager().get_repo_tree()
+    manager = CacheManager()
+
+    contents = manager.get_repo_contents("firmware-2.7.1.new")
+
+    assert contents == [{"type": "file", "name": "new.bin"}]
+    assert sum("/git/trees/" in url for url in urls) == 2
+    assert urls[-1].endswith("/contents/firmware-2.7.1.new")
+
+    # The tree was already revalidated this run; other missing paths go straight
+    # to the Contents API.
+    manager.get_repo_contents("firmware-2.7.2.newer")
+
+    assert sum("/git/trees/" in url for url in urls) == 2
+    assert urls[-1].endswith("/contents/firmware-2.7.2.newer")
+
+
+def test_directory_sha_revalidates_parent_listing_with_etag(
+    monkeypatch, isolated_cache_dir
+):
+    calls = []
+
+    def fake_request(url, *_args, **kwargs):
+        calls.append((url, kwargs.get("etag")))
+        response = _FakeResponse(
+            [
+                {"type": "dir", "name": "firmware-nightly", "sha": "gen1"},
+                {"type": "file", "name": "index.html", "sha": "i1"},
+            ]
+        )
+        response.headers = {"ETag": 'W/"root1"'}
+        if kwargs.get("etag") == 'W/"root1"':
+            response.status_code = 304
+        return response
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request",
+        _reject_tree_requests(fake_request),
+    )
+
+    assert CacheManager().get_repo_directory_sha("firmware-nightly") == "gen1"
+    # A later run revalidates the stored listing instead of downloading it again.
+    assert CacheManager().get_repo_directory_sha("/firmware-nightly/") == "gen1"
+    assert CacheManager().get_repo_directory_sha("index.html") is None
+
+    assert [etag for _url, etag in calls] == [None, 'W/"root1"', 'W/"root1"']
+    assert all(url.endswith("/contents") for url, _etag in calls)
+
+
+def test_directory_sha_reads_tree_confirmed_this_run(monkeypatch, isolated_cache_dir):
+    urls = []
+    nightly = {
+        "path": "firmware-nightly",
+        "mode": "040000",
+        "type": "tree",
+        "sha": "g1",
+    }
+
+    def fake_request(url, *_args, **_kwargs):
+        urls.append(url)
+        return _FakeResponse(_tree_payload(extra=(nightly,)))
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+    manager = CacheManager()
+
+    assert manager.get_repo_directory_sha("firmware-nightly") == "g1"
+    assert manager.get_repo_directory_sha("index.html") is None
+    assert manager.get_repo_directory_sha("firmware-missing") is None
+    # The live listing of the directory reuses the same revalidated tree.
+    assert manager.get_repo_contents("firmware-nightly", force_refresh=True) == []
+    assert len(urls) == 1
+    assert urls[0].endswith("/git/trees/HEAD")
+
+
+def test_directory_sha_of_truncated_tree_uses_parent_listing(
+    monkeypatch, isolated_cache_dir
+):
+    urls = []
+
+    def fake_request(url, *_args, **_kwargs):
+        urls.append(url)
+        if "/git/trees/" in url:
+            return _FakeResponse(_tree_payload(truncated=True))
+        return _FakeResponse([{"type": "dir", "name": "firmware-nightly", "sha": "g2"}])
+
+    monkeypatch.setattr(
+        "fetchtastic.download.cache.make_github_api_request", fake_request
+    )
+
+    assert CacheManager().get_repo_directory_sha("firmware-nightly") == "g2"
+    assert urls[-1].endswith("/contents")
@@ -111,6 +111,26 @@ def test_cli_download_command(mocker, mock_cli_dependencies):
     mock_cli_dependencies.main.assert_not_called()
 
 
+@pytest.mark.user_interface
+@pytest.mark.unit
+@pytest.mark.usefixtures("mock_cli_dependencies")
+def test_cli_download_metrics_out_writes_report(mocker, mock_cli_dependencies):
+    """Test 'download --metrics-out' writes the run metrics report after downloading."""
+    mocker.patch(
+        "sys.argv", ["fetchtastic", "download", "--metrics-out", "/tmp/run.prom"]
+    )
+    mocker.patch(
+        "fetchtastic.setup_config.config_exists", return_value=(True, "/fake/path")
+    )
+    mocker.patch("fetchtastic.setup_config.prompt_for_migration")
+    mocker.patch("fetchtastic.setup_config.migrate_config")
+
+    cli.main()
+
+    mock_cli_dependencies.main.assert_called_once()
+    mock_cli_dependencies.write_metrics_report.assert_called_once_with("/tmp/run.prom")
+
+
 @pytest.mark.user_interface
 @pytest.mark.unit
 @pytest.mark.usefixtures("mock_cli_dependencies")
@@ -0,0 +1,79 @@
+"""
+Import-time budget for the CLI entry point.
+
+Cron wrappers and shell completion start ``fetchtastic`` often, so importing the CLI
+and running light subcommands must not pull in the setup wizard or the download
+stack. Each check runs a fresh interpreter with ``-X importtime`` and inspects the
+modules it imported. ``FETCHTASTIC_IMPORT_BUDGET_MS`` overrides the time budget.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.user_interface, pytest.mark.performance]
+
+IMPORT_BUDGET_MS = float(os.environ.get("FETCHTASTIC_IMPORT_BUDGET_MS", "300"))
+
+HEAVY_MODULES = (
+    "fetchtastic.setup_config",
+    "fetchtastic.download",
+    "fetchtastic.utils",
+    "requests",
+    "aiohttp",
+    "yaml",
+)
+
+
+def _import_times(*args: str) -> Dict[str, int]:
+    """Run a fresh interpreter with -X importtime and map module -> cumulative microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "FETCHTASTIC_DISABLE_FILE_LOGGING": "1"},
+    )
+    assert result.returncode == 0, result.stderr
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:") :].split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            times[parts[2]] = int(parts[1])
+    return times
+
+
+def _heavy_imports(times: Dict[str, int]) -> List[str]:
+    return sorted(
+        module
+        for module in times
+        if any(
+            module == heavy or module.startswith(heavy + ".") for heavy in HEAVY_MODULES
+        )
+    )
+
+
+def test_cli_import_skips_heavy_modules():
+    times = _import_times("-c", "import fetchtastic.cli")
+
+    assert _heavy_imports(times) == []
+
+
+def test_cli_import_within_budget():
+    times = _import_times("-c", "import fetchtastic.cli")
+
+    cli_ms = times["fetchtastic.cli"] / 1000
+    assert (
+        cli_ms <= IMPORT_BUDGET_MS
+    ), f"importing fetchtastic.cli took {cli_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+
+
+def test_help_subcommand_skips_heavy_modules():
+    times = _import_times("-m", "fetchtastic.cli", "help")
+
+    assert _heavy_imports(times) == []
@@ -12,6 +12,7 @@ from fetchtastic.constants import (
     ERROR_TYPE_FILESYSTEM,
     ERROR_TYPE_NETWORK,
     ERROR_TYPE_VALIDATION,
+    FILE_TYPE_ANDROID,
     FILE_TYPE_CLIENT_APP,
     FILE_TYPE_CLIENT_APP_PRERELEASE,
     LATEST_POINTER_NAME,
@@ -959,6 +960,7 @@ def test_download_app_success(downloader, tmp_path, mocker):
     result = downloader.download_app(release, asset)
     assert result.success is True
     assert result.file_type == FILE_TYPE_CLIENT_APP
+    assert result.asset_platform == FILE_TYPE_ANDROID
 
 
 def test_download_app_prerelease_file_type(downloader, tmp_path, mocker):
@@ -26,6 +26,13 @@ from fetchtastic.device_hardware import (
 from fetchtastic.utils import get_user_agent
 
 
+def _patch_patterns(manager, patterns):
+    """Temporarily give `manager` a fresh in-memory device pattern set."""
+    return patch.multiple(
+        manager, _device_patterns=set(patterns), _last_fetch_time=time.time()
+    )
+
+
 class TestDeviceHardwareManager:
     """Test DeviceHardwareManager class functionality."""
 
@@ -175,9 +182,7 @@ class TestDeviceHardwareManager:
                 assert manager.is_device_pattern(pattern) is True
 
         # Test with custom patterns
-        with patch.object(
-            manager, "get_device_patterns", return_value={"custom1", "custom2"}
-        ):
+        with _patch_patterns(manager, {"custom1", "custom2"}):
             assert manager.is_device_pattern("custom1") is True
             assert manager.is_device_pattern("custom2") is True
 
@@ -185,9 +190,7 @@ class TestDeviceHardwareManager:
         """Test is_device_pattern with invalid patterns."""
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager, "get_device_patterns", return_value={"device1", "device2"}
-        ):
+        with _patch_patterns(manager, {"device1", "device2"}):
             assert manager.is_device_pattern("invalid") is False
             assert manager.is_device_pattern("") is False
             assert manager.is_device_pattern("device") is False  # Too short/partial
@@ -196,9 +199,7 @@ class TestDeviceHardwareManager:
         """Test that is_device_pattern is case insensitive."""
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager, "get_device_patterns", return_value={"RAK4631", "TBEAM"}
-        ):
+        with _patch_patterns(manager, {"RAK4631", "TBEAM"}):
             assert manager.is_device_pattern("rak4631") is True
             assert manager.is_device_pattern("RAK4631") is True
             assert manager.is_device_pattern("Rak4631") is True
@@ -209,7 +210,7 @@ class TestDeviceHardwareManager:
         """Test is_device_pattern respects minimum prefix length."""
         manager = DeviceHardwareManager()
 
-        with patch.object(manager, "get_device_patterns", return_value={"ab", "abc"}):
+        with _patch_patterns(manager, {"ab", "abc"}):
             # 'ab' should match (meets minimum length)
             assert manager.is_device_pattern("ab") is True
             # 'a' should not match (too short)
@@ -219,9 +220,7 @@ class TestDeviceHardwareManager:
         """Test is_device_pattern with substring matching."""
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager, "get_device_patterns", return_value={"rak4631", "tbeam"}
-        ):
+        with _patch_patterns(manager, {"rak4631", "tbeam"}):
             # Exact matches should work
             assert manager.is_device_pattern("rak4631") is True
             assert manager.is_device_pattern("tbeam") is True
@@ -232,6 +231,46 @@ class TestDeviceHardwareManager:
             assert manager.is_device_pattern("tbeam-") is True
             assert manager.is_device_pattern("tbeam_") is True
 
+    def test_is_device_pattern_prefix_index_matches_boundaries(self):
+        """Prefix lookups match only whole "-"/"_" delimited leading segments."""
+        manager = DeviceHardwareManager()
+
+        with _patch_patterns(manager, {"Heltec-WSL_v3", "station-g2"}):
+            assert manager.is_device_pattern("heltec-") is True
+            assert manager.is_device_pattern("heltec-wsl") is True
+            assert manager.is_device_pattern("HELTEC-WSL_V3") is True
+            assert manager.is_device_pattern("station_") is True
+            assert manager.is_device_pattern("helt") is False
+            assert manager.is_device_pattern("heltec-ws") is False
+            assert manager.is_device_pattern("wsl") is False
+
+    def test_is_device_pattern_reindexes_when_patterns_reload(self):
+        """Indexes and memoised results are rebuilt when the pattern set changes."""
+        manager = DeviceHardwareManager()
+
+        with _patch_patterns(manager, {"rak4631"}):
+            assert manager.is_device_pattern("rak4631-") is True
+            assert manager.is_device_pattern("tbeam-") is False
+        with _patch_patterns(manager, {"tbeam"}):
+            assert manager.is_device_pattern("rak4631-") is False
+            assert manager.is_device_pattern("tbeam-") is True
+
+    def test_is_device_pattern_does_not_copy_patterns_per_call(self):
+        """Repeated lookups reuse the index instead of copying the pattern set."""
+        manager = DeviceHardwareManager()
+
+        with (
+            _patch_patterns(manager, {"rak4631", "tbeam"}),
+            patch.object(
+                manager, "get_device_patterns", wraps=manager.get_device_patterns
+            ) as mock_get,
+        ):
+            for _ in range(3):
+                assert manager.is_device_pattern("rak4631-") is True
+                assert manager.is_device_pattern("esp32-") is False
+
+        mock_get.assert_not_called()
+
     def test_cache_expiration(self):
         """Test cache expiration logic."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -526,11 +565,7 @@ class TestDeviceHardwareManagerEdgeCases:
         """Test is_device_pattern with special characters."""
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager,
-            "get_device_patterns",
-            return_value={"device-with-dash", "device_with_underscore"},
-        ):
+        with _patch_patterns(manager, {"device-with-dash", "device_with_underscore"}):
             assert manager.is_device_pattern("device-with-dash") is True
             assert manager.is_device_pattern("device_with_underscore") is True
             assert manager.is_device_pattern("device.with.dots") is False
@@ -539,9 +574,7 @@ class TestDeviceHardwareManagerEdgeCases:
         """Test is_device_pattern with numeric patterns."""
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager, "get_device_patterns", return_value={"device123", "123device"}
-        ):
+        with _patch_patterns(manager, {"device123", "123device"}):
             assert manager.is_device_pattern("device123") is True
             assert manager.is_device_pattern("123device") is True
 
@@ -550,7 +583,7 @@ class TestDeviceHardwareManagerEdgeCases:
         long_pattern = "a" * 1000
         manager = DeviceHardwareManager()
 
-        with patch.object(manager, "get_device_patterns", return_value={long_pattern}):
+        with _patch_patterns(manager, {long_pattern}):
             assert manager.is_device_pattern(long_pattern) is True
             assert manager.is_device_pattern(long_pattern[:10]) is False
 
@@ -559,9 +592,7 @@ class TestDeviceHardwareManagerEdgeCases:
         unicode_patterns = {"设备1", "девайс2", "デバイス3"}
         manager = DeviceHardwareManager()
 
-        with patch.object(
-            manager, "get_device_patterns", return_value=unicode_patterns
-        ):
+        with _patch_patterns(manager, unicode_patterns):
             for pattern in unicode_patterns:
                 assert manager.is_device_pattern(pattern) is True
 
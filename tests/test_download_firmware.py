@@ -1964,11 +1964,13 @@ class TestFirmwareReleaseDownloader:
         mocker.patch(
             "fetchtastic.download.firmware.load_file_hash", return_value="hash"
         )
-        verify_mock = mocker.patch.object(downloader, "verify", return_value=True)
+        verify_mock = mocker.patch.object(
+            downloader, "verify_files", return_value={str(asset_path): True}
+        )
         zip_file_ctor = mocker.patch("fetchtastic.download.firmware.zipfile.ZipFile")
 
         assert downloader.is_release_complete(release) is True
-        verify_mock.assert_called_once_with(str(asset_path))
+        verify_mock.assert_called_once_with([str(asset_path)])
         zip_file_ctor.assert_not_called()
 
     def test_is_release_complete_zip_without_hash_runs_zip_and_verify(
@@ -1994,10 +1996,12 @@ class TestFirmwareReleaseDownloader:
         )
 
         mocker.patch("fetchtastic.download.firmware.load_file_hash", return_value=None)
-        verify_mock = mocker.patch.object(downloader, "verify", return_value=True)
+        verify_mock = mocker.patch.object(
+            downloader, "verify_files", return_value={str(asset_path): True}
+        )
 
         assert downloader.is_release_complete(release) is True
-        verify_mock.assert_called_once_with(str(asset_path))
+        verify_mock.assert_called_once_with([str(asset_path)])
 
     def test_extract_firmware_missing_zip(self, downloader):
         """Missing ZIP files should return a validation error result."""
@@ -2351,7 +2355,7 @@ class TestFirmwareUncoveredBranches:
         mocker.patch(
             "fetchtastic.download.firmware.load_file_hash", return_value="hash123"
         )
-        downloader.verify = Mock(side_effect=OSError("IO error"))
+        downloader.verify_files = Mock(side_effect=OSError("IO error"))
 
         release = Release(
             tag_name="v1.0.0",
@@ -3,11 +3,10 @@
 # Comprehensive unit tests for the DownloadOrchestrator class.
 
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
-from packaging.version import Version
 
 from fetchtastic.constants import FILE_TYPE_CLIENT_APP, FILE_TYPE_FIRMWARE
 from fetchtastic.download.interfaces import DownloadResult, Release
@@ -59,7 +58,7 @@ class TestDownloadOrchestrator:
             DownloadOrchestrator: Test instance with mocked managers and downloaders and deterministic firmware helper behavior.
         """
         orch = DownloadOrchestrator(mock_config)
-        orch.cache_manager = Mock()
+        orch.cache_manager = MagicMock()
         orch.version_manager = Mock()
         orch.prerelease_manager = Mock()
         orch.client_app_downloader = Mock()
@@ -1860,11 +1859,6 @@ class TestDownloadOrchestrator:
         """Normalized prerelease versions order beta.10 after beta.2."""
         beta_2 = Release(tag_name="v2.0.0-beta.2", prerelease=True)
         beta_10 = Release(tag_name="v2.0.0-beta.10", prerelease=True)
-        orchestrator.version_manager.normalize_version.side_effect = lambda tag: {
-            "v2.0.0-beta.2": Version("2.0.0b2"),
-            "v2.0.0-beta.10": Version("2.0.0b10"),
-        }[tag]
-        orchestrator.version_manager.get_release_tuple.return_value = (2, 0, 0)
 
         selected = orchestrator._select_latest_successful_release([beta_2, beta_10])
 
@@ -1874,11 +1868,6 @@ class TestDownloadOrchestrator:
         """Normalized prerelease versions order rc after beta."""
         beta = Release(tag_name="v2.0.0-beta.10", prerelease=True)
         rc = Release(tag_name="v2.0.0-rc.1", prerelease=True)
-        orchestrator.version_manager.normalize_version.side_effect = lambda tag: {
-            "v2.0.0-beta.10": Version("2.0.0b10"),
-            "v2.0.0-rc.1": Version("2.0.0rc1"),
-        }[tag]
-        orchestrator.version_manager.get_release_tuple.return_value = (2, 0, 0)
 
         selected = orchestrator._select_latest_successful_release([rc, beta])
 
@@ -1898,8 +1887,6 @@ class TestDownloadOrchestrator:
             prerelease=False,
             published_at="2025-01-02T00:00:00Z",
         )
-        orchestrator.version_manager.normalize_version.return_value = Version("2.0.0")
-        orchestrator.version_manager.get_release_tuple.return_value = (2, 0, 0)
 
         selected = orchestrator._select_latest_successful_release([newer, older])
 
@@ -1911,7 +1898,6 @@ class TestDownloadOrchestrator:
         """Unparsable tags fall back to deterministic string ordering without crashing."""
         lower = Release(tag_name=123, name=456, prerelease=False)
         higher = Release(tag_name="nightly-z", name="release-z", prerelease=False)
-        orchestrator.version_manager.normalize_version.return_value = None
         orchestrator.version_manager.get_release_tuple.return_value = None
 
         selected = orchestrator._select_latest_successful_release([higher, lower])
@@ -4889,7 +4875,7 @@ class TestFirmwareSummaryUsesSelectedReleases:
 
         orch = DownloadOrchestrator(mock_config)
         # Mock the dependencies
-        orch.cache_manager = Mock()
+        orch.cache_manager = MagicMock()
         orch.version_manager = Mock()
         orch.prerelease_manager = Mock()
         orch.android_downloader = Mock()
@@ -0,0 +1,119 @@
+"""Tests for inter-process locking and merge-on-write of shared cache files."""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import fetchtastic.utils as utils
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.file_lock import file_lock
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+RESET = datetime.now(timezone.utc) + timedelta(minutes=30)
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=str(tmp_path / "cache"))
+
+
+def _try_lock_in_subprocess(path):
+    script = (
+        "import sys\n"
+        "from fetchtastic.file_lock import file_lock\n"
+        "with file_lock(sys.argv[1], timeout=0) as held:\n"
+        "    print(held)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return result.stdout.strip()
+
+
+def test_lock_excludes_other_holders(tmp_path):
+    shared = tmp_path / "shared.json"
+
+    with file_lock(str(shared)) as held:
+        assert held
+        with file_lock(str(shared), timeout=0) as second:
+            assert not second
+        assert _try_lock_in_subprocess(shared) == "False"
+
+    assert _try_lock_in_subprocess(shared) == "True"
+
+
+def test_releases_write_keeps_entries_from_other_processes(cache_manager):
+    release = {"tag_name": "v1.0.0", "prerelease": False}
+    cache_manager.write_releases_cache_entry("ours-1", [release])
+    cache_file = cache_manager._get_releases_cache_file()
+
+    # Another process adds its own entry after this one last read the file
+    with open(cache_file) as f:
+        data = json.load(f)
+    data["theirs"] = dict(data["ours-1"])
+    with open(cache_file, "w") as f:
+        json.dump(data, f)
+
+    assert cache_manager.write_releases_cache_entry("ours-2", [release])
+    with open(cache_file) as f:
+        assert set(json.load(f)) == {"ours-1", "ours-2", "theirs"}
+
+
+def test_commit_timestamp_write_merges_with_file(cache_manager, mocker):
+    cache_file = cache_manager.get_cache_file_path("commit_timestamps")
+    other_entry = ["2026-01-01T00:00:00+00:00", datetime.now(timezone.utc).isoformat()]
+    fetched = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    def fetch_and_race(*_args):
+        # Written by another process while this one was fetching
+        with open(cache_file, "w") as f:
+            json.dump({"meshtastic/firmware/bbb": other_entry}, f)
+        return fetched
+
+    mocker.patch.object(
+        cache_manager, "_fetch_commit_timestamp", side_effect=fetch_and_race
+    )
+
+    result = cache_manager.get_commit_timestamps("meshtastic", "firmware", ["aaa"])
+
+    assert result == {"aaa": fetched}
+    with open(cache_file) as f:
+        data = json.load(f)
+    assert data["meshtastic/firmware/bbb"] == other_entry
+    assert data["meshtastic/firmware/aaa"][0] == fetched.isoformat()
+
+
+def test_rate_limit_save_merges_budgets_across_processes(tmp_path, mocker):
+    cache_file = tmp_path / "rate_limits.json"
+    later_reset = RESET + timedelta(hours=1)
+    cache_file.write_text(
+        json.dumps(
+            {
+                "shared": [1200, RESET.isoformat()],
+                "theirs": [4000, RESET.isoformat()],
+                "renewed": [4999, later_reset.isoformat()],
+            }
+        )
+    )
+    memory = {"shared": (1500, RESET), "renewed": (10, RESET), "ours": (300, RESET)}
+    mocker.patch.object(utils, "_rate_limit_cache_file", str(cache_file))
+    mocker.patch.object(utils, "_rate_limit_cache", memory)
+
+    utils._save_rate_limit_cache()
+
+    expected = {
+        "shared": (1200, RESET),
+        "theirs": (4000, RESET),
+        "renewed": (4999, later_reset),
+        "ours": (300, RESET),
+    }
+    assert memory == expected
+    assert utils._read_rate_limit_file(str(cache_file)) == expected
@@ -249,20 +249,20 @@ class TestIsReleaseComplete:
 
         verify_calls = {"count": 0}
 
-        def fake_verify(file_path: str) -> bool:
+        def fake_verify(file_paths: list[str]) -> dict[str, bool]:
             """
             Test helper that records each invocation and succeeds only for the configured test file.
 
             Increments verify_calls["count"] on every call.
 
             Parameters:
-                file_path (str): Path of the file to verify.
+                file_paths (list[str]): Paths of the files to verify.
 
             Returns:
-                bool: `True` if `file_path` equals `str(test_file)`, `false` otherwise.
+                dict[str, bool]: `True` for `str(test_file)`, `False` for any other path.
             """
             verify_calls["count"] += 1
-            return file_path == str(test_file)
+            return {path: path == str(test_file) for path in file_paths}
 
         def fail_zip_open(*_args, **_kwargs):
             """
@@ -278,7 +278,7 @@ class TestIsReleaseComplete:
 
         monkeypatch.setattr("fetchtastic.download.files.load_file_hash", lambda _p: "h")
         monkeypatch.setattr(
-            "fetchtastic.download.files.verify_file_integrity", fake_verify
+            "fetchtastic.download.files.verify_files_integrity", fake_verify
         )
         monkeypatch.setattr("fetchtastic.download.files.zipfile.ZipFile", fail_zip_open)
 
@@ -303,12 +303,12 @@ class TestIsReleaseComplete:
 
         verify_calls = {"count": 0}
 
-        def fake_verify(file_path: str) -> bool:
+        def fake_verify(file_paths: list[str]) -> dict[str, bool]:
             verify_calls["count"] += 1
-            return file_path == str(test_file)
+            return {path: path == str(test_file) for path in file_paths}
 
         monkeypatch.setattr(
-            "fetchtastic.download.files.verify_file_integrity", fake_verify
+            "fetchtastic.download.files.verify_files_integrity", fake_verify
         )
 
         result = _is_release_complete(
@@ -331,7 +331,8 @@ class TestIsReleaseComplete:
         test_file.write_bytes(b"binary-data")
 
         monkeypatch.setattr(
-            "fetchtastic.download.files.verify_file_integrity", lambda _p: False
+            "fetchtastic.download.files.verify_files_integrity",
+            lambda paths: dict.fromkeys(paths, False),
         )
 
         result = _is_release_complete(
@@ -620,6 +621,82 @@ class TestFileOperations:
         )
         assert result is True
 
+    @staticmethod
+    def _extracted_release(tmp_path):
+        """Create a hashed firmware zip with its rak4631 member already extracted."""
+        zip_path = tmp_path / "firmware.zip"
+        extract_dir = tmp_path / "extract"
+        extract_dir.mkdir()
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("firmware-rak4631-2.7.6.uf2", b"rak payload")
+            zf.writestr("firmware-tbeam-2.7.6.bin", b"tbeam payload")
+        (extract_dir / "firmware-rak4631-2.7.6.uf2").write_bytes(b"rak payload")
+        utils.save_file_hash(str(zip_path), utils.calculate_sha256(str(zip_path)))
+        return str(zip_path), str(extract_dir)
+
+    def test_check_extraction_needed_uses_manifest_without_reopening_zip(
+        self, tmp_path
+    ):
+        """A recorded manifest answers later checks without opening the archive."""
+        file_ops = FileOperations()
+        zip_path, extract_dir = self._extracted_release(tmp_path)
+
+        assert not file_ops.check_extraction_needed(
+            zip_path, extract_dir, ["rak4631-"], ["*.hex"]
+        )
+        assert os.path.exists(utils.get_extraction_manifest_path(zip_path))
+
+        with patch(
+            "fetchtastic.download.files.zipfile.ZipFile",
+            side_effect=AssertionError("zip reopened"),
+        ):
+            assert not file_ops.check_extraction_needed(
+                zip_path, extract_dir, ["rak4631-", "rak4631-"], ["*.hex"]
+            )
+
+    @pytest.mark.parametrize(
+        "change",
+        ["patterns", "missing_output", "modified_output", "zip_hash"],
+    )
+    def test_check_extraction_manifest_invalidated(self, tmp_path, change):
+        """Pattern changes, missing/modified outputs and new zip contents rerun the full check."""
+        file_ops = FileOperations()
+        zip_path, extract_dir = self._extracted_release(tmp_path)
+        assert not file_ops.check_extraction_needed(
+            zip_path, extract_dir, ["rak4631-"], []
+        )
+
+        patterns = ["rak4631-"]
+        output = os.path.join(extract_dir, "firmware-rak4631-2.7.6.uf2")
+        if change == "patterns":
+            patterns = ["rak4631-", "tbeam-"]
+        elif change == "missing_output":
+            os.remove(output)
+        elif change == "modified_output":
+            os.utime(output, ns=(1, 1))
+        else:
+            utils.save_file_hash(zip_path, "0" * 64)
+
+        with patch(
+            "fetchtastic.download.files.zipfile.ZipFile", wraps=zipfile.ZipFile
+        ) as zip_ctor:
+            needed = file_ops.check_extraction_needed(
+                zip_path, extract_dir, patterns, []
+            )
+
+        zip_ctor.assert_called_once()
+        assert needed is (change in ("patterns", "missing_output"))
+
+    def test_prepare_for_redownload_removes_extraction_manifest(self, tmp_path):
+        """Re-downloading a zip drops its extraction manifest."""
+        zip_path, extract_dir = self._extracted_release(tmp_path)
+        FileOperations().check_extraction_needed(
+            zip_path, extract_dir, ["rak4631-"], []
+        )
+
+        assert _prepare_for_redownload(zip_path)
+        assert not os.path.exists(utils.get_extraction_manifest_path(zip_path))
+
     def test_extract_with_validation_success(self, tmp_path):
         """Test successful extraction with validation."""
         file_ops = FileOperations()
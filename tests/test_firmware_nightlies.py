@@ -31,8 +31,10 @@ import pytest
 from fetchtastic import constants
 from fetchtastic.constants import (
     FIRMWARE_DIR_NAME,
+    FIRMWARE_NIGHTLY_SOURCE_DIR,
     FIRMWARE_PRERELEASES_DIR_NAME,
     LATEST_POINTER_NAME,
+    NightlyRunState,
 )
 from fetchtastic.download.cache import CacheManager
 from fetchtastic.download.firmware import FirmwareReleaseDownloader
@@ -175,6 +177,24 @@ def _make_nightly_listing(build: str = BUILD_2_8_0) -> list[dict]:
 # ==================================================================
 
 
+@pytest.fixture(autouse=True)
+def _no_repo_tree(monkeypatch):
+    """Make the recursive repo tree and directory SHAs unavailable so the nightly stage always lists.
+
+    Tests of the tree-SHA generation skip opt back in by patching
+    ``CacheManager.get_repo_directory_sha`` themselves.
+    """
+    monkeypatch.setattr(
+        CacheManager, "get_repo_tree", lambda self, **_kwargs: None, raising=True
+    )
+    monkeypatch.setattr(
+        CacheManager,
+        "get_repo_directory_sha",
+        lambda self, *_args, **_kwargs: None,
+        raising=True,
+    )
+
+
 @pytest.fixture
 def cache_manager(tmp_path):
     """Real CacheManager backed by tmp_path for file I/O."""
@@ -790,7 +810,7 @@ def test_orch_nightly_all_success_tracks_and_updates_latest(tmp_path, cache_mana
     ), f"DownloadOrchestrator._process_firmware_nightlies missing — {_NOT_IMPL}"
     orch._process_firmware_nightlies()
 
-    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0)
+    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0, selected)
     fd.cleanup_superseded_nightlies.assert_called_once_with(BUILD_2_8_0)
     fd.update_latest_pointer_for_nightly.assert_called_once_with(BUILD_2_8_0)
     # Run-scoped build-id must be set after a fully finalized transaction.
@@ -1410,7 +1430,7 @@ def test_orch_nightly_tracking_failure_no_cleanup_no_pointer(tmp_path, cache_man
 
     orch._process_firmware_nightlies()
 
-    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0)
+    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0, selected)
     fd.cleanup_superseded_nightlies.assert_not_called()
     fd.update_latest_pointer_for_nightly.assert_not_called()
     assert orch.latest_firmware_nightly_build_id is None
@@ -1665,7 +1685,7 @@ def test_finalize_nightly_transaction_all_success_finalizes_once(tmp_path):
 
     orch._finalize_nightly_transaction_if_complete()
 
-    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0)
+    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0, [asset1, asset2])
     fd.cleanup_superseded_nightlies.assert_called_once_with(BUILD_2_8_0)
     fd.update_latest_pointer_for_nightly.assert_called_once_with(BUILD_2_8_0)
     assert orch.latest_firmware_nightly_build_id == BUILD_2_8_0
@@ -1702,7 +1722,7 @@ def test_finalize_nightly_transaction_tracking_failure_finalizes_nothing(tmp_pat
 
     orch._finalize_nightly_transaction_if_complete()
 
-    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0)
+    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0, [asset1])
     fd.cleanup_superseded_nightlies.assert_not_called()
     fd.update_latest_pointer_for_nightly.assert_not_called()
     assert orch.latest_firmware_nightly_build_id is None
@@ -3916,7 +3936,7 @@ def test_retry_nightly_coherent_set_reconciliation(tmp_path):
     orch._finalize_nightly_transaction_if_complete()
 
     assert orch.nightly_run_state == NightlyRunState.FINALIZED_WITH_DOWNLOAD
-    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0)
+    fd.update_nightly_tracking.assert_called_once_with(BUILD_2_8_0, selected)
 
 
 # ==================================================================
@@ -5442,3 +5462,111 @@ def test_orch_config_mutation_cannot_alter_repair_set(downloader, tmp_path):
     # the precomputed set was used, not a recomputed empty set.
     assert "device-install.sh" in examined_names
     downloader.get_selected_nightly_assets.assert_not_called()
+
+
+# ==================================================================
+# Generation skip: firmware-nightly/ tree SHA
+# ==================================================================
+
+
+def test_generation_sha_read_from_root_listing(downloader, monkeypatch):
+    lookups = []
+
+    def directory_sha(self, path, **_kwargs):
+        lookups.append(path)
+        return "gen1"
+
+    monkeypatch.setattr(CacheManager, "get_repo_directory_sha", directory_sha)
+    downloader.cache_manager.get_repo_contents = Mock()
+
+    assert downloader.get_nightly_generation_sha() == "gen1"
+
+    assert lookups == [FIRMWARE_NIGHTLY_SOURCE_DIR]
+    downloader.cache_manager.get_repo_contents.assert_not_called()
+
+
+def _finalized_selection():
+    return [
+        _contents_entry(MANIFEST_2_8_0, size=2),
+        _contents_entry(f"firmware-rak4631-{BUILD_2_8_0}.uf2", size=3),
+    ]
+
+
+def _write_selection(downloader, selected):
+    build_dir = Path(downloader._ensure_nightly_base_dir()) / BUILD_2_8_0
+    build_dir.mkdir(exist_ok=True)
+    for entry in selected:
+        (build_dir / entry["name"]).write_bytes(b"x" * entry["size"])
+    return build_dir
+
+
+def test_finalized_build_requires_same_generation_selection_and_assets(downloader):
+    selected = _finalized_selection()
+    downloader._nightly_generation_sha = "gen1"
+    assert downloader.update_nightly_tracking(BUILD_2_8_0, selected)
+
+    # Assets not on disk yet.
+    assert downloader.get_finalized_nightly_build("gen1") is None
+
+    build_dir = _write_selection(downloader, selected)
+    build_id, recorded = downloader.get_finalized_nightly_build("gen1")
+    assert build_id == BUILD_2_8_0
+    assert [(e["name"], e["size"]) for e in recorded] == [
+        (e["name"], e["size"]) for e in selected
+    ]
+    assert downloader.get_finalized_nightly_build("gen2") is None
+
+    # Changed selection patterns could select a different set.
+    downloader.config["EXTRACT_PATTERNS"] = ["tbeam-"]
+    assert downloader.get_finalized_nightly_build("gen1") is None
+    downloader.config["EXTRACT_PATTERNS"] = ["rak4631-"]
+
+    # A truncated asset must be re-checked against the live listing.
+    (build_dir / selected[1]["name"]).write_bytes(b"x")
+    assert downloader.get_finalized_nightly_build("gen1") is None
+
+
+def test_tracking_without_selection_records_no_generation(downloader):
+    downloader._nightly_generation_sha = "gen1"
+    _write_selection(downloader, _finalized_selection())
+    assert downloader.update_nightly_tracking(BUILD_2_8_0)
+
+    assert downloader.get_finalized_nightly_build("gen1") is None
+
+
+def test_orch_unchanged_generation_skips_listing_but_runs_maintenance(tmp_path):
+    from fetchtastic.download.orchestrator import DownloadOrchestrator
+
+    orch = DownloadOrchestrator(_make_config(tmp_path, SAVE_FIRMWARE=True))
+    fd = orch.firmware_downloader
+    selected = _finalized_selection()
+    fd.get_nightly_generation_sha = Mock(return_value="gen1")
+    fd.get_finalized_nightly_build = Mock(return_value=(BUILD_2_8_0, selected))
+    fd.fetch_firmware_nightlies = Mock()
+    fd.cleanup_superseded_nightlies = Mock(return_value=0)
+    fd.recreate_latest_pointer_for_nightly = Mock(return_value=True)
+    fd.repair_nightly_executable_metadata = Mock(return_value=0)
+
+    orch._process_firmware_nightlies()
+
+    fd.fetch_firmware_nightlies.assert_not_called()
+    fd.recreate_latest_pointer_for_nightly.assert_called_once_with(BUILD_2_8_0)
+    fd.repair_nightly_executable_metadata.assert_called_once_with(
+        BUILD_2_8_0, selected, selected=selected
+    )
+    assert orch.nightly_run_state == NightlyRunState.ALREADY_COMPLETE
+
+
+def test_orch_changed_generation_lists_nightlies(tmp_path):
+    from fetchtastic.download.orchestrator import DownloadOrchestrator
+
+    orch = DownloadOrchestrator(_make_config(tmp_path, SAVE_FIRMWARE=True))
+    fd = orch.firmware_downloader
+    fd.get_nightly_generation_sha = Mock(return_value="gen2")
+    fd.get_finalized_nightly_build = Mock(return_value=None)
+    fd.fetch_firmware_nightlies = Mock(return_value=[])
+
+    orch._process_firmware_nightlies()
+
+    fd.fetch_firmware_nightlies.assert_called_once()
+    assert orch.nightly_run_state == NightlyRunState.UNCHECKED
@@ -0,0 +1,199 @@
+"""Tests for the batched GraphQL metadata backend."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from fetchtastic.constants import (
+    MESHTASTIC_CLIENT_APP_RELEASES_URL,
+    MESHTASTIC_FIRMWARE_RELEASES_URL,
+    PRERELEASE_COMMITS_CACHE_FILE,
+)
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.github_graphql import GraphQLMetadataSource
+from fetchtastic.download.github_source import (
+    GithubReleaseSource,
+    create_release_from_github_data,
+)
+from fetchtastic.download.interfaces import get_release_body
+from fetchtastic.download.prerelease_history import PrereleaseHistoryManager
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+QUERY_PATH = "fetchtastic.download.github_graphql.make_github_graphql_request"
+HEAD_SHA = "a" * 40
+
+
+def _release_node(tag, *, draft=False):
+    return {
+        "tagName": tag,
+        "name": f"Release {tag}",
+        "isPrerelease": False,
+        "isDraft": draft,
+        "publishedAt": "2026-01-01T00:00:00Z",
+        "createdAt": "2026-01-01T00:00:00Z",
+        "description": "notes",
+        "releaseAssets": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "name": f"firmware-esp32-{tag}.zip",
+                    "size": 123,
+                    "downloadUrl": f"https://github.com/dl/{tag}.zip",
+                    "contentType": "application/zip",
+                    "digest": "sha256:" + "0" * 64,
+                    "updatedAt": "2026-01-01T00:00:00Z",
+                }
+            ],
+        },
+    }
+
+
+def _data(firmware_tags=("v2.7.15", "v2.7.14"), has_next=True):
+    return {
+        "firmware": {
+            "releases": {
+                "pageInfo": {"hasNextPage": has_next},
+                "nodes": [_release_node("v2.8.0", draft=True)]
+                + [_release_node(tag) for tag in firmware_tags],
+            }
+        },
+        "clientApp": {
+            "releases": {"pageInfo": {"hasNextPage": False}, "nodes": []},
+            "snapshot": None,
+        },
+        "site": {
+            "defaultBranchRef": {
+                "target": {
+                    "oid": HEAD_SHA,
+                    "committedDate": "2026-03-01T00:00:00Z",
+                    "tree": {"oid": "t" * 40},
+                }
+            }
+        },
+    }
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    manager.metadata_source = GraphQLMetadataSource("token")
+    return manager
+
+
+def test_releases_are_served_in_rest_shape(mocker, cache_manager):
+    query = mocker.patch(QUERY_PATH, return_value=(_data(), []))
+    rest = mocker.patch("fetchtastic.download.github_source.make_github_api_request")
+    source = GithubReleaseSource(MESHTASTIC_FIRMWARE_RELEASES_URL, cache_manager, {})
+
+    releases = source.get_releases({"per_page": 2}, create_release_from_github_data)
+
+    assert [r.tag_name for r in releases] == ["v2.7.15", "v2.7.14"]
+    asset = releases[0].assets[0]
+    assert asset.download_url == "https://github.com/dl/v2.7.15.zip"
+    assert asset.size == 123
+    assert get_release_body(releases[0]) == "notes"
+    rest.assert_not_called()
+    query.assert_called_once()
+
+
+def test_larger_requests_fall_back_to_rest(mocker, cache_manager):
+    mocker.patch(QUERY_PATH, return_value=(_data(), []))
+    metadata_source = cache_manager.metadata_source
+
+    assert metadata_source.get_releases(MESHTASTIC_FIRMWARE_RELEASES_URL, 3) is None
+    # A repository with no further pages answers any size
+    assert metadata_source.get_releases(MESHTASTIC_CLIENT_APP_RELEASES_URL, 50) == []
+    assert metadata_source.get_snapshot_release() == (True, None)
+
+
+def test_truncated_assets_fall_back_to_rest(mocker, cache_manager):
+    data = _data()
+    nodes = data["firmware"]["releases"]["nodes"]
+    nodes[-1]["releaseAssets"]["pageInfo"]["hasNextPage"] = True
+    mocker.patch(QUERY_PATH, return_value=(data, []))
+
+    assert (
+        cache_manager.metadata_source.get_releases(MESHTASTIC_FIRMWARE_RELEASES_URL, 1)
+        is None
+    )
+
+
+def test_errored_fields_are_unanswered(mocker, cache_manager):
+    data = _data()
+    errors = [
+        {"message": "timeout", "path": ["clientApp", "snapshot"]},
+        {"message": "timeout", "path": ["firmware", "releases", "nodes", 0]},
+    ]
+    mocker.patch(QUERY_PATH, return_value=(data, errors))
+    metadata_source = cache_manager.metadata_source
+
+    # A null snapshot caused by an error is not "no snapshot release"
+    assert metadata_source.get_snapshot_release() == (False, None)
+    assert metadata_source.get_releases(MESHTASTIC_FIRMWARE_RELEASES_URL, 1) is None
+    assert metadata_source.get_releases(MESHTASTIC_CLIENT_APP_RELEASES_URL, 5) == []
+    assert metadata_source.get_site_head()["sha"] == HEAD_SHA
+
+
+def test_failed_query_falls_back_to_rest_once(mocker, cache_manager):
+    query = mocker.patch(QUERY_PATH, side_effect=requests.HTTPError("502"))
+    response = mocker.Mock()
+    response.json.return_value = [
+        {"tag_name": "v1.0.0", "assets": [{"name": "a.zip", "size": 1}]}
+    ]
+    rest = mocker.patch(
+        "fetchtastic.download.github_source.make_github_api_request",
+        return_value=response,
+    )
+    source = GithubReleaseSource(MESHTASTIC_FIRMWARE_RELEASES_URL, cache_manager, {})
+
+    assert source.fetch_raw_releases_data({"per_page": 5})[0]["tag_name"] == "v1.0.0"
+    assert source.fetch_raw_releases_data({"per_page": 6}) is not None
+    assert rest.call_count == 2
+    query.assert_called_once()
+
+
+def test_from_config_requires_opt_in_and_token(monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+    assert GraphQLMetadataSource.from_config({"GITHUB_TOKEN": "t"}) is None
+    assert GraphQLMetadataSource.from_config({"USE_GITHUB_GRAPHQL": True}) is None
+    assert isinstance(
+        GraphQLMetadataSource.from_config(
+            {"USE_GITHUB_GRAPHQL": True, "GITHUB_TOKEN": "t"}
+        ),
+        GraphQLMetadataSource,
+    )
+
+
+def test_unchanged_head_skips_commit_sync(mocker, cache_manager):
+    mocker.patch(QUERY_PATH, return_value=(_data(), []))
+    rest = mocker.patch(
+        "fetchtastic.download.prerelease_history.make_github_api_request"
+    )
+    stale = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    commits = [{"sha": HEAD_SHA, "commit": {"committer": {"date": "2026-03-01"}}}]
+    cache_file = cache_manager.get_cache_file_path(
+        PRERELEASE_COMMITS_CACHE_FILE, suffix=""
+    )
+    with open(cache_file, "w") as f:
+        json.dump(
+            {
+                "commits": commits,
+                "cached_at": stale,
+                "newest_sha": HEAD_SHA,
+                "newest_date": "2026-03-01T00:00:00Z",
+                "etag": None,
+            },
+            f,
+        )
+
+    result = PrereleaseHistoryManager().fetch_recent_repo_commits(
+        1, cache_manager=cache_manager
+    )
+
+    assert result == commits
+    rest.assert_not_called()
+    assert cache_manager.read_json(cache_file)["cached_at"] != stale
@@ -4,11 +4,14 @@ from unittest.mock import Mock
 
 import pytest
 
+from fetchtastic.download.cache import CacheManager
 from fetchtastic.download.github_source import (
     GithubReleaseSource,
     create_asset_from_github_data,
     create_release_from_github_data,
+    project_release_data,
 )
+from fetchtastic.download.interfaces import get_release_body
 
 pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
 
@@ -62,6 +65,70 @@ class TestGithubReleaseSourceGetReleases:
         assert releases[0].tag_name == "v1.0.0"
         cache_manager.write_releases_cache_entry.assert_called_once()
 
+    def test_get_releases_offloads_bodies_to_releases_cache(self, tmp_path, mocker):
+        """Release notes should be dropped from memory and reloaded from the cache."""
+        source = GithubReleaseSource(
+            releases_url="https://api.github.com/repos/owner/repo/releases",
+            cache_manager=CacheManager(cache_dir=str(tmp_path)),
+            config={},
+        )
+        body = "Highlights\n" + "\n".join(f"- change {i}" for i in range(30))
+        mocker.patch.object(
+            source,
+            "_fetch_from_api",
+            return_value=[
+                {
+                    "tag_name": "v1.0.0",
+                    "prerelease": False,
+                    "body": body,
+                    "assets": [
+                        {
+                            "name": "firmware.bin",
+                            "size": 12,
+                            "browser_download_url": "https://example.com/fw.bin",
+                        }
+                    ],
+                }
+            ],
+        )
+
+        fetched = source.get_releases({}, create_release_from_github_data)
+        cached = source.get_releases({}, create_release_from_github_data)
+
+        for releases in (fetched, cached):
+            assert releases[0].body is None
+            assert releases[0].get_body_head().startswith("Highlights\n- change 0")
+            assert get_release_body(releases[0]) == body
+        source._fetch_from_api.assert_called_once()
+
+    def test_get_releases_keeps_bodies_when_cache_write_fails(self, mocker):
+        """Bodies stay in memory when the releases cache could not be written."""
+        source, cache_manager = _build_source()
+        cache_manager.read_releases_cache_entry.return_value = None
+        cache_manager.write_releases_cache_entry.return_value = False
+        mocker.patch.object(
+            source,
+            "_fetch_from_api",
+            return_value=[
+                {
+                    "tag_name": "v1.0.0",
+                    "body": "notes",
+                    "assets": [
+                        {
+                            "name": "firmware.bin",
+                            "size": 12,
+                            "browser_download_url": "https://example.com/fw.bin",
+                        }
+                    ],
+                }
+            ],
+        )
+
+        releases = source.get_releases({}, create_release_from_github_data)
+
+        assert releases[0].body == "notes"
+        cache_manager.read_cached_release_body.assert_not_called()
+
     def test_get_releases_invalid_api_shape_skips_cache_write_and_returns_empty(
         self, mocker
     ):
@@ -222,3 +289,104 @@ class TestGithubReleaseAndAssetParsing:
         assert asset.name == "fw.bin"
         assert asset.size == 42
         assert asset.download_url == "https://example.com/fw.bin"
+
+
+class TestProjectReleaseData:
+    """Tests for the compact release projection stored in the releases cache."""
+
+    def test_project_release_data_keeps_only_consumed_fields(self):
+        """Author objects, reactions and API URLs should be dropped."""
+        projected = project_release_data(
+            {
+                "id": 1,
+                "url": "https://api.github.com/repos/owner/repo/releases/1",
+                "author": {"login": "someone", "id": 2},
+                "reactions": {"+1": 3},
+                "tag_name": "v1.0.0",
+                "prerelease": False,
+                "published_at": "2024-01-01T00:00:00Z",
+                "body": "notes",
+                "assets": [
+                    {
+                        "id": 3,
+                        "uploader": {"login": "someone"},
+                        "download_count": 7,
+                        "name": "fw.bin",
+                        "size": 12,
+                        "browser_download_url": "https://example.com/fw.bin",
+                        "digest": "sha256:abc",
+                        "updated_at": "2024-01-01T00:00:00Z",
+                    }
+                ],
+            }
+        )
+
+        assert projected == {
+            "tag_name": "v1.0.0",
+            "prerelease": False,
+            "published_at": "2024-01-01T00:00:00Z",
+            "body": "notes",
+            "assets": [
+                {
+                    "name": "fw.bin",
+                    "size": 12,
+                    "browser_download_url": "https://example.com/fw.bin",
+                    "digest": "sha256:abc",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                }
+            ],
+        }
+
+    def test_project_release_data_passes_malformed_values_through(self):
+        """Malformed entries should survive projection so validation still skips them."""
+        assert project_release_data("bad") == "bad"
+        assert project_release_data({"tag_name": "v1", "assets": "x"}) == {
+            "tag_name": "v1",
+            "assets": "x",
+        }
+        assert project_release_data({"tag_name": "v1", "assets": [None]}) == {
+            "tag_name": "v1",
+            "assets": [None],
+        }
+
+    def test_get_releases_caches_projected_payload(self, mocker):
+        """The cache write should receive the projected releases, not the raw payload."""
+        source, cache_manager = _build_source()
+        cache_manager.read_releases_cache_entry.return_value = None
+        mocker.patch.object(
+            source,
+            "_fetch_from_api",
+            return_value=[
+                {
+                    "tag_name": "v1.0.0",
+                    "author": {"login": "someone"},
+                    "assets": [
+                        {
+                            "name": "firmware.bin",
+                            "size": 12,
+                            "browser_download_url": "https://example.com/fw.bin",
+                            "uploader": {"login": "someone"},
+                        }
+                    ],
+                }
+            ],
+        )
+
+        releases = source.get_releases({}, create_release_from_github_data)
+
+        assert releases[0].assets[0].name == "firmware.bin"
+        cache_manager.write_releases_cache_entry.assert_called_once_with(
+            "cache-key",
+            [
+                {
+                    "tag_name": "v1.0.0",
+                    "assets": [
+                        {
+                            "name": "firmware.bin",
+                            "size": 12,
+                            "browser_download_url": "https://example.com/fw.bin",
+                        }
+                    ],
+                }
+            ],
+        )
@@ -0,0 +1,106 @@
+"""Tests for GitHub token pool loading and budget-aware token rotation."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+import fetchtastic.utils as utils
+from fetchtastic.download.async_client import AsyncGitHubClient
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+RESET = datetime.now(timezone.utc) + timedelta(minutes=30)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pool(mocker, monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    mocker.patch.object(utils, "_rate_limit_cache", {})
+    mocker.patch.object(utils, "_rate_limit_cache_loaded", True)
+    mocker.patch.object(utils, "_save_rate_limit_cache")
+    yield
+    utils.configure_github_token_pool([])
+
+
+def _set_budget(token, remaining, reset=RESET):
+    utils._rate_limit_cache[utils.github_token_hash(token)] = (remaining, reset)
+
+
+def test_pool_loaded_from_list_string_and_file(tmp_path):
+    tokens_file = tmp_path / "tokens.txt"
+    tokens_file.write_text("# shared tokens\ntok-c\n\ntok-a  # duplicate\n")
+
+    assert utils.load_github_token_pool(
+        {"GITHUB_TOKENS": ["tok-a", " tok-b "], "GITHUB_TOKENS_FILE": str(tokens_file)}
+    ) == ["tok-a", "tok-b", "tok-c"]
+    assert utils.load_github_token_pool({"GITHUB_TOKENS": "tok-a, tok-b"}) == [
+        "tok-a",
+        "tok-b",
+    ]
+    assert utils.load_github_token_pool({}) == []
+
+
+def test_select_prefers_most_remaining_budget():
+    utils.configure_github_token_pool(["tok-a", "tok-b", "tok-c"])
+    _set_budget("tok-a", 100)
+    _set_budget("tok-b", 4000)
+    _set_budget("tok-c", 0)
+    _set_budget("tok-config", 50)
+
+    assert utils.select_github_token("tok-config") == "tok-b"
+
+    _set_budget("tok-b", 0)
+    assert utils.select_github_token("tok-config") == "tok-a"
+
+
+def test_select_prefers_unknown_and_reset_tokens():
+    utils.configure_github_token_pool(["tok-a", "tok-b"])
+    _set_budget("tok-a", 4999)
+    _set_budget("tok-b", 0, reset=datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    assert utils.select_github_token(None) == "tok-b"
+
+
+def test_exhausted_pool_falls_back_to_unauthenticated():
+    utils.configure_github_token_pool(["tok-a", "tok-b"])
+    _set_budget("tok-a", 0)
+    _set_budget("tok-b", 0)
+
+    assert utils.select_github_token(None) is None
+
+
+def test_without_pool_explicit_token_is_used():
+    _set_budget("tok-config", 0)
+
+    assert utils.select_github_token("tok-config") == "tok-config"
+
+
+def test_request_rotates_away_from_rejected_token(mocker):
+    utils.configure_github_token_pool(["tok-a", "tok-b"])
+    _set_budget("tok-a", 200)
+    _set_budget("tok-b", 100)
+    rejected = Mock(status_code=401, headers={})
+    rejected.raise_for_status.side_effect = requests.HTTPError(response=rejected)
+    accepted = Mock(status_code=200, headers={})
+    get = mocker.patch("requests.get", side_effect=[rejected, accepted, accepted])
+
+    assert utils.make_github_api_request("https://api.github.com/x") is accepted
+    utils.make_github_api_request("https://api.github.com/y")
+
+    used = [call.kwargs["headers"]["Authorization"] for call in get.call_args_list]
+    assert used == ["token tok-a", "token tok-b", "token tok-b"]
+
+
+def test_async_client_selects_pooled_token_per_request():
+    client = AsyncGitHubClient(github_token="tok-a", github_tokens=["tok-b"])
+    client._rate_limit_remaining[utils.github_token_hash("tok-a")] = 10
+    client._rate_limit_reset[utils.github_token_hash("tok-a")] = RESET
+
+    assert "Authorization" not in client._get_default_headers()
+    assert client._select_token() == "tok-b"
+
+    client._rate_limit_remaining[utils.github_token_hash("tok-b")] = 0
+    client._rate_limit_reset[utils.github_token_hash("tok-b")] = RESET
+    assert client._select_token() == "tok-a"
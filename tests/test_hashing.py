@@ -0,0 +1,114 @@
+"""Tests for the shared file hashing engine and the verify/scrub helpers built on it."""
+
+import hashlib
+import threading
+
+import pytest
+
+from fetchtastic import hashing, utils
+from fetchtastic.cli import run_verify
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for index, size in enumerate((0, 10, hashing.HASH_BUFFER_SIZE + 7, 3 * 4096)):
+        path = tmp_path / f"file{index}.bin"
+        path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+        paths.append(str(path))
+    return paths
+
+
+def _expected(path, algorithm="sha256"):
+    with open(path, "rb") as f:
+        return hashlib.new(algorithm, f.read()).hexdigest()
+
+
+def test_hash_file_matches_hashlib(files):
+    for path in files:
+        assert hashing.hash_file(path) == _expected(path)
+        assert hashing.hash_file(path, "md5") == _expected(path, "md5")
+
+
+def test_hash_file_unreadable_returns_none(tmp_path):
+    assert hashing.hash_file(str(tmp_path / "missing.bin")) is None
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_hash_files_batch(files, tmp_path, max_workers):
+    missing = str(tmp_path / "missing.bin")
+    progress = []
+
+    results = hashing.hash_files(
+        files + [missing, files[0]],
+        max_workers=max_workers,
+        progress=lambda done, total, path: progress.append((done, total, path)),
+    )
+
+    assert results == {**{path: _expected(path) for path in files}, missing: None}
+    assert [done for done, _total, _path in progress] == [1, 2, 3, 4, 5]
+    assert {total for _done, total, _path in progress} == {5}
+    assert {path for _done, _total, path in progress} == set(results)
+
+
+def test_hash_files_rejects_unknown_algorithm(files):
+    with pytest.raises(ValueError):
+        hashing.hash_files(files, "not-a-hash")
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_hash_files_cancelled_before_start(files, max_workers):
+    cancel = threading.Event()
+    cancel.set()
+
+    assert hashing.hash_files(files, max_workers=max_workers, cancel_event=cancel) == {}
+
+
+def test_hash_files_cancel_from_progress_skips_remaining(files):
+    cancel = threading.Event()
+
+    results = hashing.hash_files(
+        files,
+        max_workers=1,
+        progress=lambda *_args: cancel.set(),
+        cancel_event=cancel,
+    )
+
+    assert results == {files[0]: _expected(files[0])}
+
+
+def test_verify_files_integrity_reports_mismatch(files, tmp_path):
+    utils.save_file_hash(files[1], "0" * 64)
+    missing = str(tmp_path / "missing.bin")
+
+    results = utils.verify_files_integrity(files + [missing])
+
+    assert results[files[1]] is False
+    assert results[missing] is False
+    assert all(results[path] for path in files if path != files[1])
+    # Files without a stored hash get a baseline, as with verify_file_integrity
+    assert utils.load_file_hash(files[0]) == _expected(files[0])
+
+
+def test_scrub_only_checks_files_with_stored_hashes(files, tmp_path):
+    utils.save_file_hash(files[0], _expected(files[0]))
+    utils.save_file_hash(files[2], "0" * 64)
+
+    assert utils.scrub_hashed_files(str(tmp_path)) == {
+        files[0]: True,
+        files[2]: False,
+    }
+    assert utils.load_file_hash(files[1]) is None
+
+
+def test_run_verify_fails_on_corruption(files, tmp_path, capsys):
+    utils.save_file_hash(files[0], _expected(files[0]))
+    config = {"DOWNLOAD_DIR": str(tmp_path)}
+    assert run_verify(config) is True
+
+    utils.save_file_hash(files[3], "0" * 64)
+
+    assert run_verify(config) is False
+    assert f"FAILED: {files[3]}" in capsys.readouterr().err
@@ -0,0 +1,117 @@
+"""Tests for the one-shot migration registry."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.migrations import MigrationRegistry
+from fetchtastic.download.orchestrator import DownloadOrchestrator
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "downloads"
+    root.mkdir()
+    return root
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=str(tmp_path / "cache"))
+
+
+def _registry(cache_manager, tree, run, version=1, sentinel=None):
+    registry = MigrationRegistry(cache_manager, str(tree))
+    registry.register("example", version, run, sentinel=sentinel)
+    return registry
+
+
+def test_migration_runs_once_per_tree(cache_manager, tree):
+    run = Mock()
+
+    assert _registry(cache_manager, tree, run).run_pending() == ["example"]
+    assert _registry(cache_manager, tree, run).run_pending() == []
+    assert run.call_count == 1
+
+    with open(cache_manager.get_cache_file_path("migrations.json", suffix="")) as f:
+        record = json.load(f)["example"]
+    assert record["version"] == 1
+    assert record["tree"][0] == str(tree)
+
+
+def test_newer_version_reruns_migration(cache_manager, tree):
+    run = Mock()
+    _registry(cache_manager, tree, run).run_if_needed("example")
+
+    assert _registry(cache_manager, tree, run, version=2).run_if_needed("example")
+    assert run.call_count == 2
+
+
+def test_replaced_tree_reruns_migration(cache_manager, tree):
+    run = Mock()
+    _registry(cache_manager, tree, run).run_if_needed("example")
+
+    tree.rename(tree.parent / "old")
+    tree.mkdir()
+
+    assert _registry(cache_manager, tree, run).run_if_needed("example")
+    assert run.call_count == 2
+
+
+def test_sentinel_reruns_recorded_migration(cache_manager, tree):
+    run = Mock()
+    sentinel = Mock(return_value=False)
+    _registry(cache_manager, tree, run, sentinel=sentinel).run_if_needed("example")
+
+    assert not _registry(cache_manager, tree, run, sentinel=sentinel).run_pending()
+    sentinel.return_value = True
+    assert _registry(cache_manager, tree, run, sentinel=sentinel).run_pending()
+    assert run.call_count == 2
+
+
+def test_failed_migration_is_retried(cache_manager, tree):
+    run = Mock(side_effect=[OSError("busy"), None])
+
+    assert not _registry(cache_manager, tree, run).run_if_needed("example")
+    assert _registry(cache_manager, tree, run).run_if_needed("example")
+
+
+def test_missing_tree_is_not_recorded(cache_manager, tmp_path):
+    run = Mock()
+    missing = tmp_path / "missing"
+
+    _registry(cache_manager, missing, run).run_if_needed("example")
+    _registry(cache_manager, missing, run).run_if_needed("example")
+
+    assert run.call_count == 2
+
+
+def test_pipeline_skips_completed_legacy_sidecar_walk(tree, mocker):
+    cleanup = mocker.patch(
+        "fetchtastic.download.orchestrator.cleanup_legacy_hash_sidecars"
+    )
+    config = {"DOWNLOAD_DIR": str(tree)}
+
+    DownloadOrchestrator(config).migrations.run_if_needed("legacy_hash_sidecars")
+    DownloadOrchestrator(config).migrations.run_if_needed("legacy_hash_sidecars")
+
+    cleanup.assert_called_once_with(str(tree))
+
+
+def test_client_app_layout_rerun_when_legacy_dirs_appear(tree, mocker):
+    config = {"DOWNLOAD_DIR": str(tree), "SAVE_CLIENT_APPS": True}
+    orchestrator = DownloadOrchestrator(config)
+    migrate = mocker.patch.object(
+        orchestrator.client_app_downloader, "migrate_legacy_layout"
+    )
+
+    assert orchestrator.migrations.run_if_needed("client_app_layout")
+    assert not orchestrator.migrations.run_if_needed("client_app_layout")
+
+    (tree / "apks").mkdir()
+    assert orchestrator.migrations.run_if_needed("client_app_layout")
+    assert migrate.call_count == 2
@@ -488,6 +488,38 @@ class TestDownloadOrchestrator:
         client_app_count = orchestrator._count_artifact_downloads(FILE_TYPE_CLIENT_APP)
         assert client_app_count == 5
 
+    def test_count_artifact_downloads_reads_recorded_platform(
+        self, orchestrator, tmp_path
+    ):
+        """Results carrying the asset's platform are not re-classified by name."""
+        orchestrator.download_results = [
+            DownloadResult(
+                success=True,
+                file_type=FILE_TYPE_CLIENT_APP,
+                file_path=str(tmp_path / "app" / "v2.0.0" / "Meshtastic.dmg"),
+                asset_platform=FILE_TYPE_DESKTOP,
+            ),
+            DownloadResult(
+                success=True,
+                file_type=FILE_TYPE_CLIENT_APP,
+                file_path=str(tmp_path / "app" / "v2.0.0" / "app-google-release.apk"),
+                asset_platform=FILE_TYPE_ANDROID,
+            ),
+        ]
+
+        with patch(
+            "fetchtastic.download.interfaces.classify_asset_platform"
+        ) as classify:
+            android_count = orchestrator._count_artifact_downloads(
+                FILE_TYPE_CLIENT_APP, artifact_type=FILE_TYPE_ANDROID
+            )
+            desktop_count = orchestrator._count_artifact_downloads(
+                FILE_TYPE_CLIENT_APP, artifact_type=FILE_TYPE_DESKTOP
+            )
+
+        assert (android_count, desktop_count) == (1, 1)
+        classify.assert_not_called()
+
     def test_cleanup_old_versions(self, orchestrator):
         """Test cleanup of old versions."""
         # Method should exist and be callable without raising; exact cleanup depends on filesystem contents
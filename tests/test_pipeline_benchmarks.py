@@ -0,0 +1,279 @@
+"""
+End-to-end download pipeline benchmarks.
+
+Each scenario runs ``DownloadOrchestrator.run_download_pipeline`` against the local
+GitHub stand-in from ``tests/benchmark_server.py`` and records wall time, API calls,
+asset requests, bytes downloaded and peak memory. Results are compared with the
+committed baselines in ``tests/pipeline_benchmark_baselines.json`` (see
+``tests/benchmark_baselines.py`` for the tolerance rules; wall time is checked only
+with ``FETCHTASTIC_BENCHMARK_TIMINGS=1`` and without coverage).
+
+Regenerate the baselines after an intentional change with::
+
+    FETCHTASTIC_UPDATE_BENCHMARK_BASELINES=1 pytest --no-cov tests/test_pipeline_benchmarks.py
+
+The suite's global ``time.sleep`` mock stays active for the client, so polite API
+delays and retry backoff do not count towards wall time; stand-in latency and
+bandwidth throttling use real sleeps.
+"""
+
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from fetchtastic.download.orchestrator import DownloadOrchestrator
+from fetchtastic.run_metrics import get_run_metrics
+from fetchtastic.utils import reset_api_tracking
+from tests.benchmark_baselines import check_against_baseline
+from tests.benchmark_server import (
+    API_HOST,
+    DEVICE_API_HOST,
+    GitHubStandIn,
+    StandInConfig,
+    redirect_requests,
+)
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.integration,
+    pytest.mark.core_downloads,
+]
+
+BASELINES_PATH = Path(__file__).with_name("pipeline_benchmark_baselines.json")
+# Absolute slack so very fast scenarios are not failed by scheduler noise.
+WALL_TIME_SLACK_SECONDS = 0.5
+MEMORY_SLACK_MIB = 4.0
+
+MIB = 1024 * 1024
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one measured pipeline run."""
+
+    wall_seconds: float
+    api_calls: int
+    asset_requests: int
+    bytes_downloaded: int
+    files_downloaded: int
+    failed_downloads: int
+    peak_traced_mib: float
+    peak_rss_mib: float
+
+
+def _peak_rss_mib() -> float:
+    """Process-wide peak RSS (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / MIB if sys.platform == "darwin" else peak / 1024
+
+
+def _base_config(download_dir: Path) -> Dict[str, Any]:
+    return {
+        "DOWNLOAD_DIR": str(download_dir),
+        "SAVE_FIRMWARE": True,
+        "SAVE_CLIENT_APPS": True,
+        "SELECTED_FIRMWARE_ASSETS": ["esp32-", "nrf52840"],
+        "SELECTED_APP_ASSETS": ["fdroid", ".dmg", ".msi", ".AppImage"],
+        "FIRMWARE_VERSIONS_TO_KEEP": 2,
+        "APP_VERSIONS_TO_KEEP": 2,
+        "AUTO_EXTRACT": True,
+        "EXTRACT_PATTERNS": ["rak4631-", "tbeam-"],
+        "CHECK_FIRMWARE_PRERELEASES": True,
+        "CHECK_FIRMWARE_NIGHTLIES": True,
+        "SELECTED_PRERELEASE_ASSETS": ["rak4631-", "tbeam-"],
+    }
+
+
+def _publish_initial_catalogue(stand_in: GitHubStandIn) -> None:
+    stand_in.add_firmware_release("2.7.14.aaaaaaa", published_at="2026-01-01T00:00:00Z")
+    stand_in.add_firmware_release("2.7.15.bbbbbbb", published_at="2026-02-01T00:00:00Z")
+    stand_in.add_app_release("2.7.10", published_at="2026-01-05T00:00:00Z")
+    stand_in.add_app_release("2.7.11", published_at="2026-02-05T00:00:00Z")
+    stand_in.publish_prerelease("2.7.16.ddddddd", committed_at="2026-02-10T00:00:00Z")
+    stand_in.publish_nightly("2.7.16.eeeeeee")
+
+
+def _expire_release_caches(orchestrator: DownloadOrchestrator) -> None:
+    """Model the releases cache TTL elapsing between two scheduled runs."""
+    cache_file = orchestrator.cache_manager.get_cache_file_path("releases")
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
+
+
+def _run_pipeline(stand_in: GitHubStandIn, config: Dict[str, Any]) -> BenchmarkResult:
+    stand_in.reset_counters()
+    reset_api_tracking()
+    orchestrator = DownloadOrchestrator(config)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        successes, failures = orchestrator.run_download_pipeline()
+        wall_seconds = time.perf_counter() - start
+        _current, peak_traced = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    api_hosts = (f"/{API_HOST}/", f"/{DEVICE_API_HOST}/")
+    api_calls = sum(1 for path in stand_in.request_log if path.startswith(api_hosts))
+    return BenchmarkResult(
+        wall_seconds=round(wall_seconds, 4),
+        api_calls=api_calls,
+        asset_requests=len(stand_in.request_log) - api_calls,
+        bytes_downloaded=get_run_metrics()["bytes_downloaded"],
+        files_downloaded=sum(1 for result in successes if not result.was_skipped),
+        failed_downloads=len(failures),
+        peak_traced_mib=round(peak_traced / MIB, 3),
+        peak_rss_mib=round(_peak_rss_mib(), 1),
+    )
+
+
+@pytest.fixture
+def stand_in():
+    server = GitHubStandIn(StandInConfig(latency_seconds=0.002)).start()
+    try:
+        with redirect_requests(server):
+            yield server
+    finally:
+        server.stop()
+
+
+def _benchmark(
+    name: str,
+    stand_in: GitHubStandIn,
+    config: Dict[str, Any],
+    *,
+    prepare: Optional[Callable[[], None]] = None,
+) -> BenchmarkResult:
+    """Apply `prepare` (e.g. a priming sync), then measure one run against its baseline."""
+    if prepare is not None:
+        prepare()
+    result = _run_pipeline(stand_in, config)
+    check_against_baseline(
+        BASELINES_PATH,
+        name,
+        asdict(result),
+        count_keys=(
+            "api_calls",
+            "asset_requests",
+            "bytes_downloaded",
+            "failed_downloads",
+            "files_downloaded",
+        ),
+        time_keys=("wall_seconds",),
+        memory_keys=("peak_traced_mib",),
+        time_slack=WALL_TIME_SLACK_SECONDS,
+        memory_slack=MEMORY_SLACK_MIB,
+    )
+    return result
+
+
+def test_cold_sync(stand_in, tmp_path):
+    _publish_initial_catalogue(stand_in)
+
+    result = _benchmark("cold_sync", stand_in, _base_config(tmp_path / "downloads"))
+
+    assert result.failed_downloads == 0
+    assert result.files_downloaded > 0
+
+
+def test_warm_noop(stand_in, tmp_path):
+    _publish_initial_catalogue(stand_in)
+    config = _base_config(tmp_path / "downloads")
+
+    result = _benchmark(
+        "warm_noop", stand_in, config, prepare=lambda: _run_pipeline(stand_in, config)
+    )
+
+    assert result.files_downloaded == 0
+    assert result.asset_requests == 0
+
+
+def test_one_new_release(stand_in, tmp_path):
+    _publish_initial_catalogue(stand_in)
+    config = _base_config(tmp_path / "downloads")
+
+    def _prepare():
+        _run_pipeline(stand_in, config)
+        stand_in.add_firmware_release(
+            "2.7.17.fffffff", published_at="2026-03-01T00:00:00Z"
+        )
+        stand_in.add_app_release("2.7.12", published_at="2026-03-05T00:00:00Z")
+        _expire_release_caches(DownloadOrchestrator(config))
+
+    result = _benchmark("one_new_release", stand_in, config, prepare=_prepare)
+
+    assert result.failed_downloads == 0
+    assert result.files_downloaded > 0
+
+
+def test_one_new_release_graphql(stand_in, tmp_path):
+    _publish_initial_catalogue(stand_in)
+    config = {
+        **_base_config(tmp_path / "downloads"),
+        "GITHUB_TOKEN": "benchmark-token",
+        "USE_GITHUB_GRAPHQL": True,
+    }
+
+    def _prepare():
+        _run_pipeline(stand_in, config)
+        stand_in.add_firmware_release(
+            "2.7.17.fffffff", published_at="2026-03-01T00:00:00Z"
+        )
+        stand_in.add_app_release("2.7.12", published_at="2026-03-05T00:00:00Z")
+        _expire_release_caches(DownloadOrchestrator(config))
+
+    result = _benchmark("one_new_release_graphql", stand_in, config, prepare=_prepare)
+
+    assert result.failed_downloads == 0
+    assert result.files_downloaded > 0
+    assert stand_in.request_log.count(f"/{API_HOST}/graphql") == 1
+
+
+def test_new_nightly_generation(stand_in, tmp_path):
+    _publish_initial_catalogue(stand_in)
+    config = _base_config(tmp_path / "downloads")
+
+    def _prepare():
+        _run_pipeline(stand_in, config)
+        stand_in.publish_nightly("2.7.16.0123456")
+
+    result = _benchmark("new_nightly_generation", stand_in, config, prepare=_prepare)
+
+    assert result.failed_downloads == 0
+    assert result.files_downloaded > 0
+
+
+def test_large_desktop_installers(tmp_path):
+    server = GitHubStandIn(
+        StandInConfig(
+            latency_seconds=0.002,
+            bandwidth_bytes_per_second=256 * MIB,
+            desktop_installer_bytes=8 * MIB,
+        )
+    ).start()
+    try:
+        with redirect_requests(server):
+            server.add_app_release("2.7.10", published_at="2026-01-05T00:00:00Z")
+            server.add_app_release("2.7.11", published_at="2026-02-05T00:00:00Z")
+            config = {
+                **_base_config(tmp_path / "downloads"),
+                "SAVE_FIRMWARE": False,
+                "SELECTED_APP_ASSETS": [".dmg", ".msi", ".AppImage"],
+            }
+
+            result = _benchmark("large_desktop_installers", server, config)
+    finally:
+        server.stop()
+
+    assert result.failed_downloads == 0
+    assert result.files_downloaded == 6
+    assert result.bytes_downloaded == 6 * 8 * MIB
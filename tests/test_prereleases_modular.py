@@ -391,6 +391,108 @@ def test_fetch_recent_repo_commits_refreshes_expired_cache(tmp_path):
     mock_write.assert_called_once()
 
 
+def _commit(sha, date):
+    return {"sha": sha, "commit": {"committer": {"date": date}}}
+
+
+def _commit_log_entry():
+    entry = _stale_cache_entry()
+    entry["commits"] = [
+        _commit("b", "2026-01-02T00:00:00Z"),
+        _commit("a", "2026-01-01T00:00:00Z"),
+    ]
+    entry["newest_sha"] = "b"
+    entry["newest_date"] = "2026-01-02T00:00:00Z"
+    entry["etag"] = 'W/"old"'
+    return entry
+
+
+def _commits_response(commits, status_code=200, etag='W/"new"'):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag}
+    response.json.return_value = commits
+    return response
+
+
+def test_fetch_recent_repo_commits_syncs_only_newer_commits(tmp_path):
+    cache_manager = _make_cache_manager(tmp_path)
+    manager = _make_manager()
+    response = _commits_response(
+        [_commit("c", "2026-01-03T00:00:00Z"), _commit("b", "2026-01-02T00:00:00Z")]
+    )
+
+    with (
+        patch.object(cache_manager, "read_json", return_value=_commit_log_entry()),
+        patch(
+            "fetchtastic.download.prerelease_history.make_github_api_request",
+            return_value=response,
+        ) as mock_request,
+        patch.object(
+            cache_manager, "atomic_write_json", return_value=True
+        ) as mock_write,
+    ):
+        commits = manager.fetch_recent_repo_commits(2, cache_manager=cache_manager)
+
+    assert [c["sha"] for c in commits] == ["c", "b"]
+    mock_request.assert_called_once()
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["params"]["since"] == "2026-01-02T00:00:00Z"
+    assert kwargs["etag"] == 'W/"old"'
+    saved = mock_write.call_args.args[1]
+    assert [c["sha"] for c in saved["commits"]] == ["c", "b", "a"]
+    assert saved["newest_sha"] == "c"
+    assert saved["newest_date"] == "2026-01-03T00:00:00Z"
+    assert saved["etag"] == 'W/"new"'
+
+
+def test_fetch_recent_repo_commits_not_modified_keeps_log(tmp_path):
+    cache_manager = _make_cache_manager(tmp_path)
+    manager = _make_manager()
+    entry = _commit_log_entry()
+
+    with (
+        patch.object(cache_manager, "read_json", return_value=entry),
+        patch(
+            "fetchtastic.download.prerelease_history.make_github_api_request",
+            return_value=_commits_response([], status_code=304),
+        ) as mock_request,
+        patch.object(
+            cache_manager, "atomic_write_json", return_value=True
+        ) as mock_write,
+    ):
+        commits = manager.fetch_recent_repo_commits(2, cache_manager=cache_manager)
+
+    assert commits == entry["commits"]
+    mock_request.assert_called_once()
+    saved = mock_write.call_args.args[1]
+    assert saved["commits"] == entry["commits"]
+    assert saved["cached_at"] != entry["cached_at"]
+
+
+def test_fetch_recent_repo_commits_refetches_when_known_sha_missing(tmp_path):
+    cache_manager = _make_cache_manager(tmp_path)
+    manager = _make_manager()
+    rewritten = [
+        _commit("y", "2026-01-03T00:00:00Z"),
+        _commit("x", "2026-01-02T00:00:00Z"),
+    ]
+
+    with (
+        patch.object(cache_manager, "read_json", return_value=_commit_log_entry()),
+        patch(
+            "fetchtastic.download.prerelease_history.make_github_api_request",
+            return_value=_commits_response(rewritten),
+        ) as mock_request,
+        patch.object(cache_manager, "atomic_write_json", return_value=True),
+    ):
+        commits = manager.fetch_recent_repo_commits(2, cache_manager=cache_manager)
+
+    assert commits == rewritten
+    assert mock_request.call_count == 2
+    assert "since" not in mock_request.call_args.kwargs["params"]
+
+
 def test_prerelease_history_uses_cached_entries(tmp_path):
     cache_manager = _make_cache_manager(tmp_path)
     manager = _make_manager()
@@ -1,12 +1,14 @@
 # Tests for release history tracking utilities.
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from fetchtastic import log_utils
 from fetchtastic.download.cache import CacheManager
-from fetchtastic.download.interfaces import Release
+from fetchtastic.download.github_source import create_release_from_github_data
+from fetchtastic.download.interfaces import Asset, FirmwareManifest, Release
 from fetchtastic.download.release_history import (
     ReleaseHistoryManager,
     _join_text,
@@ -94,6 +96,145 @@ def test_is_release_revoked_skips_previously_revoked_prefix():
     assert is_release_revoked(release) is False
 
 
+def test_release_classification_is_memoised_per_release():
+    release = Release(tag_name="v2.7.15", name="Firmware 2.7.15 Beta", body="notes")
+
+    with patch(
+        "fetchtastic.download.release_history._detect_release_channel",
+        return_value="beta",
+    ) as mock_detect:
+        assert detect_release_channel(release) == "beta"
+        assert release.channel == "beta"
+        assert detect_release_channel(release) == "beta"
+
+    mock_detect.assert_called_once_with(release)
+
+
+def test_release_classification_recomputes_when_fields_change():
+    release = Release(tag_name="v2.7.15", name="Firmware 2.7.15 Beta", body="notes")
+    assert release.channel == "beta"
+    assert release.is_revoked is False
+
+    release.name = "Firmware 2.7.15 RC"
+    release.body = "This release was revoked"
+
+    assert release.channel == "rc"
+    assert release.is_revoked is True
+
+
+def test_release_classification_cache_excluded_from_equality_and_repr():
+    cached = Release(tag_name="v2.7.15", name="Firmware 2.7.15 Beta")
+    fresh = Release(tag_name="v2.7.15", name="Firmware 2.7.15 Beta")
+    assert cached.channel == "beta"
+
+    assert cached == fresh
+    assert "_classification_cache" not in repr(cached)
+
+
+def test_asset_classification_fields():
+    apk = Asset(
+        name="app-fdroid-arm64-v8a-release.apk", download_url="https://x", size=1
+    )
+    dmg = Asset(name="Meshtastic-2.7.11.dmg", download_url="https://x", size=1)
+    manifest = Asset(
+        name="firmware-2.7.15.567b8ea.json", download_url="https://x", size=1
+    )
+    device_manifest = Asset(
+        name="firmware-rak4631-2.7.15.567b8ea.mt.json",
+        download_url="https://x",
+        size=1,
+    )
+
+    assert apk.platform == "android"
+    assert (apk.apk_identity.flavor, apk.apk_identity.abi) == ("fdroid", "arm64-v8a")
+    assert dmg.platform == "desktop"
+    assert dmg.apk_identity is None
+    assert manifest.platform is None
+    assert manifest.is_manifest is True
+    assert device_manifest.is_manifest is True
+    assert apk.is_manifest is False
+    assert (
+        Asset(
+            name="firmware-rak4631-2.7.15.567b8ea.uf2", download_url="", size=1
+        ).base_name
+        == "firmware-rak4631.uf2"
+    )
+
+
+def test_parsed_releases_are_classified_once():
+    release = create_release_from_github_data(
+        {
+            "tag_name": "v2.7.15.567b8ea",
+            "name": "Meshtastic Firmware 2.7.15 Beta",
+            "body": "notes",
+            "assets": [
+                {
+                    "name": "firmware-rak4631-2.7.15.567b8ea.uf2",
+                    "size": 1,
+                    "browser_download_url": "https://example.com/fw.uf2",
+                }
+            ],
+        }
+    )
+
+    with (
+        patch("fetchtastic.download.release_history._detect_release_channel") as detect,
+        patch("fetchtastic.download.interfaces.extract_base_name") as base_name,
+    ):
+        assert release.channel == "beta"
+        assert release.is_revoked is False
+        assert release.assets[0].base_name == "firmware-rak4631.uf2"
+        assert release.assets[0].platform is None
+
+    detect.assert_not_called()
+    base_name.assert_not_called()
+
+
+def test_snapshot_release_classification():
+    assert Release(tag_name="snapshot").is_snapshot is True
+    assert Release(tag_name="v2.7.15").is_snapshot is False
+
+
+def test_offloaded_release_body_loads_on_demand():
+    body = "\n".join(f"line {i}" for i in range(40))
+    loader = Mock(return_value=body)
+    release = Release(tag_name="v2.7.15", body=body)
+
+    release.offload_body(loader)
+
+    assert release.body is None
+    assert release.get_body_head() == "\n".join(body.splitlines()[:14])
+    assert release.get_body() == body
+    assert release.get_body() == body
+    assert loader.call_count == 2
+    assert release.body is None
+
+
+def test_revocation_detected_from_offloaded_preview():
+    loader = Mock(side_effect=AssertionError("full notes should not be loaded"))
+    release = Release(
+        tag_name="v2.7.15", body="## Notice\n\n> This release was revoked"
+    )
+
+    release.offload_body(loader)
+
+    assert is_release_revoked(release) is True
+    loader.assert_not_called()
+
+
+def test_release_models_are_slotted():
+    release = Release(tag_name="v2.7.15")
+    manifest = FirmwareManifest(version="2.7.15", hwModelSlug="RAK4631")
+
+    assert not hasattr(release, "__dict__")
+    assert not hasattr(Asset(name="a", download_url="", size=1), "__dict__")
+    with pytest.raises(AttributeError):
+        release.unknown_field = 1
+    with pytest.raises(FrozenInstanceError):
+        manifest.version = "2.7.16"
+    assert manifest.raw_data is None
+
+
 def test_format_release_label_and_suffix(tmp_path):
     cache_manager = CacheManager(cache_dir=str(tmp_path))
     history_path = cache_manager.get_cache_file_path("release_history_labels")
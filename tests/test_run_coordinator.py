@@ -0,0 +1,165 @@
+"""Tests for single-instance coordination of download runs."""
+
+import argparse
+import os
+import threading
+
+import pytest
+
+from fetchtastic import cli
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.run_coordinator import (
+    RUN_MODE_EXIT,
+    RUN_MODE_QUEUE,
+    RUN_MODE_WAIT,
+    RunCoordinator,
+    resolve_run_mode,
+)
+from fetchtastic.file_lock import get_lock_file_path
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+SUMMARY = {"downloaded": 2, "failed": 0, "latest_firmware": "v2.7.15"}
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def coordinator_factory(tmp_path, cache_manager):
+    download_dir = str(tmp_path / "downloads")
+
+    def factory(**kwargs):
+        return RunCoordinator(download_dir, cache_manager, **kwargs)
+
+    return factory
+
+
+def _hold_in_thread(coordinator, result=SUMMARY):
+    """Claim the directory in a thread and release it shortly after it is held."""
+    held = threading.Event()
+    release = threading.Event()
+
+    def run():
+        with coordinator.claim(RUN_MODE_EXIT) as ticket:
+            assert ticket.should_run
+            held.set()
+            release.wait(timeout=10)
+            coordinator.record_result(result)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert held.wait(timeout=10)
+    threading.Timer(0.2, release.set).start()
+    return thread
+
+
+def test_free_directory_runs_and_records_result(coordinator_factory):
+    coordinator = coordinator_factory()
+
+    with coordinator.claim(RUN_MODE_EXIT) as ticket:
+        assert ticket.should_run
+        assert coordinator.read_status()["state"] == "running"
+        coordinator.record_result(SUMMARY)
+
+    status = coordinator.read_status()
+    assert status["state"] == "finished"
+    assert status["pid"] == os.getpid()
+    assert status["summary"] == SUMMARY
+
+
+def test_failed_run_is_recorded(coordinator_factory):
+    coordinator = coordinator_factory()
+
+    with pytest.raises(RuntimeError):
+        with coordinator.claim(RUN_MODE_EXIT):
+            raise RuntimeError("download failed")
+
+    assert coordinator.read_status()["state"] == "failed"
+
+
+def test_exit_mode_reports_in_flight_run(coordinator_factory):
+    with coordinator_factory().claim(RUN_MODE_EXIT) as first:
+        with coordinator_factory().claim(RUN_MODE_EXIT) as second:
+            assert first.should_run
+            assert not second.should_run
+            assert second.other_run["state"] == "running"
+
+
+def test_wait_mode_reuses_finished_run(coordinator_factory):
+    thread = _hold_in_thread(coordinator_factory())
+
+    with coordinator_factory().claim(RUN_MODE_WAIT) as ticket:
+        assert not ticket.should_run
+        assert ticket.waited
+        assert ticket.other_run["summary"] == SUMMARY
+    thread.join()
+
+
+def test_queue_mode_runs_after_in_flight_run(coordinator_factory):
+    thread = _hold_in_thread(coordinator_factory())
+
+    with coordinator_factory().claim(RUN_MODE_QUEUE) as ticket:
+        assert ticket.should_run
+        assert ticket.other_run["state"] == "finished"
+    thread.join()
+
+
+def test_wait_times_out_without_running(coordinator_factory):
+    with coordinator_factory().claim(RUN_MODE_EXIT):
+        with coordinator_factory(wait_timeout=0).claim(RUN_MODE_QUEUE) as ticket:
+            assert not ticket.should_run
+            assert not ticket.waited
+
+
+def test_unopenable_lock_runs_uncoordinated(mocker, coordinator_factory):
+    coordinator = coordinator_factory()
+    # A directory in the lock file's place cannot be opened as a lock file
+    os.makedirs(get_lock_file_path(coordinator.status_file))
+    mock_logger = mocker.patch("fetchtastic.download.run_coordinator.logger")
+
+    with coordinator.claim(RUN_MODE_EXIT) as ticket:
+        assert ticket.should_run
+        assert ticket.other_run is None
+
+    mock_logger.warning.assert_called_once()
+
+    with pytest.raises(RuntimeError) as excinfo:
+        with coordinator.claim(RUN_MODE_EXIT):
+            raise RuntimeError("download failed")
+
+    # Errors from the run are not chained to the lock failure
+    assert excinfo.value.__context__ is None
+
+
+def test_run_mode_from_config_and_flag():
+    assert resolve_run_mode({}) == RUN_MODE_EXIT
+    assert resolve_run_mode({"CONCURRENT_RUN_MODE": " Wait "}) == RUN_MODE_WAIT
+    assert resolve_run_mode({"CONCURRENT_RUN_MODE": "bogus"}) == RUN_MODE_EXIT
+    assert resolve_run_mode({"CONCURRENT_RUN_MODE": "wait"}, queue=True) == (
+        RUN_MODE_QUEUE
+    )
+
+
+def test_download_command_exits_while_directory_is_busy(mocker, tmp_path):
+    config = {"DOWNLOAD_DIR": str(tmp_path / "downloads")}
+    args = argparse.Namespace(
+        clear_cache=False,
+        force_download=False,
+        metrics_out=None,
+        trace_out=None,
+        queue=False,
+    )
+    integration = mocker.MagicMock()
+    integration.main.return_value = ([], [], [], [], [], [], [], [], [], [], "", "", "")
+
+    with RunCoordinator(config["DOWNLOAD_DIR"]).claim(RUN_MODE_EXIT):
+        cli._handle_download_subcommand(args, integration, config)
+    integration.main.assert_not_called()
+
+    cli._handle_download_subcommand(args, integration, config)
+    integration.main.assert_called_once()
+    status = RunCoordinator(config["DOWNLOAD_DIR"]).read_status()
+    assert status["summary"]["downloaded"] == 0
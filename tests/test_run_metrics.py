@@ -0,0 +1,150 @@
+import json
+import zipfile
+
+import pytest
+
+from fetchtastic import run_metrics, utils
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.cli_integration import DownloadCLIIntegration
+from fetchtastic.download.files import FileOperations, is_zip_intact
+from fetchtastic.download.orchestrator import DownloadOrchestrator
+
+pytestmark = [pytest.mark.unit, pytest.mark.infrastructure]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    run_metrics.reset_run_metrics()
+    yield
+    run_metrics.reset_run_metrics()
+
+
+def test_counters_stage_timings_and_cache_ratios():
+    run_metrics.increment_metric(run_metrics.METRIC_BYTES_DOWNLOADED, 100)
+    run_metrics.increment_metric(run_metrics.METRIC_BYTES_DOWNLOADED, 50)
+    run_metrics.increment_metric(run_metrics.METRIC_FILES_STATTED)
+    run_metrics.increment_metric(run_metrics.METRIC_BYTES_HASHED, 0)
+    run_metrics.record_cache_lookup("releases", hit=True)
+    run_metrics.record_cache_lookup("releases", hit=True)
+    run_metrics.record_cache_lookup("releases", hit=False)
+    with run_metrics.stage_timer("firmware"):
+        pass
+    with pytest.raises(RuntimeError), run_metrics.stage_timer("client_apps"):
+        raise RuntimeError("boom")
+
+    metrics = run_metrics.get_run_metrics()
+
+    assert metrics["bytes_downloaded"] == 150
+    assert metrics["files_statted"] == 1
+    assert metrics["bytes_hashed"] == 0
+    assert metrics["api_calls_conditional"] == 0
+    assert set(metrics["stage_timings"]) == {"firmware", "client_apps"}
+    assert metrics["cache_stats"]["releases"] == {
+        "hits": 2,
+        "misses": 1,
+        "hit_ratio": pytest.approx(2 / 3),
+    }
+
+    run_metrics.reset_run_metrics()
+    metrics = run_metrics.get_run_metrics()
+    assert metrics["bytes_downloaded"] == 0
+    assert metrics["stage_timings"] == {}
+    assert metrics["cache_stats"] == {}
+
+
+def test_flatten_run_metrics_is_numeric():
+    run_metrics.record_stage_duration("firmware", 1.5)
+    run_metrics.record_cache_lookup("repo_contents", hit=False)
+
+    flat = run_metrics.flatten_run_metrics(run_metrics.get_run_metrics())
+
+    assert flat["stage_firmware_seconds"] == 1.5
+    assert flat["cache_repo_contents_misses"] == 1
+    assert flat["cache_repo_contents_hit_ratio"] == 0.0
+    assert all(isinstance(value, (int, float)) for value in flat.values())
+
+
+def test_format_prometheus_metrics():
+    run_metrics.increment_metric(run_metrics.METRIC_BYTES_DOWNLOADED, 42)
+    run_metrics.record_stage_duration("firmware", 1.5)
+    for hit in (True, True, True, False):
+        run_metrics.record_cache_lookup("releases", hit=hit)
+    metrics = run_metrics.get_run_metrics()
+    statistics = {
+        "success_rate": 100.0,
+        **run_metrics.flatten_run_metrics(metrics),
+    }
+
+    text = run_metrics.format_prometheus_metrics(statistics, metrics)
+
+    assert text.endswith("\n")
+    assert "fetchtastic_bytes_downloaded 42" in text
+    assert "fetchtastic_success_rate 100.0" in text
+    assert 'fetchtastic_stage_duration_seconds{stage="firmware"} 1.5' in text
+    assert 'fetchtastic_cache_lookups{cache="releases",result="hit"} 3' in text
+    assert 'fetchtastic_cache_lookups{cache="releases",result="miss"} 1' in text
+    assert 'fetchtastic_cache_hit_ratio{cache="releases"} 0.75' in text
+    assert "fetchtastic_stage_firmware_seconds" not in text
+    assert "fetchtastic_cache_releases_hits" not in text
+
+
+def test_hashing_and_zip_checks_record_bytes(tmp_path):
+    payload = b"x" * 10_000
+    plain = tmp_path / "plain.bin"
+    plain.write_bytes(payload)
+    archive = tmp_path / "archive.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("firmware-rak4631.bin", payload)
+
+    assert utils.calculate_sha256(str(plain)) is not None
+    assert is_zip_intact(archive)
+    extracted = FileOperations().extract_archive(
+        str(archive), str(tmp_path / "out"), ["rak4631"], []
+    )
+
+    metrics = run_metrics.get_run_metrics()
+    assert len(extracted) == 1
+    assert metrics["bytes_hashed"] == len(payload)
+    assert metrics["bytes_decompressed"] == 2 * len(payload)
+
+
+def test_releases_cache_lookups_recorded_per_cache(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+
+    assert cache_manager.read_releases_cache_entry("key", expiry_seconds=60) is None
+
+    stats = run_metrics.get_run_metrics()["cache_stats"]
+    assert stats["releases"]["misses"] == 1
+    assert stats["releases"]["hit_ratio"] == 0.0
+
+
+def test_orchestrator_statistics_include_run_metrics():
+    orchestrator = DownloadOrchestrator({})
+    run_metrics.increment_metric(run_metrics.METRIC_API_CALLS_FULL, 3)
+
+    stats = orchestrator.get_download_statistics()
+
+    assert stats["api_calls_full"] == 3
+    assert stats["bytes_downloaded"] == 0
+    assert all(isinstance(value, (int, float)) for value in stats.values())
+
+
+@pytest.mark.parametrize("file_name", ["metrics.json", "metrics.prom"])
+def test_write_metrics_report(tmp_path, file_name):
+    integration = DownloadCLIIntegration()
+    integration.orchestrator = None
+    run_metrics.record_stage_duration("firmware", 0.25)
+    output_path = tmp_path / "reports" / file_name
+
+    assert integration.write_metrics_report(str(output_path)) is True
+
+    content = output_path.read_text(encoding="utf-8")
+    if file_name.endswith(".prom"):
+        assert "fetchtastic_total_downloads 0" in content
+        assert "fetchtastic_api_requests" in content
+    else:
+        report = json.loads(content)
+        assert report["statistics"]["total_downloads"] == 0
+        assert report["stage_timings"] == {"firmware": 0.25}
+        assert "total_requests" in report["api"]
+        assert "generated_at" in report
@@ -0,0 +1,398 @@
+"""
+Micro-benchmarks and scaling curves for the asset-selection matchers.
+
+Covers ``matches_selected_patterns``, ``matches_extract_patterns``,
+``_matches_device_pattern``, ``DeviceHardwareManager.is_device_pattern``, the
+glob exclude helpers and the precompiled ``SelectionMatcher`` over realistic inputs (typical user selections against full
+nightly listings and firmware ZIP member lists) and synthetic ones (hundreds of
+device patterns, thousands of nightly files).
+
+Each benchmark records the time per call in microseconds and the number of
+matches. The match count must equal the committed baseline in
+``tests/selection_benchmark_baselines.json`` so optimisations cannot silently change
+selection behaviour. Timings are checked only in a dedicated run without coverage
+and fail only beyond the tolerance described in ``tests/benchmark_baselines.py``::
+
+    FETCHTASTIC_BENCHMARK_TIMINGS=1 pytest --no-cov tests/test_selection_benchmarks.py
+
+Scaling curves store one baseline per input size. Regenerate the baselines after an
+intentional change, in the same configuration, with::
+
+    FETCHTASTIC_UPDATE_BENCHMARK_BASELINES=1 pytest --no-cov tests/test_selection_benchmarks.py
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+import pytest
+
+from fetchtastic.device_hardware import FALLBACK_DEVICE_PATTERNS, DeviceHardwareManager
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.files import _matches_exclude
+from fetchtastic.download.firmware import FirmwareReleaseDownloader
+from fetchtastic.download.selection import SelectionMatcher
+from fetchtastic.utils import (
+    _matches_device_pattern,
+    matches_extract_patterns,
+    matches_selected_patterns,
+)
+from tests.benchmark_baselines import check_against_baseline
+
+pytestmark = [pytest.mark.performance, pytest.mark.unit, pytest.mark.core_downloads]
+
+BASELINES_PATH = Path(__file__).with_name("selection_benchmark_baselines.json")
+# Absolute slack (microseconds per call) for timer resolution and scheduler noise.
+TIME_SLACK_US = 1.0
+# Workloads shorter than this are repeated and the fastest pass is kept.
+MIN_SAMPLE_SECONDS = 0.05
+MAX_REPEATS = 5
+
+NIGHTLY_BUILD = "2.7.16.abc1234"
+RELEASE_VERSION = "2.7.15.567b8ea"
+
+REALISTIC_SELECTED = [
+    "rak4631-",
+    "tbeam-",
+    "t1000-e-",
+    "heltec-v3-",
+    "esp32-",
+    "nrf52840",
+    "app-fdroid",
+    ".dmg",
+]
+REALISTIC_EXTRACT = [
+    "rak4631-",
+    "tbeam-",
+    "t1000-e-",
+    "heltec-v3-",
+    "littlefs-",
+    "device-install.sh",
+    "device-update.sh",
+    "bleota",
+]
+REALISTIC_EXCLUDES = ["*.hex", "*-ota.zip", "*debug*", "*.elf", "littlefs-*"]
+
+
+def _device_targets(count: int) -> List[str]:
+    """Return `count` platformio targets: the real fallback set, then synthetic ones."""
+    targets = sorted(FALLBACK_DEVICE_PATTERNS)
+    index = 0
+    while len(targets) < count:
+        family = ("board", "heltec-wsl", "tlora-t3s3", "station-g", "rak")[index % 5]
+        targets.append(f"{family}-v{index // 5}_{index % 7}")
+        index += 1
+    return targets[:count]
+
+
+def _nightly_listing(targets: Sequence[str]) -> List[str]:
+    """Synthesise a firmware-nightly directory listing for `targets`."""
+    files = [f"firmware-{NIGHTLY_BUILD}.json", "bleota.bin", "bleota-c3.bin"]
+    for target in targets:
+        files.extend(
+            [
+                f"firmware-{target}-{NIGHTLY_BUILD}.bin",
+                f"firmware-{target}-{NIGHTLY_BUILD}.factory.bin",
+                f"firmware-{target}-{NIGHTLY_BUILD}.uf2",
+                f"firmware-{target}-{NIGHTLY_BUILD}-ota.zip",
+                f"firmware-{target}-{NIGHTLY_BUILD}.mt.json",
+                f"littlefs-{target}-{NIGHTLY_BUILD}.bin",
+            ]
+        )
+    return files
+
+
+def _zip_members(targets: Sequence[str]) -> List[str]:
+    """Synthesise the member list of a full per-architecture firmware ZIP."""
+    members = [
+        "device-install.sh",
+        "device-install.bat",
+        "device-update.sh",
+        "device-update.bat",
+        "bleota.bin",
+        "bleota-s3.bin",
+        "Meshtastic_nRF52_factory_erase_v3_S140_7.3.0.uf2",
+    ]
+    for target in targets:
+        members.extend(
+            [
+                f"firmware-{target}-{RELEASE_VERSION}.bin",
+                f"firmware-{target}-{RELEASE_VERSION}.factory.bin",
+                f"firmware-{target}-{RELEASE_VERSION}-update.bin",
+                f"littlefs-{target}-{RELEASE_VERSION}.bin",
+            ]
+        )
+    return members
+
+
+def _release_assets() -> List[str]:
+    """Asset names of a typical firmware release plus a client-app release."""
+    platforms = ("esp32", "esp32c3", "esp32c6", "esp32s3", "nrf52840", "rp2040")
+    return [
+        *(f"firmware-{p}-{RELEASE_VERSION}.zip" for p in platforms),
+        f"debug-elfs-esp32-{RELEASE_VERSION}.zip",
+        f"firmware-{RELEASE_VERSION}.json",
+        "app-fdroid-arm64-v8a-release.apk",
+        "app-fdroid-universal-release.apk",
+        "app-google-release.aab",
+        "Meshtastic-2.7.11.dmg",
+        "Meshtastic-2.7.11.msi",
+        "Meshtastic-2.7.11-x86_64.AppImage",
+    ]
+
+
+def _device_manager(tmp_path: Path, targets: Iterable[str]) -> DeviceHardwareManager:
+    manager = DeviceHardwareManager(cache_dir=tmp_path, enabled=False)
+    manager._device_patterns = set(targets)
+    manager._last_fetch_time = time.time()
+    return manager
+
+
+def _measure(workload: Callable[[], int], calls: int) -> Tuple[float, int]:
+    """
+    Time `workload` (which performs `calls` matcher calls and returns the match count).
+
+    Returns:
+        Tuple[float, int]: Best observed microseconds per call, and the match count.
+    """
+    best = float("inf")
+    matches = 0
+    for _ in range(MAX_REPEATS):
+        start = time.perf_counter()
+        matches = workload()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if elapsed >= MIN_SAMPLE_SECONDS:
+            break
+    return best / calls * 1_000_000, matches
+
+
+def _record(name: str, workload: Callable[[], int], calls: int) -> float:
+    us_per_call, matches = _measure(workload, calls)
+    check_against_baseline(
+        BASELINES_PATH,
+        name,
+        {"calls": calls, "matches": matches, "us_per_call": round(us_per_call, 4)},
+        exact_keys=("calls", "matches"),
+        time_keys=("us_per_call",),
+        time_slack=TIME_SLACK_US,
+    )
+    return us_per_call
+
+
+def _selected_workload(files: Sequence[str], patterns: List[str]) -> Callable[[], int]:
+    return lambda: sum(matches_selected_patterns(name, patterns) for name in files)
+
+
+def _extract_workload(
+    files: Sequence[str], patterns: List[str], manager
+) -> Callable[[], int]:
+    return lambda: sum(
+        matches_extract_patterns(name, patterns, manager) for name in files
+    )
+
+
+# --------------------------------------------------------- matches_selected_patterns
+
+
+def test_selected_patterns_release_assets():
+    assets = _release_assets() * 25
+    _record(
+        "selected_patterns/release_assets",
+        _selected_workload(assets, REALISTIC_SELECTED),
+        len(assets),
+    )
+
+
+def test_selected_patterns_nightly_listing():
+    files = _nightly_listing(_device_targets(300))
+    _record(
+        "selected_patterns/nightly_listing",
+        _selected_workload(files, REALISTIC_SELECTED),
+        len(files),
+    )
+
+
+@pytest.mark.parametrize("pattern_count", [10, 100, 300])
+def test_selected_patterns_scaling(pattern_count):
+    targets = _device_targets(300)
+    files = _nightly_listing(targets)[:600]
+    # Select every other target so roughly half the listing matches.
+    patterns = [f"{target}-" for target in targets[::2]][:pattern_count]
+    _record(
+        f"selected_patterns/scaling[patterns={pattern_count}]",
+        _selected_workload(files, patterns),
+        len(files),
+    )
+
+
+# ---------------------------------------------------------- matches_extract_patterns
+
+
+def test_extract_patterns_zip_members(tmp_path):
+    targets = _device_targets(120)
+    members = _zip_members(targets)
+    manager = _device_manager(tmp_path, targets)
+    _record(
+        "extract_patterns/zip_members",
+        _extract_workload(members, REALISTIC_EXTRACT, manager),
+        len(members),
+    )
+
+
+def test_extract_patterns_without_device_manager():
+    members = _zip_members(_device_targets(120))
+    _record(
+        "extract_patterns/zip_members_no_device_manager",
+        _extract_workload(members, REALISTIC_EXTRACT, None),
+        len(members),
+    )
+
+
+@pytest.mark.parametrize("pattern_count", [5, 20, 80])
+def test_extract_patterns_scaling(tmp_path, pattern_count):
+    targets = _device_targets(300)
+    members = _zip_members(targets[:25])
+    manager = _device_manager(tmp_path, targets)
+    patterns = [f"{target}-" for target in targets[::3]][:pattern_count]
+    _record(
+        f"extract_patterns/scaling[patterns={pattern_count}]",
+        _extract_workload(members, patterns, manager),
+        len(members),
+    )
+
+
+# ----------------------------------------------------------- _matches_device_pattern
+
+
+def test_matches_device_pattern_nightly_listing():
+    targets = _device_targets(300)
+    files = [name.lower() for name in _nightly_listing(targets)]
+    patterns = [f"{target}-" for target in targets[:20]] + ["t1-", "g2_"]
+    lowered = [(pattern.lower(), pattern) for pattern in patterns]
+
+    def _workload() -> int:
+        return sum(
+            _matches_device_pattern(name, pattern_lower, pattern, None)
+            for name in files
+            for pattern_lower, pattern in lowered
+        )
+
+    _record("device_pattern/nightly_listing", _workload, len(files) * len(patterns))
+
+
+# ------------------------------------------------ DeviceHardwareManager.is_device_pattern
+
+
+@pytest.mark.parametrize("device_count", [50, 300, 1200])
+def test_is_device_pattern_scaling(tmp_path, device_count):
+    targets = _device_targets(device_count)
+    manager = _device_manager(tmp_path, targets)
+    # Same queries at every size: known targets (hits) plus common non-device tokens.
+    queries = [f"{target}-" for target in _device_targets(50)[::2]]
+    queries += ["esp32-", "firmware-", "littlefs-", "bleota", "t1", "station"]
+
+    def _workload() -> int:
+        return sum(manager.is_device_pattern(query) for query in queries)
+
+    _record(
+        f"is_device_pattern/scaling[devices={device_count}]",
+        _workload,
+        len(queries),
+    )
+
+
+# ------------------------------------------------------------------- exclude helpers
+
+
+def test_files_exclude_nightly_listing():
+    files = _nightly_listing(_device_targets(300))
+    _record(
+        "exclude/files_matches_exclude",
+        lambda: sum(_matches_exclude(name, REALISTIC_EXCLUDES) for name in files),
+        len(files),
+    )
+
+
+@pytest.mark.parametrize("pattern_count", [5, 20, 80])
+def test_downloader_exclude_scaling(tmp_path, pattern_count):
+    downloader = FirmwareReleaseDownloader(
+        {"DOWNLOAD_DIR": str(tmp_path / "downloads")},
+        CacheManager(cache_dir=str(tmp_path / "cache")),
+    )
+    targets = _device_targets(300)
+    files = _nightly_listing(targets)
+    patterns = (REALISTIC_EXCLUDES + [f"*{target}-*.uf2" for target in targets[::4]])[
+        :pattern_count
+    ]
+    _record(
+        f"exclude/downloader_scaling[patterns={pattern_count}]",
+        lambda: sum(
+            downloader._matches_exclude_patterns(name, patterns) for name in files
+        ),
+        len(files),
+    )
+
+
+# ------------------------------------------------------------------ SelectionMatcher
+
+
+def _compiled_workload(predicate, files: Sequence[str]) -> Callable[[], int]:
+    """Return a workload for a compiled matcher predicate, warmed up once.
+
+    The warm-up pass fills the per-filename base-name memo so the measurement
+    reflects steady-state selection loops rather than first-sight normalisation.
+    """
+
+    def _workload() -> int:
+        return sum(predicate(name) for name in files)
+
+    _workload()
+    return _workload
+
+
+def test_compiled_selected_nightly_listing():
+    files = _nightly_listing(_device_targets(300))
+    matcher = SelectionMatcher.compile(REALISTIC_SELECTED)
+    _record(
+        "compiled/selected_nightly_listing",
+        _compiled_workload(matcher.matches, files),
+        len(files),
+    )
+
+
+@pytest.mark.parametrize("pattern_count", [10, 100, 300])
+def test_compiled_selected_scaling(pattern_count):
+    targets = _device_targets(300)
+    files = _nightly_listing(targets)[:600]
+    matcher = SelectionMatcher.compile(
+        [f"{target}-" for target in targets[::2]][:pattern_count]
+    )
+    _record(
+        f"compiled/selected_scaling[patterns={pattern_count}]",
+        _compiled_workload(matcher.matches, files),
+        len(files),
+    )
+
+
+def test_compiled_extract_zip_members(tmp_path):
+    targets = _device_targets(120)
+    members = _zip_members(targets)
+    matcher = SelectionMatcher.compile(
+        REALISTIC_EXTRACT, None, _device_manager(tmp_path, targets), extract=True
+    )
+    _record(
+        "compiled/extract_zip_members",
+        _compiled_workload(matcher.matches, members),
+        len(members),
+    )
+
+
+def test_compiled_exclude_nightly_listing():
+    files = _nightly_listing(_device_targets(300))
+    matcher = SelectionMatcher.compile(None, REALISTIC_EXCLUDES)
+    _record(
+        "compiled/exclude_nightly_listing",
+        _compiled_workload(matcher.is_excluded, files),
+        len(files),
+    )
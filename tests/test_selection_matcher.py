@@ -0,0 +1,187 @@
+"""
+Differential tests for the precompiled ``SelectionMatcher``.
+
+The compiled matcher must agree with the function-based reference matchers
+(``matches_selected_patterns``, ``matches_extract_patterns`` and the glob exclude
+helper) for every filename/pattern combination, so these tests compare both over
+hand-picked edge cases and a seeded random corpus.
+"""
+
+import random
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from fetchtastic.device_hardware import FALLBACK_DEVICE_PATTERNS, DeviceHardwareManager
+from fetchtastic.download.files import _matches_exclude
+from fetchtastic.download.selection import SelectionMatcher, get_selection_matcher
+from fetchtastic.utils import matches_extract_patterns, matches_selected_patterns
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+FILENAMES = [
+    "firmware-rak4631-2.7.15.567b8ea.uf2",
+    "firmware-rak4631_eink-2.7.15.567b8ea.uf2",
+    "firmware-tbeam-2.7.15.567b8ea.bin",
+    "firmware-tbeam-s3-core-2.7.15.567b8ea.factory.bin",
+    "firmware-t1000-e-2.7.15.567b8ea.uf2",
+    "firmware-heltec-v3-2.7.16.abc1234-ota.zip",
+    "firmware-esp32-2.7.15.567b8ea.zip",
+    "firmware-esp32s3-2.7.15.567b8ea.zip",
+    "firmware-nrf52840-2.7.15.567b8ea.zip",
+    "firmware-2.7.15.567b8ea.json",
+    "littlefs-rak4631-2.7.15.567b8ea.bin",
+    "littlefs-tbeam-2.7.15.567b8ea.bin",
+    "device-install.sh",
+    "device-update.bat",
+    "bleota.bin",
+    "bleota-c3.bin",
+    "Meshtastic_nRF52_factory_erase_v3_S140_7.3.0.uf2",
+    "debug-elfs-esp32-2.7.15.567b8ea.zip",
+    "app-fdroid-arm64-v8a-release.apk",
+    "app-google-universal-release.apk",
+    "app-google-release.aab",
+    "Meshtastic-2.7.11.dmg",
+    "Meshtastic-2.7.11.msi",
+    "Meshtastic-2.7.11-x86_64.AppImage",
+    "Meshtastic Desktop-2.7.11.dmg",
+    "meshtastic-desktop_2.7.11_amd64.deb",
+    "meshtasticd_2.7.15.567b8ea_arm64.deb",
+    "t1-firmware.bin",
+    "README.md",
+]
+
+PATTERN_POOL = [
+    "rak4631-",
+    "rak4631_",
+    "rak4631",
+    "tbeam-",
+    "tbeam",
+    "t1000-e-",
+    "heltec-v3-",
+    "esp32-",
+    "esp32s3",
+    "nrf52840",
+    "littlefs-",
+    "device-install.sh",
+    "device-",
+    "bleota",
+    "app-fdroid",
+    "fdroid",
+    "release",
+    ".apk",
+    ".aab",
+    ".dmg",
+    ".AppImage",
+    "Meshtastic",
+    "meshtastic-desktop",
+    "NRF52",
+    "t1",
+    "t1-",
+    "g2_",
+    "uf2",
+    "  tbeam-  ",
+    "",
+    "   ",
+]
+
+EXCLUDE_POOL = [
+    "*.hex",
+    "*-ota.zip",
+    "*debug*",
+    "*.ELF",
+    "littlefs-*",
+    "*rak4631_*",
+    "Meshtastic-*.msi",
+    "firmware-?beam-*",
+    "*[0-9].uf2",
+]
+
+
+@pytest.fixture
+def device_manager(tmp_path):
+    manager = DeviceHardwareManager(cache_dir=tmp_path, enabled=False)
+    manager._device_patterns = set(FALLBACK_DEVICE_PATTERNS) | {"tbeam", "t1000-e"}
+    manager._last_fetch_time = time.time()
+    return manager
+
+
+def _random_pattern_sets(count):
+    rng = random.Random(20260530)
+    for _ in range(count):
+        yield rng.sample(PATTERN_POOL, rng.randint(1, 6))
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        None,
+        [],
+        [""],
+        ["   "],
+        ["rak4631-"],
+        ["t1"],
+        ["NRF52"],
+        [".dmg", "meshtastic-desktop"],
+        ["fdroid", "release"],
+        ["esp32-", "esp32s3"],
+    ],
+)
+def test_selected_edge_cases_match_reference(patterns):
+    matcher = SelectionMatcher.compile(patterns)
+    for name in FILENAMES:
+        assert matcher.matches(name) == matches_selected_patterns(name, patterns), name
+
+
+def test_selected_random_corpus_matches_reference():
+    for patterns in _random_pattern_sets(300):
+        matcher = SelectionMatcher.compile(patterns)
+        for name in FILENAMES:
+            assert matcher.matches(name) == matches_selected_patterns(name, patterns), (
+                name,
+                patterns,
+            )
+
+
+def test_extract_random_corpus_matches_reference(device_manager):
+    raising_manager = Mock()
+    raising_manager.is_device_pattern.side_effect = ValueError("bad pattern")
+    for manager in (device_manager, None, raising_manager):
+        for patterns in _random_pattern_sets(200):
+            matcher = SelectionMatcher.compile(patterns, None, manager, extract=True)
+            for name in FILENAMES:
+                assert matcher.matches(name) == matches_extract_patterns(
+                    name, patterns, manager
+                ), (name, patterns, manager)
+
+
+def test_extract_empty_patterns_match_nothing():
+    matcher = SelectionMatcher.compile([], extract=True)
+    assert not any(matcher.matches(name) for name in FILENAMES)
+
+
+def test_excludes_match_reference():
+    rng = random.Random(7)
+    for _ in range(100):
+        excludes = rng.sample(EXCLUDE_POOL, rng.randint(0, 4))
+        matcher = SelectionMatcher.compile(None, excludes)
+        for name in FILENAMES:
+            assert matcher.is_excluded(name) == _matches_exclude(name, excludes), (
+                name,
+                excludes,
+            )
+
+
+def test_selects_combines_include_and_exclude():
+    matcher = SelectionMatcher.compile(["rak4631"], ["*rak4631_*"])
+    assert matcher.selects("firmware-rak4631-2.7.15.567b8ea.uf2")
+    assert not matcher.selects("firmware-rak4631_eink-2.7.15.567b8ea.uf2")
+    assert not matcher.selects("firmware-tbeam-2.7.15.567b8ea.bin")
+
+
+def test_get_selection_matcher_reuses_compiled_matcher():
+    first = get_selection_matcher(["rak4631-"], ["*.hex"])
+    assert get_selection_matcher(["rak4631-"], ["*.hex"]) is first
+    assert get_selection_matcher(("rak4631-",), ("*.hex",)) is first
+    assert get_selection_matcher(["tbeam-"], ["*.hex"]) is not first
@@ -0,0 +1,178 @@
+"""Tests for single-flight deduplication of concurrent requests and downloads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from fetchtastic import run_metrics, utils
+from fetchtastic.download.async_client import AsyncGitHubClient
+from fetchtastic.single_flight import AsyncSingleFlight, SingleFlight
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+CALLERS = 3
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    run_metrics.reset_run_metrics()
+    yield
+    run_metrics.reset_run_metrics()
+
+
+def _shared_count():
+    return run_metrics.get_run_metrics()[run_metrics.METRIC_REQUESTS_SHARED]
+
+
+def _block_until_callers_join(result=None, error=None):
+    """Return an operation that finishes once every other caller is waiting on it."""
+
+    def operation(*_args, **_kwargs):
+        release = threading.Event()
+        while _shared_count() < CALLERS - 1:
+            release.wait(0.01)
+        if error is not None:
+            raise error
+        return result
+
+    return operation
+
+
+def _call_concurrently(func):
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        futures = [executor.submit(func) for _ in range(CALLERS)]
+    return futures
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    operation = Mock(side_effect=_block_until_callers_join(result="value"))
+
+    futures = _call_concurrently(lambda: flights.do("key", operation))
+
+    assert [future.result() for future in futures] == ["value"] * CALLERS
+    operation.assert_called_once()
+    # Completed calls are not reused
+    assert flights.do("key", lambda: "again") == "again"
+
+
+def test_concurrent_callers_share_the_error():
+    flights = SingleFlight()
+    operation = Mock(side_effect=_block_until_callers_join(error=OSError("boom")))
+
+    futures = _call_concurrently(lambda: flights.do("key", operation))
+
+    for future in futures:
+        with pytest.raises(OSError, match="boom"):
+            future.result()
+    operation.assert_called_once()
+
+
+def test_identical_api_requests_are_sent_once(mocker):
+    response = Mock(status_code=200, headers={})
+    get = mocker.patch(
+        "requests.get", side_effect=_block_until_callers_join(result=response)
+    )
+
+    futures = _call_concurrently(
+        lambda: utils.make_github_api_request(
+            "https://api.github.com/x", params={"per_page": 5}
+        )
+    )
+
+    assert all(future.result() is response for future in futures)
+    get.assert_called_once()
+    assert _shared_count() == CALLERS - 1
+
+
+def test_requests_with_different_params_are_not_shared(mocker):
+    get = mocker.patch("requests.get", return_value=Mock(status_code=200, headers={}))
+
+    utils.make_github_api_request("https://api.github.com/x", params={"page": 1})
+    utils.make_github_api_request("https://api.github.com/x", params={"page": 2})
+
+    assert get.call_count == 2
+    assert _shared_count() == 0
+
+
+def test_identical_downloads_run_once(mocker, tmp_path):
+    download = mocker.patch(
+        "fetchtastic.utils._download_file_with_retry",
+        side_effect=_block_until_callers_join(result=True),
+    )
+    target = str(tmp_path / "firmware.zip")
+
+    futures = _call_concurrently(
+        lambda: utils.download_file_with_retry("https://example.com/fw.zip", target)
+    )
+
+    assert all(future.result() for future in futures)
+    download.assert_called_once_with("https://example.com/fw.zip", target)
+
+
+async def test_async_callers_share_one_operation():
+    flights = AsyncSingleFlight()
+    calls = 0
+
+    async def operation():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return calls
+
+    results = await asyncio.gather(
+        *(flights.do("key", operation) for _ in range(CALLERS))
+    )
+
+    assert results == [1] * CALLERS
+    assert await flights.do("key", operation) == 2
+
+
+async def test_cancelled_leader_does_not_cancel_waiters():
+    flights = AsyncSingleFlight()
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def operation():
+        started.set()
+        await finish.wait()
+        return "value"
+
+    leader = asyncio.ensure_future(flights.do("key", operation))
+    await started.wait()
+    waiter = asyncio.ensure_future(flights.do("key", operation))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    finish.set()
+
+    assert await waiter == "value"
+    assert leader.cancelled()
+    assert _shared_count() == 1
+
+
+async def test_async_client_shares_identical_downloads(mocker, tmp_path):
+    client = AsyncGitHubClient()
+    started = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def download_file(*_args, **_kwargs):
+        started.set()
+        await finish.wait()
+        return True
+
+    download = mocker.patch.object(client, "download_file", side_effect=download_file)
+    target = tmp_path / "app.apk"
+
+    first = asyncio.ensure_future(client.download_file_with_retry("u", target))
+    await started.wait()
+    second = asyncio.ensure_future(client.download_file_with_retry("u", str(target)))
+    await asyncio.sleep(0)
+    finish.set()
+
+    assert await asyncio.gather(first, second) == [True, True]
+    download.assert_called_once()
+    await client.close()
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+import zipfile
+
+import pytest
+
+from fetchtastic import cli, tracing
+from fetchtastic.download.files import FileOperations, _safe_rmtree
+from fetchtastic.run_metrics import stage_timer
+from fetchtastic.utils import calculate_sha256
+
+pytestmark = [pytest.mark.unit, pytest.mark.infrastructure]
+
+
+@pytest.fixture(autouse=True)
+def _tracing_session():
+    tracing.start_tracing()
+    yield
+    tracing.stop_tracing()
+
+
+def _load_events(path):
+    with open(path, encoding="utf-8") as f:
+        trace = json.load(f)
+    assert trace["displayTimeUnit"] == "ms"
+    return trace["traceEvents"]
+
+
+def _complete_events(events):
+    return [event for event in events if event["ph"] == "X"]
+
+
+def test_disabled_tracing_is_noop(tmp_path):
+    tracing.stop_tracing()
+
+    with tracing.trace_span("work", tracing.TRACE_CATEGORY_STAGE, a=1) as span:
+        span["b"] = 2
+
+    assert tracing.is_tracing_enabled() is False
+    assert tracing.write_trace(str(tmp_path / "trace.json")) is False
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_spans_record_args_errors_and_stage_timer(tmp_path):
+    with tracing.trace_span("outer", tracing.TRACE_CATEGORY_STAGE, url="u") as span:
+        tracing.add_throughput(span, 2 * 1024 * 1024, 2.0)
+    with pytest.raises(ValueError):
+        with tracing.trace_span("failing", tracing.TRACE_CATEGORY_API):
+            raise ValueError("boom")
+    with stage_timer("firmware"):
+        pass
+
+    output = tmp_path / "nested" / "trace.json"
+    assert tracing.write_trace(str(output)) is True
+
+    events = {event["name"]: event for event in _complete_events(_load_events(output))}
+    assert events["outer"]["args"] == {
+        "url": "u",
+        "bytes": 2 * 1024 * 1024,
+        "throughput_mib_s": 1.0,
+    }
+    assert events["outer"]["dur"] >= 0
+    assert events["failing"]["args"]["error"] == "ValueError"
+    assert events["failing"]["cat"] == tracing.TRACE_CATEGORY_API
+    assert events["firmware"]["cat"] == tracing.TRACE_CATEGORY_STAGE
+
+
+def test_threads_and_tasks_get_separate_lanes(tmp_path):
+    def _work():
+        with tracing.trace_span("thread-work"):
+            pass
+
+    async def _task_work(name):
+        with tracing.trace_span(name):
+            await asyncio.sleep(0)
+
+    async def _main():
+        await asyncio.gather(_task_work("task-a"), _task_work("task-b"))
+
+    worker = threading.Thread(target=_work, name="worker-1")
+    worker.start()
+    worker.join()
+    with tracing.trace_span("main-work"):
+        pass
+    asyncio.run(_main())
+
+    output = tmp_path / "trace.json"
+    assert tracing.write_trace(str(output))
+    events = _load_events(output)
+
+    lanes = {event["name"]: event["tid"] for event in _complete_events(events)}
+    assert len(set(lanes.values())) == 4
+    lane_names = {
+        event["args"]["name"] for event in events if event["name"] == "thread_name"
+    }
+    assert "worker-1" in lane_names
+
+
+def test_hash_extract_and_delete_spans(tmp_path):
+    archive = tmp_path / "firmware.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("firmware-rak4631.bin", b"data")
+    stale_dir = tmp_path / "old"
+    stale_dir.mkdir()
+
+    calculate_sha256(str(archive))
+    FileOperations().extract_archive(
+        str(archive), str(tmp_path / "out"), ["rak4631"], []
+    )
+    assert _safe_rmtree(str(stale_dir), str(tmp_path), "old")
+
+    output = tmp_path / "trace.json"
+    assert tracing.write_trace(str(output))
+    events = {event["name"]: event for event in _complete_events(_load_events(output))}
+    assert events["sha256"]["args"]["bytes"] == archive.stat().st_size
+    assert events["extract"]["args"]["extracted_files"] == 1
+    assert events["delete"]["cat"] == tracing.TRACE_CATEGORY_CLEANUP
+
+
+def test_handle_download_subcommand_writes_trace(mocker, tmp_path):
+    tracing.stop_tracing()
+    output = tmp_path / "run.json"
+    args = mocker.Mock(
+        clear_cache=False, force_download=False, metrics_out=None, trace_out=str(output)
+    )
+    integration = mocker.MagicMock()
+    integration.main.side_effect = RuntimeError("download failed")
+
+    with pytest.raises(RuntimeError):
+        cli._handle_download_subcommand(args, integration, {})
+
+    events = _complete_events(_load_events(output))
+    assert [event["name"] for event in events] == ["download"]
+    assert events[0]["args"]["error"] == "RuntimeError"
+    assert tracing.is_tracing_enabled() is False
@@ -1797,3 +1797,82 @@ def test_get_package_version_success(mocker):
 
     assert result == "1.2.3"
     mock_logger.warning.assert_not_called()
+
+
+def _write_zip(path, payload=b"firmware" * 1000):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("firmware-rak4631.bin", payload)
+        zf.writestr("littlefs-rak4631.bin", payload[::-1])
+
+
+def test_check_zip_integrity_runs_full_crc_once(tmp_path, mocker):
+    archive = tmp_path / "fw.zip"
+    _write_zip(archive)
+    crc_check = mocker.spy(utils, "_zip_members_pass_crc")
+
+    assert utils.check_zip_integrity(str(archive)) is True
+    assert utils.check_zip_integrity(str(archive)) is True
+    assert crc_check.call_count == 1
+
+    assert utils.check_zip_integrity(str(archive), full=True) is True
+    assert crc_check.call_count == 2
+
+
+def test_check_zip_integrity_rechecks_crc_after_file_changes(tmp_path, mocker):
+    archive = tmp_path / "fw.zip"
+    _write_zip(archive)
+    assert utils.check_zip_integrity(str(archive)) is True
+
+    _write_zip(archive, b"different" * 500)
+    os.utime(archive, ns=(1, 1))
+    crc_check = mocker.spy(utils, "_zip_members_pass_crc")
+
+    assert utils.check_zip_integrity(str(archive)) is True
+    assert crc_check.call_count == 1
+
+
+def test_structural_check_detects_truncation(tmp_path):
+    archive = tmp_path / "fw.zip"
+    _write_zip(archive)
+    assert utils.is_zip_structurally_sound(str(archive)) is True
+
+    data = archive.read_bytes()
+    archive.write_bytes(data[: len(data) // 2])
+    assert utils.is_zip_structurally_sound(str(archive)) is False
+
+
+def test_structural_check_detects_member_overlapping_central_directory(tmp_path):
+    archive = tmp_path / "fw.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("firmware.bin", b"x" * 200)
+    data = bytearray(archive.read_bytes())
+    # Inflate the compressed size recorded in the central directory entry
+    central = data.rindex(b"PK\x01\x02")
+    data[central + 20 : central + 24] = (10_000).to_bytes(4, "little")
+    archive.write_bytes(bytes(data))
+
+    assert utils.is_zip_structurally_sound(str(archive)) is False
+
+
+def test_check_zip_integrity_detects_crc_corruption_without_record(tmp_path):
+    archive = tmp_path / "fw.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr("firmware.bin", b"x" * 200)
+    data = archive.read_bytes()
+    offset = data.index(b"x" * 200)
+    archive.write_bytes(data[:offset] + b"y" + data[offset + 1 :])
+
+    assert utils.is_zip_structurally_sound(str(archive)) is True
+    assert utils.check_zip_integrity(str(archive)) is False
+    assert not os.path.exists(utils.get_zip_check_file_path(str(archive)))
+
+
+def test_remove_file_and_hash_removes_zip_check_marker(tmp_path):
+    archive = tmp_path / "fw.zip"
+    _write_zip(archive)
+    assert utils.check_zip_integrity(str(archive)) is True
+    marker = utils.get_zip_check_file_path(str(archive))
+    assert os.path.exists(marker)
+
+    assert utils._remove_file_and_hash(str(archive)) is True
+    assert not os.path.exists(marker)
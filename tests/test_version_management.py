@@ -10,11 +10,13 @@ Comprehensive tests for the version.py module covering:
 """
 
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from fetchtastic.download import version as version_module
 from fetchtastic.download.version import (
+    VersionKey,
     VersionManager,
     _read_latest_release_tag,
     _read_prerelease_tracking_data,
@@ -24,6 +26,7 @@ from fetchtastic.download.version import (
     is_prerelease_base_newer_than_stable,
     is_prerelease_directory,
     normalize_commit_identifier,
+    version_key,
 )
 
 
@@ -599,6 +602,87 @@ class TestVersionTracking:
         assert result is False
 
 
+class TestVersionKey:
+    """Test memoised parsing and precomputed version keys."""
+
+    VERSIONS = [
+        "v2.7.15",
+        "2.7.15",
+        "v2.7.15.567b8ea",
+        "2.7.16-rc1",
+        "2.7.16.beta2",
+        "v2.7.9",
+        "v2.7.10",
+        "2.7",
+        "v3.0.0-alpha",
+        "nightly-build",
+        "abc",
+        "V1.0.0",
+    ]
+
+    def test_version_key_ordering_matches_compare_versions(self):
+        """VersionKey agrees with compare_versions when both or neither tag parses."""
+        vm = VersionManager()
+        for left in self.VERSIONS:
+            for right in self.VERSIONS:
+                if (version_key(left).parsed is None) != (
+                    version_key(right).parsed is None
+                ):
+                    continue
+                expected = vm.compare_versions(left, right)
+                assert version_key(left).compare(version_key(right)) == expected
+                assert (version_key(left) < version_key(right)) == (expected < 0)
+                assert (version_key(left) == version_key(right)) == (expected == 0)
+
+    def test_version_key_sorts_tags(self):
+        """version_key can be used directly as a sort key."""
+        tags = ["v2.7.10", "v2.7.9", "v2.7.11.abc1234", "v2.7.10-rc1"]
+        assert sorted(tags, key=version_key) == [
+            "v2.7.9",
+            "v2.7.10-rc1",
+            "v2.7.10",
+            "v2.7.11.abc1234",
+        ]
+
+    def test_version_key_is_a_total_order(self):
+        """Mixed parsable and unparsable tags sort the same regardless of input order."""
+        cycle = ["2.7.9-rc1", "2.7.9", "2.7.9-q"]
+        keys = [version_key(tag) for tag in cycle]
+        assert not (keys[0] < keys[1] < keys[2] < keys[0])
+        assert sorted(cycle, key=version_key) == sorted(
+            reversed(cycle), key=version_key
+        )
+        expected = sorted(self.VERSIONS, key=version_key)
+        assert [
+            version_key(tag) for tag in sorted(reversed(self.VERSIONS), key=version_key)
+        ] == [version_key(tag) for tag in expected]
+        parsed = [tag for tag in expected if version_key(tag).parsed is not None]
+        assert expected[-len(parsed) :] == parsed
+
+    def test_version_key_is_memoised(self):
+        """Equal inputs return the same key instance."""
+        assert version_key("v2.7.15") is version_key("v2.7.15")
+        assert isinstance(VersionManager().version_key("v2.7.15"), VersionKey)
+
+    def test_repeated_parsing_hits_cache(self):
+        """Repeated normalize/get_release_tuple calls parse each tag only once."""
+        vm = VersionManager()
+        tag = "v9.8.7.fedcba9"
+        with patch.object(
+            version_module, "parse_version", wraps=version_module.parse_version
+        ) as mock_parse:
+            for _ in range(5):
+                vm.normalize_version(tag)
+                vm.get_release_tuple(tag)
+                vm.compare_versions(tag, "v9.8.6")
+        assert mock_parse.call_count <= 3
+
+    def test_compare_versions_unhashable_input_raises(self):
+        """Unhashable input still fails like the uncached parser did."""
+        with pytest.raises(AttributeError):
+            VersionManager().compare_versions(["v1.0"], "v1.0")
+
+
 class TestLegacyFunctions:
     """Test legacy compatibility functions."""
 
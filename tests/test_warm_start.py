@@ -0,0 +1,155 @@
+"""Tests for the warm-start snapshot of parsed release lists."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from fetchtastic.download.cache import CacheManager
+from fetchtastic.download.github_source import CachedReleaseBody
+from fetchtastic.download.interfaces import Asset, Release
+from fetchtastic.download.orchestrator import DownloadOrchestrator
+from fetchtastic.download.warm_start import WarmStartSnapshot
+
+pytestmark = [pytest.mark.unit, pytest.mark.core_downloads]
+
+CONFIG = {"SELECTED_PATTERNS": ["rak4631-"], "EXCLUDE_PATTERNS": ["*debug*"]}
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    manager = CacheManager(cache_dir=str(tmp_path))
+    manager.write_releases_cache_entry(
+        "key", [{"tag_name": "v2.7.15", "prerelease": False, "body": "full notes"}]
+    )
+    return manager
+
+
+def _releases(cache_manager):
+    offloaded = Release(tag_name="v2.7.15", name="Beta", body="full notes")
+    offloaded.offload_body(CachedReleaseBody(cache_manager, "key", "v2.7.15"))
+    offloaded.assets.append(
+        Asset(
+            name="firmware-rak4631-2.7.15.uf2",
+            download_url="https://example.com/fw.uf2",
+            size=12,
+            browser_download_url="https://example.com/fw.uf2",
+        )
+    )
+    return [offloaded, Release(tag_name="v2.7.14", prerelease=True, body="notes")]
+
+
+def _saved_snapshot(cache_manager, releases):
+    snapshot = WarmStartSnapshot(cache_manager, CONFIG)
+    snapshot.record_releases("firmware_releases:10", releases, time.time() + 3600)
+    assert snapshot.save() is True
+    return snapshot
+
+
+def test_snapshot_round_trips_release_lists(cache_manager):
+    releases = _releases(cache_manager)
+    _saved_snapshot(cache_manager, releases)
+
+    restored = WarmStartSnapshot(cache_manager, CONFIG).get_releases(
+        "firmware_releases:10"
+    )
+
+    assert restored == releases
+    assert restored[0] is not releases[0]
+    assert restored[0].body is None
+    assert restored[0].get_body() == "full notes"
+    assert restored[1].body == "notes"
+
+
+def test_snapshot_ignored_when_releases_cache_changes(cache_manager):
+    _saved_snapshot(cache_manager, _releases(cache_manager))
+
+    cache_manager.write_releases_cache_entry(
+        "other", [{"tag_name": "v2.7.16", "prerelease": False}]
+    )
+
+    assert (
+        WarmStartSnapshot(cache_manager, CONFIG).get_releases("firmware_releases:10")
+        is None
+    )
+
+
+def test_snapshot_ignored_when_config_changes(cache_manager):
+    _saved_snapshot(cache_manager, _releases(cache_manager))
+
+    changed = {**CONFIG, "SELECTED_PATTERNS": ["tbeam-"]}
+
+    assert (
+        WarmStartSnapshot(cache_manager, changed).get_releases("firmware_releases:10")
+        is None
+    )
+
+
+def test_snapshot_entries_expire_with_releases_cache(cache_manager):
+    snapshot = WarmStartSnapshot(cache_manager, CONFIG)
+    snapshot.record_releases(
+        "firmware_releases:10", _releases(cache_manager), time.time() - 1
+    )
+    snapshot.save()
+
+    assert (
+        WarmStartSnapshot(cache_manager, CONFIG).get_releases("firmware_releases:10")
+        is None
+    )
+
+
+def test_snapshot_skips_lists_not_served_from_releases_cache(tmp_path):
+    snapshot = WarmStartSnapshot(CacheManager(cache_dir=str(tmp_path)), CONFIG)
+    snapshot.record_releases(
+        "firmware_releases:10", [Release(tag_name="v1.0.0")], fresh_until=None
+    )
+
+    assert snapshot.save() is False
+
+
+def test_snapshot_skips_lists_with_unknown_objects(cache_manager):
+    snapshot = WarmStartSnapshot(cache_manager, CONFIG)
+    snapshot.record_releases(
+        "firmware_releases:10", [Mock(spec=Release)], time.time() + 3600
+    )
+
+    assert snapshot.save() is False
+
+
+def test_freshness_tracks_only_entries_used_in_the_block(cache_manager):
+    cache_manager.write_releases_cache_entry("other", [{"tag_name": "v1.0.0"}])
+
+    with cache_manager.track_releases_freshness() as freshness:
+        assert cache_manager.read_releases_cache_entry("key", expiry_seconds=60)
+    with cache_manager.track_releases_freshness() as untouched:
+        pass
+
+    # The entry's own cached_at + expiry, not the later write's full lifetime
+    assert freshness.fresh_until <= time.time() + 60
+    assert untouched.fresh_until is None
+
+
+def test_orchestrator_restores_releases_from_warm_start(cache_manager, mocker):
+    mocker.patch(
+        "fetchtastic.download.orchestrator.CacheManager", return_value=cache_manager
+    )
+    releases = _releases(cache_manager)
+    config = {"DOWNLOAD_DIR": str(cache_manager.cache_dir)}
+
+    first = DownloadOrchestrator(config)
+
+    def get_releases(limit=None):
+        cache_manager.read_releases_cache_entry("key", expiry_seconds=3600)
+        return releases
+
+    mocker.patch.object(
+        first.firmware_downloader, "get_releases", side_effect=get_releases
+    )
+    assert first._ensure_firmware_releases(limit=10) == releases
+    first.warm_start.save()
+
+    second = DownloadOrchestrator(config)
+    get_releases = mocker.patch.object(second.firmware_downloader, "get_releases")
+
+    assert second._ensure_firmware_releases(limit=10) == releases
+    get_releases.assert_not_called()